@@ -16,6 +16,7 @@ from .response_handlers import (
     StreamHandler, collect_stream, stream_to_string,
     StructuredOutputParser, OutputFormat, FormatError
 )
+from .cache import ResponseCache, MemoryCacheBackend, DiskCacheBackend
 from .config import (
     get_env, get_env_bool, get_env_int, get_env_float, 
     get_env_list, get_env_dict, set_env, has_env,
@@ -42,6 +43,9 @@ __all__ = [
     'StreamHandler', 'collect_stream', 'stream_to_string',
     'StructuredOutputParser', 'OutputFormat',
     
+    # Response caching
+    'ResponseCache', 'MemoryCacheBackend', 'DiskCacheBackend',
+    
     # Configuration
     'get_env', 'get_env_bool', 'get_env_int', 'get_env_float',
     'get_env_list', 'get_env_dict', 'set_env', 'has_env',
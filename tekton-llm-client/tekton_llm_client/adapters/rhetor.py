@@ -6,6 +6,7 @@ import os
 import json
 import logging
 import asyncio
+import time
 import aiohttp
 from typing import Dict, List, Optional, Any, AsyncGenerator, Union
 from urllib.parse import urljoin
@@ -15,11 +16,25 @@ from ..models import Message, CompletionOptions
 from ..exceptions import (
     TektonLLMError, ConnectionError, TimeoutError, 
     AuthenticationError, ServiceUnavailableError, 
-    InvalidRequestError, AdapterError
+    RateLimitError, InvalidRequestError, AdapterError
 )
+from ..utils.limits import RequestLimiter
+from ..utils.sse import iter_sse_events
 
 logger = logging.getLogger(__name__)
 
+# Pooled connections to Rhetor
+DEFAULT_LIMIT_PER_HOST = 32
+
+# Idle pooled connections are closed after this many seconds
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+
+# Seconds resolved host names are cached
+DEFAULT_DNS_CACHE_TTL = 300
+
+# Seconds new requests are held back after a 429 without Retry-After
+DEFAULT_RETRY_AFTER = 1.0
+
 class RhetorAdapter(BaseAdapter):
     """Adapter for Rhetor LLM service."""
     
@@ -27,7 +42,13 @@ class RhetorAdapter(BaseAdapter):
         self,
         base_url: str,
         auth_token: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        limiter: Optional[RequestLimiter] = None
     ):
         """
         Initialize the Rhetor adapter.
@@ -36,11 +57,31 @@ class RhetorAdapter(BaseAdapter):
             base_url: Base URL for the Rhetor API
             auth_token: Authentication token for Rhetor API
             timeout: Request timeout in seconds
+            limit_per_host: Maximum pooled connections to Rhetor (0 for no limit)
+            keepalive_timeout: Seconds idle connections are kept open for reuse
+            dns_cache_ttl: Seconds resolved host names are cached (None to cache forever)
+            max_concurrency: Maximum in-flight requests per provider/model (None for no limit)
+            requests_per_second: Maximum request rate per provider/model (None for no limit)
+            limiter: Request limiter to use instead of one built from
+                max_concurrency and requests_per_second (e.g. shared between adapters)
         """
         self.base_url = base_url.rstrip("/")
         self.auth_token = auth_token
         self.timeout = timeout
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.limiter = limiter or RequestLimiter(
+            max_concurrency=max_concurrency,
+            requests_per_second=requests_per_second
+        )
         self.session = None
+        self.connection_stats = {
+            "connections_created": 0,
+            "connections_reused": 0,
+            "connection_waits": 0,
+            "connection_wait_time": 0.0
+        }
         self.available = False
         self.providers_cache = None
         self.ws_url = self._get_ws_url()
@@ -71,10 +112,7 @@ class RhetorAdapter(BaseAdapter):
         try:
             # Create session if it doesn't exist
             if self.session is None:
-                self.session = aiohttp.ClientSession(
-                    headers=self._get_headers(),
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                )
+                self.session = self._create_session()
             
             # Check if Rhetor is available
             async with self.session.get(
@@ -110,6 +148,88 @@ class RhetorAdapter(BaseAdapter):
             self.session = None
         self.available = False
     
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create the HTTP session with a keep-alive connection pool.
+        
+        Returns:
+            aiohttp.ClientSession for Rhetor requests
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.limit_per_host,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self._get_headers(),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=[self._trace_config()]
+        )
+    
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build trace hooks that count connection reuse and pool waits.
+        
+        Returns:
+            aiohttp.TraceConfig updating connection_stats
+        """
+        stats = self.connection_stats
+        
+        async def on_connection_queued_start(session, context, params):
+            context.queued_at = time.monotonic()
+        
+        async def on_connection_queued_end(session, context, params):
+            stats["connection_waits"] += 1
+            stats["connection_wait_time"] += time.monotonic() - context.queued_at
+        
+        async def on_connection_create_end(session, context, params):
+            stats["connections_created"] += 1
+        
+        async def on_connection_reuseconn(session, context, params):
+            stats["connections_reused"] += 1
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection and request queueing statistics.
+        
+        Returns:
+            Dictionary with connection pool counters and per provider/model
+            limiter statistics
+        """
+        opened = self.connection_stats["connections_created"] + self.connection_stats["connections_reused"]
+        return {
+            "connections": dict(
+                self.connection_stats,
+                reuse_rate=self.connection_stats["connections_reused"] / opened if opened else 0.0
+            ),
+            "limits": self.limiter.get_stats()
+        }
+    
+    def _rate_limited(self, response, provider_id: str, model_id: Optional[str]) -> None:
+        """
+        Hold back requests for a provider/model after a 429 response.
+        
+        Args:
+            response: The 429 response
+            provider_id: Provider ID of the request
+            model_id: Model ID of the request
+        """
+        try:
+            retry_after = float(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+        except ValueError:
+            retry_after = DEFAULT_RETRY_AFTER
+        self.limiter.pause(provider_id, model_id, retry_after)
+    
     def _get_headers(self) -> Dict[str, str]:
         """
         Get headers for HTTP requests.
@@ -210,7 +330,7 @@ class RhetorAdapter(BaseAdapter):
             payload["options"]["frequency_penalty"] = options.frequency_penalty
         
         try:
-            async with self.session.post(
+            async with self.limiter.acquire(provider_id, model_id), self.session.post(
                 urljoin(self.base_url, "/api/v1/chat"),
                 json=payload,
                 raise_for_status=False,
@@ -226,6 +346,7 @@ class RhetorAdapter(BaseAdapter):
                     elif response.status == 400:
                         raise InvalidRequestError(f"Invalid request: {error_message}")
                     elif response.status == 429:
+                        self._rate_limited(response, provider_id, model_id)
                         raise RateLimitError(f"Rate limit exceeded: {error_message}")
                     elif response.status == 503:
                         raise ServiceUnavailableError(f"Service unavailable: {error_message}")
@@ -317,7 +438,7 @@ class RhetorAdapter(BaseAdapter):
             payload["options"]["frequency_penalty"] = options.frequency_penalty
         
         try:
-            async with self.session.post(
+            async with self.limiter.acquire(provider_id, model_id), self.session.post(
                 urljoin(self.base_url, "/api/v1/chat/stream"),
                 json=payload,
                 raise_for_status=False,
@@ -332,31 +453,26 @@ class RhetorAdapter(BaseAdapter):
                     elif response.status == 400:
                         raise InvalidRequestError(f"Invalid request: {error_message}")
                     elif response.status == 429:
+                        self._rate_limited(response, provider_id, model_id)
                         raise RateLimitError(f"Rate limit exceeded: {error_message}")
                     elif response.status == 503:
                         raise ServiceUnavailableError(f"Service unavailable: {error_message}")
                     else:
                         raise AdapterError("rhetor", f"HTTP error {response.status}: {error_message}")
                 
-                # Process the stream
-                async for line in response.content:
-                    line = line.decode('utf-8').strip()
-                    
-                    if not line:
-                        continue
-                        
-                    if line.startswith('data: '):
-                        line = line[6:]  # Remove 'data: ' prefix
+                # Process the stream; events may span network chunks
+                async for event in iter_sse_events(response.content.iter_any()):
+                    if event.raw == b"[DONE]":
+                        # End of stream
+                        break
                         
-                        if line == '[DONE]':
-                            # End of stream
-                            break
-                            
-                        try:
-                            chunk_data = json.loads(line)
-                            yield chunk_data
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Error parsing chunk data: {str(e)}, data: {line}")
+                    try:
+                        chunk_data = event.json()
+                    except ValueError as e:
+                        logger.error(f"Error parsing chunk data: {str(e)}, data: {event.raw!r}")
+                        continue
+                    
+                    yield chunk_data
                 
                 # Send a final chunk indicating completion
                 yield {
@@ -0,0 +1,14 @@
+"""
+Response caching for Tekton LLM Client.
+
+This module provides an exact-match and semantic cache of LLM responses
+with in-memory and on-disk storage backends.
+"""
+
+from .backends import CacheBackend, MemoryCacheBackend, DiskCacheBackend
+from .response_cache import ResponseCache
+
+__all__ = [
+    'CacheBackend', 'MemoryCacheBackend', 'DiskCacheBackend',
+    'ResponseCache'
+]
@@ -0,0 +1,250 @@
+"""
+Storage backends for the LLM response cache.
+
+Backends store JSON-serializable entries by key with least-recently-used
+eviction beyond a maximum size and expiry after a time to live.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Entries kept before the least recently used are evicted
+DEFAULT_MAX_ENTRIES = 1000
+
+# Seconds an entry is served before it expires
+DEFAULT_TTL = 3600.0
+
+
+class CacheBackend(ABC):
+    """Base interface for response cache storage."""
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an entry and mark it recently used.
+        
+        Args:
+            key: Entry key
+        
+        Returns:
+            The entry, or None if it is missing or expired
+        """
+        pass
+    
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store an entry, evicting the least recently used beyond the size limit.
+        
+        Args:
+            key: Entry key
+            value: JSON-serializable entry
+        """
+        pass
+    
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry if present.
+        
+        Args:
+            key: Entry key
+        """
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        pass
+    
+    @abstractmethod
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over unexpired entries without marking them used.
+        
+        Yields:
+            (key, entry) tuples
+        """
+        pass
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+    
+    def close(self) -> None:
+        """Release resources held by the backend."""
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with per-entry expiry."""
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: Optional[float] = DEFAULT_TTL):
+        """
+        Initialize the memory backend.
+        
+        Args:
+            max_entries: Maximum number of entries
+            ttl: Seconds entries are kept (None for no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    def _expired(self, stored_at: float) -> bool:
+        """Check whether an entry stored at the given time has expired."""
+        return self.ttl is not None and time.monotonic() - stored_at >= self.ttl
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an entry and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry[0]):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store an entry, evicting the least recently used beyond max_entries."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+    
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over unexpired entries without marking them used."""
+        for key, (stored_at, value) in list(self._entries.items()):
+            if not self._expired(stored_at):
+                yield key, value
+    
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet removed."""
+        return len(self._entries)
+
+
+class DiskCacheBackend(CacheBackend):
+    """
+    SQLite-backed cache that survives restarts.
+    
+    Entries are stored as JSON with their creation and last-access times;
+    expiry uses wall-clock time so it holds across processes.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL
+    ):
+        """
+        Initialize the disk backend.
+        
+        Args:
+            path: Path of the SQLite database file
+            max_entries: Maximum number of entries
+            ttl: Seconds entries are kept (None for no expiry)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._size = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+    
+    def _expired(self, created: float) -> bool:
+        """Check whether an entry stored at the given time has expired."""
+        return self.ttl is not None and time.time() - created >= self.ttl
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an entry and mark it recently used."""
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if self._expired(row[1]):
+                self._delete(key)
+                return None
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store an entry, evicting the least recently used beyond max_entries."""
+        data = json.dumps(value)
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE entries SET value = ?, created = ?, accessed = ? WHERE key = ?", (data, now, now, key)
+            )
+            if cursor.rowcount == 0:
+                self._conn.execute("INSERT INTO entries VALUES (?, ?, ?, ?)", (key, data, now, now))
+                self._size += 1
+            if self._size > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY accessed LIMIT ?)",
+                    (self._size - self.max_entries,)
+                )
+                self._size = self.max_entries
+    
+    def _delete(self, key: str) -> None:
+        """Remove an entry; the caller holds the lock."""
+        if self._conn.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount:
+            self._size -= 1
+    
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._delete(key)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._size = 0
+    
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over unexpired entries without marking them used."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value, created FROM entries").fetchall()
+        for key, value, created in rows:
+            if not self._expired(created):
+                yield key, json.loads(value)
+    
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet removed."""
+        return self._size
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
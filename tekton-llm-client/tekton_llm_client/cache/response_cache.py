@@ -0,0 +1,333 @@
+"""
+Response cache for LLM completions.
+
+Completions are cached under a hash of everything that determines the
+response: messages, system prompt, provider, model, context and sampling
+parameters. An optional semantic layer also serves a cached response when
+a new prompt's embedding is close enough to a cached prompt's, as long as
+everything else about the request is identical.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..models import Message, CompletionOptions
+from .backends import CacheBackend, MemoryCacheBackend, DEFAULT_MAX_ENTRIES
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+# Minimum cosine similarity for a semantic hit
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+# Sampling parameters that change the response, and so the cache key
+SAMPLING_FIELDS = (
+    "temperature", "max_tokens", "stop_sequences", "top_p", "top_k",
+    "presence_penalty", "frequency_penalty"
+)
+
+EmbeddingFunction = Callable[[str], Union[Sequence[float], Awaitable[Sequence[float]]]]
+
+
+def _digest(data: Any) -> str:
+    """Hash JSON-serializable data deterministically."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    """Scale a vector to unit length."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else list(vector)
+
+
+class _SemanticIndex:
+    """
+    Prompt embeddings grouped by scope, for nearest-neighbour lookup.
+    
+    A scope is everything about a request except its last message, so a
+    semantic hit only ever substitutes one final prompt for another.
+    """
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, List[float]]]" = OrderedDict()
+        self._scopes: Dict[str, Dict[str, List[float]]] = {}
+        self._matrices: Dict[str, Tuple[List[str], Any]] = {}
+    
+    def add(self, key: str, scope: str, vector: List[float]) -> None:
+        """Index a prompt embedding, dropping the oldest beyond max_entries."""
+        self.remove(key)
+        self._entries[key] = (scope, vector)
+        self._scopes.setdefault(scope, {})[key] = vector
+        self._matrices.pop(scope, None)
+        while len(self._entries) > self.max_entries:
+            self.remove(next(iter(self._entries)))
+    
+    def remove(self, key: str) -> None:
+        """Drop a prompt embedding if indexed."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        scope = entry[0]
+        vectors = self._scopes[scope]
+        del vectors[key]
+        if not vectors:
+            del self._scopes[scope]
+        self._matrices.pop(scope, None)
+    
+    def clear(self) -> None:
+        """Drop all embeddings."""
+        self._entries.clear()
+        self._scopes.clear()
+        self._matrices.clear()
+    
+    def nearest(self, scope: str, vector: List[float]) -> Tuple[Optional[str], float]:
+        """
+        Find the most similar cached prompt in a scope.
+        
+        Args:
+            scope: Request scope
+            vector: Normalized prompt embedding
+        
+        Returns:
+            (key, cosine similarity), or (None, 0.0) if the scope is empty
+        """
+        vectors = self._scopes.get(scope)
+        if not vectors:
+            return None, 0.0
+        
+        if HAS_NUMPY:
+            cached = self._matrices.get(scope)
+            if cached is None:
+                keys = list(vectors)
+                cached = (keys, np.array([vectors[key] for key in keys], dtype=np.float32))
+                self._matrices[scope] = cached
+            keys, matrix = cached
+            scores = matrix @ np.asarray(vector, dtype=np.float32)
+            best = int(np.argmax(scores))
+            return keys[best], float(scores[best])
+        
+        best_key, best_score = None, -1.0
+        for key, other in vectors.items():
+            score = sum(a * b for a, b in zip(vector, other))
+            if score > best_score:
+                best_key, best_score = key, score
+        return best_key, best_score
+
+
+class ResponseCache:
+    """
+    Exact-match and optional semantic cache of completion responses.
+    
+    Only deterministic requests are cached: by default a request with
+    temperature above 0 bypasses the cache, since repeating it is expected
+    to produce a different response. Fallback and error responses are never
+    stored. Expiry and eviction follow the backend; the semantic index is
+    rebuilt from the backend on start, so it persists with a disk backend.
+    """
+    
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        embedding_function: Optional[EmbeddingFunction] = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_temperature: float = 0.0
+    ):
+        """
+        Initialize the response cache.
+        
+        Args:
+            backend: Storage backend (defaults to an in-memory LRU)
+            embedding_function: Function (sync or async) returning an
+                embedding for a prompt; enables the semantic layer
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_temperature: Highest temperature whose responses are cached
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.embedding_function = embedding_function
+        self.similarity_threshold = similarity_threshold
+        self.max_temperature = max_temperature
+        self._semantic: Optional[_SemanticIndex] = None
+        self._stats = {
+            "lookups": 0,
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "stores": 0,
+            "latency_saved": 0.0
+        }
+        
+        if embedding_function is not None:
+            self._semantic = _SemanticIndex(getattr(self.backend, "max_entries", DEFAULT_MAX_ENTRIES))
+            for key, entry in self.backend.items():
+                if entry.get("embedding"):
+                    self._semantic.add(key, entry["scope"], entry["embedding"])
+    
+    def is_cacheable(self, options: CompletionOptions) -> bool:
+        """
+        Check whether a request's response may be cached.
+        
+        Args:
+            options: Completion options of the request
+        
+        Returns:
+            True if the request's temperature is at most max_temperature
+        """
+        return options.temperature <= self.max_temperature
+    
+    def make_keys(
+        self,
+        messages: List[Message],
+        system_prompt: Optional[str],
+        context_id: str,
+        provider_id: str,
+        model_id: Optional[str],
+        options: CompletionOptions
+    ) -> Tuple[str, str]:
+        """
+        Build the cache key and semantic scope of a request.
+        
+        Args:
+            messages: Conversation messages
+            system_prompt: Optional system instructions
+            context_id: Context ID of the request
+            provider_id: Provider ID
+            model_id: Model ID
+            options: Completion options
+        
+        Returns:
+            (key, scope): the key covers the whole request, the scope all
+            of it except the last message
+        """
+        formatted = [[msg.role.value, msg.content, msg.name] for msg in messages]
+        request = {
+            "system_prompt": system_prompt,
+            "context_id": context_id,
+            "provider": provider_id,
+            "model": model_id,
+            "options": {field: getattr(options, field) for field in SAMPLING_FIELDS}
+        }
+        scope = _digest(dict(request, messages=formatted[:-1], last_role=formatted[-1][0] if formatted else None))
+        key = _digest(dict(request, messages=formatted))
+        return key, scope
+    
+    async def _embed(self, text: str) -> List[float]:
+        """Get the normalized embedding of a prompt."""
+        vector = self.embedding_function(text)
+        if asyncio.iscoroutine(vector):
+            vector = await vector
+        return _normalize(vector)
+    
+    async def lookup(
+        self,
+        messages: List[Message],
+        system_prompt: Optional[str],
+        context_id: str,
+        provider_id: str,
+        model_id: Optional[str],
+        options: CompletionOptions
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Look up a cached response for a request.
+        
+        Args:
+            messages: Conversation messages
+            system_prompt: Optional system instructions
+            context_id: Context ID of the request
+            provider_id: Provider ID
+            model_id: Model ID
+            options: Completion options
+        
+        Returns:
+            (response, lookup): the cached response fields or None, and
+            lookup state to pass to store() after a miss
+        """
+        if not self.is_cacheable(options):
+            self._stats["bypassed"] += 1
+            return None, {}
+        
+        self._stats["lookups"] += 1
+        key, scope = self.make_keys(messages, system_prompt, context_id, provider_id, model_id, options)
+        lookup = {"key": key, "scope": scope}
+        
+        entry = self.backend.get(key)
+        if entry is not None:
+            self._stats["exact_hits"] += 1
+            self._stats["latency_saved"] += entry.get("latency") or 0.0
+            return entry["response"], lookup
+        
+        if self._semantic is not None and messages:
+            vector = await self._embed(messages[-1].content)
+            lookup["embedding"] = vector
+            match, score = self._semantic.nearest(scope, vector)
+            if match is not None and score >= self.similarity_threshold:
+                entry = self.backend.get(match)
+                if entry is not None:
+                    self._stats["semantic_hits"] += 1
+                    self._stats["latency_saved"] += entry.get("latency") or 0.0
+                    logger.debug(f"Semantic cache hit (similarity {score:.3f})")
+                    return entry["response"], lookup
+                # Expired or evicted from the backend
+                self._semantic.remove(match)
+        
+        self._stats["misses"] += 1
+        return None, lookup
+    
+    def store(self, lookup: Dict[str, Any], response: Dict[str, Any], latency: float) -> None:
+        """
+        Cache a response after a miss.
+        
+        Args:
+            lookup: Lookup state returned by lookup()
+            response: Response fields to cache
+            latency: Seconds the request took, counted as saved on each hit
+        """
+        if not lookup:
+            return
+        
+        embedding = lookup.get("embedding")
+        self.backend.set(lookup["key"], {
+            "response": response,
+            "latency": latency,
+            "scope": lookup["scope"],
+            "embedding": embedding
+        })
+        if embedding is not None:
+            self._semantic.add(lookup["key"], lookup["scope"], embedding)
+        self._stats["stores"] += 1
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self.backend.clear()
+        if self._semantic is not None:
+            self._semantic.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with lookups, exact and semantic hits, misses,
+            bypassed requests, stores, hit rate, entries and seconds of
+            request latency saved by hits
+        """
+        hits = self._stats["exact_hits"] + self._stats["semantic_hits"]
+        lookups = self._stats["lookups"]
+        return dict(
+            self._stats,
+            hits=hits,
+            hit_rate=hits / lookups if lookups else 0.0,
+            entries=len(self.backend)
+        )
@@ -10,7 +10,6 @@ import time
 from typing import Dict, List, Optional, Any, Union, AsyncGenerator, Callable
 from urllib.parse import urljoin
 
-import aiohttp
 import requests
 
 from .exceptions import (
@@ -22,8 +21,10 @@ from .models import (
     Message, CompletionOptions, CompletionResponse, 
     StreamingChunk, AvailableProviders
 )
-from .adapters.rhetor import RhetorAdapter
+from .adapters.rhetor import RhetorAdapter, DEFAULT_LIMIT_PER_HOST, DEFAULT_KEEPALIVE_TIMEOUT
 from .adapters.fallback import LocalFallbackAdapter
+from .utils.limits import RequestLimiter
+from .cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +40,13 @@ class TektonLLMClient:
         timeout: int = 30,
         max_retries: int = 3,
         use_fallback: bool = True,
-        auth_token: Optional[str] = None
+        auth_token: Optional[str] = None,
+        max_connections: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        limiter: Optional[RequestLimiter] = None,
+        cache: Optional[ResponseCache] = None
     ):
         """
         Initialize the Tekton LLM client.
@@ -53,6 +60,13 @@ class TektonLLMClient:
             max_retries: Maximum number of retries for failed requests
             use_fallback: Whether to use local fallback when Rhetor is unavailable
             auth_token: Optional authentication token for Rhetor API
+            max_connections: Maximum pooled connections to Rhetor
+            keepalive_timeout: Seconds idle connections to Rhetor are kept open for reuse
+            max_concurrency: Maximum in-flight requests per provider/model (None for no limit)
+            requests_per_second: Maximum request rate per provider/model (None for no limit)
+            limiter: Request limiter to share with other clients, instead of
+                one built from max_concurrency and requests_per_second
+            cache: Optional response cache for non-streaming requests
         """
         # Load settings from environment variables with defaults
         self.component_id = component_id
@@ -63,15 +77,18 @@ class TektonLLMClient:
         self.max_retries = max_retries
         self.use_fallback = use_fallback
         self.auth_token = auth_token or os.environ.get("RHETOR_AUTH_TOKEN")
+        self.cache = cache
         
-        # Create HTTP session for reuse
-        self.session = None
-        
-        # Initialize adapters
+        # Initialize adapters; the Rhetor adapter owns the pooled HTTP session
         self.primary_adapter = RhetorAdapter(
             base_url=self.rhetor_url,
             auth_token=self.auth_token,
-            timeout=self.timeout
+            timeout=self.timeout,
+            limit_per_host=max_connections,
+            keepalive_timeout=keepalive_timeout,
+            max_concurrency=max_concurrency,
+            requests_per_second=requests_per_second,
+            limiter=limiter
         )
         
         # Initialize fallback adapter if enabled
@@ -97,10 +114,6 @@ class TektonLLMClient:
             True if initialization was successful, False otherwise
         """
         try:
-            # Initialize session if not already done
-            if self.session is None:
-                self.session = aiohttp.ClientSession()
-                
             # Initialize the primary adapter
             await self.primary_adapter.initialize()
             
@@ -129,10 +142,6 @@ class TektonLLMClient:
         Should be called when the client is no longer needed to ensure
         proper cleanup of resources.
         """
-        if self.session:
-            await self.session.close()
-            self.session = None
-            
         # Shutdown adapters
         await self.primary_adapter.shutdown()
         if self.fallback_adapter:
@@ -202,7 +211,7 @@ class TektonLLMClient:
             streaming: Whether to stream the response
             callback: Optional callback function for streaming response chunks
             context_id: Context ID for tracking conversation (defaults to component_id)
-            options: Additional options for the LLM
+            options: Additional options for the LLM ("cache": False skips the response cache)
             
         Returns:
             If streaming=False, returns a CompletionResponse
@@ -263,7 +272,8 @@ class TektonLLMClient:
                 context_id=context_id,
                 provider_id=provider_id,
                 model_id=model_id,
-                options=completion_options
+                options=completion_options,
+                use_cache=options.get("cache", True)
             )
     
     async def _complete_chat_response(
@@ -273,7 +283,8 @@ class TektonLLMClient:
         context_id: str,
         provider_id: str,
         model_id: Optional[str],
-        options: CompletionOptions
+        options: CompletionOptions,
+        use_cache: bool = True
     ) -> CompletionResponse:
         """
         Complete a chat response (non-streaming).
@@ -287,12 +298,32 @@ class TektonLLMClient:
             provider_id: Provider ID to use
             model_id: Model ID to use
             options: Completion options
+            use_cache: Whether to use the response cache, if configured
             
         Returns:
             CompletionResponse object
         """
         start_time = time.time()
         
+        # Serve repeated deterministic requests from the cache
+        lookup = {}
+        if self.cache is not None and use_cache:
+            try:
+                cached, lookup = await self.cache.lookup(
+                    messages, system_prompt, context_id, provider_id, model_id, options
+                )
+            except Exception as e:
+                logger.warning(f"Response cache lookup failed: {str(e)}")
+                cached, lookup = None, {}
+            
+            if cached is not None:
+                return CompletionResponse(
+                    **cached,
+                    context_id=context_id,
+                    latency=time.time() - start_time,
+                    cached=True
+                )
+        
         try:
             # Try the primary adapter first
             response = await self.primary_adapter.complete_chat(
@@ -308,7 +339,7 @@ class TektonLLMClient:
             latency = time.time() - start_time
             
             # Create the response object
-            return CompletionResponse(
+            completion = CompletionResponse(
                 content=response.get("content", ""),
                 model=response.get("model", model_id),
                 provider=response.get("provider", provider_id),
@@ -321,6 +352,11 @@ class TektonLLMClient:
                 error=response.get("error")
             )
             
+            if lookup and completion.error is None:
+                self._cache_response(lookup, completion)
+            
+            return completion
+            
         except Exception as e:
             logger.error(f"Error using primary adapter: {str(e)}")
             
@@ -362,6 +398,23 @@ class TektonLLMClient:
                 logger.error(f"Fallback adapter also failed: {str(fallback_error)}")
                 raise FallbackError(f"Primary error: {str(e)}. Fallback error: {str(fallback_error)}")
     
+    def _cache_response(self, lookup: Dict[str, Any], completion: CompletionResponse) -> None:
+        """
+        Store a successful primary response in the cache.
+        
+        Args:
+            lookup: Lookup state from the cache miss
+            completion: Response to store
+        """
+        try:
+            self.cache.store(
+                lookup,
+                completion.model_dump(include={"content", "model", "provider", "finish_reason", "usage", "timestamp"}),
+                completion.latency or 0.0
+            )
+        except Exception as e:
+            logger.warning(f"Response cache store failed: {str(e)}")
+    
     async def _stream_chat_response(
         self,
         messages: List[Message],
@@ -488,6 +541,20 @@ class TektonLLMClient:
                 
                 yield error_chunk
     
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection reuse, request queueing and cache statistics.
+        
+        Returns:
+            Dictionary with the Rhetor adapter's connection pool counters,
+            per provider/model request and queue-time statistics, and
+            response cache statistics if a cache is configured
+        """
+        stats = self.primary_adapter.get_stats()
+        if self.cache is not None:
+            stats["cache"] = self.cache.get_stats()
+        return stats
+    
     async def get_providers(self) -> AvailableProviders:
         """
         Get information about all available LLM providers.
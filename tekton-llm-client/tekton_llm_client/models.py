@@ -75,6 +75,7 @@ class CompletionResponse(BaseModel):
     timestamp: str
     latency: Optional[float] = None
     error: Optional[str] = None
+    cached: bool = False
     
     @property
     def success(self) -> bool:
@@ -35,10 +35,36 @@ class StreamHandler:
         """
         self.callback = callback
         self.buffer_size = buffer_size
-        self.buffer = ""
+        self._parts: List[str] = []
         self.done = False
         self.error = None
     
+    @property
+    def buffer(self) -> str:
+        """
+        Text collected so far.
+        
+        Chunks are appended to a list and joined on read, so collecting a
+        long stream costs linear rather than quadratic time.
+        """
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+    
+    @buffer.setter
+    def buffer(self, value: str) -> None:
+        self._parts = [value] if value else []
+    
+    def _tail(self, length: int) -> str:
+        """Last ``length`` characters of the buffer, without joining it."""
+        tail = []
+        for part in reversed(self._parts):
+            if length <= 0:
+                break
+            tail.append(part[-length:])
+            length -= len(part)
+        return "".join(reversed(tail))
+    
     async def process_stream(
         self, 
         stream: AsyncGenerator[StreamingChunk, None],
@@ -62,7 +88,7 @@ class StreamHandler:
                 content = transform(content)
                 
             # Add to buffer
-            self.buffer += content
+            self._parts.append(content)
             
             # Call callback if provided
             if self.callback:
@@ -123,7 +149,7 @@ class StreamHandler:
                 content = transform(content)
                 
             # Add to buffer
-            self.buffer += content
+            self._parts.append(content)
             
             # Get timestamp - handle both callable and static values
             timestamp = context.get("timestamp", datetime.now().isoformat())
@@ -181,24 +207,30 @@ class StreamHandler:
         Yields:
             Complete segments from the stream
         """
-        self.buffer = ""
+        self._parts = []
+        overlap = len(delimiter) - 1
         
         async for chunk in stream:
             content = chunk.chunk
-            self.buffer += content
             
-            # While we have delimiters in the buffer, yield segments
-            while delimiter in self.buffer:
-                idx = self.buffer.find(delimiter)
-                
-                if include_delimiter:
-                    segment = self.buffer[:idx + len(delimiter)]
-                else:
-                    segment = self.buffer[:idx]
-                    
-                self.buffer = self.buffer[idx + len(delimiter):]
+            # A new delimiter ends in this chunk, so only the chunk and the
+            # pending text it could straddle need searching
+            if delimiter in self._tail(overlap) + content:
+                text = self.buffer + content
+                segments = []
+                start = 0
+                idx = text.find(delimiter)
+                while idx != -1:
+                    end = idx + len(delimiter)
+                    segments.append(text[start:end if include_delimiter else idx])
+                    start = end
+                    idx = text.find(delimiter, start)
+                self.buffer = text[start:]
                 
-                yield segment
+                for segment in segments:
+                    yield segment
+            else:
+                self._parts.append(content)
                 
             # Check for completion or error
             if chunk.done:
@@ -210,7 +242,7 @@ class StreamHandler:
                 break
                 
         # Yield any remaining content in the buffer
-        if self.buffer:
+        if self._parts:
             yield self.buffer
     
     async def buffer_until(
@@ -235,25 +267,26 @@ class StreamHandler:
             Buffered content when condition is met or max size reached
         """
         max_buffer_size = max_buffer_size or self.buffer_size
-        self.buffer = ""
+        self._parts = []
         
         async for chunk in stream:
-            content = chunk.chunk
-            self.buffer += content
+            self._parts.append(chunk.chunk)
+            text = self.buffer
             
             # Check if condition is met or max size reached
-            if condition(self.buffer) or len(self.buffer) >= max_buffer_size:
-                yield self.buffer
-                self.buffer = ""
+            if condition(text) or len(text) >= max_buffer_size:
+                self._parts = []
+                yield text
                 
             # Check for completion or error
             if chunk.done:
                 self.done = True
                 
                 # Yield any remaining content
-                if self.buffer:
-                    yield self.buffer
-                    self.buffer = ""
+                if self._parts:
+                    text = self.buffer
+                    self._parts = []
+                    yield text
                     
             if chunk.error:
                 self.error = chunk.error
@@ -5,7 +5,8 @@ Utility functions for Tekton LLM Client.
 from .token_counter import (
     count_tokens, count_message_tokens, 
     truncate_text_to_token_limit, 
-    optimize_messages_for_token_limit
+    optimize_messages_for_token_limit,
+    count_tokens_batch, ConversationTokenCounter, TokenCountCache
 )
 
 from .streaming import (
@@ -16,9 +17,20 @@ from .retries import (
     RetryConfig, retry_async
 )
 
+from .limits import (
+    RequestLimiter, TokenBucket
+)
+
+from .sse import (
+    SSEParser, SSEEvent, iter_sse_events
+)
+
 __all__ = [
     'count_tokens', 'count_message_tokens', 
     'truncate_text_to_token_limit', 'optimize_messages_for_token_limit',
+    'count_tokens_batch', 'ConversationTokenCounter', 'TokenCountCache',
     'StreamProcessor', 'StreamBuffer',
-    'RetryConfig', 'retry_async'
+    'RetryConfig', 'retry_async',
+    'RequestLimiter', 'TokenBucket',
+    'SSEParser', 'SSEEvent', 'iter_sse_events'
 ]
\ No newline at end of file
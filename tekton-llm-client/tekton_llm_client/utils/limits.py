@@ -0,0 +1,255 @@
+"""
+Client-side request limiting for LLM calls.
+
+This module provides a token bucket and a request limiter that caps the
+number of in-flight requests and the request rate per provider/model, and
+records how long requests queue before they are sent.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+
+def limit_key(provider_id: str, model_id: Optional[str] = None) -> str:
+    """
+    Get the limiter key for a provider and model.
+    
+    Args:
+        provider_id: Provider ID
+        model_id: Optional model ID
+    
+    Returns:
+        "provider/model", or "provider" when no model is given
+    """
+    return f"{provider_id}/{model_id}" if model_id else provider_id
+
+
+class TokenBucket:
+    """
+    Token bucket allowing a sustained request rate with bursts.
+    
+    Tokens are reserved in call order, so waiters are served first come,
+    first served without holding a lock while they sleep.
+    """
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held (defaults to one second's worth, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = float(burst) if burst else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+    
+    def reserve(self) -> float:
+        """
+        Take a token.
+        
+        Returns:
+            Seconds until the token is available (0 if it is available now)
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class _Slot:
+    """Concurrency, rate and pause state for one limiter key."""
+    
+    def __init__(self, max_concurrency: Optional[int], requests_per_second: Optional[float], burst: Optional[int]):
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.bucket = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        self.paused_until = 0.0
+        self.stats = {
+            "requests": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "waiting": 0,
+            "max_waiting": 0,
+            "queued": 0,
+            "queue_time_total": 0.0,
+            "queue_time_max": 0.0,
+            "rate_limited": 0
+        }
+
+
+class RequestLimiter:
+    """
+    Limit concurrent requests and request rate per provider/model.
+    
+    Each key gets a semaphore capping in-flight requests and an optional
+    token bucket capping the request rate. Limits can be set for a provider
+    ("anthropic") or a single model ("anthropic/claude-3-opus"); a provider
+    limit is shared by all of its models. Keys without a specific limit use
+    the defaults, separately per provider/model.
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        limits: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
+        """
+        Initialize the request limiter.
+        
+        Args:
+            max_concurrency: Default maximum in-flight requests per key (None for no limit)
+            requests_per_second: Default sustained request rate per key (None for no limit)
+            burst: Default number of requests allowed at once above the rate
+            limits: Limits for specific providers or models, keyed by
+                "provider" or "provider/model", with the same keyword arguments
+        """
+        self.defaults = {
+            "max_concurrency": max_concurrency,
+            "requests_per_second": requests_per_second,
+            "burst": burst
+        }
+        self._limits: Dict[str, Dict[str, Any]] = {}
+        self._slots: Dict[str, _Slot] = {}
+        
+        for key, settings in (limits or {}).items():
+            self.set_limit(key, **settings)
+    
+    def set_limit(
+        self,
+        key: str,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None
+    ):
+        """
+        Set the limits for a provider or model.
+        
+        Requests already holding a slot keep it; new requests use the new limits.
+        
+        Args:
+            key: "provider" or "provider/model"
+            max_concurrency: Maximum in-flight requests (None for no limit)
+            requests_per_second: Sustained request rate (None for no limit)
+            burst: Number of requests allowed at once above the rate
+        """
+        self._limits[key] = {
+            "max_concurrency": max_concurrency,
+            "requests_per_second": requests_per_second,
+            "burst": burst
+        }
+        self._slots.pop(key, None)
+    
+    def _slot(self, provider_id: str, model_id: Optional[str]) -> _Slot:
+        """
+        Get the slot a request for a provider and model is counted against.
+        
+        Args:
+            provider_id: Provider ID
+            model_id: Optional model ID
+        
+        Returns:
+            The model's slot if it has its own limit, else the provider's if
+            it has one, else a default-limited slot for the model
+        """
+        key = limit_key(provider_id, model_id)
+        if key not in self._limits and provider_id in self._limits:
+            key = provider_id
+        
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = _Slot(**self._limits.get(key, self.defaults))
+            self._slots[key] = slot
+        return slot
+    
+    @asynccontextmanager
+    async def acquire(self, provider_id: str, model_id: Optional[str] = None) -> AsyncIterator[float]:
+        """
+        Wait for a request slot and hold it for the duration of the block.
+        
+        Args:
+            provider_id: Provider ID
+            model_id: Optional model ID
+        
+        Yields:
+            Seconds the request waited in the queue
+        """
+        slot = self._slot(provider_id, model_id)
+        stats = slot.stats
+        start = time.monotonic()
+        
+        stats["waiting"] += 1
+        stats["max_waiting"] = max(stats["max_waiting"], stats["waiting"])
+        try:
+            if slot.semaphore:
+                await slot.semaphore.acquire()
+            try:
+                delay = slot.bucket.reserve() if slot.bucket else 0.0
+                delay = max(delay, slot.paused_until - time.monotonic())
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            except BaseException:
+                if slot.semaphore:
+                    slot.semaphore.release()
+                raise
+        finally:
+            stats["waiting"] -= 1
+        
+        queue_time = time.monotonic() - start
+        stats["requests"] += 1
+        stats["queue_time_total"] += queue_time
+        stats["queue_time_max"] = max(stats["queue_time_max"], queue_time)
+        if queue_time > 0.001:
+            stats["queued"] += 1
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        
+        try:
+            yield queue_time
+        finally:
+            stats["in_flight"] -= 1
+            if slot.semaphore:
+                slot.semaphore.release()
+    
+    def pause(self, provider_id: str, model_id: Optional[str] = None, seconds: float = 1.0):
+        """
+        Hold back new requests for a key, e.g. after the service returned 429.
+        
+        Args:
+            provider_id: Provider ID
+            model_id: Optional model ID
+            seconds: Seconds to hold requests back
+        """
+        slot = self._slot(provider_id, model_id)
+        slot.paused_until = max(slot.paused_until, time.monotonic() + seconds)
+        slot.stats["rate_limited"] += 1
+        logger.warning(f"Rate limited on {limit_key(provider_id, model_id)}, pausing for {seconds:.1f}s")
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get request and queueing statistics per key.
+        
+        Returns:
+            Dictionary mapping keys to request counts, concurrency and
+            queue time (total, average and maximum, in seconds)
+        """
+        result = {}
+        for key, slot in self._slots.items():
+            stats = slot.stats
+            result[key] = dict(
+                stats,
+                max_concurrency=slot.max_concurrency,
+                queue_time_avg=stats["queue_time_total"] / stats["requests"] if stats["requests"] else 0.0
+            )
+        return result
@@ -0,0 +1,271 @@
+"""
+Incremental Server-Sent Events parser.
+
+This module frames SSE events from arbitrary network chunks: events may be
+split across chunks, several events may arrive in one chunk, and an event
+may carry several data lines. Chunks are appended to one bytearray and
+events are sliced out of it through a memoryview, so the stream is neither
+decoded nor split into per-line strings before an event is complete.
+"""
+
+import json
+import logging
+from typing import Any, AsyncGenerator, AsyncIterable, List, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def json_loads(data: Union[str, BytesLike]) -> Any:
+    """
+    Decode JSON, with orjson when it is installed.
+    
+    Input orjson rejects but the standard library accepts (NaN, very large
+    integers) is decoded with the standard library.
+    
+    Args:
+        data: JSON text or UTF-8 bytes
+    
+    Returns:
+        Decoded value
+    
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if not isinstance(data, str):
+        # SSE is always UTF-8; skip json's encoding detection
+        data = str(data, "utf-8")
+    return json.loads(data)
+
+
+class SSEEvent:
+    """A Server-Sent Event received from a stream."""
+    
+    __slots__ = ("raw", "event", "id", "retry")
+    
+    def __init__(
+        self,
+        raw: bytes,
+        event: Optional[str] = None,
+        id: Optional[str] = None,
+        retry: Optional[int] = None
+    ):
+        """
+        Initialize the event.
+        
+        Args:
+            raw: UTF-8 data of the event, data lines joined with newlines
+            event: Event type, if the event set one
+            id: Last event ID seen on the stream
+            retry: Reconnection time in milliseconds, if the event set one
+        """
+        self.raw = raw
+        self.event = event
+        self.id = id
+        self.retry = retry
+    
+    @property
+    def data(self) -> str:
+        """The event data as text."""
+        return self.raw.decode("utf-8")
+    
+    def json(self) -> Any:
+        """
+        Decode the event data as JSON.
+        
+        Returns:
+            Decoded value
+        
+        Raises:
+            ValueError: If the data is not valid JSON
+        """
+        return json_loads(self.raw)
+    
+    def __repr__(self) -> str:
+        return f"SSEEvent(raw={self.raw!r}, event={self.event!r}, id={self.id!r})"
+
+
+class SSEParser:
+    """
+    Incremental parser turning SSE byte chunks into events.
+    
+    Lines may end in LF, CRLF or CR, including a CRLF split across chunks.
+    Comment lines and unknown fields are ignored, and events without data
+    are not dispatched, as in the SSE specification.
+    """
+    
+    def __init__(self):
+        """Initialize the parser."""
+        self._buffer = bytearray()
+        self._scan = 0
+        self._pending_cr = False
+        self.last_event_id: Optional[str] = None
+    
+    def feed(self, chunk: BytesLike) -> List[SSEEvent]:
+        """
+        Add bytes from the stream.
+        
+        Args:
+            chunk: Next chunk of the stream
+        
+        Returns:
+            Events completed by this chunk, in stream order
+        """
+        if self._pending_cr or b"\r" in chunk:
+            chunk = self._normalize_newlines(chunk)
+        
+        buffer = self._buffer
+        buffer += chunk
+        events = []
+        start = 0
+        
+        with memoryview(buffer) as view:
+            while True:
+                end = buffer.find(b"\n\n", self._scan)
+                if end < 0:
+                    break
+                event = self._parse_event(buffer, view, start, end)
+                if event is not None:
+                    events.append(event)
+                start = self._scan = end + 2
+        
+        if start:
+            del buffer[:start]
+        # An event boundary may straddle the next chunk; rescan its first newline
+        self._scan = max(0, len(buffer) - 1)
+        return events
+    
+    def flush(self) -> List[SSEEvent]:
+        """
+        End the stream, dispatching a final event that lacks its blank line.
+        
+        Returns:
+            The final event, if any
+        """
+        buffer = self._buffer
+        self._pending_cr = False
+        events = []
+        
+        if buffer.strip(b"\n"):
+            end = len(buffer.rstrip(b"\n"))
+            with memoryview(buffer) as view:
+                event = self._parse_event(buffer, view, 0, end)
+            if event is not None:
+                events.append(event)
+        
+        buffer.clear()
+        self._scan = 0
+        return events
+    
+    def _normalize_newlines(self, chunk: BytesLike) -> bytes:
+        """
+        Convert CRLF and CR line endings to LF.
+        
+        A trailing CR is held back until the next chunk shows whether it
+        starts a CRLF pair.
+        
+        Args:
+            chunk: Chunk to convert
+        
+        Returns:
+            Converted chunk
+        """
+        chunk = bytes(chunk)
+        if self._pending_cr:
+            chunk = b"\r" + chunk
+            self._pending_cr = False
+        if chunk.endswith(b"\r"):
+            chunk = chunk[:-1]
+            self._pending_cr = True
+        return chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    
+    def _parse_event(self, buffer: bytearray, view: memoryview, start: int, end: int) -> Optional[SSEEvent]:
+        """
+        Parse the lines of one event.
+        
+        Args:
+            buffer: Stream buffer
+            view: Memoryview of the buffer
+            start: Offset of the event's first line
+            end: Offset of the newline ending the event's last line
+        
+        Returns:
+            The event, or None if it has no data
+        """
+        # Fast path: the usual token event is a single "data: " line
+        if buffer.startswith(b"data: ", start, end) and buffer.find(b"\n", start, end) < 0:
+            return SSEEvent(bytes(view[start + 6:end]), None, self.last_event_id)
+        
+        data = []
+        event_type = None
+        retry = None
+        position = start
+        
+        while position < end:
+            line_end = buffer.find(b"\n", position, end)
+            if line_end < 0:
+                line_end = end
+            
+            if buffer.startswith(b"data:", position, line_end):
+                value_start = position + 5
+                if value_start < line_end and buffer[value_start] == 0x20:
+                    value_start += 1
+                data.append(view[value_start:line_end])
+            elif line_end > position and buffer[position] != 0x3A:
+                colon = buffer.find(b":", position, line_end)
+                if colon < 0:
+                    name, value_start = view[position:line_end], line_end
+                else:
+                    name, value_start = view[position:colon], colon + 1
+                    if value_start < line_end and buffer[value_start] == 0x20:
+                        value_start += 1
+                value = view[value_start:line_end]
+                
+                if name == b"data":
+                    data.append(value)
+                elif name == b"event":
+                    event_type = str(value, "utf-8")
+                elif name == b"id":
+                    if 0 not in value:
+                        self.last_event_id = str(value, "utf-8")
+                elif name == b"retry":
+                    if bytes(value).isdigit():
+                        retry = int(bytes(value))
+            
+            position = line_end + 1
+        
+        if not data:
+            return None
+        raw = bytes(data[0]) if len(data) == 1 else b"\n".join(data)
+        return SSEEvent(raw, event_type, self.last_event_id, retry)
+
+
+async def iter_sse_events(chunks: AsyncIterable[BytesLike]) -> AsyncGenerator[SSEEvent, None]:
+    """
+    Parse events from an asynchronous byte stream.
+    
+    Args:
+        chunks: Async iterable of byte chunks, e.g. aiohttp's
+            response.content.iter_any()
+    
+    Yields:
+        SSEEvent objects
+    """
+    parser = SSEParser()
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
+    for event in parser.flush():
+        yield event
@@ -20,7 +20,7 @@ class StreamProcessor:
             callback: Optional callback function for each chunk
         """
         self.callback = callback
-        self.buffer = ""
+        self._parts: List[str] = []
         self.chunks = []
         self.is_complete = False
         self.has_error = False
@@ -37,7 +37,7 @@ class StreamProcessor:
         self.chunks.append(chunk)
         
         # Add to buffer
-        self.buffer += chunk.chunk
+        self._parts.append(chunk.chunk)
         
         # Check for completion
         if chunk.done:
@@ -52,6 +52,17 @@ class StreamProcessor:
         if self.callback:
             self.callback(chunk)
     
+    @property
+    def buffer(self) -> str:
+        """Text collected so far, joined from the received chunks on read."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+    
+    @buffer.setter
+    def buffer(self, value: str) -> None:
+        self._parts = [value] if value else []
+    
     def get_result(self) -> str:
         """
         Get the complete result as a string.
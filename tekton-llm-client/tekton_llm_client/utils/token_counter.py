@@ -1,18 +1,45 @@
 """
 Utility functions for token counting.
+
+Encoders are resolved once per model, and token counts are kept in an LRU
+keyed by encoding and a hash of the text, so recounting the same history
+(as context-window trimming does) only hashes it. Batches of uncached
+texts are encoded in parallel threads with tiktoken's encode_batch.
 """
 
+import os
 import re
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 import tiktoken
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Token counts kept in the LRU
+DEFAULT_CACHE_SIZE = 4096
+
+# Threads used to encode a batch
+DEFAULT_NUM_THREADS = min(8, os.cpu_count() or 1)
+
+# Uncached texts in a batch below which encoding threads are not worth starting
+BATCH_THRESHOLD = 8
+
+# Approximate format overhead per message (role, metadata) and per conversation
+MESSAGE_OVERHEAD = 4
+CONVERSATION_OVERHEAD = 3
+
+@lru_cache(maxsize=64)
 def get_encoder(model: str) -> Any:
     """
     Get the appropriate tokenizer for a model.
     
+    Encoders are memoized per model, including failures, so an encoding
+    that cannot be loaded is not retried on every count.
+    
     Args:
         model: Model name or ID
         
@@ -35,6 +62,106 @@ def get_encoder(model: str) -> Any:
         # Fallback to simple estimation
         return None
 
+def _estimate_tokens(text: str) -> int:
+    """Simple approximation (about 4 chars per token)."""
+    return len(text) // 4 + 1
+
+class TokenCountCache:
+    """
+    Thread-safe LRU of token counts keyed by encoding and content hash.
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of counts kept
+        """
+        self.max_entries = max_entries
+        self._counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(encoding: str, text: str) -> Tuple[str, bytes]:
+        """
+        Build the cache key of a text.
+        
+        Args:
+            encoding: Encoding name
+            text: Text to count
+            
+        Returns:
+            (encoding, digest of the text)
+        """
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return encoding, digest
+    
+    def get(self, key: Tuple[str, bytes]) -> Optional[int]:
+        """
+        Get a cached count and mark it recently used.
+        
+        Args:
+            key: Key from key()
+            
+        Returns:
+            Token count, or None if not cached
+        """
+        with self._lock:
+            count = self._counts.get(key)
+            if count is None:
+                self.misses += 1
+                return None
+            self._counts.move_to_end(key)
+            self.hits += 1
+            return count
+    
+    def set(self, key: Tuple[str, bytes], count: int) -> None:
+        """
+        Cache a count, evicting the least recently used beyond max_entries.
+        
+        Args:
+            key: Key from key()
+            count: Token count
+        """
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.max_entries:
+                self._counts.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached counts and reset statistics."""
+        with self._lock:
+            self._counts.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entries, hits, misses and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._counts),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+    
+    def __len__(self) -> int:
+        """Number of cached counts."""
+        return len(self._counts)
+
+# Shared by all counting functions
+token_count_cache = TokenCountCache()
+
 def count_tokens(text: str, model: str = "gpt-4") -> int:
     """
     Count the number of tokens in a text string.
@@ -49,16 +176,74 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
     encoder = get_encoder(model)
     
     if encoder:
+        key = token_count_cache.key(encoder.name, text)
+        count = token_count_cache.get(key)
+        if count is not None:
+            return count
+        
         try:
             # Use the encoder
-            return len(encoder.encode(text))
+            count = len(encoder.encode(text))
         except Exception as e:
             logger.warning(f"Error encoding text: {str(e)}")
             # Fall back to simple estimation
-            pass
+            return _estimate_tokens(text)
+        
+        token_count_cache.set(key, count)
+        return count
     
-    # Simple approximation (about 4 chars per token)
-    return len(text) // 4 + 1
+    return _estimate_tokens(text)
+
+def count_tokens_batch(
+    texts: List[str],
+    model: str = "gpt-4",
+    num_threads: int = DEFAULT_NUM_THREADS
+) -> List[int]:
+    """
+    Count the tokens in several texts at once.
+    
+    Cached counts are reused, repeated texts are encoded once, and the
+    remaining texts are encoded in parallel threads when there are at
+    least BATCH_THRESHOLD of them.
+    
+    Args:
+        texts: Texts to count tokens in
+        model: Model name for tokenization
+        num_threads: Threads used to encode uncached texts
+        
+    Returns:
+        Number of tokens of each text, in order
+    """
+    encoder = get_encoder(model)
+    if not encoder:
+        return [_estimate_tokens(text) for text in texts]
+    
+    counts: List[Optional[int]] = [None] * len(texts)
+    missing: Dict[Tuple[str, bytes], List[int]] = {}
+    for i, text in enumerate(texts):
+        key = token_count_cache.key(encoder.name, text)
+        counts[i] = token_count_cache.get(key)
+        if counts[i] is None:
+            missing.setdefault(key, []).append(i)
+    
+    if missing:
+        pending = [texts[indices[0]] for indices in missing.values()]
+        try:
+            if len(pending) >= BATCH_THRESHOLD and num_threads > 1:
+                encoded = [len(tokens) for tokens in encoder.encode_batch(pending, num_threads=num_threads)]
+            else:
+                encoded = [len(encoder.encode(text)) for text in pending]
+        except Exception as e:
+            logger.warning(f"Error encoding batch: {str(e)}")
+            # Count individually so one bad text only affects its own count
+            return [count if count is not None else count_tokens(text, model) for text, count in zip(texts, counts)]
+        
+        for (key, indices), count in zip(missing.items(), encoded):
+            token_count_cache.set(key, count)
+            for i in indices:
+                counts[i] = count
+    
+    return counts
 
 def count_message_tokens(messages: List[Dict[str, str]], model: str = "gpt-4") -> Dict[str, int]:
     """
@@ -71,21 +256,12 @@ def count_message_tokens(messages: List[Dict[str, str]], model: str = "gpt-4") -
     Returns:
         Dictionary with token counts for prompt and total
     """
-    total_tokens = 0
+    # Count tokens in message content
+    content_tokens = count_tokens_batch([message.get("content", "") for message in messages], model)
     
-    for message in messages:
-        # Count tokens in message content
-        content_tokens = count_tokens(message.get("content", ""), model)
-        
-        # Add overhead for message format (role, metadata)
-        # This is an approximation that varies by model
-        overhead = 4  # Approximation for message overhead
-        
-        total_tokens += content_tokens + overhead
-    
-    # Add conversation overhead
-    # (varies by model but typically 2-3 tokens)
-    total_tokens += 3
+    # Add overhead for message format (role, metadata) and the conversation
+    # This is an approximation that varies by model
+    total_tokens = sum(content_tokens) + MESSAGE_OVERHEAD * len(messages) + CONVERSATION_OVERHEAD
     
     return {
         "prompt_tokens": total_tokens,
@@ -147,28 +323,26 @@ def optimize_messages_for_token_limit(
         Optimized list of messages
     """
     # Count tokens in all messages
-    messages_with_tokens = []
-    total_tokens = 0
     system_prompt = None
+    other_messages = []
     
     for msg in messages:
         # Extract system prompt if needed
         if keep_system_prompt and msg.get("role") == "system":
             system_prompt = msg
             continue
-            
-        tokens = count_tokens(msg.get("content", ""), model)
-        messages_with_tokens.append({
-            "message": msg,
-            "tokens": tokens
-        })
-        total_tokens += tokens
-    
-    # Add system prompt tokens if present
-    system_tokens = 0
-    if system_prompt:
-        system_tokens = count_tokens(system_prompt.get("content", ""), model)
-        total_tokens += system_tokens
+        other_messages.append(msg)
+    
+    counted = other_messages + ([system_prompt] if system_prompt else [])
+    counts = count_tokens_batch([msg.get("content", "") for msg in counted], model)
+    messages_with_tokens = [
+        {"message": msg, "tokens": tokens}
+        for msg, tokens in zip(other_messages, counts)
+    ]
+    total_tokens = sum(counts)
+    
+    # System prompt tokens, if present, are counted last
+    system_tokens = counts[-1] if system_prompt else 0
     
     # If messages fit within limit, return as is
     if total_tokens <= max_tokens:
@@ -197,9 +371,78 @@ def optimize_messages_for_token_limit(
             break
     
     # Restore original order (oldest first)
+    positions = {id(m): i for i, m in enumerate(messages)}
     optimized_messages.sort(key=lambda m: (
         0 if m.get("role") == "system" else
-        messages.index(m) if m in messages else 999
+        positions.get(id(m), 999)
     ))
     
-    return optimized_messages
\ No newline at end of file
+    return optimized_messages
+
+class ConversationTokenCounter:
+    """
+    Running token count of an append-only conversation.
+    
+    Each call to count() compares the conversation with the one counted
+    last time and only encodes messages past the common prefix, so a
+    growing chat history is counted in time proportional to what was
+    appended. Counts match count_message_tokens().
+    """
+    
+    def __init__(self, model: str = "gpt-4"):
+        """
+        Initialize the counter.
+        
+        Args:
+            model: Model name for tokenization
+        """
+        self.model = model
+        self._contents: List[str] = []
+        self._counts: List[int] = []
+        self._content_tokens = 0
+    
+    @property
+    def message_tokens(self) -> List[int]:
+        """Content tokens of each message counted so far."""
+        return list(self._counts)
+    
+    def count(self, messages: List[Dict[str, str]]) -> Dict[str, int]:
+        """
+        Count tokens in a conversation, reusing counts of unchanged messages.
+        
+        Args:
+            messages: List of message dictionaries with "role" and "content"
+            
+        Returns:
+            Dictionary with token counts for prompt and total
+        """
+        kept = 0
+        for previous, message in zip(self._contents, messages):
+            if previous != message.get("content", ""):
+                break
+            kept += 1
+        
+        # Earlier messages changed: recount from the first difference
+        if kept < len(self._contents):
+            self._content_tokens -= sum(self._counts[kept:])
+            del self._contents[kept:]
+            del self._counts[kept:]
+        
+        appended = [message.get("content", "") for message in messages[kept:]]
+        if appended:
+            counts = count_tokens_batch(appended, self.model)
+            self._contents.extend(appended)
+            self._counts.extend(counts)
+            self._content_tokens += sum(counts)
+        
+        total_tokens = self._content_tokens + MESSAGE_OVERHEAD * len(messages) + CONVERSATION_OVERHEAD
+        return {
+            "prompt_tokens": total_tokens,
+            "total_tokens": total_tokens
+        }
+    
+    def reset(self) -> None:
+        """Forget the counted conversation."""
+        self._contents.clear()
+        self._counts.clear()
+        self._content_tokens = 0
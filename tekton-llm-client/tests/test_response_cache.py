@@ -0,0 +1,128 @@
+"""
+Tests for the exact-match and semantic response cache.
+"""
+
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tekton_llm_client import TektonLLMClient
+from tekton_llm_client.cache import ResponseCache, MemoryCacheBackend, DiskCacheBackend
+
+DETERMINISTIC = {"temperature": 0}
+
+
+def response_for(messages, **kwargs):
+    return {
+        "content": f"answer to {messages[-1].content}",
+        "model": kwargs.get("model_id") or "claude",
+        "provider": kwargs.get("provider_id"),
+        "timestamp": "2024-01-01T00:00:00Z"
+    }
+
+
+def make_client(cache):
+    client = TektonLLMClient(component_id="test", rhetor_url="http://localhost:1", use_fallback=False, cache=cache)
+
+    async def complete_chat(messages, **kwargs):
+        return response_for(messages, **kwargs)
+
+    client.primary_adapter.complete_chat = AsyncMock(side_effect=complete_chat)
+    return client
+
+
+def embed(text):
+    """Bag-of-words embedding over a tiny vocabulary"""
+    vocabulary = ["classify", "sentiment", "review", "great", "terrible", "product", "weather"]
+    words = text.lower().replace(":", " ").split()
+    return [float(words.count(word)) for word in vocabulary]
+
+
+@pytest.mark.asyncio
+async def test_exact_hits_and_bypass():
+    """Test identical deterministic requests hit, while sampled or opted-out requests bypass the cache."""
+    client = make_client(ResponseCache())
+
+    first = await client.generate_text("Classify: great product", options=DETERMINISTIC)
+    second = await client.generate_text("Classify: great product", options=DETERMINISTIC)
+    other_model = await client.generate_text("Classify: great product", options={"temperature": 0, "model": "opus"})
+    await client.generate_text("Classify: great product")
+    await client.generate_text("Classify: great product", options={"temperature": 0, "cache": False})
+
+    assert client.primary_adapter.complete_chat.call_count == 4
+    assert not first.cached and second.cached
+    assert second.content == first.content and second.model == first.model
+    assert other_model.model == "opus" and not other_model.cached
+    stats = client.get_stats()["cache"]
+    assert stats["exact_hits"] == 1 and stats["misses"] == 2 and stats["bypassed"] == 1
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    """Test responses carrying an error are served once and not stored."""
+    client = make_client(ResponseCache())
+    client.primary_adapter.complete_chat.side_effect = None
+    client.primary_adapter.complete_chat.return_value = {"content": "", "model": "claude", "error": "overloaded"}
+
+    await client.generate_text("hello", options=DETERMINISTIC)
+    await client.generate_text("hello", options=DETERMINISTIC)
+
+    assert client.primary_adapter.complete_chat.call_count == 2
+    assert client.get_stats()["cache"]["stores"] == 0
+
+
+@pytest.mark.asyncio
+async def test_semantic_hits():
+    """Test a similar final prompt hits within the same scope, but not for another model or a dissimilar prompt."""
+    client = make_client(ResponseCache(embedding_function=embed, similarity_threshold=0.9))
+
+    await client.generate_text("Classify sentiment: great product review", options=DETERMINISTIC)
+    similar = await client.generate_text("classify sentiment review: great product", options=DETERMINISTIC)
+    other_model = await client.generate_text("classify sentiment review: great product",
+                                             options={"temperature": 0, "model": "opus"})
+    different = await client.generate_text("classify weather", options=DETERMINISTIC)
+
+    assert similar.cached and similar.content == "answer to Classify sentiment: great product review"
+    assert not other_model.cached and not different.cached
+    stats = client.get_stats()["cache"]
+    assert stats["semantic_hits"] == 1 and stats["misses"] == 3
+
+
+def test_memory_backend_lru_and_ttl():
+    """Test the least recently used entry is evicted and entries expire."""
+    backend = MemoryCacheBackend(max_entries=2, ttl=0.05)
+    backend.set("a", {"v": 1})
+    backend.set("b", {"v": 2})
+    backend.get("a")
+    backend.set("c", {"v": 3})
+    assert backend.get("b") is None and backend.get("a") == {"v": 1}
+
+    time.sleep(0.06)
+    assert backend.get("a") is None and list(backend.items()) == []
+
+
+@pytest.mark.asyncio
+async def test_disk_backend_persists(tmp_path):
+    """Test cached responses and the semantic index survive a restart, with LRU eviction on disk."""
+    path = str(tmp_path / "cache" / "responses.db")
+    client = make_client(ResponseCache(DiskCacheBackend(path), embedding_function=embed))
+    await client.generate_text("Classify sentiment: terrible product", options=DETERMINISTIC)
+    client.cache.backend.close()
+
+    client = make_client(ResponseCache(DiskCacheBackend(path), embedding_function=embed))
+    exact = await client.generate_text("Classify sentiment: terrible product", options=DETERMINISTIC)
+    similar = await client.generate_text("classify terrible product sentiment", options=DETERMINISTIC)
+    assert exact.cached and similar.cached
+    assert client.primary_adapter.complete_chat.call_count == 0
+    client.cache.backend.close()
+
+    backend = DiskCacheBackend(path, max_entries=2, ttl=None)
+    backend.set("a", {"v": 1})
+    backend.set("b", {"v": 2})
+    backend.get("a")
+    backend.set("c", {"v": 3})
+    assert len(backend) == 2
+    assert backend.get("a") == {"v": 1} and backend.get("c") == {"v": 3}
+    backend.close()
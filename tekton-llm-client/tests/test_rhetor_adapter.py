@@ -0,0 +1,170 @@
+"""
+Tests for connection reuse and request limiting in the Rhetor adapter,
+against a local stub Rhetor server.
+"""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from tekton_llm_client import TektonLLMClient
+from tekton_llm_client.exceptions import RateLimitError
+from tekton_llm_client.utils.limits import RequestLimiter, TokenBucket
+
+
+class StubRhetor:
+    """Minimal Rhetor API that tracks concurrent chat requests"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+        self.rate_limit_next = 0
+        self.url = None
+
+    async def health(self, request):
+        return web.json_response({"status": "ok"})
+
+    async def providers(self, request):
+        return web.json_response({
+            "providers": {"anthropic": {"default_model": "claude"}},
+            "default_provider": "anthropic",
+            "default_model": "claude"
+        })
+
+    async def chat(self, request):
+        payload = await request.json()
+        self.requests += 1
+        if self.rate_limit_next:
+            self.rate_limit_next -= 1
+            return web.json_response({"error": "slow down"}, status=429, headers={"Retry-After": "0.1"})
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return web.json_response({
+            "content": payload["messages"][-1]["content"],
+            "model": payload.get("model_id", "claude"),
+            "provider": payload["provider_id"]
+        })
+
+    async def stream(self, request):
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        body = "".join(f"data: {json.dumps({'chunk': word})}\n\n" for word in ("a", "b")).encode()
+        body += b"data: [DONE]\n\n"
+        # Split events across writes
+        for i in range(0, len(body), 7):
+            await response.write(body[i:i + 7])
+            await asyncio.sleep(0)
+        return response
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/api/v1/health", self.health)
+        app.router.add_get("/api/v1/providers", self.providers)
+        app.router.add_post("/api/v1/chat", self.chat)
+        app.router.add_post("/api/v1/chat/stream", self.stream)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def rhetor():
+    """Start a stub Rhetor server for the test."""
+    server = StubRhetor()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+async def make_client(rhetor, **kwargs):
+    client = TektonLLMClient(component_id="test", rhetor_url=rhetor.url, use_fallback=False, **kwargs)
+    await client.initialize()
+    return client
+
+
+def test_token_bucket():
+    """Test the bucket allows a burst, then spaces tokens by the rate."""
+    bucket = TokenBucket(rate=10, burst=2)
+    waits = [bucket.reserve() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_limit_keys():
+    """Test provider limits are shared by the provider's models, and models default separately."""
+    limiter = RequestLimiter(max_concurrency=8, limits={"openai": {"max_concurrency": 2}})
+    assert limiter._slot("openai", "gpt-4") is limiter._slot("openai", "gpt-4o")
+    assert limiter._slot("anthropic", "a") is not limiter._slot("anthropic", "b")
+    assert limiter._slot("anthropic", "a").max_concurrency == 8
+
+    limiter.set_limit("openai/gpt-4", max_concurrency=1)
+    assert limiter._slot("openai", "gpt-4").max_concurrency == 1
+    assert limiter._slot("openai", "gpt-4o").max_concurrency == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_connection_reuse(rhetor):
+    """Test a burst is capped per provider/model, queue time is recorded and connections are reused."""
+    client = await make_client(rhetor, max_concurrency=2)
+    try:
+        responses = await asyncio.gather(*(client.generate_text(f"hi {i}") for i in range(6)))
+        await client.generate_text("again")
+        stats = client.get_stats()
+    finally:
+        await client.shutdown()
+
+    assert [response.content for response in responses] == [f"hi {i}" for i in range(6)]
+    assert rhetor.peak == 2
+    limits = stats["limits"]["anthropic/claude"]
+    assert limits["requests"] == 7 and limits["in_flight"] == 0
+    assert limits["queued"] == 4 and limits["queue_time_max"] >= 0.09
+    connections = stats["connections"]
+    assert connections["connections_created"] <= 3
+    assert connections["connections_reused"] >= 5
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_pauses_requests(rhetor):
+    """Test a 429 raises RateLimitError and holds back the next request for Retry-After."""
+    client = await make_client(rhetor)
+    rhetor.rate_limit_next = 1
+    try:
+        with pytest.raises(RateLimitError):
+            await client.generate_text("first")
+        response = await client.generate_text("second")
+        stats = client.get_stats()["limits"]["anthropic/claude"]
+    finally:
+        await client.shutdown()
+
+    assert response.content == "second"
+    assert stats["rate_limited"] == 1
+    assert stats["queue_time_max"] >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_stream_holds_slot(rhetor):
+    """Test a streaming request counts against the limit until the stream ends."""
+    client = await make_client(rhetor, max_concurrency=1)
+    try:
+        stream = await client.generate_text("stream", streaming=True)
+        chunks = [chunk.chunk async for chunk in stream]
+        stats = client.get_stats()["limits"]["anthropic/claude"]
+    finally:
+        await client.shutdown()
+
+    assert chunks == ["a", "b", ""]
+    assert stats["requests"] == 1 and stats["in_flight"] == 0
@@ -0,0 +1,126 @@
+"""
+Tests for incremental SSE parsing and stream accumulation.
+"""
+
+import asyncio
+
+import pytest
+
+from tekton_llm_client.models import StreamingChunk
+from tekton_llm_client.response_handlers import StreamHandler
+from tekton_llm_client.utils import SSEParser, StreamProcessor, iter_sse_events
+
+STREAM = (
+    b": keep-alive\r\n"
+    b"retry: 3000\r\n"
+    b"event: token\r\n"
+    b"id: 1\r\n"
+    b"data: {\"chunk\": \"Hel\"}\r\n"
+    b"\r\n"
+    b"data: {\"chunk\":\n"
+    b"data:  \"lo\"}\n"
+    b"\n"
+    b"id: 2\n"
+    b"\n"
+    b"data: [DONE]\n"
+    b"\n"
+)
+
+
+def parse(chunks):
+    parser = SSEParser()
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    events.extend(parser.flush())
+    return [(event.raw, event.event, event.id, event.retry) for event in events]
+
+
+EXPECTED = [
+    (b'{"chunk": "Hel"}', "token", "1", 3000),
+    (b'{"chunk":\n "lo"}', None, "1", None),
+    (b"[DONE]", None, "2", None),
+]
+
+
+def test_parse_whole_stream():
+    """Test fields, comments, CRLF and multi-line data in one chunk."""
+    assert parse([STREAM]) == EXPECTED
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 16])
+def test_parse_split_stream(size):
+    """Test events split across chunks at every position, including inside CRLF."""
+    chunks = [STREAM[i:i + size] for i in range(0, len(STREAM), size)]
+    assert parse(chunks) == EXPECTED
+
+
+def test_event_json_and_unterminated_tail():
+    """Test JSON decoding of multi-line data and that flush dispatches a final event without its blank line."""
+    parser = SSEParser()
+    events = parser.feed(b'data: {"a":\ndata: [1, 2]}\n\ndata: {"b": 3}')
+    assert [event.json() for event in events] == [{"a": [1, 2]}]
+    assert [event.data for event in parser.flush()] == ['{"b": 3}']
+
+
+def test_iter_sse_events():
+    """Test parsing an async byte stream."""
+    async def chunks():
+        for i in range(0, len(STREAM), 4):
+            yield STREAM[i:i + 4]
+
+    async def collect():
+        return [event.raw async for event in iter_sse_events(chunks())]
+
+    assert asyncio.run(collect()) == [raw for raw, _, _, _ in EXPECTED]
+
+
+def test_stream_accumulation():
+    """Test stream handlers collect chunks in order and expose them as one buffer."""
+    words = [f"w{i} " for i in range(1000)]
+
+    async def stream():
+        for i, word in enumerate(words):
+            yield StreamingChunk(chunk=word, context_id="c", model="m", provider="p",
+                                 timestamp="", done=i == len(words) - 1)
+
+    handler = StreamHandler()
+    assert asyncio.run(handler.process_stream(stream())) == "".join(words)
+    assert handler.buffer == "".join(words) and handler.done
+
+    processor = StreamProcessor()
+    assert asyncio.run(processor.process_stream(stream())) == "".join(words)
+    assert len(processor.get_chunks()) == 1000
+
+    processor.buffer = ""
+    assert processor.get_result() == ""
+
+
+def test_stream_segments():
+    """Test segment helpers split on delimiters that straddle chunks and flush the remainder."""
+    pieces = ["item 1", "<", "|>item 2<|", ">item", " 3<|><|>tail"]
+
+    def stream():
+        async def generate():
+            for i, piece in enumerate(pieces):
+                yield StreamingChunk(chunk=piece, context_id="c", model="m", provider="p",
+                                     timestamp="", done=i == len(pieces) - 1)
+        return generate()
+
+    async def collect(generator):
+        return [segment async for segment in generator]
+
+    handler = StreamHandler()
+    assert asyncio.run(collect(handler.collect_stream_segments(stream(), "<|>"))) == [
+        "item 1", "item 2", "item 3", "", "tail"
+    ]
+    assert asyncio.run(collect(handler.collect_stream_segments(stream(), "<|>", include_delimiter=True)))[:2] == [
+        "item 1<|>", "item 2<|>"
+    ]
+    assert asyncio.run(collect(handler.buffer_until(stream(), lambda text: "<|>" in text))) == [
+        "item 1<|>item 2<|", ">item 3<|><|>tail"
+    ]
+    assert asyncio.run(collect(handler.buffer_until(stream(), lambda text: False, max_buffer_size=12))) == [
+        "item 1<|>item 2<|", ">item 3<|><|>tail"
+    ]
+    assert asyncio.run(collect(handler.buffer_until(stream(), lambda text: False))) == ["".join(pieces)]
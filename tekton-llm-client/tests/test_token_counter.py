@@ -0,0 +1,110 @@
+"""
+Tests for cached, batched and incremental token counting.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import tiktoken
+
+from tekton_llm_client.utils import (
+    count_tokens, count_message_tokens, count_tokens_batch,
+    ConversationTokenCounter, TokenCountCache
+)
+from tekton_llm_client.utils import token_counter
+
+
+def byte_encoding():
+    """A byte-level encoding that needs no download: one token per UTF-8 byte"""
+    return tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={"<|endoftext|>": 256}
+    )
+
+
+@pytest.fixture
+def encoder():
+    encoding = byte_encoding()
+    spy = MagicMock(wraps=encoding)
+    spy.name = encoding.name
+    token_counter.token_count_cache.clear()
+    with patch.object(token_counter, "get_encoder", return_value=spy):
+        yield spy
+    token_counter.token_count_cache.clear()
+
+
+def test_get_encoder_is_memoized():
+    """Test encodings are resolved once per model, including failures."""
+    token_counter.get_encoder.cache_clear()
+    try:
+        with patch.object(token_counter.tiktoken, "get_encoding", return_value=byte_encoding()) as get_encoding:
+            assert token_counter.get_encoder("claude-3") is token_counter.get_encoder("claude-3")
+            assert get_encoding.call_count == 1
+        
+        with patch.object(token_counter.tiktoken, "get_encoding", side_effect=OSError("offline")) as get_encoding:
+            assert token_counter.get_encoder("other") is None
+            assert count_tokens("12345678", "other") == 3
+            assert get_encoding.call_count == 1
+    finally:
+        token_counter.get_encoder.cache_clear()
+
+
+def test_counts_are_cached(encoder):
+    """Test repeated texts are hashed, not re-encoded."""
+    assert count_tokens("héllo") == 6
+    assert count_tokens("héllo") == 6
+    assert encoder.encode.call_count == 1
+    assert token_counter.token_count_cache.get_stats()["hits"] == 1
+
+
+def test_count_tokens_batch(encoder):
+    """Test batches match single counts, reuse the cache and encode uncached texts in threads."""
+    texts = [f"message {i}" * (i + 1) for i in range(20)]
+    count_tokens(texts[0])
+    
+    counts = count_tokens_batch(texts + texts[:5], num_threads=4)
+    assert counts == [len(text.encode()) for text in texts + texts[:5]]
+    encoder.encode_batch.assert_called_once()
+    assert len(encoder.encode_batch.call_args[0][0]) == 19
+    
+    count_tokens_batch(texts)
+    assert encoder.encode_batch.call_count == 1
+
+
+def test_count_tokens_batch_falls_back_per_text(encoder):
+    """Test a text the encoder rejects is estimated without affecting the others."""
+    texts = ["plain text", "<|endoftext|>"] * 5
+    assert count_tokens_batch(texts) == [10, len("<|endoftext|>") // 4 + 1] * 5
+
+
+def test_conversation_counter(encoder):
+    """Test appended messages alone are encoded and edits recount from the change."""
+    messages = [{"role": "system", "content": "Be brief."}]
+    counter = ConversationTokenCounter()
+    for i in range(10):
+        messages.append({"role": "user" if i % 2 == 0 else "assistant", "content": f"turn {i} " * 10})
+        assert counter.count(messages) == count_message_tokens(messages)
+    
+    token_counter.token_count_cache.clear()
+    encoder.reset_mock()
+    messages.append({"role": "user", "content": "one more"})
+    counter.count(messages)
+    assert encoder.encode.call_count == 1
+    
+    messages[3] = {"role": "assistant", "content": "edited"}
+    assert counter.count(messages) == count_message_tokens(messages)
+    assert counter.message_tokens[3] == 6
+    assert counter.count(messages[:2]) == count_message_tokens(messages[:2])
+
+
+def test_token_count_cache_lru():
+    """Test the least recently used count is evicted."""
+    cache = TokenCountCache(max_entries=2)
+    a, b, c = (cache.key("bytes", text) for text in "abc")
+    cache.set(a, 1)
+    cache.set(b, 2)
+    cache.get(a)
+    cache.set(c, 3)
+    assert cache.get(b) is None and cache.get(a) == 1 and len(cache) == 2
@@ -18,7 +18,8 @@ from .jsonrpc import (
     JSONRPCBatch,
     parse_jsonrpc_message,
     create_error_response,
-    create_success_response
+    create_success_response,
+    set_json_codec
 )
 
 from .agent import (
@@ -79,6 +80,7 @@ from .conversation import (
     ConversationMessage
 )
 from .conversation_manager import ConversationManager
+from .conversation_history import ConversationHistory
 
 # Import task coordination components
 from .task_coordination import (
@@ -117,6 +119,7 @@ __all__ = [
     'parse_jsonrpc_message',
     'create_error_response',
     'create_success_response',
+    'set_json_codec',
     
     # Agent
     'AgentCard',
@@ -167,6 +170,7 @@ __all__ = [
     'ConversationParticipant',
     'ConversationMessage',
     'ConversationManager',
+    'ConversationHistory',
     
     # Task Coordination
     'TaskCoordinator',
@@ -5,7 +5,8 @@ This module provides structured conversations between multiple agents,
 building on top of the channel-based pub/sub system.
 """
 
-from typing import Dict, List, Optional, Set, Any, Literal
+from typing import Deque, Dict, List, Optional, Set, Any, Literal
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -14,6 +15,10 @@ from uuid import uuid4
 from tekton.models import TektonBaseModel
 
 
+# Maximum number of message IDs remembered per turn
+MAX_TURN_MESSAGE_IDS = 100
+
+
 class ConversationRole(str, Enum):
     """Roles that agents can have in a conversation"""
     MODERATOR = "moderator"      # Can manage conversation settings
@@ -66,7 +71,10 @@ class ConversationTurn:
     agent_id: str
     started_at: datetime
     ended_at: Optional[datetime] = None
-    messages: List[str] = field(default_factory=list)  # Message IDs
+    messages: Deque[str] = field(  # Most recent message IDs
+        default_factory=lambda: deque(maxlen=MAX_TURN_MESSAGE_IDS)
+    )
+    message_count: int = 0
     
 
 class Conversation(TektonBaseModel):
@@ -258,9 +266,11 @@ class Conversation(TektonBaseModel):
             participant.message_count += 1
             participant.last_active = datetime.now(timezone.utc)
             
-        # Track message in current turn
+        # Track message in current turn (bounded, so long turns stay O(1))
         if self.current_turn and self.current_turn.agent_id == message.sender_id:
-            self.current_turn.messages.append(message.id)
+            turn = self.current_turn
+            turn.message_count += 1
+            turn.messages.append(message.id)
     
     def activate(self) -> None:
         """Activate the conversation"""
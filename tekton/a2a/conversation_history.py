@@ -0,0 +1,289 @@
+"""
+Windowed message history for multi-agent conversations
+
+Keeps a fixed-size window of recent messages in memory and spills older
+messages to an append-only JSON lines file per conversation. A sparse
+offset index allows paginated reads of spilled messages without loading
+the whole file, so memory stays flat regardless of conversation length.
+
+Evicted messages wait in memory until flush() writes them, so callers on
+an event loop can batch the writes and run them in an executor with
+flush_async().
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional
+
+from .conversation import ConversationMessage
+
+
+logger = logging.getLogger(__name__)
+
+# Evicted messages held before the conversation manager writes them out
+SPILL_BATCH_SIZE = 64
+
+
+def message_to_dict(message: ConversationMessage) -> Dict[str, Any]:
+    """Convert a conversation message to a JSON-serializable dict"""
+    return {
+        "id": message.id,
+        "conversation_id": message.conversation_id,
+        "sender_id": message.sender_id,
+        "content": message.content,
+        "timestamp": message.timestamp.isoformat(),
+        "in_reply_to": message.in_reply_to,
+        "metadata": message.metadata
+    }
+
+
+def message_from_dict(data: Dict[str, Any]) -> ConversationMessage:
+    """Create a conversation message from a dict"""
+    return ConversationMessage(
+        id=data["id"],
+        conversation_id=data["conversation_id"],
+        sender_id=data["sender_id"],
+        content=data["content"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        in_reply_to=data.get("in_reply_to"),
+        metadata=data.get("metadata") or {}
+    )
+
+
+class ConversationHistory:
+    """
+    Message history for a single conversation.
+
+    Messages are addressed by sequence number (0 for the first message).
+    The most recent ``window_size`` messages live in a ring buffer; older
+    messages are appended to ``<storage_dir>/<conversation_id>.jsonl``
+    when the history is flushed. If no storage directory is configured,
+    evicted messages are dropped.
+
+    append() and reads run on the owner's thread; flush() may run in a
+    worker thread alongside them.
+    """
+
+    def __init__(
+        self,
+        conversation_id: str,
+        window_size: int = 1000,
+        storage_dir: Optional[str] = None,
+        index_interval: int = 1000
+    ):
+        """
+        Initialize the history.
+
+        Args:
+            conversation_id: Conversation this history belongs to
+            window_size: Number of recent messages kept in memory
+            storage_dir: Directory for spilled messages (None to drop them)
+            index_interval: Spilled messages between sparse index entries
+        """
+        if window_size < 1:
+            raise ValueError("window_size must be at least 1")
+
+        self.conversation_id = conversation_id
+        self.window_size = window_size
+        self.storage_dir = storage_dir
+        self.index_interval = index_interval
+
+        self._window: Deque[ConversationMessage] = deque()
+        self._total = 0
+        self._spilled = 0
+        self._dropped = 0
+
+        # Evicted messages not yet written to the spill file
+        self._pending: List[ConversationMessage] = []
+
+        # Byte offset of every index_interval-th spilled message
+        self._offsets: List[int] = []
+        self._file: Optional[BinaryIO] = None
+
+        # _state_lock guards _pending/_spilled/_offsets; _write_lock serializes flushes
+        self._state_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        """Total number of messages recorded"""
+        return self._total
+
+    @property
+    def window_start(self) -> int:
+        """Sequence number of the oldest message held in memory"""
+        return self._total - len(self._window)
+
+    @property
+    def available_from(self) -> int:
+        """Sequence number of the oldest retrievable message"""
+        return self._dropped
+
+    @property
+    def pending(self) -> int:
+        """Number of evicted messages waiting to be written"""
+        return len(self._pending)
+
+    @property
+    def path(self) -> Optional[str]:
+        """Path of the spill file, if spilling is enabled"""
+        if not self.storage_dir:
+            return None
+        return os.path.join(self.storage_dir, f"{self.conversation_id}.jsonl")
+
+    def append(self, message: ConversationMessage) -> int:
+        """
+        Append a message to the history.
+
+        Returns:
+            Sequence number of the message
+        """
+        if len(self._window) >= self.window_size:
+            evicted = self._window.popleft()
+            if self.storage_dir:
+                with self._state_lock:
+                    self._pending.append(evicted)
+            else:
+                self._dropped += 1
+
+        self._window.append(message)
+        self._total += 1
+        return self._total - 1
+
+    def get_page(self, offset: int = 0, limit: int = 100) -> List[ConversationMessage]:
+        """
+        Get messages by sequence number.
+
+        Args:
+            offset: Sequence number of the first message
+            limit: Maximum number of messages to return
+
+        Returns:
+            Messages with sequence numbers in [offset, offset + limit)
+        """
+        offset = max(offset, self._dropped)
+        end = min(offset + limit, self._total)
+        if offset >= end:
+            return []
+
+        messages: List[ConversationMessage] = []
+        window_start = self.window_start
+        with self._state_lock:
+            spilled_end = self._dropped + self._spilled
+            pending = list(self._pending)
+
+        # Oldest part of the page comes from the spill file
+        if offset < spilled_end:
+            messages.extend(self._read_spilled(offset, min(end, spilled_end) - offset))
+            offset = spilled_end
+
+        # Then messages evicted but not yet written
+        if offset < min(end, window_start):
+            messages.extend(pending[offset - spilled_end:min(end, window_start) - spilled_end])
+            offset = window_start
+
+        if offset < end:
+            messages.extend(islice(self._window, offset - window_start, end - window_start))
+
+        return messages
+
+    def get_recent(self, limit: int = 100) -> List[ConversationMessage]:
+        """Get the most recent messages, oldest first"""
+        return self.get_page(max(self._total - limit, 0), limit)
+
+    def iter_pages(self, start: int = 0, page_size: int = 500) -> Iterator[List[ConversationMessage]]:
+        """Iterate over the history in pages, oldest first"""
+        offset = max(start, self._dropped)
+        while offset < self._total:
+            page = self.get_page(offset, page_size)
+            if not page:
+                break
+            yield page
+            offset += len(page)
+
+    def flush(self) -> None:
+        """Write evicted messages to the spill file (blocking)"""
+        with self._write_lock:
+            with self._state_lock:
+                batch = list(self._pending)
+            if not batch:
+                return
+
+            if self._file is None:
+                os.makedirs(self.storage_dir, exist_ok=True)
+                self._file = open(self.path, "ab")
+
+            offsets = []
+            spilled = self._spilled
+            for message in batch:
+                if spilled % self.index_interval == 0:
+                    offsets.append(self._file.tell())
+                line = json.dumps(message_to_dict(message), default=str) + "\n"
+                self._file.write(line.encode("utf-8"))
+                spilled += 1
+            self._file.flush()
+
+            # Publish the batch to readers only once it is on disk
+            with self._state_lock:
+                self._offsets.extend(offsets)
+                self._spilled = spilled
+                del self._pending[:len(batch)]
+
+    async def flush_async(self) -> None:
+        """Write evicted messages in an executor, without blocking the event loop"""
+        if self._pending:
+            await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    def close(self) -> None:
+        """Write evicted messages and close the spill file"""
+        self.flush()
+        with self._write_lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def archive(self) -> None:
+        """
+        Spill the in-memory window and close the spill file (blocking).
+
+        Used once the conversation has ended: the whole history stays
+        readable from disk while only the sparse index is held in memory.
+        Without a storage directory the window is kept as is.
+        """
+        if self.storage_dir:
+            with self._state_lock:
+                self._pending.extend(self._window)
+                self._window.clear()
+        self.close()
+
+    def delete(self) -> None:
+        """Close the history, discard its messages and remove the spill file"""
+        self.close()
+        with self._state_lock:
+            self._window.clear()
+            self._pending.clear()
+            self._offsets.clear()
+            self._dropped = self._total
+            self._spilled = 0
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _read_spilled(self, offset: int, count: int) -> List[ConversationMessage]:
+        """Read spilled messages starting at a sequence number"""
+        # Spilled sequence numbers are relative to the first retained message
+        relative = offset - self._dropped
+
+        messages = []
+        with open(self.path, "rb") as f:
+            f.seek(self._offsets[relative // self.index_interval])
+            lines = islice(f, relative % self.index_interval, None)
+            for line in islice(lines, count):
+                messages.append(message_from_dict(json.loads(line)))
+
+        return messages
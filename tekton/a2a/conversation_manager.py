@@ -7,7 +7,8 @@ lifecycle, message routing, and integration with the channel system.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Set, Any, Callable
+import os
+from typing import AsyncIterator, Dict, List, Optional, Set, Any, Callable
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
@@ -15,6 +16,7 @@ from .conversation import (
     Conversation, ConversationMessage, ConversationRole,
     ConversationState, TurnTakingMode, ConversationParticipant
 )
+from .conversation_history import ConversationHistory, SPILL_BATCH_SIZE, message_to_dict
 from .streaming.channels import ChannelBridge
 from .streaming.events import ChannelEvent, EventType
 from .errors import InvalidRequestError, UnauthorizedError, ConversationNotFoundError
@@ -22,19 +24,37 @@ from .errors import InvalidRequestError, UnauthorizedError, ConversationNotFound
 
 logger = logging.getLogger(__name__)
 
+# Spill directory used when the manager is not given one
+DEFAULT_HISTORY_DIR = os.path.expanduser("~/.tekton/conversations")
+
 
 class ConversationManager:
     """Manages multi-agent conversations"""
     
-    def __init__(self, channel_bridge: ChannelBridge):
+    def __init__(
+        self,
+        channel_bridge: ChannelBridge,
+        history_window: int = 1000,
+        history_dir: Optional[str] = None
+    ):
         """
         Initialize the conversation manager.
         
         Args:
             channel_bridge: Bridge to the channel system for message distribution
+            history_window: Number of recent messages kept in memory per conversation
+            history_dir: Directory for spilled message history (defaults to
+                TEKTON_CONVERSATION_HISTORY_PATH or DEFAULT_HISTORY_DIR).
+                Spill files are kept after their conversation ends, until
+                it is purged with purge_conversation().
         """
         self.channel_bridge = channel_bridge
+        self.history_window = history_window
+        self.history_dir = history_dir or os.environ.get(
+            "TEKTON_CONVERSATION_HISTORY_PATH", DEFAULT_HISTORY_DIR
+        )
         self.conversations: Dict[str, Conversation] = {}
+        self.histories: Dict[str, ConversationHistory] = {}  # conv_id -> history
         self.agent_conversations: Dict[str, Set[str]] = {}  # agent_id -> set of conv_ids
         self._lock = asyncio.Lock()
         self._turn_timers: Dict[str, asyncio.Task] = {}  # conv_id -> timer task
@@ -74,6 +94,11 @@ class ConversationManager:
             
             # Store conversation
             self.conversations[conversation.id] = conversation
+            self.histories[conversation.id] = ConversationHistory(
+                conversation.id,
+                window_size=self.history_window,
+                storage_dir=self.history_dir
+            )
             
             # Track creator's conversations
             if created_by not in self.agent_conversations:
@@ -273,21 +298,20 @@ class ConversationManager:
             
             # Record in conversation
             conversation.record_message(message)
+            history = None
+            if conversation.settings.get("record_history", True):
+                history = self.histories[conversation_id]
+                history.append(message)
             
             # Publish to channel
+            message_data = message_to_dict(message)
+            del message_data["conversation_id"]
             await self.channel_bridge.publish_with_metadata(
                 conversation.channel_name,
                 sender_id,
                 {
                     "type": "conversation.message",
-                    "message": {
-                        "id": message.id,
-                        "sender_id": message.sender_id,
-                        "content": message.content,
-                        "timestamp": message.timestamp.isoformat(),
-                        "in_reply_to": message.in_reply_to,
-                        "metadata": message.metadata
-                    },
+                    "message": message_data,
                     "conversation_id": conversation_id
                 },
                 metadata={"conversation_id": conversation_id}
@@ -296,7 +320,11 @@ class ConversationManager:
             # Handle turn management
             await self._handle_turn_management(conversation, sender_id)
             
-            return message
+        # Write spilled history in batches, off the event loop and outside the lock
+        if history is not None and history.pending >= SPILL_BATCH_SIZE:
+            await history.flush_async()
+            
+        return message
     
     async def request_turn(
         self,
@@ -419,6 +447,44 @@ class ConversationManager:
                     
             await self._end_conversation_internal(conversation)
     
+    async def purge_conversation(
+        self,
+        conversation_id: str,
+        agent_id: str
+    ) -> None:
+        """
+        Forget an ended conversation and delete its history (moderator only).
+        
+        Raises:
+            ConversationNotFoundError: If conversation doesn't exist
+            UnauthorizedError: If agent is not a moderator or the creator
+            InvalidRequestError: If the conversation has not ended
+        """
+        async with self._lock:
+            conversation = self.conversations.get(conversation_id)
+            if not conversation:
+                raise ConversationNotFoundError(conversation_id)
+                
+            participant = conversation.participants.get(agent_id)
+            if agent_id != conversation.created_by and (
+                participant is None or participant.role != ConversationRole.MODERATOR
+            ):
+                raise UnauthorizedError("Only moderators can purge conversations")
+                
+            if conversation.state != ConversationState.ENDED:
+                raise InvalidRequestError("Only ended conversations can be purged")
+                
+            del self.conversations[conversation_id]
+            for conv_ids in self.agent_conversations.values():
+                conv_ids.discard(conversation_id)
+                
+            # Remove the spill file
+            history = self.histories.pop(conversation_id, None)
+            if history is not None:
+                await asyncio.get_running_loop().run_in_executor(None, history.delete)
+                
+            logger.info(f"Purged conversation {conversation_id}")
+    
     async def get_conversation(
         self,
         conversation_id: str,
@@ -434,6 +500,72 @@ class ConversationManager:
                 
         return conversation
     
+    async def get_history(
+        self,
+        conversation_id: str,
+        agent_id: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Get a page of conversation message history.
+        
+        Args:
+            conversation_id: ID of the conversation
+            agent_id: If given, only return history to participants
+            offset: Sequence number of the first message (defaults to the
+                most recent ``limit`` messages)
+            limit: Maximum number of messages to return
+            
+        Returns:
+            Page with messages, offset, total and has_more
+            
+        Raises:
+            ConversationNotFoundError: If conversation doesn't exist
+            UnauthorizedError: If agent is not in the conversation
+        """
+        conversation = self.conversations.get(conversation_id)
+        if not conversation:
+            raise ConversationNotFoundError(conversation_id)
+            
+        if agent_id and agent_id not in conversation.participants:
+            raise UnauthorizedError(f"Agent {agent_id} not in conversation")
+            
+        history = self.histories[conversation_id]
+        if offset is None:
+            offset = max(history.total - limit, 0)
+        offset = max(offset, history.available_from)
+        messages = history.get_page(offset, limit)
+        
+        return {
+            "conversation_id": conversation_id,
+            "messages": [message_to_dict(message) for message in messages],
+            "offset": offset,
+            "total": history.total,
+            "has_more": offset + len(messages) < history.total
+        }
+    
+    async def stream_history(
+        self,
+        conversation_id: str,
+        start: int = 0,
+        page_size: int = 500
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream conversation history in pages, oldest first.
+        
+        Only one page is materialized at a time, so arbitrarily long
+        histories can be exported with flat memory use.
+        """
+        if conversation_id not in self.conversations:
+            raise ConversationNotFoundError(conversation_id)
+        history = self.histories[conversation_id]
+            
+        for page in history.iter_pages(start, page_size):
+            yield [message_to_dict(message) for message in page]
+            # Let other tasks run between pages
+            await asyncio.sleep(0)
+    
     async def list_conversations(
         self,
         agent_id: Optional[str] = None,
@@ -483,6 +615,12 @@ class ConversationManager:
         """Internal method to end conversation."""
         conversation.end()
         
+        # Move the in-memory window to disk; the history stays readable
+        # until the conversation is purged
+        history = self.histories.get(conversation.id)
+        if history is not None:
+            await asyncio.get_running_loop().run_in_executor(None, history.archive)
+        
         # Cancel any turn timers
         if conversation.id in self._turn_timers:
             self._turn_timers[conversation.id].cancel()
@@ -11,6 +11,50 @@ from uuid import uuid4
 
 from .errors import ParseError, InvalidRequestError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Active JSON codec ("json" or "orjson"), see set_json_codec()
+_json_codec = "json"
+
+
+def set_json_codec(codec: str) -> None:
+    """
+    Select the JSON codec used for JSON-RPC serialization.
+    
+    Args:
+        codec: "json" for the standard library, "orjson" for the optional
+            orjson backend (must be installed)
+    """
+    global _json_codec
+    if codec not in ("json", "orjson"):
+        raise ValueError(f"Unknown JSON codec: {codec}")
+    if codec == "orjson" and not ORJSON_AVAILABLE:
+        raise ValueError("orjson codec requested but orjson is not installed")
+    _json_codec = codec
+
+
+def get_json_codec() -> str:
+    """Get the name of the active JSON codec"""
+    return _json_codec
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string with the active codec"""
+    if _json_codec == "orjson":
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON string with the active codec"""
+    if _json_codec == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class JSONRPCMessage:
     """Base class for JSON-RPC messages"""
@@ -21,7 +65,7 @@ class JSONRPCMessage:
     
     def to_json(self) -> str:
         """Convert message to JSON string"""
-        return json.dumps(self.to_dict())
+        return json_dumps(self.to_dict())
 
 
 class JSONRPCRequest(JSONRPCMessage):
@@ -136,16 +180,16 @@ class JSONRPCBatch:
     
     def to_json(self) -> str:
         """Convert batch to JSON string"""
-        return json.dumps(self.to_dict())
+        return json_dumps(self.to_dict())
 
 
-def parse_jsonrpc_message(data: Union[str, Dict, List]) -> Union[JSONRPCRequest, JSONRPCBatch, None]:
+def parse_jsonrpc_message(data: Union[str, bytes, Dict, List]) -> Union[JSONRPCRequest, JSONRPCBatch, None]:
     """Parse JSON-RPC message from various input formats"""
     
     # Parse JSON string
-    if isinstance(data, str):
+    if isinstance(data, (str, bytes)):
         try:
-            data = json.loads(data)
+            data = json_loads(data)
         except json.JSONDecodeError as e:
             raise ParseError(str(e))
     
@@ -5,10 +5,14 @@ Defines standard A2A methods and provides a dispatcher for handling them.
 """
 
 from typing import Dict, List, Any, Callable, Optional, Union
+import asyncio
 import inspect
 import logging
 
-from .jsonrpc import JSONRPCRequest, JSONRPCResponse, create_error_response, create_success_response
+from .jsonrpc import (
+    JSONRPCRequest, JSONRPCResponse, JSONRPCBatch,
+    create_error_response, create_success_response
+)
 from .errors import MethodNotFoundError, InvalidParamsError, InternalError
 from .agent import AgentCard, AgentRegistry, AgentStatus
 from .task import Task, TaskManager, TaskState
@@ -17,16 +21,100 @@ from .discovery import DiscoveryService, AgentQuery
 logger = logging.getLogger(__name__)
 
 
+class MethodEntry:
+    """
+    Precompiled dispatch table entry for a registered method.
+    
+    Inspects the handler signature once at registration time so that
+    dispatching a request only needs set operations to bind parameters.
+    """
+    
+    __slots__ = (
+        "name", "handler", "is_async", "param_names", "required",
+        "positional", "required_positional", "accepts_var_kwargs",
+        "accepts_var_args"
+    )
+    
+    def __init__(self, name: str, handler: Callable):
+        self.name = name
+        self.handler = handler
+        self.is_async = inspect.iscoroutinefunction(handler)
+        
+        param_names = set()
+        required = set()
+        positional = []
+        required_positional = 0
+        self.accepts_var_kwargs = False
+        self.accepts_var_args = False
+        
+        try:
+            # Bind against the callable actually invoked, not a wrapped original
+            parameters = inspect.signature(handler, follow_wrapped=False).parameters.values()
+        except (TypeError, ValueError):
+            # Builtins without signature metadata accept anything
+            parameters = []
+            self.accepts_var_kwargs = True
+            self.accepts_var_args = True
+        
+        for param in parameters:
+            if param.kind == param.VAR_KEYWORD:
+                self.accepts_var_kwargs = True
+            elif param.kind == param.VAR_POSITIONAL:
+                self.accepts_var_args = True
+            else:
+                if param.kind != param.POSITIONAL_ONLY:
+                    param_names.add(param.name)
+                if param.kind != param.KEYWORD_ONLY:
+                    positional.append(param.name)
+                    if param.default is param.empty:
+                        required_positional += 1
+                if param.default is param.empty and param.kind != param.POSITIONAL_ONLY:
+                    required.add(param.name)
+        
+        self.param_names = frozenset(param_names)
+        self.required = frozenset(required)
+        self.positional = tuple(positional)
+        self.required_positional = required_positional
+    
+    def bind_kwargs(self, params: Dict[str, Any]) -> None:
+        """Validate keyword parameters against the cached signature"""
+        missing = self.required.difference(params)
+        if missing:
+            raise InvalidParamsError(
+                f"Missing required parameters: {', '.join(sorted(missing))}"
+            )
+        if not self.accepts_var_kwargs:
+            unexpected = set(params).difference(self.param_names)
+            if unexpected:
+                raise InvalidParamsError(
+                    f"Unexpected parameters: {', '.join(sorted(unexpected))}"
+                )
+    
+    def bind_args(self, params: List[Any]) -> None:
+        """Validate positional parameters against the cached signature"""
+        if len(params) < self.required_positional:
+            raise InvalidParamsError(
+                f"Expected at least {self.required_positional} parameters, got {len(params)}"
+            )
+        if not self.accepts_var_args and len(params) > len(self.positional):
+            raise InvalidParamsError(
+                f"Expected at most {len(self.positional)} parameters, got {len(params)}"
+            )
+
+
 class MethodDispatcher:
     """
     Dispatcher for JSON-RPC methods in the A2A protocol.
     
     Handles method registration, parameter validation, and execution.
+    Batch requests are dispatched concurrently, bounded by
+    ``max_batch_concurrency``, with responses returned in request order.
     """
     
-    def __init__(self):
-        self._methods: Dict[str, Callable] = {}
+    def __init__(self, max_batch_concurrency: int = 32):
+        self._methods: Dict[str, MethodEntry] = {}
         self._method_metadata: Dict[str, Dict[str, Any]] = {}
+        self.max_batch_concurrency = max_batch_concurrency
     
     def register_method(
         self,
@@ -36,7 +124,7 @@ class MethodDispatcher:
         params_schema: Optional[Dict[str, Any]] = None
     ) -> None:
         """Register a method handler"""
-        self._methods[name] = handler
+        self._methods[name] = MethodEntry(name, handler)
         self._method_metadata[name] = {
             "description": description or handler.__doc__,
             "params_schema": params_schema,
@@ -54,28 +142,32 @@ class MethodDispatcher:
         """Dispatch a JSON-RPC request to the appropriate handler"""
         method_name = request.method
         
-        # Check if method exists
-        if method_name not in self._methods:
+        # Look up precompiled entry
+        entry = self._methods.get(method_name)
+        if entry is None:
             return create_error_response(
                 request.id,
                 MethodNotFoundError(method_name).code,
                 f"Method '{method_name}' not found"
             )
         
-        handler = self._methods[method_name]
-        
         try:
             # Extract parameters
             params = request.params or {}
             
             # Call handler based on parameter type
             if isinstance(params, dict):
-                result = await self._call_with_kwargs(handler, params)
+                entry.bind_kwargs(params)
+                result = entry.handler(**params)
             elif isinstance(params, list):
-                result = await self._call_with_args(handler, params)
+                entry.bind_args(params)
+                result = entry.handler(*params)
             else:
                 raise InvalidParamsError("Parameters must be dict or list")
             
+            if entry.is_async:
+                result = await result
+            
             return create_success_response(request.id, result)
             
         except InvalidParamsError as e:
@@ -89,21 +181,68 @@ class MethodDispatcher:
                 str(e)
             )
     
-    async def _call_with_kwargs(self, handler: Callable, params: Dict[str, Any]) -> Any:
-        """Call handler with keyword arguments"""
-        # Check if handler is async
-        if inspect.iscoroutinefunction(handler):
-            return await handler(**params)
+    async def dispatch_batch(
+        self,
+        batch: JSONRPCBatch,
+        max_concurrency: Optional[int] = None
+    ) -> Optional[JSONRPCBatch]:
+        """
+        Dispatch a JSON-RPC batch concurrently.
+        
+        Args:
+            batch: Batch of requests
+            max_concurrency: Maximum number of requests in flight at once
+                (defaults to the dispatcher's max_batch_concurrency)
+            
+        Returns:
+            Batch of responses in request order, or None if the batch
+            contained only notifications
+            
+        Raises:
+            ValueError: If the concurrency limit is less than 1
+        """
+        limit = self.max_batch_concurrency if max_concurrency is None else max_concurrency
+        if limit < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {limit}")
+        requests = batch.messages
+        
+        if limit >= len(requests):
+            responses = await asyncio.gather(
+                *(self.dispatch(request) for request in requests)
+            )
         else:
-            return handler(**params)
+            semaphore = asyncio.Semaphore(limit)
+            
+            async def bounded_dispatch(request: JSONRPCRequest) -> JSONRPCResponse:
+                async with semaphore:
+                    return await self.dispatch(request)
+            
+            responses = await asyncio.gather(
+                *(bounded_dispatch(request) for request in requests)
+            )
+        
+        # Notifications do not get responses in a batch
+        responses = [
+            response for request, response in zip(requests, responses)
+            if request.id is not None
+        ]
+        return JSONRPCBatch(responses) if responses else None
     
-    async def _call_with_args(self, handler: Callable, params: List[Any]) -> Any:
-        """Call handler with positional arguments"""
-        # Check if handler is async
-        if inspect.iscoroutinefunction(handler):
-            return await handler(*params)
-        else:
-            return handler(*params)
+    async def handle_message(
+        self,
+        message: Union[JSONRPCRequest, JSONRPCBatch]
+    ) -> Union[JSONRPCResponse, JSONRPCBatch, None]:
+        """
+        Dispatch a parsed JSON-RPC message (single request or batch).
+        
+        Returns:
+            The response to send, or None for a notification or a batch
+            of notifications
+        """
+        if isinstance(message, JSONRPCBatch):
+            return await self.dispatch_batch(message)
+        response = await self.dispatch(message)
+        return response if message.id is not None else None
     
     def list_methods(self) -> List[Dict[str, Any]]:
         """List all registered methods with metadata"""
@@ -16,6 +16,7 @@ from .websocket import (
     handle_websocket
 )
 from .channels import Channel, ChannelBridge
+from .patterns import PatternCache, SegmentTrie, matches_pattern
 
 __all__ = [
     # SSE
@@ -45,5 +46,10 @@ __all__ = [
     
     # Channels
     'Channel',
-    'ChannelBridge'
+    'ChannelBridge',
+    
+    # Channel patterns
+    'PatternCache',
+    'SegmentTrie',
+    'matches_pattern'
 ]
\ No newline at end of file
@@ -6,14 +6,14 @@ A2A streaming channels, enhancing existing functionality without breaking
 compatibility.
 """
 
-from typing import Dict, List, Optional, Set, Any, Pattern
+from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
-import re
 from uuid import uuid4
 
 from .events import ChannelEvent, EventType
+from .patterns import SegmentTrie, default_pattern_cache
 from .subscription import SubscriptionManager, Subscription, SubscriptionType
 
 
@@ -47,7 +47,8 @@ class ChannelBridge:
         self.message_bus = message_bus
         self.subscription_manager = subscription_manager
         self.channels: Dict[str, Channel] = {}
-        self._pattern_cache: Dict[str, Pattern] = {}
+        self._pattern_cache = default_pattern_cache
+        self._channel_index = SegmentTrie(self._pattern_cache)
         self._lock = asyncio.Lock()
         
     async def initialize(self):
@@ -110,6 +111,7 @@ class ChannelBridge:
                     **kwargs
                 )
                 self.channels[name] = channel
+                self._channel_index.add(name)
                 
                 # Emit channel created event
                 event = ChannelEvent(
@@ -227,20 +229,7 @@ class ChannelBridge:
         Returns:
             True if channel matches pattern
         """
-        if pattern not in self._pattern_cache:
-            # Convert pattern to regex
-            # First escape dots
-            regex_pattern = pattern.replace(".", r"\.")
-            # Replace ** with a placeholder to avoid conflict with *
-            regex_pattern = regex_pattern.replace("**", "__DOUBLE_STAR__")
-            # Replace single * with pattern for one segment
-            regex_pattern = regex_pattern.replace("*", "[^.]+")
-            # Replace placeholder with pattern for multiple segments
-            regex_pattern = regex_pattern.replace("__DOUBLE_STAR__", ".*")
-            regex_pattern = f"^{regex_pattern}$"
-            self._pattern_cache[pattern] = re.compile(regex_pattern)
-        
-        return bool(self._pattern_cache[pattern].match(channel))
+        return self._pattern_cache.matches(channel, pattern)
     
     async def list_channels(self, pattern: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -250,13 +239,15 @@ class ChannelBridge:
             pattern: Optional pattern to filter channels
             
         Returns:
-            List of channel info dicts
+            List of channel info dicts (sorted by name when filtered)
         """
-        channels = []
-        for name, channel in self.channels.items():
-            if pattern is None or self.matches_pattern(name, pattern):
-                channels.append(self._channel_to_dict(channel))
-        return channels
+        if pattern is None:
+            names = list(self.channels)
+        else:
+            # Walk the channel index instead of testing every channel
+            names = sorted(self._channel_index.find(pattern))
+        
+        return [self._channel_to_dict(self.channels[name]) for name in names]
     
     async def get_channel_info(self, channel_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -293,6 +284,7 @@ class ChannelBridge:
                 
             # Remove channel
             del self.channels[channel_name]
+            self._channel_index.remove(channel_name)
             
             # Emit channel deleted event
             event = ChannelEvent(
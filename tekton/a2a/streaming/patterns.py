@@ -0,0 +1,294 @@
+"""
+Compiled channel pattern matching for A2A streaming
+
+Channel names are dot-separated segments. Patterns support two wildcards:
+
+* ``*`` matches exactly one non-empty segment (``metrics.*`` matches
+  ``metrics.cpu`` but not ``metrics.system.cpu``)
+* ``**`` matches one or more segments (``metrics.**`` matches both)
+
+A ``*`` inside a segment (``metrics.c*``) is also accepted and matches any
+run of non-dot characters.
+
+This module provides an LRU of compiled patterns for one-off checks and a
+segment trie that indexes either patterns (to find every pattern matching a
+channel) or channel names (to find every channel matching a pattern), so
+neither direction needs to scan all entries.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Pattern, Set, Tuple
+
+
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "**"
+
+
+def pattern_to_regex(pattern: str) -> str:
+    """Translate a channel pattern into an anchored regular expression"""
+    regex_pattern = re.escape(pattern)
+    # re.escape turns * into \*, so translate the escaped forms
+    regex_pattern = regex_pattern.replace(r"\*\*", "__DOUBLE_STAR__")
+    regex_pattern = regex_pattern.replace(r"\*", "[^.]+")
+    regex_pattern = regex_pattern.replace("__DOUBLE_STAR__", ".*")
+    return f"^{regex_pattern}$"
+
+
+def _is_segmented(segments: Iterable[str]) -> bool:
+    """Check that wildcards only appear as whole segments"""
+    return all(
+        SINGLE_WILDCARD not in segment or segment in (SINGLE_WILDCARD, MULTI_WILDCARD)
+        for segment in segments
+    )
+
+
+class CompiledPattern:
+    """A channel pattern compiled once for repeated matching"""
+
+    __slots__ = ("pattern", "segments", "is_literal", "is_segmented", "_regex")
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.segments: Tuple[str, ...] = tuple(pattern.split("."))
+        self.is_literal = SINGLE_WILDCARD not in pattern
+        # Segmented patterns only use whole-segment wildcards and can live in a trie
+        self.is_segmented = _is_segmented(self.segments)
+        self._regex: Optional[Pattern] = None if self.is_literal else re.compile(pattern_to_regex(pattern))
+
+    def match(self, channel: str) -> bool:
+        """Check if a channel matches this pattern"""
+        if self.is_literal:
+            return channel == self.pattern
+        return self._regex.match(channel) is not None
+
+    def __repr__(self) -> str:
+        return f"CompiledPattern({self.pattern!r})"
+
+
+class PatternCache:
+    """Bounded LRU of compiled channel patterns"""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._patterns: "OrderedDict[str, CompiledPattern]" = OrderedDict()
+
+    def get(self, pattern: str) -> CompiledPattern:
+        """Get the compiled form of a pattern, compiling it on first use"""
+        compiled = self._patterns.get(pattern)
+        if compiled is not None:
+            self._patterns.move_to_end(pattern)
+            return compiled
+
+        compiled = CompiledPattern(pattern)
+        self._patterns[pattern] = compiled
+        if len(self._patterns) > self.maxsize:
+            self._patterns.popitem(last=False)
+        return compiled
+
+    def matches(self, channel: str, pattern: str) -> bool:
+        """Check if a channel matches a pattern"""
+        return self.get(pattern).match(channel)
+
+    def clear(self) -> None:
+        """Drop all compiled patterns"""
+        self._patterns.clear()
+
+    def __contains__(self, pattern: str) -> bool:
+        return pattern in self._patterns
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+
+# Process-wide cache shared by subscriptions and channel bridges
+default_pattern_cache = PatternCache()
+
+
+def matches_pattern(channel: str, pattern: str) -> bool:
+    """Check if a channel matches a pattern using the shared cache"""
+    return default_pattern_cache.matches(channel, pattern)
+
+
+class _TrieNode:
+    """Node in a segment trie"""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.values: Set[Hashable] = set()
+
+
+class SegmentTrie:
+    """
+    Trie over dot-separated segments mapping keys to sets of values.
+
+    Keys may be channel names or channel patterns. ``match(channel)``
+    treats stored keys as patterns and returns the values of every key
+    matching the channel; ``find(pattern)`` treats stored keys as literal
+    channel names and returns every key matching the pattern.
+    """
+
+    def __init__(self, cache: Optional[PatternCache] = None):
+        self._root = _TrieNode()
+        self._cache = cache if cache is not None else default_pattern_cache
+        # Keys with partial-segment wildcards are matched by regex
+        self._irregular: Dict[str, Set[Hashable]] = {}
+        self._size = 0
+
+    def add(self, key: str, value: Hashable = None) -> None:
+        """Associate a value with a key"""
+        value = key if value is None else value
+        segments = key.split(".")
+
+        if not _is_segmented(segments):
+            values = self._irregular.setdefault(key, set())
+        else:
+            node = self._root
+            for segment in segments:
+                node = node.children.setdefault(segment, _TrieNode())
+            values = node.values
+
+        if value not in values:
+            values.add(value)
+            self._size += 1
+
+    def remove(self, key: str, value: Hashable = None) -> bool:
+        """Remove a value from a key, returning True if it was present"""
+        value = key if value is None else value
+
+        if key in self._irregular:
+            values = self._irregular[key]
+            if value not in values:
+                return False
+            values.discard(value)
+            if not values:
+                del self._irregular[key]
+            self._size -= 1
+            return True
+
+        path = [self._root]
+        for segment in key.split("."):
+            node = path[-1].children.get(segment)
+            if node is None:
+                return False
+            path.append(node)
+
+        if value not in path[-1].values:
+            return False
+        path[-1].values.discard(value)
+        self._size -= 1
+
+        # Prune empty branches
+        segments = key.split(".")
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.values or node.children:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+        return True
+
+    def match(self, channel: str) -> Set[Hashable]:
+        """Get the values of every stored pattern matching a channel"""
+        segments = channel.split(".")
+        count = len(segments)
+        result: Set[Hashable] = set()
+
+        stack: List[Tuple[_TrieNode, int]] = [(self._root, 0)]
+        seen: Set[Tuple[int, int]] = set()
+        while stack:
+            node, index = stack.pop()
+            state = (id(node), index)
+            if state in seen:
+                continue
+            seen.add(state)
+
+            if index == count:
+                result.update(node.values)
+                continue
+
+            segment = segments[index]
+            child = node.children.get(segment)
+            if child is not None:
+                stack.append((child, index + 1))
+
+            if segment:
+                child = node.children.get(SINGLE_WILDCARD)
+                if child is not None:
+                    stack.append((child, index + 1))
+
+            child = node.children.get(MULTI_WILDCARD)
+            if child is not None:
+                # ** consumes one or more segments
+                for end in range(index + 1, count + 1):
+                    stack.append((child, end))
+
+        for pattern, values in self._irregular.items():
+            if self._cache.matches(channel, pattern):
+                result.update(values)
+
+        return result
+
+    def find(self, pattern: str) -> Set[Hashable]:
+        """Get the values of every stored channel name matching a pattern"""
+        compiled = self._cache.get(pattern)
+
+        if not compiled.is_segmented:
+            # Partial-segment wildcards cannot be walked; fall back to a scan
+            return {
+                value
+                for key, values in self.items()
+                if compiled.match(key)
+                for value in values
+            }
+
+        segments = compiled.segments
+        count = len(segments)
+        result: Set[Hashable] = set()
+
+        stack: List[Tuple[_TrieNode, int]] = [(self._root, 0)]
+        seen: Set[Tuple[int, int]] = set()
+        while stack:
+            node, index = stack.pop()
+            state = (id(node), index)
+            if state in seen:
+                continue
+            seen.add(state)
+
+            if index == count:
+                result.update(node.values)
+                continue
+
+            segment = segments[index]
+            if segment == MULTI_WILDCARD:
+                # Descend one or more levels, trying the rest of the pattern at each
+                frontier = list(node.children.values())
+                while frontier:
+                    child = frontier.pop()
+                    stack.append((child, index + 1))
+                    frontier.extend(child.children.values())
+            elif segment == SINGLE_WILDCARD:
+                for name, child in node.children.items():
+                    if name:
+                        stack.append((child, index + 1))
+            else:
+                child = node.children.get(segment)
+                if child is not None:
+                    stack.append((child, index + 1))
+
+        return result
+
+    def items(self) -> Iterable[Tuple[str, Set[Hashable]]]:
+        """Iterate over (key, values) pairs"""
+        stack: List[Tuple[_TrieNode, Tuple[str, ...]]] = [(self._root, ())]
+        while stack:
+            node, path = stack.pop()
+            if node.values and path:
+                yield ".".join(path), node.values
+            for segment, child in node.children.items():
+                stack.append((child, path + (segment,)))
+        yield from self._irregular.items()
+
+    def __len__(self) -> int:
+        return self._size
@@ -6,13 +6,13 @@ Handles subscriptions to channels, tasks, and agents for real-time updates.
 
 import asyncio
 import logging
-import re
 from datetime import datetime
 from typing import Dict, Set, List, Optional, Any, Callable
 from uuid import uuid4
 
 from tekton.models import TektonBaseModel
 from .events import StreamEvent, EventType
+from .patterns import SegmentTrie, matches_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -120,15 +120,15 @@ class Subscription(TektonBaseModel):
                 return False
             # Check for pattern matching in filters
             if "channel_pattern" in self.filters:
-                from .channels import ChannelBridge
-                # Use static pattern matching method
-                if not self._matches_channel_pattern(event.channel, self.filters["channel_pattern"]):
+                if not matches_pattern(event.channel, self.filters["channel_pattern"]):
                     return False
             elif event.channel != self.target:
                 return False
         
         # Check custom filters
         for key, value in self.filters.items():
+            if key == "channel_pattern":
+                continue
             if not hasattr(event, key) or getattr(event, key) != value:
                 return False
         
@@ -140,17 +140,7 @@ class Subscription(TektonBaseModel):
     
     def _matches_channel_pattern(self, channel: str, pattern: str) -> bool:
         """Check if channel matches pattern with wildcards"""
-        # Convert pattern to regex
-        # First escape dots
-        regex_pattern = pattern.replace(".", r"\.")
-        # Replace ** with a placeholder to avoid conflict with *
-        regex_pattern = regex_pattern.replace("**", "__DOUBLE_STAR__")
-        # Replace single * with pattern for one segment
-        regex_pattern = regex_pattern.replace("*", "[^.]+")
-        # Replace placeholder with pattern for multiple segments
-        regex_pattern = regex_pattern.replace("__DOUBLE_STAR__", ".*")
-        regex_pattern = f"^{regex_pattern}$"
-        return bool(re.match(regex_pattern, channel))
+        return matches_pattern(channel, pattern)
 
 
 class SubscriptionManager:
@@ -162,6 +152,7 @@ class SubscriptionManager:
         self._subscriptions: Dict[str, Subscription] = {}
         self._subscriber_index: Dict[str, Set[str]] = {}  # subscriber_id -> subscription_ids
         self._target_index: Dict[str, Set[str]] = {}  # target -> subscription_ids
+        self._pattern_index = SegmentTrie()  # channel_pattern -> subscription_ids
         self._callbacks: Dict[str, Callable[[StreamEvent], None]] = {}
         self._lock = asyncio.Lock()
     
@@ -194,6 +185,10 @@ class SubscriptionManager:
                     self._target_index[subscription.target] = set()
                 self._target_index[subscription.target].add(subscription.id)
             
+            pattern = subscription.filters.get("channel_pattern")
+            if pattern is not None:
+                self._pattern_index.add(pattern, subscription.id)
+            
             # Store callback if provided
             if callback:
                 self._callbacks[subscription.id] = callback
@@ -206,6 +201,41 @@ class SubscriptionManager:
         
         return subscription.id
     
+    async def create_subscription(
+        self,
+        subscriber_id: str,
+        subscription_type: str,
+        target: Optional[str] = None,
+        event_types: Optional[List[EventType]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        callback: Optional[Callable[[StreamEvent], None]] = None
+    ) -> Subscription:
+        """
+        Create and add a subscription
+        
+        Args:
+            subscriber_id: Agent or client ID
+            subscription_type: Type of subscription
+            target: Optional target (task_id, agent_id, channel name)
+            event_types: Event types to receive (all if omitted)
+            filters: Event filters; ``channel_pattern`` enables wildcard channels
+            callback: Optional callback for matching events
+            
+        Returns:
+            The created subscription
+        """
+        subscription = Subscription(
+            id=f"sub-{uuid4()}",
+            subscriber_id=subscriber_id,
+            subscription_type=subscription_type,
+            target=target,
+            event_types=event_types or [],
+            filters=filters or {},
+            created_at=datetime.utcnow()
+        )
+        await self.add_subscription(subscription, callback)
+        return subscription
+    
     async def remove_subscription(self, subscription_id: str) -> bool:
         """Remove a subscription"""
         async with self._lock:
@@ -225,6 +255,10 @@ class SubscriptionManager:
                 if not self._target_index[subscription.target]:
                     del self._target_index[subscription.target]
             
+            pattern = subscription.filters.get("channel_pattern")
+            if pattern is not None:
+                self._pattern_index.remove(pattern, subscription_id)
+            
             # Remove subscription and callback
             del self._subscriptions[subscription_id]
             self._callbacks.pop(subscription_id, None)
@@ -284,8 +318,12 @@ class SubscriptionManager:
             if hasattr(event, "agent_id") and event.agent_id in self._target_index:
                 potential_subs.update(self._target_index[event.agent_id])
             
-            if hasattr(event, "channel") and event.channel in self._target_index:
-                potential_subs.update(self._target_index[event.channel])
+            if hasattr(event, "channel") and event.channel is not None:
+                if event.channel in self._target_index:
+                    potential_subs.update(self._target_index[event.channel])
+                # Pattern subscriptions are found through the segment trie
+                if self._pattern_index:
+                    potential_subs.update(self._pattern_index.match(event.channel))
             
             # Also check broadcast subscriptions
             if None in self._target_index:
@@ -19,9 +19,11 @@ from starlette.websockets import WebSocketState
 from ..jsonrpc import (
     JSONRPCRequest,
     JSONRPCResponse,
+    JSONRPCBatch,
     JSONRPCError,
     parse_jsonrpc_message
 )
+from ..methods import MethodDispatcher
 from .events import StreamEvent, EventType
 
 logger = logging.getLogger(__name__)
@@ -60,6 +62,9 @@ class WebSocketConnection:
         self.on_notification: Optional[Callable] = None
         self.on_response: Optional[Callable] = None
         
+        # Dispatcher for batches (and requests, if set)
+        self.dispatcher: Optional[MethodDispatcher] = None
+        
         # Pending requests awaiting responses
         self.pending_requests: Dict[Union[str, int], asyncio.Future] = {}
     
@@ -211,6 +216,7 @@ class WebSocketManager:
         # Global message handlers
         self.on_request: Optional[Callable] = None
         self.on_notification: Optional[Callable] = None
+        self.dispatcher: Optional[MethodDispatcher] = None
     
     async def connect(
         self,
@@ -286,7 +292,9 @@ class WebSocketManager:
                     continue
                 
                 # Handle different message types
-                if isinstance(parsed, JSONRPCRequest):
+                if isinstance(parsed, JSONRPCBatch):
+                    await self._handle_batch(connection, parsed)
+                elif isinstance(parsed, JSONRPCRequest):
                     # Check if it's a notification (no ID)
                     if parsed.id is None:
                         await self._handle_notification(connection, parsed)
@@ -302,12 +310,43 @@ class WebSocketManager:
         finally:
             await self.disconnect(connection.id)
     
+    async def _handle_batch(
+        self,
+        connection: WebSocketConnection,
+        batch: JSONRPCBatch
+    ):
+        """Handle incoming JSON-RPC batch through the method dispatcher"""
+        dispatcher = connection.dispatcher or self.dispatcher
+        if not dispatcher:
+            logger.error(f"Batch from {connection.id} but no dispatcher configured")
+            await connection.send_message(
+                JSONRPCResponse(
+                    id=None,
+                    error={
+                        "code": -32603,
+                        "message": "No dispatcher configured for batch requests"
+                    }
+                ).to_dict()
+            )
+            return
+        
+        responses = await dispatcher.dispatch_batch(batch)
+        
+        # A batch of notifications gets no reply
+        if responses is not None:
+            await connection.send_message(responses.to_json())
+    
     async def _handle_request(
         self,
         connection: WebSocketConnection,
         request: JSONRPCRequest
     ):
         """Handle incoming JSON-RPC request"""
+        dispatcher = connection.dispatcher or self.dispatcher
+        if dispatcher and not (connection.on_request or self.on_request):
+            await connection.send_message((await dispatcher.dispatch(request)).to_dict())
+            return
+        
         try:
             # Use connection-specific handler or global handler
             handler = connection.on_request or self.on_request
@@ -344,8 +383,11 @@ class WebSocketManager:
         try:
             # Use connection-specific handler or global handler
             handler = connection.on_notification or self.on_notification
+            dispatcher = connection.dispatcher or self.dispatcher
             if handler:
                 await handler(connection, notification)
+            elif dispatcher:
+                await dispatcher.handle_message(notification)
         except Exception as e:
             logger.error(f"Error handling notification: {e}")
     
@@ -447,7 +489,8 @@ async def handle_websocket(
     agent_id: Optional[str] = None,
     filters: Optional[Dict[str, Any]] = None,
     on_request: Optional[Callable] = None,
-    on_notification: Optional[Callable] = None
+    on_notification: Optional[Callable] = None,
+    dispatcher: Optional[MethodDispatcher] = None
 ) -> None:
     """
     Handle a WebSocket connection for A2A streaming
@@ -458,6 +501,8 @@ async def handle_websocket(
         filters: Optional filters for event routing
         on_request: Optional handler for incoming requests
         on_notification: Optional handler for incoming notifications
+        dispatcher: Optional method dispatcher for batches, and for
+            requests when no request handler is set
     """
     connection = await websocket_manager.connect(websocket, agent_id, filters)
     
@@ -466,6 +511,8 @@ async def handle_websocket(
         connection.on_request = on_request
     if on_notification:
         connection.on_notification = on_notification
+    if dispatcher:
+        connection.dispatcher = dispatcher
     
     # Handle the connection
     await websocket_manager.handle_connection(connection)
\ No newline at end of file
@@ -12,7 +12,7 @@ import logging
 from typing import Dict, List, Any, Optional, Callable
 
 from ..graceful_degradation import GracefulDegradationManager, NoFallbackAvailableError
-from ..registry import _save_registrations
+from .registry.persistence import persist_component
 
 logger = logging.getLogger("tekton.component_lifecycle.capability")
 
@@ -90,7 +90,7 @@ async def register_capability(
     
     # Save updated registrations
     if data_dir:
-        await _save_registrations(components, data_dir)
+        await persist_component(component, None, data_dir)
     
     return True
 
@@ -11,7 +11,7 @@ import logging
 from typing import Dict, Optional, Tuple, Any
 
 from ..lifecycle import ComponentState
-from ..registry import _save_registrations
+from .registry.persistence import persist_component, persist_heartbeat
 
 logger = logging.getLogger("tekton.component_lifecycle.heartbeat")
 
@@ -59,6 +59,8 @@ async def process_heartbeat(
     # Get component registration
     component = components[component_id]
     
+    state_persisted = False
+    
     # Update last heartbeat time
     instances[component_id]["last_heartbeat"] = time.time()
     
@@ -101,7 +103,8 @@ async def process_heartbeat(
             
             # Persist state update
             if data_dir:
-                await _save_registrations(components, data_dir)
+                await persist_component(component, instances[component_id], data_dir)
+                state_persisted = True
         else:
             logger.warning(f"Invalid state transition in heartbeat: {component.state} -> {state}")
     
@@ -109,6 +112,10 @@ async def process_heartbeat(
     if metadata:
         component.metadata.update(metadata)
         instances[component_id].setdefault("metadata", {}).update(metadata)
+    
+    # Heartbeat-only updates are written in batches on the store's flush interval
+    if data_dir and not state_persisted:
+        await persist_heartbeat(component, instances[component_id], data_dir)
         
     return True, "Heartbeat processed"
 
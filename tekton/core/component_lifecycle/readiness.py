@@ -11,7 +11,7 @@ import logging
 from typing import Dict, List, Any, Optional, Callable, Awaitable, Tuple
 
 from ..lifecycle import ComponentState, ReadinessCondition
-from ..registry import _save_registrations
+from .registry.persistence import persist_component
 
 logger = logging.getLogger("tekton.component_lifecycle.readiness")
 
@@ -173,7 +173,7 @@ async def mark_component_ready(
         
     # Persist state update
     if data_dir:
-        await _save_registrations(components, data_dir)
+        await persist_component(component, instances.get(component_id), data_dir)
         
     return True, "Component marked as ready"
 
@@ -11,7 +11,7 @@ import logging
 from typing import Dict, List, Any, Optional, Set, Tuple
 
 from ..lifecycle import ComponentState
-from ..registry import _save_registrations
+from .registry.persistence import persist_component
 
 logger = logging.getLogger("tekton.component_lifecycle.recovery")
 
@@ -111,7 +111,7 @@ async def _implement_restart_recovery(
     # Save state change
     instances[component_id]["state"] = ComponentState.RESTARTING.value
     if data_dir:
-        await _save_registrations(components, data_dir)
+        await persist_component(component, instances.get(component_id), data_dir)
     
     try:
         # 1. Signal component to save state if possible
@@ -138,7 +138,7 @@ async def _implement_restart_recovery(
             
             instances[component_id]["state"] = ComponentState.INITIALIZING.value
             if data_dir:
-                await _save_registrations(components, data_dir)
+                await persist_component(component, instances.get(component_id), data_dir)
                 
             logger.info(f"Recovery restart successful for component {component_id}")
             return True
@@ -152,7 +152,7 @@ async def _implement_restart_recovery(
             
             instances[component_id]["state"] = ComponentState.FAILED.value
             if data_dir:
-                await _save_registrations(components, data_dir)
+                await persist_component(component, instances.get(component_id), data_dir)
                 
             logger.error(f"Recovery restart failed for component {component_id}")
             return False
@@ -169,7 +169,7 @@ async def _implement_restart_recovery(
         
         instances[component_id]["state"] = ComponentState.FAILED.value
         if data_dir:
-            await _save_registrations(components, data_dir)
+            await persist_component(component, instances.get(component_id), data_dir)
             
         return False
 
@@ -219,7 +219,7 @@ async def _implement_reset_recovery(
         
         instances[component_id]["state"] = ComponentState.INITIALIZING.value
         if data_dir:
-            await _save_registrations(components, data_dir)
+            await persist_component(component, instances.get(component_id), data_dir)
             
         logger.info(f"Recovery reset successful for component {component_id}")
         return True
@@ -236,7 +236,7 @@ async def _implement_reset_recovery(
         
         instances[component_id]["state"] = ComponentState.FAILED.value
         if data_dir:
-            await _save_registrations(components, data_dir)
+            await persist_component(component, instances.get(component_id), data_dir)
             
         return False
 
@@ -285,7 +285,7 @@ async def _implement_failover_recovery(
         
         instances[component_id]["state"] = ComponentState.FAILED.value
         if data_dir:
-            await _save_registrations(components, data_dir)
+            await persist_component(component, instances.get(component_id), data_dir)
             
         # 4. Perform failover
         failover_success = await _perform_failover(
@@ -317,7 +317,7 @@ async def _implement_failover_recovery(
             
             instances[component_id]["state"] = ComponentState.INACTIVE.value
             if data_dir:
-                await _save_registrations(components, data_dir)
+                await persist_component(component, instances.get(component_id), data_dir)
                 
             return True
         else:
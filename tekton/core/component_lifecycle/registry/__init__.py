@@ -11,8 +11,12 @@ from .components import (
     get_all_components
 )
 from .persistence import (
+    RegistrationStore,
+    get_registration_store,
     load_registrations,
-    save_registrations
+    save_registrations,
+    persist_component,
+    persist_heartbeat
 )
 from .monitoring import (
     check_for_automatic_recovery
@@ -22,7 +26,11 @@ __all__ = [
     "ComponentRegistry",
     "get_component_info",
     "get_all_components",
+    "RegistrationStore",
+    "get_registration_store",
     "load_registrations",
     "save_registrations",
+    "persist_component",
+    "persist_heartbeat",
     "check_for_automatic_recovery"
 ]
\ No newline at end of file
@@ -38,7 +38,7 @@ async def get_component_info(components: Dict[str, Any], instances: Dict[str, Di
         "state": component.state,
         "instance_uuid": component.instance_uuid,
         "capabilities": component.capabilities,
-        "dependencies": component.dependencies,
+        "dependencies": getattr(component, "dependencies", []),
         "metadata": component.metadata,
         "recovery_attempts": component.recovery_attempts,
         "health_metrics": instance_data.get("health_metrics", {}),
@@ -3,7 +3,9 @@
 Core Component Registry Module
 
 This module provides the main ComponentRegistry class for handling component
-lifecycle management.
+lifecycle management. Waiting for component readiness is event-driven: every
+registry operation that can change a component's state wakes the tasks
+waiting on that component, so waiters neither poll nor take the lock.
 """
 
 import os
@@ -21,11 +23,10 @@ from ...graceful_degradation import GracefulDegradationManager
 from ..readiness import (
     register_readiness_condition,
     check_readiness_conditions,
-    mark_component_ready,
-    wait_for_dependencies
+    mark_component_ready
 )
 from ..healthcheck import attempt_component_recovery
-from .persistence import load_registrations, save_registrations
+from .persistence import load_registrations, get_registration_store
 from .components import get_component_info, get_all_components
 from .operations import (
     register_component,
@@ -41,6 +42,10 @@ from .operations import (
 
 logger = logging.getLogger("tekton.component_lifecycle.registry")
 
+# Waiters re-check state at least this often, to catch changes made to a
+# ComponentRegistration directly rather than through the registry
+STATE_RECHECK_INTERVAL = 5.0
+
 
 class ComponentRegistry:
     """
@@ -80,6 +85,12 @@ class ComponentRegistry:
         
         self.lock = asyncio.Lock()
         
+        # Journaled persistence shared with the registry operations
+        self.store = get_registration_store(self.data_dir)
+        
+        # Events of tasks waiting for state changes, by component ID
+        self._state_waiters: Dict[str, Set[asyncio.Event]] = {}
+        
         # Use default values until async load is performed
         self.components = {}
         self.instances = {}
@@ -95,9 +106,54 @@ class ComponentRegistry:
                 self.components = components
                 self.instances = instances
                 logger.debug("Loaded registrations asynchronously")
+            self._notify_state_change()
         except Exception as e:
             logger.error(f"Failed to load registrations: {e}")
     
+    def _notify_state_change(self, component_ids: Optional[List[str]] = None) -> None:
+        """
+        Wake tasks waiting on components whose state may have changed.
+        
+        Args:
+            component_ids: Components to notify about (None for all)
+        """
+        if component_ids is None:
+            component_ids = list(self._state_waiters)
+        for component_id in component_ids:
+            for event in self._state_waiters.get(component_id, ()):
+                event.set()
+    
+    async def _wait_for_state_change(self, component_ids: List[str], timeout: float) -> None:
+        """
+        Wait until any of the components may have changed state, or the timeout.
+        
+        Callers check state first; since nothing is awaited between that check
+        and registering the waiter, no notification can be missed.
+        
+        Args:
+            component_ids: Components to watch
+            timeout: Maximum time to wait in seconds
+        """
+        event = asyncio.Event()
+        for component_id in component_ids:
+            self._state_waiters.setdefault(component_id, set()).add(event)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for component_id in component_ids:
+                waiters = self._state_waiters.get(component_id)
+                if waiters is not None:
+                    waiters.discard(event)
+                    if not waiters:
+                        del self._state_waiters[component_id]
+    
+    def _component_state(self, component_id: str) -> Optional[str]:
+        """Current state of a component, or None if not registered."""
+        component = self.components.get(component_id)
+        return component.state if component is not None else None
+    
     async def register_component(self, registration: ComponentRegistration) -> Tuple[bool, str]:
         """
         Register a component with the registry.
@@ -109,12 +165,14 @@ class ComponentRegistry:
             Tuple of (success, message)
         """
         async with self.lock:
-            return await register_component(
+            result = await register_component(
                 self.components, 
                 self.instances, 
                 registration, 
                 self.data_dir
             )
+        self._notify_state_change([registration.component_id])
+        return result
     
     async def update_component_state(self, 
                             component_id: str, 
@@ -134,7 +192,7 @@ class ComponentRegistry:
             Tuple of (success, message)
         """
         async with self.lock:
-            return await update_component_state(
+            result = await update_component_state(
                 self.components,
                 self.instances,
                 component_id,
@@ -143,6 +201,8 @@ class ComponentRegistry:
                 metadata,
                 self.data_dir
             )
+        self._notify_state_change([component_id])
+        return result
     
     async def register_readiness_condition(self,
                                 component_id: str,
@@ -206,7 +266,7 @@ class ComponentRegistry:
             Tuple of (success, message)
         """
         async with self.lock:
-            return await mark_component_ready(
+            result = await mark_component_ready(
                 self.components,
                 self.instances,
                 self.readiness_conditions,
@@ -215,62 +275,56 @@ class ComponentRegistry:
                 metadata,
                 self.data_dir
             )
+        self._notify_state_change([component_id])
+        return result
     
     async def wait_for_component_ready(self, 
                             component_id: str, 
                             timeout: float = 60.0,
-                            check_interval: float = 0.5) -> Tuple[bool, Optional[Dict[str, Any]]]:
+                            check_interval: float = STATE_RECHECK_INTERVAL) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """
         Wait for a component to become ready.
         
+        Returns as soon as the registry records the component as READY or
+        FAILED; the component does not need to be registered yet.
+        
         Args:
             component_id: Component ID to wait for
             timeout: Timeout in seconds
-            check_interval: Interval between checks
+            check_interval: Longest time between state re-checks
             
         Returns:
             Tuple of (success, component_info)
         """
-        # Initial check with lock
-        async with self.lock:
-            if component_id in self.components:
-                state = self.components[component_id].state
-                if state == ComponentState.READY.value:
-                    return True, await self.get_component_info(component_id)
-        
-        # Periodic checking without holding lock for the entire duration
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            # Check with lock
-            async with self.lock:
-                if component_id in self.components:
-                    state = self.components[component_id].state
-                    if state == ComponentState.READY.value:
-                        return True, await self.get_component_info(component_id)
-                    elif state == ComponentState.FAILED.value:
-                        return False, await self.get_component_info(component_id)
-            
-            # Wait without holding lock
-            await asyncio.sleep(check_interval)
-            
-            # Increase check interval with a cap
-            check_interval = min(check_interval * 1.5, 5)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
         
-        # Final check with lock
-        async with self.lock:
-            return False, await self.get_component_info(component_id)
+        while True:
+            state = self._component_state(component_id)
+            if state == ComponentState.READY.value:
+                return True, await self.get_component_info(component_id)
+            if state == ComponentState.FAILED.value:
+                return False, await self.get_component_info(component_id)
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False, await self.get_component_info(component_id)
+            await self._wait_for_state_change([component_id], min(remaining, check_interval))
     
     async def wait_for_dependencies(self, 
                         dependencies: List[str], 
                         timeout: float = 60.0,
-                        check_interval: float = 0.5) -> Tuple[bool, List[str]]:
+                        check_interval: float = STATE_RECHECK_INTERVAL) -> Tuple[bool, List[str]]:
         """
         Wait for multiple dependencies to become ready.
         
+        All dependencies are watched at once, and the call returns as soon
+        as they are all READY or any of them has FAILED.
+        
         Args:
             dependencies: List of component IDs to wait for
             timeout: Timeout in seconds
-            check_interval: Interval between checks
+            check_interval: Longest time between state re-checks
             
         Returns:
             Tuple of (all_ready, failed_dependencies)
@@ -279,17 +333,35 @@ class ComponentRegistry:
         if not dependencies:
             return True, []
         
-        # Initial check with lock
-        async with self.lock:
-            components_copy = self.components.copy()
-        
-        # Use the copied state to minimize lock contention
-        return await wait_for_dependencies(
-            components_copy,
-            dependencies,
-            timeout,
-            check_interval
-        )
+        # Check for unknown dependencies
+        unknown = [d for d in dependencies if d not in self.components]
+        if unknown:
+            logger.warning(f"Unknown dependencies: {unknown}")
+            return False, unknown
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        while True:
+            pending = []
+            failed = []
+            for dep_id in dependencies:
+                state = self._component_state(dep_id)
+                if state == ComponentState.FAILED.value or state is None:
+                    failed.append(dep_id)
+                elif state != ComponentState.READY.value:
+                    pending.append(dep_id)
+            
+            if failed:
+                logger.error(f"Dependencies in FAILED state: {failed}")
+                return False, failed
+            if not pending:
+                return True, []
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False, pending
+            await self._wait_for_state_change(pending, min(remaining, check_interval))
     
     async def process_heartbeat(self, 
                     component_id: str, 
@@ -317,7 +389,7 @@ class ComponentRegistry:
             Tuple of (success, message)
         """
         async with self.lock:
-            return await process_heartbeat_internal(
+            result = await process_heartbeat_internal(
                 self.components,
                 self.instances,
                 component_id,
@@ -330,6 +402,8 @@ class ComponentRegistry:
                 details,
                 self.data_dir
             )
+        self._notify_state_change([component_id])
+        return result
     
     async def attempt_component_recovery(self, 
                                 component_id: str,
@@ -347,7 +421,7 @@ class ComponentRegistry:
             True if recovery was successful
         """
         async with self.lock:
-            return await attempt_component_recovery(
+            result = await attempt_component_recovery(
                 self.components,
                 self.instances,
                 component_id,
@@ -355,6 +429,8 @@ class ComponentRegistry:
                 recovery_strategy,
                 self.data_dir
             )
+        self._notify_state_change([component_id])
+        return result
     
     async def get_component_info(self, component_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -379,6 +455,24 @@ class ComponentRegistry:
         async with self.lock:
             return await get_all_components(self.components, self.instances)
     
+    async def flush(self) -> bool:
+        """
+        Write heartbeat updates still held in memory to disk.
+        
+        Returns:
+            True if saved successfully
+        """
+        return self.store.flush()
+    
+    def get_persistence_stats(self) -> Dict[str, Any]:
+        """
+        Get persistence metrics (writes, bytes written, persist latency).
+        
+        Returns:
+            Dictionary of persistence statistics
+        """
+        return self.store.get_stats()
+    
     async def monitor_components(self, heartbeat_timeout: int = 30) -> None:
         """
         Monitor component health and mark failed components with enhanced degradation.
@@ -397,9 +491,12 @@ class ComponentRegistry:
                         heartbeat_timeout
                     )
                 
-                    # Attempt recovery for candidates
-                    for component_id in recovery_candidates:
-                        await self.attempt_component_recovery(component_id)
+                # Attempt recovery for candidates (takes the lock itself)
+                for component_id in recovery_candidates:
+                    await self.attempt_component_recovery(component_id)
+                
+                # Components may have been marked failed
+                self._notify_state_change()
             
             except Exception as e:
                 logger.error(f"Error in component monitor: {e}")
@@ -9,7 +9,7 @@ import logging
 from typing import Dict, List, Any, Optional, Tuple
 
 from ....lifecycle import ComponentState
-from ..persistence import save_registrations
+from ..persistence import persist_component
 from ..monitoring import check_for_automatic_recovery
 from ...healthcheck import monitor_component_health, process_heartbeat
 
@@ -72,7 +72,7 @@ async def monitor_components(
                         # Try to save (but don't fail if we can't)
                         try:
                             if data_dir:
-                                await save_registrations(components, data_dir)
+                                await persist_component(component, instances[component_id], data_dir)
                         except Exception as e:
                             logger.error(f"Error saving degraded state: {e}")
                     else:
@@ -95,7 +95,7 @@ async def monitor_components(
                         # Try to save (but don't fail if we can't)
                         try:
                             if data_dir:
-                                await save_registrations(components, data_dir)
+                                await persist_component(component, instances[component_id], data_dir)
                         except Exception as e:
                             logger.error(f"Error saving failed state: {e}")
     
@@ -9,7 +9,7 @@ import logging
 from typing import Dict, Any, Optional, Tuple
 
 from ....lifecycle import ComponentRegistration
-from ..persistence import save_registrations
+from ..persistence import persist_component
 
 logger = logging.getLogger("tekton.component_lifecycle.registry.operations.registration")
 
@@ -50,7 +50,7 @@ async def register_component(
         }
         
         logger.info(f"Updated registration for {registration.component_id}")
-        await save_registrations(components, data_dir)
+        await persist_component(registration, instances[registration.component_id], data_dir)
         return True, "Registration updated"
     
     # New registration
@@ -64,7 +64,7 @@ async def register_component(
     }
     
     logger.info(f"Registered new component: {registration.component_id} ({registration.component_name})")
-    await save_registrations(components, data_dir)
+    await persist_component(registration, instances[registration.component_id], data_dir)
     return True, "Registration successful"
 
 
@@ -118,7 +118,7 @@ async def update_component_state(
         component.metadata.update(metadata)
         instances[component_id].setdefault("metadata", {}).update(metadata)
         
-    # Save updated registrations
-    await save_registrations(components, data_dir)
+    # Save updated registration
+    await persist_component(component, instances[component_id], data_dir)
     
     return True, f"Updated component state: {state}"
\ No newline at end of file
@@ -3,111 +3,449 @@
 Component Registry Persistence Module
 
 This module provides functionality for loading and saving registry state.
+
+State is kept as a compact snapshot (registrations.json) plus an append-only
+journal (registrations.journal) of per-component records. Structural changes
+(registration, state transitions, capabilities) are journaled immediately;
+heartbeat-only updates are held in memory and written in one batch per flush
+interval. The journal is folded into a new snapshot once it grows past a
+threshold.
 """
 
 import os
 import json
+import time
 import asyncio
 import logging
-from typing import Dict, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional
 
 from ...lifecycle import ComponentRegistration
 
 logger = logging.getLogger("tekton.component_lifecycle.registry.persistence")
 
+SNAPSHOT_FILE = "registrations.json"
+JOURNAL_FILE = "registrations.journal"
+
+# Seconds heartbeat-only updates may stay in memory before being written
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# Journal records written before the journal is compacted into a snapshot
+DEFAULT_SNAPSHOT_THRESHOLD = 1000
+
+
+class RegistrationStore:
+    """
+    Snapshot-plus-journal persistence for the registrations in one data directory.
+
+    The store keeps references to the registrations and instance records it
+    has seen, so a snapshot always reflects their current values.
+    """
+
+    def __init__(self,
+                 data_dir: str,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 snapshot_threshold: int = DEFAULT_SNAPSHOT_THRESHOLD):
+        """
+        Initialize the store.
+
+        Args:
+            data_dir: Directory holding the snapshot and journal
+            flush_interval: Seconds heartbeat-only updates are held before writing
+            snapshot_threshold: Journal records that trigger a new snapshot
+        """
+        self.data_dir = data_dir
+        self.flush_interval = flush_interval
+        self.snapshot_threshold = snapshot_threshold
+        self.snapshot_file = os.path.join(data_dir, SNAPSHOT_FILE)
+        self.journal_file = os.path.join(data_dir, JOURNAL_FILE)
+
+        # Persisted view: component ID -> (registration, instance record)
+        self._records: Dict[str, Tuple[Any, Optional[Dict[str, Any]]]] = {}
+        self._loaded = False
+        self._journal_records = 0
+
+        # Heartbeat-only updates waiting for the next flush
+        self._pending: Dict[str, Tuple[Any, Optional[Dict[str, Any]]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        self.stats = {
+            "journal_writes": 0,
+            "journal_records": 0,
+            "snapshots": 0,
+            "bytes_written": 0,
+            "persist_seconds": 0.0,
+            "last_persist_ms": 0.0,
+            "max_persist_ms": 0.0,
+            "heartbeats_coalesced": 0
+        }
+
+    def load(self) -> Tuple[Dict[str, ComponentRegistration], Dict[str, Dict[str, Any]]]:
+        """
+        Read the snapshot and replay the journal on top of it.
+
+        Returns:
+            Tuple of (components, instances)
+        """
+        # Reading back must not drop heartbeats that are still in memory
+        self.flush()
+
+        component_data: Dict[str, Dict[str, Any]] = {}
+        instances: Dict[str, Dict[str, Any]] = {}
+
+        if os.path.exists(self.snapshot_file):
+            try:
+                with open(self.snapshot_file, "r") as f:
+                    data = json.load(f)
+                for item in data.get("components", []):
+                    component_data[item.get("component_id")] = item
+                instances = data.get("instances", {})
+            except Exception as e:
+                logger.error(f"Error loading registrations: {e}")
+
+        self._journal_records = 0
+        if os.path.exists(self.journal_file):
+            try:
+                with open(self.journal_file, "r") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            # A torn final write; everything before it is intact
+                            logger.warning(f"Ignoring incomplete journal record in {self.journal_file}")
+                            break
+                        self._journal_records += 1
+                        self._apply(record, component_data, instances)
+            except Exception as e:
+                logger.error(f"Error replaying registration journal: {e}")
+
+        components = {}
+        for component_id, item in component_data.items():
+            try:
+                components[component_id] = ComponentRegistration.from_dict(item)
+            except Exception as e:
+                logger.error(f"Error loading component: {e}")
+
+        self._records = {
+            component_id: (component, instances.get(component_id))
+            for component_id, component in components.items()
+        }
+        self._pending.clear()
+        self._loaded = True
+
+        logger.info(f"Loaded {len(components)} component registrations "
+                    f"({self._journal_records} journal records)")
+        return components, instances
+
+    @staticmethod
+    def _apply(record: Dict[str, Any],
+               component_data: Dict[str, Dict[str, Any]],
+               instances: Dict[str, Dict[str, Any]]) -> None:
+        """Apply one journal record to loaded state."""
+        component_id = record.get("component_id")
+        if record.get("op") == "remove":
+            component_data.pop(component_id, None)
+            instances.pop(component_id, None)
+            return
+
+        component_data[component_id] = record["component"]
+        if record.get("instance") is not None:
+            instances[component_id] = record["instance"]
+
+    def _ensure_loaded(self) -> None:
+        """Populate the persisted view before the first write, so snapshots are complete."""
+        if not self._loaded:
+            self.load()
+
+    def record(self, component: Any, instance: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Journal a structural change to a component immediately.
+
+        Args:
+            component: ComponentRegistration
+            instance: Instance record for the component
+
+        Returns:
+            True if written successfully
+        """
+        self._ensure_loaded()
+        self._pending.pop(component.component_id, None)
+        instance = self._track(component, instance)
+        return self._append([self._put_record(component, instance)])
+
+    def record_heartbeat(self, component: Any, instance: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Note a heartbeat-only update, written at the next flush.
+
+        Args:
+            component: ComponentRegistration
+            instance: Instance record for the component
+        """
+        self._ensure_loaded()
+        if component.component_id in self._pending:
+            self.stats["heartbeats_coalesced"] += 1
+        self._pending[component.component_id] = (component, self._track(component, instance))
+        self._schedule_flush()
+
+    def _track(self, component: Any, instance: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Update the persisted view, keeping the known instance record if none is given."""
+        if instance is None:
+            instance = self._records.get(component.component_id, (None, None))[1]
+        self._records[component.component_id] = (component, instance)
+        return instance
+
+    def remove(self, component_id: str) -> bool:
+        """
+        Journal the removal of a component.
+
+        Args:
+            component_id: Component ID
+
+        Returns:
+            True if written successfully
+        """
+        self._ensure_loaded()
+        self._pending.pop(component_id, None)
+        self._records.pop(component_id, None)
+        return self._append([{"op": "remove", "component_id": component_id}])
+
+    def _schedule_flush(self) -> None:
+        """Arrange for pending heartbeats to be written within the flush interval."""
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None or self.flush_interval <= 0:
+            self.flush()
+        else:
+            self._flush_handle = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self) -> bool:
+        """
+        Write pending heartbeat-only updates as a single journal append.
+
+        Returns:
+            True if written successfully (or nothing was pending)
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return True
+
+        pending = list(self._pending.values())
+        self._pending.clear()
+        return self._append([self._put_record(component, instance) for component, instance in pending])
+
+    @staticmethod
+    def _put_record(component: Any, instance: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "op": "put",
+            "component_id": component.component_id,
+            "component": component.to_dict(),
+            "instance": instance
+        }
+
+    def _append(self, records: List[Dict[str, Any]]) -> bool:
+        """Append records to the journal, compacting it when it grows too long."""
+        lines = []
+        for record in records:
+            try:
+                lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+            except Exception as e:
+                logger.error(f"Error serializing component {record.get('component_id')}: {e}")
+        if not lines:
+            return False
+
+        start = time.perf_counter()
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+            payload = "".join(lines).encode("utf-8")
+            with open(self.journal_file, "ab") as f:
+                f.write(payload)
+        except Exception as e:
+            logger.error(f"Error saving registrations: {e}")
+            return False
+
+        self._record_persist(start, len(payload))
+        self.stats["journal_writes"] += 1
+        self.stats["journal_records"] += len(lines)
+        self._journal_records += len(lines)
+
+        if self._journal_records >= self.snapshot_threshold:
+            return self.snapshot()
+        return True
+
+    def snapshot(self, components: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Write a full snapshot and truncate the journal.
+
+        Args:
+            components: Replace the persisted set of registrations with these
+                (instance records of components still present are kept)
+
+        Returns:
+            True if saved successfully
+        """
+        self._ensure_loaded()
+        if components is not None:
+            self._records = {
+                component_id: (component, self._records.get(component_id, (None, None))[1])
+                for component_id, component in components.items()
+            }
+
+        # Pending heartbeats are covered by the snapshot
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+
+        data = {
+            "components": [],
+            "instances": {}
+        }
+        for component_id, (component, instance) in self._records.items():
+            try:
+                data["components"].append(component.to_dict())
+                if instance is not None:
+                    data["instances"][component_id] = instance
+            except Exception as e:
+                logger.error(f"Error serializing component {component_id}: {e}")
+
+        start = time.perf_counter()
+        temp_file = self.snapshot_file + ".tmp"
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+            payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+            # Write to temporary file first, then replace atomically
+            with open(temp_file, "wb") as f:
+                f.write(payload)
+            os.replace(temp_file, self.snapshot_file)
+
+            # Replaying records the snapshot already contains would be harmless,
+            # so a crash between these two steps loses nothing
+            open(self.journal_file, "wb").close()
+        except Exception as e:
+            logger.error(f"Error saving registrations: {e}")
+            return False
+
+        self._record_persist(start, len(payload))
+        self.stats["snapshots"] += 1
+        self._journal_records = 0
+        logger.debug(f"Saved snapshot of {len(data['components'])} component registrations")
+        return True
+
+    def _record_persist(self, start: float, size: int) -> None:
+        elapsed = time.perf_counter() - start
+        self.stats["bytes_written"] += size
+        self.stats["persist_seconds"] += elapsed
+        self.stats["last_persist_ms"] = elapsed * 1000
+        self.stats["max_persist_ms"] = max(self.stats["max_persist_ms"], elapsed * 1000)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get persistence metrics.
+
+        Returns:
+            Dictionary with write counts, bytes written and persist latency
+        """
+        writes = self.stats["journal_writes"] + self.stats["snapshots"]
+        stats = dict(self.stats)
+        stats["avg_persist_ms"] = self.stats["persist_seconds"] * 1000 / writes if writes else 0.0
+        stats["pending_heartbeats"] = len(self._pending)
+        stats["journal_length"] = self._journal_records
+        return stats
+
+
+# Stores by data directory, shared by every registry operation on that directory
+_stores: Dict[str, RegistrationStore] = {}
+
+
+def get_registration_store(data_dir: str) -> RegistrationStore:
+    """
+    Get the persistence store for a data directory.
+
+    Args:
+        data_dir: Registry data directory
+
+    Returns:
+        RegistrationStore shared by all callers using that directory
+    """
+    key = os.path.abspath(data_dir)
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = RegistrationStore(data_dir)
+    return store
+
 
 async def load_registrations(data_dir: str) -> Tuple[Dict[str, ComponentRegistration], Dict[str, Dict[str, Any]]]:
     """
     Load component registrations from disk.
-    
+
     Args:
         data_dir: Directory containing saved registrations
-        
+
     Returns:
         Tuple of (components, instances)
     """
-    components = {}
-    instances = {}
-    
     # Check if data directory exists
     if not os.path.exists(data_dir):
         logger.info(f"Data directory does not exist: {data_dir}")
-        return components, instances
-        
-    # Load component registrations
-    registrations_file = os.path.join(data_dir, "registrations.json")
-    if os.path.exists(registrations_file):
-        try:
-            with open(registrations_file, "r") as f:
-                data = json.load(f)
-                
-                # Process each component
-                for component_data in data.get("components", []):
-                    try:
-                        # Create ComponentRegistration from data
-                        component_id = component_data.get("component_id")
-                        component = ComponentRegistration.from_dict(component_data)
-                        
-                        # Store component
-                        components[component_id] = component
-                        
-                    except Exception as e:
-                        logger.error(f"Error loading component: {e}")
-                        
-                # Load instance data
-                instances = data.get("instances", {})
-                
-                logger.info(f"Loaded {len(components)} component registrations")
-                
-        except Exception as e:
-            logger.error(f"Error loading registrations: {e}")
-            
-    return components, instances
+        return {}, {}
+
+    return get_registration_store(data_dir).load()
 
 
 async def save_registrations(components: Dict[str, ComponentRegistration], data_dir: str) -> bool:
     """
-    Save component registrations to disk.
-    
+    Save all component registrations to disk as a new snapshot.
+
+    Prefer persist_component for single-component changes.
+
     Args:
         components: Component registrations
         data_dir: Directory to save registrations
-        
+
     Returns:
         True if saved successfully
     """
-    # Ensure data directory exists
-    os.makedirs(data_dir, exist_ok=True)
-    
-    # Prepare data
-    data = {
-        "components": [],
-        "instances": {}
-    }
-    
-    # Add components
-    for component_id, component in components.items():
-        try:
-            component_data = component.to_dict()
-            data["components"].append(component_data)
-            
-        except Exception as e:
-            logger.error(f"Error serializing component {component_id}: {e}")
-            
-    # Save to file
-    registrations_file = os.path.join(data_dir, "registrations.json")
-    temp_file = os.path.join(data_dir, "registrations.json.tmp")
-    
-    try:
-        # Write to temporary file first
-        with open(temp_file, "w") as f:
-            json.dump(data, f, indent=2)
-            
-        # Atomic replace
-        os.replace(temp_file, registrations_file)
-        logger.debug(f"Saved {len(components)} component registrations")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error saving registrations: {e}")
-        return False
\ No newline at end of file
+    if not data_dir:
+        return False
+    return get_registration_store(data_dir).snapshot(components)
+
+
+async def persist_component(component: Any,
+                            instance: Optional[Dict[str, Any]],
+                            data_dir: Optional[str]) -> bool:
+    """
+    Persist a structural change (registration, state, capabilities) to one component.
+
+    Args:
+        component: ComponentRegistration
+        instance: Instance record for the component
+        data_dir: Registry data directory (nothing is written if None)
+
+    Returns:
+        True if saved successfully
+    """
+    if not data_dir:
+        return False
+    return get_registration_store(data_dir).record(component, instance)
+
+
+async def persist_heartbeat(component: Any,
+                            instance: Optional[Dict[str, Any]],
+                            data_dir: Optional[str]) -> None:
+    """
+    Persist a heartbeat-only update at the next flush of the data directory's store.
+
+    Args:
+        component: ComponentRegistration
+        instance: Instance record for the component
+        data_dir: Registry data directory (nothing is written if None)
+    """
+    if data_dir:
+        get_registration_store(data_dir).record_heartbeat(component, instance)
@@ -7,6 +7,7 @@ detecting and breaking dependency cycles to prevent startup deadlocks.
 """
 
 import logging
+from collections import deque
 from typing import Dict, List, Tuple, Set
 
 logger = logging.getLogger("tekton.dependency")
@@ -83,24 +84,27 @@ class DependencyResolver:
                     logger.warning(f"Breaking dependency cycle by removing {from_node} -> {to_node}")
                     dependency_graph[from_node].remove(to_node)
         
-        # Perform topological sort on the (now acyclic) graph
+        # Perform topological sort on the (now acyclic) graph, counting for
+        # each node the dependencies it is still waiting for
         in_degree = {node: 0 for node in dependency_graph}
+        dependents = {node: [] for node in dependency_graph}
         for node, deps in dependency_graph.items():
             for dep in deps:
-                if dep in in_degree:
-                    in_degree[dep] += 1
+                if dep in dependents:
+                    in_degree[node] += 1
+                    dependents[dep].append(node)
         
         # Start with nodes that have no dependencies
-        queue = [node for node, degree in in_degree.items() if degree == 0]
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
         result = []
         
         while queue:
             # Process node with no dependencies
-            node = queue.pop(0)
+            node = queue.popleft()
             result.append(node)
             
             # Reduce in-degree of all nodes that depend on this one
-            for dependent in [n for n, deps in dependency_graph.items() if node in deps]:
+            for dependent in dependents[node]:
                 in_degree[dependent] -= 1
                 if in_degree[dependent] == 0:
                     queue.append(dependent)
@@ -115,6 +119,47 @@ class DependencyResolver:
         
         return result, had_cycles
     
+    @staticmethod
+    def critical_path(dependency_graph: Dict[str, List[str]],
+                      durations: Dict[str, float]) -> Tuple[List[str], float]:
+        """
+        Find the longest chain of dependencies, weighted by duration.
+        
+        With unlimited parallelism this chain bounds the total startup time.
+        
+        Args:
+            dependency_graph: Graph of dependencies (component_id -> list of dependency_ids)
+            durations: Startup duration of each component in seconds (missing = 0)
+            
+        Returns:
+            Tuple of (components on the path in startup order, total duration)
+        """
+        # Work on a copy, since resolving breaks cycles in place
+        graph = {node: list(deps) for node, deps in dependency_graph.items()}
+        order, _ = DependencyResolver.resolve_dependencies(graph)
+        
+        finish = {}
+        previous = {}
+        for node in order:
+            start = 0.0
+            for dep in graph.get(node, []):
+                if dep in finish and finish[dep] > start:
+                    start = finish[dep]
+                    previous[node] = dep
+            finish[node] = start + durations.get(node, 0.0)
+        
+        if not finish:
+            return [], 0.0
+            
+        node = max(finish, key=finish.get)
+        total = finish[node]
+        path = [node]
+        while node in previous:
+            node = previous[node]
+            path.append(node)
+        path.reverse()
+        return path, total
+    
     def __init__(self):
         """Initialize the dependency resolver."""
         self.dependency_graph = {}
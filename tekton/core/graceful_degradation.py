@@ -3,13 +3,18 @@
 Graceful Degradation Module
 
 This module provides capabilities for implementing graceful degradation
-when components become unavailable or performance degrades.
+when components become unavailable or performance degrades. Fallback
+providers are tried in order of circuit health, capability level and
+observed latency, and can optionally be hedged: the next provider starts
+once the current one runs past its usual latency, and the first success
+wins.
 """
 
 import time
 import asyncio
 import logging
 import random
+from collections import deque
 from enum import Enum
 from typing import Dict, List, Any, Optional, Callable, TypeVar, Union, Tuple, Set
 
@@ -20,6 +25,18 @@ logger = logging.getLogger("tekton.graceful_degradation")
 # Generic type for function return values
 T = TypeVar("T")
 
+# Weight of the newest sample in a provider's latency EWMA
+LATENCY_EWMA_ALPHA = 0.2
+
+# Recent latencies kept per provider for quantile estimates
+LATENCY_WINDOW = 100
+
+# Samples needed before a provider's latency quantile sets its hedge delay
+MIN_LATENCY_SAMPLES = 10
+
+# Hedge delay used until a provider has enough latency samples
+DEFAULT_HEDGE_DELAY = 0.5
+
 class CircuitBreakerState(Enum):
     """Circuit breaker state for implementing the circuit breaker pattern."""
     CLOSED = "closed"       # Normal operation, requests go through
@@ -93,6 +110,9 @@ class CircuitBreaker:
                 raise CircuitBreakerError(f"Circuit {self.name} is HALF_OPEN with max calls reached")
             
             self.half_open_calls += 1
+            probe = True
+        else:
+            probe = False
         
         # Execute the function
         try:
@@ -115,6 +135,12 @@ class CircuitBreaker:
                 
             return result
             
+        except asyncio.CancelledError:
+            # A cancelled probe (e.g. a losing hedge) proved nothing; free its slot
+            if probe and self.state == CircuitBreakerState.HALF_OPEN:
+                self.half_open_calls = max(0, self.half_open_calls - 1)
+            raise
+            
         except Exception as e:
             # Record failure
             self.last_failure_time = time.time()
@@ -141,28 +167,68 @@ class CircuitBreakerError(Exception):
     pass
 
 
+def _circuit_rank(circuit_breaker: CircuitBreaker) -> int:
+    """
+    Rank a circuit breaker for candidate ordering (lower is tried first).
+    
+    Args:
+        circuit_breaker: Circuit breaker to rank
+        
+    Returns:
+        0 if closed, 1 if half-open or due for a recovery probe, 2 if open
+    """
+    if circuit_breaker.state == CircuitBreakerState.CLOSED:
+        return 0
+    if circuit_breaker.state == CircuitBreakerState.HALF_OPEN:
+        return 1
+    if time.time() - circuit_breaker.open_time > circuit_breaker.recovery_timeout:
+        return 1
+    return 2
+
+
 class CapabilityFallback:
     """
     Manages fallback options for component capabilities.
     
     Provides a way to register multiple fallback options for a capability
     with automatic selection based on availability and capability level.
+    Providers with a closed circuit come first, then those due for a
+    recovery probe, then open ones; within that, higher levels come first
+    and equal levels are ordered by latency EWMA.
     """
     
     def __init__(self, 
                 component_id: str, 
-                capability_name: str):
+                capability_name: str,
+                hedge: bool = False,
+                hedge_delay: Optional[float] = None,
+                hedge_quantile: float = 0.95,
+                default_hedge_delay: float = DEFAULT_HEDGE_DELAY):
         """
         Initialize a capability fallback.
         
         Args:
             component_id: ID of the component
             capability_name: Name of the capability
+            hedge: Whether to hedge slow providers with the next candidate
+            hedge_delay: Fixed hedge delay in seconds (None derives it from
+                the running provider's latency quantile)
+            hedge_quantile: Latency quantile after which a hedge starts
+            default_hedge_delay: Hedge delay for providers without enough
+                latency samples
         """
         self.component_id = component_id
         self.capability_name = capability_name
         self.fallbacks: Dict[str, Dict[str, Any]] = {}
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.hedge_quantile = hedge_quantile
+        self.default_hedge_delay = default_hedge_delay
+        self.hedge_stats = {"hedged_calls": 0, "hedges_started": 0, "hedge_wins": 0}
+        
+        # Provider IDs grouped by level, highest first; rebuilt on registration
+        self._levels: Optional[List[List[str]]] = None
         
     def register_fallback(self, 
                          provider_id: str, 
@@ -183,15 +249,58 @@ class CapabilityFallback:
             "level": level,
             "description": description or f"Fallback for {self.capability_name} from {provider_id}",
             "last_success": 0,
-            "last_failure": 0
+            "last_failure": 0,
+            "latency_ewma": None,
+            "latencies": deque(maxlen=LATENCY_WINDOW)
         }
         
         # Create circuit breaker
         self.circuit_breakers[provider_id] = CircuitBreaker(
             name=f"{self.component_id}.{self.capability_name}.{provider_id}")
+        self._levels = None
             
         logger.info(f"Registered fallback for {self.component_id}.{self.capability_name} from {provider_id} (level {level})")
         
+    def get_candidates(self) -> List[str]:
+        """
+        Get provider IDs in the order they will be tried.
+        
+        Returns:
+            Provider IDs ordered by circuit health, level and latency
+        """
+        if self._levels is None:
+            levels: Dict[int, List[str]] = {}
+            for provider_id, fallback in self.fallbacks.items():
+                levels.setdefault(fallback["level"], []).append(provider_id)
+            self._levels = [levels[level] for level in sorted(levels, reverse=True)]
+        
+        candidates = []
+        for group in self._levels:
+            if len(group) > 1:
+                # Unmeasured providers go first so they get measured
+                group = sorted(group, key=lambda provider_id: self.fallbacks[provider_id]["latency_ewma"] or 0.0)
+            candidates.extend(group)
+        
+        candidates.sort(key=lambda provider_id: _circuit_rank(self.circuit_breakers[provider_id]))
+        return candidates
+    
+    def get_latency_quantile(self, provider_id: str, quantile: float) -> Optional[float]:
+        """
+        Get a latency quantile over a provider's recent calls.
+        
+        Args:
+            provider_id: ID of the provider
+            quantile: Quantile between 0 and 1
+            
+        Returns:
+            Latency in seconds, or None without any samples
+        """
+        latencies = self.fallbacks[provider_id]["latencies"]
+        if not latencies:
+            return None
+        ordered = sorted(latencies)
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+        
     async def execute(self, *args, **kwargs) -> Any:
         """
         Execute the capability with fallback support.
@@ -208,46 +317,157 @@ class CapabilityFallback:
         """
         if not self.fallbacks:
             raise NoFallbackAvailableError(f"No fallbacks registered for {self.component_id}.{self.capability_name}")
-            
-        # Sort fallbacks by level (highest first)
-        sorted_fallbacks = sorted(
-            self.fallbacks.items(), 
-            key=lambda x: x[1]["level"], 
-            reverse=True
-        )
+        
+        candidates = self.get_candidates()
+        if self.hedge and len(candidates) > 1:
+            return await self._execute_hedged(candidates, args, kwargs)
         
         last_error = None
         
         # Try fallbacks in order
-        for provider_id, fallback in sorted_fallbacks:
-            handler = fallback["handler"]
-            circuit_breaker = self.circuit_breakers[provider_id]
-            
+        for provider_id in candidates:
             try:
-                # Execute with circuit breaker
-                result = await circuit_breaker.execute(handler, *args, **kwargs)
-                
-                # Record success
-                fallback["last_success"] = time.time()
-                
-                return result
-                
-            except CircuitBreakerError as e:
-                # Circuit is open, try next fallback
-                logger.debug(f"Circuit breaker for {provider_id} is open, trying next fallback")
-                last_error = e
-                continue
-                
+                return await self._attempt(provider_id, args, kwargs)
             except Exception as e:
-                # Handler failed, record failure
-                fallback["last_failure"] = time.time()
-                logger.warning(f"Fallback {provider_id} for {self.component_id}.{self.capability_name} failed: {e}")
                 last_error = e
                 continue
         
         # All fallbacks failed
         raise NoFallbackAvailableError(
             f"All fallbacks for {self.component_id}.{self.capability_name} failed") from last_error
+    
+    async def _execute_hedged(self, candidates: List[str], args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        """
+        Execute with hedging: start the next provider when the latest one
+        fails or runs past its hedge delay, and take the first success.
+        
+        Args:
+            candidates: Provider IDs in order
+            args: Arguments for the handler
+            kwargs: Keyword arguments for the handler
+            
+        Returns:
+            Result from the first provider to succeed
+            
+        Raises:
+            NoFallbackAvailableError: If every provider fails
+        """
+        remaining = list(candidates)
+        running: Set[asyncio.Future] = set()
+        hedges: Set[asyncio.Future] = set()
+        last_error = None
+        self.hedge_stats["hedged_calls"] += 1
+        
+        def start_next():
+            provider_id = remaining.pop(0)
+            task = asyncio.ensure_future(self._attempt(provider_id, args, kwargs))
+            running.add(task)
+            return provider_id, task
+        
+        latest, _ = start_next()
+        try:
+            while running:
+                delay = self._get_hedge_delay(latest) if remaining else None
+                done, _ = await asyncio.wait(running, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    # The latest provider is slower than usual; hedge it
+                    latest, task = start_next()
+                    hedges.add(task)
+                    self.hedge_stats["hedges_started"] += 1
+                    logger.debug(f"Hedging {self.component_id}.{self.capability_name} with {latest}")
+                    continue
+                
+                for task in done:
+                    running.discard(task)
+                    if task.exception() is None:
+                        if task in hedges:
+                            self.hedge_stats["hedge_wins"] += 1
+                        return task.result()
+                    last_error = task.exception()
+                
+                # A failure frees a slot for the next provider straight away
+                if remaining:
+                    latest, _ = start_next()
+        finally:
+            # Cancel the losers
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        
+        raise NoFallbackAvailableError(
+            f"All fallbacks for {self.component_id}.{self.capability_name} failed") from last_error
+    
+    def _get_hedge_delay(self, provider_id: str) -> float:
+        """
+        Get how long to wait on a provider before hedging it.
+        
+        Args:
+            provider_id: ID of the running provider
+            
+        Returns:
+            Delay in seconds
+        """
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        if len(self.fallbacks[provider_id]["latencies"]) < MIN_LATENCY_SAMPLES:
+            return self.default_hedge_delay
+        return self.get_latency_quantile(provider_id, self.hedge_quantile)
+    
+    async def _attempt(self, provider_id: str, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        """
+        Call one provider through its circuit breaker, recording the outcome.
+        
+        Args:
+            provider_id: ID of the provider
+            args: Arguments for the handler
+            kwargs: Keyword arguments for the handler
+            
+        Returns:
+            Result from the handler
+        """
+        fallback = self.fallbacks[provider_id]
+        circuit_breaker = self.circuit_breakers[provider_id]
+        start = time.monotonic()
+        
+        try:
+            # Execute with circuit breaker
+            result = await circuit_breaker.execute(fallback["handler"], *args, **kwargs)
+            
+        except CircuitBreakerError:
+            # Circuit is open, try next fallback
+            logger.debug(f"Circuit breaker for {provider_id} is open, trying next fallback")
+            raise
+            
+        except Exception as e:
+            # Handler failed, record failure; its latency counts too, so a
+            # provider that is slow to fail does not look fast
+            fallback["last_failure"] = time.time()
+            self._record_latency(fallback, time.monotonic() - start)
+            logger.warning(f"Fallback {provider_id} for {self.component_id}.{self.capability_name} failed: {e}")
+            raise
+        
+        # Record success
+        fallback["last_success"] = time.time()
+        self._record_latency(fallback, time.monotonic() - start)
+        
+        return result
+    
+    @staticmethod
+    def _record_latency(fallback: Dict[str, Any], latency: float) -> None:
+        """
+        Add a call's latency to a provider's samples and EWMA.
+        
+        Args:
+            fallback: Fallback entry of the provider
+            latency: Call latency in seconds
+        """
+        fallback["latencies"].append(latency)
+        if fallback["latency_ewma"] is None:
+            fallback["latency_ewma"] = latency
+        else:
+            fallback["latency_ewma"] += LATENCY_EWMA_ALPHA * (latency - fallback["latency_ewma"])
 
 
 class NoFallbackAvailableError(Exception):
@@ -262,10 +482,19 @@ class GracefulDegradationManager:
     Provides a central registry for fallbacks and circuit breakers.
     """
     
-    def __init__(self):
-        """Initialize the graceful degradation manager."""
+    def __init__(self, hedge: bool = False, hedge_delay: Optional[float] = None):
+        """
+        Initialize the graceful degradation manager.
+        
+        Args:
+            hedge: Whether capabilities hedge slow providers by default
+            hedge_delay: Default fixed hedge delay in seconds (None derives
+                it from provider latency)
+        """
         self.capability_fallbacks: Dict[str, Dict[str, CapabilityFallback]] = {}
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
         
     def register_capability_fallback(self,
                                   component_id: str,
@@ -291,7 +520,9 @@ class GracefulDegradationManager:
         if capability_name not in self.capability_fallbacks[component_id]:
             self.capability_fallbacks[component_id][capability_name] = CapabilityFallback(
                 component_id=component_id,
-                capability_name=capability_name
+                capability_name=capability_name,
+                hedge=self.hedge,
+                hedge_delay=self.hedge_delay
             )
             
         # Register fallback
@@ -326,6 +557,36 @@ class GracefulDegradationManager:
         self.circuit_breakers[name] = circuit_breaker
         return circuit_breaker
         
+    def configure_hedging(self,
+                          component_id: str,
+                          capability_name: str,
+                          enabled: bool = True,
+                          hedge_delay: Optional[float] = None,
+                          hedge_quantile: float = 0.95) -> None:
+        """
+        Configure hedged execution for a registered capability.
+        
+        Args:
+            component_id: ID of the component
+            capability_name: Name of the capability
+            enabled: Whether to hedge slow providers
+            hedge_delay: Fixed hedge delay in seconds (None derives it from
+                provider latency)
+            hedge_quantile: Latency quantile after which a hedge starts
+            
+        Raises:
+            NoFallbackAvailableError: If no fallback is registered for the capability
+        """
+        if (component_id not in self.capability_fallbacks or
+            capability_name not in self.capability_fallbacks[component_id]):
+            raise NoFallbackAvailableError(
+                f"No fallbacks registered for {component_id}.{capability_name}")
+        
+        fallback = self.capability_fallbacks[component_id][capability_name]
+        fallback.hedge = enabled
+        fallback.hedge_delay = hedge_delay
+        fallback.hedge_quantile = hedge_quantile
+        
     async def execute_with_fallback(self,
                                component_id: str,
                                capability_name: str,
@@ -403,14 +664,18 @@ class GracefulDegradationManager:
                         "circuit_state": circuit_breaker.state.value,
                         "last_success": fb_info["last_success"],
                         "last_failure": fb_info["last_failure"],
-                        "failure_count": circuit_breaker.failure_count
+                        "failure_count": circuit_breaker.failure_count,
+                        "latency_ewma": fb_info["latency_ewma"],
+                        "latency_p95": fallback.get_latency_quantile(provider_id, 0.95)
                     })
                     
                     result["total_fallbacks"] += 1
                 
                 result["components"][comp_id]["capabilities"][cap_name] = {
                     "providers": providers,
-                    "provider_count": len(providers)
+                    "provider_count": len(providers),
+                    "hedging": fallback.hedge,
+                    **fallback.hedge_stats
                 }
         
         return result
@@ -3,14 +3,16 @@
 Heartbeat Monitor Module
 
 This module provides the core heartbeat monitoring functionality
-for tracking component health and managing reconnection.
+for tracking component health and managing reconnection. All requests to
+Hermes share one keep-alive HTTP session, and heartbeats from many
+components can optionally be sent together in batches.
 """
 
 import asyncio
 import logging
 import os
 import time
-from typing import Dict, Any, Optional, Set, List
+from typing import Dict, Any, Optional, Set, List, Tuple
 
 from ..lifecycle import ComponentRegistration
 from .metrics import collect_component_metrics, aggregate_health_metrics
@@ -19,6 +21,12 @@ from .component_state import ComponentHealthMetrics
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Timeout for requests to Hermes, in seconds
+REQUEST_TIMEOUT = 3
+
+# Idle pooled connections are kept at least as long as the slowest heartbeat interval
+KEEPALIVE_TIMEOUT = 60
+
 
 class HeartbeatMonitor:
     """
@@ -35,7 +43,11 @@ class HeartbeatMonitor:
                 retry_interval: int = 5,
                 max_retries: int = -1,
                 collect_metrics: bool = True,
-                stagger_heartbeats: bool = True):  # -1 means infinite retries
+                stagger_heartbeats: bool = True,  # -1 means infinite retries
+                batch_heartbeats: bool = False,
+                batch_window: float = 0.5,
+                batch_endpoint: str = "/registration/heartbeat/batch",
+                max_connections: int = 4):
         """
         Initialize the heartbeat monitor.
         
@@ -46,6 +58,11 @@ class HeartbeatMonitor:
             max_retries: Maximum number of retries (-1 for infinite)
             collect_metrics: Whether to collect health metrics
             stagger_heartbeats: Whether to stagger heartbeats to prevent thundering herd
+            batch_heartbeats: Whether to send heartbeats due within batch_window together
+            batch_window: Seconds to gather heartbeats into one batch
+            batch_endpoint: Hermes path for batched heartbeats (falls back to
+                            individual heartbeats if Hermes does not provide it)
+            max_connections: Maximum pooled connections to Hermes
         """
         self.hermes_url = hermes_url or os.environ.get("HERMES_URL", "http://localhost:5000/api")
         self.default_interval = default_interval
@@ -53,11 +70,16 @@ class HeartbeatMonitor:
         self.max_retries = max_retries
         self.collect_metrics = collect_metrics
         self.stagger_heartbeats = stagger_heartbeats
+        self.batch_heartbeats = batch_heartbeats
+        self.batch_window = batch_window
+        self.batch_endpoint = batch_endpoint
+        self.max_connections = max_connections
         
         # Component registrations and settings
         self.registrations: Dict[str, ComponentRegistration] = {}
         self.component_intervals: Dict[str, float] = {}  # Customizable intervals by component
         self.component_health: Dict[str, Dict[str, Any]] = {}  # Health tracking by component
+        self.component_metrics: Dict[str, Dict[str, float]] = {}  # Latest collected metrics by component
         
         # Active tasks
         self.heartbeat_tasks: Dict[str, asyncio.Task] = {}
@@ -65,6 +87,11 @@ class HeartbeatMonitor:
         self.running = False
         self.active_task = None
         
+        # Shared HTTP session and pending batched heartbeats
+        self._session = None
+        self._heartbeat_batch: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._batch_task: Optional[asyncio.Task] = None
+        
         # Type-specific intervals
         self.type_intervals = {
             "database": 3,    # More frequent for critical services
@@ -107,6 +134,7 @@ class HeartbeatMonitor:
             if component_id in self.heartbeat_tasks:
                 self.heartbeat_tasks[component_id].cancel()
                 del self.heartbeat_tasks[component_id]
+            self.component_metrics.pop(component_id, None)
                 
             logger.info(f"Removed component {component_id} from heartbeat monitor")
     
@@ -158,11 +186,64 @@ class HeartbeatMonitor:
             self.metrics_task.cancel()
             self.metrics_task = None
             
+        # Drop unsent batched heartbeats
+        if self._batch_task:
+            self._batch_task.cancel()
+            self._batch_task = None
+        for _, _, future in self._heartbeat_batch:
+            future.cancel()
+        self._heartbeat_batch = []
+            
+        # Close pooled connections
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            
+    def _get_session(self):
+        """
+        Get the HTTP session shared by all requests to Hermes.
+        
+        Returns:
+            aiohttp.ClientSession with a keep-alive connection pool
+        """
+        if self._session is None or self._session.closed:
+            import aiohttp
+            
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                ttl_dns_cache=300,
+                keepalive_timeout=KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            )
+        return self._session
+    
+    async def _refresh_component_metrics(self) -> None:
+        """Collect health metrics for every registered component concurrently."""
+        registrations = list(self.registrations.items())
+        results = await asyncio.gather(
+            *(collect_component_metrics(component_id, registration.component_type)
+              for component_id, registration in registrations),
+            return_exceptions=True
+        )
+        
+        for (component_id, registration), metrics in zip(registrations, results):
+            if isinstance(metrics, Exception):
+                logger.debug(f"Error collecting metrics for {component_id}: {metrics}")
+                continue
+            self.component_metrics[component_id] = metrics
+            registration.update_health_metrics(metrics)
+            
     async def _metrics_collection_loop(self) -> None:
         """Collect and aggregate metrics for all components on a regular interval."""
         try:
             while self.running:
                 try:
+                    # Refresh the metrics sent with heartbeats
+                    await self._refresh_component_metrics()
+                    
                     # Get all component health metrics
                     metrics = aggregate_health_metrics(self.component_health, self.registrations)
                     
@@ -297,10 +378,14 @@ class HeartbeatMonitor:
                     
                 registration = self.registrations[component_id]
                 
-                # Collect health metrics if enabled
+                # Use the latest metrics from the collection loop if enabled
                 health_metrics = None
                 if self.collect_metrics:
-                    health_metrics = await collect_component_metrics(component_id, registration.component_type)
+                    health_metrics = self.component_metrics.get(component_id)
+                    if health_metrics is None:
+                        # Not collected yet
+                        health_metrics = await collect_component_metrics(component_id, registration.component_type)
+                        self.component_metrics[component_id] = health_metrics
                 
                 try:
                     # Generate heartbeat sequence number
@@ -332,38 +417,30 @@ class HeartbeatMonitor:
                     }
                     
                     # Send heartbeat
-                    import aiohttp
-                    
                     heartbeat_start = time.time()
-                    async with aiohttp.ClientSession() as session:
-                        async with session.post(
-                            f"{self.hermes_url}/registration/heartbeat",
-                            json=heartbeat_data,
-                            timeout=3  # Add timeout to prevent blocking
-                        ) as response:
-                            if response.status == 200:
-                                # Track latency
-                                latency = time.time() - heartbeat_start
-                                if component_id in self.component_health:
-                                    self.component_health[component_id]["latency"] = latency
-                                
-                                logger.debug(f"Sent heartbeat #{sequence} for {component_id} (latency: {latency:.3f}s)")
-                                consecutive_failures = 0
-                            else:
-                                error = await response.text()
-                                logger.warning(f"Failed to send heartbeat for {component_id}: {error}")
-                                consecutive_failures += 1
-                                
-                                # Update health info
-                                if component_id in self.component_health:
-                                    self.component_health[component_id]["last_error"] = error
-                                    self.component_health[component_id]["last_error_time"] = time.time()
-                                
-                                # If multiple consecutive failures, try to re-register
-                                if consecutive_failures >= 3:
-                                    logger.warning(f"Multiple heartbeat failures for {component_id}, attempting to re-register")
-                                    await self._reconnect_component(component_id)
-                                    consecutive_failures = 0
+                    success, error = await self._send_heartbeat(component_id, heartbeat_data)
+                    if success:
+                        # Track latency
+                        latency = time.time() - heartbeat_start
+                        if component_id in self.component_health:
+                            self.component_health[component_id]["latency"] = latency
+                        
+                        logger.debug(f"Sent heartbeat #{sequence} for {component_id} (latency: {latency:.3f}s)")
+                        consecutive_failures = 0
+                    else:
+                        logger.warning(f"Failed to send heartbeat for {component_id}: {error}")
+                        consecutive_failures += 1
+                        
+                        # Update health info
+                        if component_id in self.component_health:
+                            self.component_health[component_id]["last_error"] = error
+                            self.component_health[component_id]["last_error_time"] = time.time()
+                        
+                        # If multiple consecutive failures, try to re-register
+                        if consecutive_failures >= 3:
+                            logger.warning(f"Multiple heartbeat failures for {component_id}, attempting to re-register")
+                            await self._reconnect_component(component_id)
+                            consecutive_failures = 0
                 
                 except asyncio.CancelledError:
                     raise
@@ -413,6 +490,111 @@ class HeartbeatMonitor:
         except asyncio.CancelledError:
             logger.info(f"Heartbeat loop for {component_id} cancelled")
             
+    async def _send_heartbeat(self, component_id: str, heartbeat_data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """
+        Send one heartbeat, directly or as part of a batch.
+        
+        Args:
+            component_id: Component ID
+            heartbeat_data: Heartbeat payload
+            
+        Returns:
+            (success, error message)
+        """
+        if not self.batch_heartbeats:
+            return await self._post_heartbeat(heartbeat_data)
+            
+        future = asyncio.get_running_loop().create_future()
+        self._heartbeat_batch.append((component_id, heartbeat_data, future))
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._flush_heartbeat_batch())
+        return await future
+        
+    async def _post_heartbeat(self, heartbeat_data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """
+        Post a single heartbeat to Hermes.
+        
+        Args:
+            heartbeat_data: Heartbeat payload
+            
+        Returns:
+            (success, error message)
+        """
+        async with self._get_session().post(
+            f"{self.hermes_url}/registration/heartbeat",
+            json=heartbeat_data
+        ) as response:
+            if response.status == 200:
+                return True, None
+            return False, await response.text()
+            
+    async def _post_heartbeat_batch(self, payloads: List[Dict[str, Any]]) -> Optional[List[Tuple[bool, Optional[str]]]]:
+        """
+        Post several heartbeats in one request.
+        
+        The batch endpoint receives ``{"heartbeats": [...]}`` and may answer
+        with ``{"results": {component_id: {"success": bool, "error": str}}}``;
+        components missing from the results are treated as successful.
+        
+        Args:
+            payloads: Heartbeat payloads
+            
+        Returns:
+            (success, error message) per payload, or None if Hermes has no batch endpoint
+        """
+        async with self._get_session().post(
+            f"{self.hermes_url}{self.batch_endpoint}",
+            json={"heartbeats": payloads}
+        ) as response:
+            if response.status in (404, 405):
+                return None
+            if response.status != 200:
+                error = await response.text()
+                return [(False, error)] * len(payloads)
+                
+            try:
+                body = await response.json(content_type=None)
+            except ValueError:
+                body = None
+            statuses = body.get("results", {}) if isinstance(body, dict) else {}
+            
+            results = []
+            for payload in payloads:
+                status = statuses.get(payload["component"])
+                if isinstance(status, dict) and status.get("success") is False:
+                    results.append((False, status.get("error", "Heartbeat rejected")))
+                else:
+                    results.append((True, None))
+            return results
+            
+    async def _flush_heartbeat_batch(self) -> None:
+        """Send the heartbeats gathered during the batch window."""
+        await asyncio.sleep(self.batch_window)
+        batch, self._heartbeat_batch = self._heartbeat_batch, []
+        batch = [item for item in batch if not item[2].done()]
+        if not batch:
+            return
+            
+        try:
+            results = await self._post_heartbeat_batch([payload for _, payload, _ in batch])
+            if results is None:
+                logger.info("Hermes has no batched heartbeat endpoint, sending heartbeats individually")
+                self.batch_heartbeats = False
+                results = await asyncio.gather(
+                    *(self._post_heartbeat(payload) for _, payload, _ in batch),
+                    return_exceptions=True
+                )
+        except Exception as e:
+            results = [e] * len(batch)
+            
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        
     def _get_heartbeat_interval(self, component_id: str) -> float:
         """
         Get the appropriate heartbeat interval for a component.
@@ -455,14 +637,8 @@ class HeartbeatMonitor:
             True if Hermes is available
         """
         try:
-            import aiohttp
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.hermes_url}/health",
-                    timeout=3
-                ) as response:
-                    return response.status == 200
+            async with self._get_session().get(f"{self.hermes_url}/health") as response:
+                return response.status == 200
         
         except Exception:
             return False
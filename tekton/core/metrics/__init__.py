@@ -15,8 +15,12 @@ from .prometheus import (
     start_all_metrics_managers,
     stop_all_metrics_managers,
     get_all_metrics,
-    get_prometheus_metrics
+    get_prometheus_metrics,
+    generate_metrics,
+    write_metrics,
+    get_exposition_encoder
 )
+from .exposition import ExpositionEncoder
 
 # Existing imports
 from .collector import MetricsCollector, SessionData
@@ -24,6 +28,7 @@ from .storage.base import MetricsStorage
 from .storage.sqlite import SQLiteMetricsStorage
 from .storage.json_file import JSONFileMetricsStorage
 from .analysis.spectral_analyzer import SpectralAnalyzer
+from .analysis.frame import MetricsFrame
 from .integration import MetricsManager as SpectralMetricsManager
 from .utils import (
     session_to_dict,
@@ -59,6 +64,10 @@ __all__ = [
     "stop_all_metrics_managers",
     "get_all_metrics",
     "get_prometheus_metrics",
+    "generate_metrics",
+    "write_metrics",
+    "get_exposition_encoder",
+    "ExpositionEncoder",
     
     # Core classes
     "MetricsCollector",
@@ -67,6 +76,7 @@ __all__ = [
     "SQLiteMetricsStorage",
     "JSONFileMetricsStorage",
     "SpectralAnalyzer",
+    "MetricsFrame",
     "SpectralMetricsManager",
     
     # Utility functions
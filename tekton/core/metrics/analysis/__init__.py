@@ -6,6 +6,7 @@ during system operation, including spectral analysis and catastrophe theory metr
 """
 
 from .spectral_analyzer import SpectralAnalyzer, EnhancedSpectralAnalyzer
+from .frame import MetricsFrame
 from .bifurcation import calculate_bifurcation_proximity
 from .parameter_sensitivity import calculate_control_parameter_sensitivity
 from .hysteresis import calculate_hysteresis_detection
@@ -15,6 +16,7 @@ from .architectural_elasticity import find_architectural_elasticity
 __all__ = [
     "SpectralAnalyzer",
     "EnhancedSpectralAnalyzer",
+    "MetricsFrame",
     "calculate_bifurcation_proximity",
     "calculate_control_parameter_sensitivity",
     "calculate_hysteresis_detection",
@@ -6,17 +6,18 @@ This module provides functions for analyzing bifurcation proximity.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 
-from ..utils import sessions_to_dicts, interpret_bifurcation_proximity
+from ..utils import interpret_bifurcation_proximity
+from .frame import MetricsFrame
 
-def calculate_bifurcation_proximity(sessions: List[Any], num_recent: int = 10) -> Dict[str, Any]:
+def calculate_bifurcation_proximity(sessions: Union[List[Any], MetricsFrame], num_recent: int = 10) -> Dict[str, Any]:
     """Calculate the bifurcation proximity index for recent sessions.
     
     BPI indicates how close the system is to a capability bifurcation.
     
     Args:
-        sessions: List of session data
+        sessions: List of session data, or a MetricsFrame
         num_recent: Number of recent sessions to consider
         
     Returns:
@@ -25,17 +26,8 @@ def calculate_bifurcation_proximity(sessions: List[Any], num_recent: int = 10) -
     if len(sessions) < num_recent:
         return {"error": f"Need at least {num_recent} sessions for bifurcation analysis"}
     
-    # Convert to list of dicts
-    session_dicts = sessions_to_dicts(sessions)
-    
-    # Sort by start time
-    session_dicts.sort(key=lambda x: x.get('start_time', 0))
-    
-    # Get most recent sessions
-    recent_sessions = session_dicts[-num_recent:]
-    
-    # Extract key metrics
-    accuracies = [s.get('performance', {}).get('accuracy', 0) for s in recent_sessions]
+    # Frames are ordered by start time, so the most recent sessions are last
+    accuracies = MetricsFrame.coerce(sessions).tail(num_recent).accuracy
     
     # Calculate variance in performance
     variance = np.var(accuracies)
@@ -0,0 +1,272 @@
+"""
+Columnar view of session metrics.
+
+This module provides MetricsFrame, which materializes the per-session
+values used by the analysis functions (timestamps, accuracy, spectral
+metrics, numeric config parameters and architecture counts) into NumPy
+arrays once, instead of every analysis re-walking lists of session dicts.
+"""
+
+import numpy as np
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .analyzer_components.metrics import calculate_spectral_metrics
+
+# Fixed columns, in addition to spectral metrics, config parameters and extra fields
+BASE_COLUMNS = (
+    "start_time",
+    "end_time",
+    "processing_time",
+    "accuracy",
+    "component_count",
+    "propagation_steps",
+    "total_params",
+)
+
+
+def _getter(session: Any):
+    """Field accessor for a session dict or SessionData object."""
+    if isinstance(session, dict):
+        return session.get
+    return lambda name, default=None: getattr(session, name, default)
+
+
+class MetricsFrame:
+    """Column arrays for a set of sessions, one row per session.
+
+    Spectral metrics and config parameters missing from a session are NaN;
+    non-numeric config values are NaN as well.
+    """
+
+    def __init__(self,
+                 ids: np.ndarray,
+                 columns: Dict[str, np.ndarray],
+                 spectral: Dict[str, np.ndarray],
+                 config: Dict[str, np.ndarray],
+                 extra: Optional[Dict[str, np.ndarray]] = None):
+        """Initialize a frame from prepared columns.
+
+        Args:
+            ids: Session IDs
+            columns: Arrays for each of BASE_COLUMNS
+            spectral: Spectral metric arrays by metric name
+            config: Numeric config parameter arrays by parameter name
+            extra: Additional object arrays by session field name
+        """
+        self.ids = ids
+        self.columns = columns
+        self.spectral_metrics = spectral
+        self.config_parameters = config
+        self.extra = extra or {}
+
+    @classmethod
+    def from_sessions(cls,
+                      sessions: Iterable[Any],
+                      sort: bool = True,
+                      fields: Sequence[str] = (),
+                      derive_spectral: bool = False) -> 'MetricsFrame':
+        """Build a frame from SessionData objects or session dicts.
+
+        Args:
+            sessions: Sessions to include
+            sort: Order rows by start time (stable), as the analyses expect
+            fields: Extra top-level session fields to keep, e.g. for grouping
+            derive_spectral: Calculate spectral metrics for sessions that have none
+
+        Returns:
+            MetricsFrame
+        """
+        ids: List[Any] = []
+        start_times: List[float] = []
+        end_times: List[float] = []
+        accuracies: List[float] = []
+        component_counts: List[int] = []
+        propagation_steps: List[int] = []
+        total_params: List[float] = []
+        spectral_rows: List[Dict[str, float]] = []
+        config_rows: List[Dict[str, Any]] = []
+        extra_values: Dict[str, List[Any]] = {field: [] for field in fields}
+
+        for session in sessions:
+            get = _getter(session)
+
+            ids.append(get('id'))
+            start_times.append(get('start_time', 0) or 0)
+            end_time = get('end_time')
+            end_times.append(np.nan if end_time is None else end_time)
+            accuracies.append((get('performance') or {}).get('accuracy', 0))
+
+            activations = get('component_activations') or {}
+            path = get('propagation_path') or []
+            usage = get('parameter_usage') or {}
+            component_counts.append(len(activations))
+            propagation_steps.append(len(path))
+            total_params.append(sum(data.get('total', 0) for data in usage.values()))
+
+            spectral = get('spectral_metrics')
+            if spectral is None:
+                if derive_spectral:
+                    spectral = calculate_spectral_metrics({
+                        'performance': get('performance') or {},
+                        'parameter_usage': usage,
+                        'propagation_path': path
+                    })
+                else:
+                    spectral = {}
+            spectral_rows.append(spectral)
+            config_rows.append(get('config') or {})
+
+            for field in fields:
+                extra_values[field].append(get(field, "unknown"))
+
+        columns = {
+            "start_time": np.asarray(start_times, dtype=float),
+            "end_time": np.asarray(end_times, dtype=float),
+            "accuracy": np.asarray(accuracies, dtype=float),
+            "component_count": np.asarray(component_counts, dtype=float),
+            "propagation_steps": np.asarray(propagation_steps, dtype=float),
+            "total_params": np.asarray(total_params, dtype=float),
+        }
+        columns["processing_time"] = columns["end_time"] - columns["start_time"]
+
+        frame = cls(
+            ids=np.asarray(ids, dtype=object),
+            columns=columns,
+            spectral=cls._pivot(spectral_rows, numeric_only=False),
+            config=cls._pivot(config_rows, numeric_only=True),
+            extra={field: np.asarray(values, dtype=object) for field, values in extra_values.items()}
+        )
+
+        if sort:
+            frame = frame.take(np.argsort(columns["start_time"], kind="stable"))
+        return frame
+
+    @classmethod
+    def from_storage(cls,
+                     storage: Any,
+                     filters: Optional[Dict[str, Any]] = None,
+                     limit: Optional[int] = None,
+                     page_size: int = 1000,
+                     **kwargs) -> 'MetricsFrame':
+        """Materialize a frame from a metrics storage engine.
+
+        Sessions are read a page at a time so the full session dicts never
+        all live in memory together.
+
+        Args:
+            storage: MetricsStorage implementation
+            filters: Optional storage filters
+            limit: Maximum number of sessions (None for all)
+            page_size: Sessions fetched per storage call
+            **kwargs: Passed to from_sessions
+
+        Returns:
+            MetricsFrame
+        """
+        def pages():
+            offset = 0
+            while limit is None or offset < limit:
+                count = page_size if limit is None else min(page_size, limit - offset)
+                page = storage.get_sessions(filters=filters, limit=count, offset=offset)
+                if not page:
+                    return
+                yield from page
+                offset += len(page)
+                if len(page) < count:
+                    return
+
+        return cls.from_sessions(pages(), **kwargs)
+
+    @classmethod
+    def coerce(cls, sessions: Any, **kwargs) -> 'MetricsFrame':
+        """Return sessions unchanged if already a frame, otherwise build one."""
+        if isinstance(sessions, cls):
+            return sessions
+        return cls.from_sessions(sessions, **kwargs)
+
+    @staticmethod
+    def _pivot(rows: List[Dict[str, Any]], numeric_only: bool) -> Dict[str, np.ndarray]:
+        """Turn per-session dicts into per-key columns, NaN where absent."""
+        keys: Dict[str, None] = {}
+        for row in rows:
+            for key, value in row.items():
+                if not numeric_only or isinstance(value, (int, float)):
+                    keys.setdefault(key)
+
+        nan = np.nan
+        result = {}
+        for key in keys:
+            if numeric_only:
+                values = [
+                    value if isinstance(value, (int, float)) else nan
+                    for value in (row.get(key, nan) for row in rows)
+                ]
+            else:
+                values = [row.get(key, nan) for row in rows]
+            result[key] = np.asarray(values, dtype=float)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def take(self, indices: Any) -> 'MetricsFrame':
+        """Select rows by index array, slice or boolean mask."""
+        return MetricsFrame(
+            ids=self.ids[indices],
+            columns={name: values[indices] for name, values in self.columns.items()},
+            spectral={name: values[indices] for name, values in self.spectral_metrics.items()},
+            config={name: values[indices] for name, values in self.config_parameters.items()},
+            extra={name: values[indices] for name, values in self.extra.items()}
+        )
+
+    def tail(self, count: int) -> 'MetricsFrame':
+        """Last rows of the frame."""
+        return self.take(slice(max(len(self) - count, 0), None))
+
+    @property
+    def accuracy(self) -> np.ndarray:
+        """Performance accuracy per session (0 when absent)."""
+        return self.columns["accuracy"]
+
+    @property
+    def start_time(self) -> np.ndarray:
+        """Session start times."""
+        return self.columns["start_time"]
+
+    def spectral(self, name: str, default: float = 0.0) -> np.ndarray:
+        """Spectral metric column with missing values filled.
+
+        Args:
+            name: Spectral metric name
+            default: Value for sessions without the metric
+
+        Returns:
+            Float array
+        """
+        values = self.spectral_metrics.get(name)
+        if values is None:
+            return np.full(len(self), default, dtype=float)
+        return np.where(np.isnan(values), default, values)
+
+    def config(self, name: str) -> Optional[np.ndarray]:
+        """Numeric config parameter column (NaN where absent), or None if never numeric."""
+        return self.config_parameters.get(name)
+
+    def column(self, name: str) -> np.ndarray:
+        """Look up any column by name.
+
+        Args:
+            name: A base column, extra field, spectral metric, or ``config.<parameter>``
+
+        Returns:
+            Column array
+        """
+        if name in self.columns:
+            return self.columns[name]
+        if name in self.extra:
+            return self.extra[name]
+        if name.startswith("config.") and name[len("config."):] in self.config_parameters:
+            return self.config_parameters[name[len("config."):]]
+        if name in self.spectral_metrics:
+            return self.spectral_metrics[name]
+        raise KeyError(name)
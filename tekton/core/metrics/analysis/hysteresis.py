@@ -5,16 +5,16 @@ This module provides functions for analyzing hysteresis in model behavior.
 """
 
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Any, Optional, Union
 
-from ..utils import sessions_to_dicts, interpret_hysteresis
+from ..utils import interpret_hysteresis
+from .frame import MetricsFrame
 
-def calculate_hysteresis_detection(sessions: List[Any], parameter: str) -> Dict[str, Any]:
+def calculate_hysteresis_detection(sessions: Union[List[Any], MetricsFrame], parameter: str) -> Dict[str, Any]:
     """Calculate hysteresis in performance as a parameter changes.
     
     Args:
-        sessions: List of session data
+        sessions: List of session data, or a MetricsFrame
         parameter: The parameter to analyze
         
     Returns:
@@ -23,53 +23,41 @@ def calculate_hysteresis_detection(sessions: List[Any], parameter: str) -> Dict[
     if len(sessions) < 10:
         return {"error": "Need at least 10 sessions for hysteresis detection"}
     
-    # Convert to list of dicts
-    session_dicts = sessions_to_dicts(sessions)
+    frame = MetricsFrame.coerce(sessions)
     
-    # Extract parameter values and performance
-    param_values = []
-    performances = []
-    
-    for session in session_dicts:
-        config = session.get('config', {})
-        
-        if parameter not in config or not isinstance(config[parameter], (int, float)):
-            continue
-            
-        param_values.append(config[parameter])
-        performances.append(session.get('performance', {}).get('accuracy', 0))
+    # Only sessions where the parameter has a numeric value
+    column = frame.config(parameter)
+    if column is None:
+        return {"error": f"Not enough data with parameter {parameter}"}
+    present = ~np.isnan(column)
+    param_values = column[present]
+    performances = frame.accuracy[present]
     
     if len(param_values) < 10:
         return {"error": f"Not enough data with parameter {parameter}"}
     
-    # Create dataframe
-    df = pd.DataFrame({
-        'parameter': param_values,
-        'performance': performances
-    })
-    
     # Sort by parameter value
-    df = df.sort_values('parameter')
-    
-    # Detect if parameter values increase then decrease
-    increasing_phase = []
-    decreasing_phase = []
+    order = np.argsort(param_values)
+    sorted_params = param_values[order]
+    sorted_performances = performances[order]
     
-    # Find the peak parameter value
-    peak_idx = df['parameter'].idxmax()
+    # Find the position of the (first) peak parameter value after sorting
+    peak = int(np.flatnonzero(order == np.argmax(param_values))[0])
     
     # Split data into increasing and decreasing phases
-    increasing_phase = df.loc[:peak_idx]
-    decreasing_phase = df.loc[peak_idx:]
+    increasing_params = sorted_params[:peak + 1]
+    increasing_performances = sorted_performances[:peak + 1]
+    decreasing_params = sorted_params[peak:]
+    decreasing_performances = sorted_performances[peak:]
     
     # Check if we have sufficient data in both phases
-    if len(increasing_phase) < 3 or len(decreasing_phase) < 3:
+    if len(increasing_params) < 3 or len(decreasing_params) < 3:
         return {"error": "Insufficient data for both increasing and decreasing parameter values"}
     
     # Interpolate performance values at common parameter points
     # This allows us to compare performance between phases
-    min_param = max(min(increasing_phase['parameter']), min(decreasing_phase['parameter']))
-    max_param = min(max(increasing_phase['parameter']), max(decreasing_phase['parameter']))
+    min_param = max(increasing_params.min(), decreasing_params.min())
+    max_param = min(increasing_params.max(), decreasing_params.max())
     
     if min_param >= max_param:
         return {"error": "No overlap between increasing and decreasing parameter ranges"}
@@ -80,12 +68,12 @@ def calculate_hysteresis_detection(sessions: List[Any], parameter: str) -> Dict[
     # Interpolate performance values
     try:
         increasing_interp = np.interp(common_params, 
-                                    increasing_phase['parameter'], 
-                                    increasing_phase['performance'])
+                                    increasing_params, 
+                                    increasing_performances)
         
         decreasing_interp = np.interp(common_params, 
-                                    decreasing_phase['parameter'][::-1], 
-                                    decreasing_phase['performance'][::-1])
+                                    decreasing_params[::-1], 
+                                    decreasing_performances[::-1])
     except Exception as e:
         return {"error": f"Error in interpolation: {str(e)}"}
     
@@ -98,7 +86,7 @@ def calculate_hysteresis_detection(sessions: List[Any], parameter: str) -> Dict[
     min_diff = np.min(performance_diffs)
     
     # Hysteresis index = average absolute difference normalized by performance range
-    performance_range = max(df['performance']) - min(df['performance'])
+    performance_range = performances.max() - performances.min()
     
     if performance_range > 0:
         hysteresis_index = np.mean(np.abs(performance_diffs)) / performance_range
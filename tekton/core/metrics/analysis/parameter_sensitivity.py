@@ -5,17 +5,24 @@ This module provides functions for analyzing parameter sensitivity.
 """
 
 import numpy as np
-import pandas as pd
 from scipy import stats
 from typing import Dict, List, Any, Optional, Union
 
-from ..utils import sessions_to_dicts, interpret_parameter_sensitivity
+from ..utils import interpret_parameter_sensitivity
+from .frame import MetricsFrame
 
-def calculate_control_parameter_sensitivity(sessions: List[Any], parameters: Optional[List[str]] = None) -> Dict[str, Any]:
+def _slope(x: np.ndarray, y: np.ndarray) -> float:
+    """Linear regression slope, or 0 when x does not vary."""
+    if np.ptp(x) > 0:
+        slope, _, _, _, _ = stats.linregress(x, y)
+        return slope
+    return 0
+
+def calculate_control_parameter_sensitivity(sessions: Union[List[Any], MetricsFrame], parameters: Optional[List[str]] = None) -> Dict[str, Any]:
     """Calculate sensitivity to different control parameters.
     
     Args:
-        sessions: List of session data
+        sessions: List of session data, or a MetricsFrame
         parameters: Optional list of parameters to analyze
         
     Returns:
@@ -24,64 +31,42 @@ def calculate_control_parameter_sensitivity(sessions: List[Any], parameters: Opt
     if len(sessions) < 10:
         return {"error": "Need at least 10 sessions for parameter sensitivity analysis"}
     
-    # Convert to list of dicts
-    session_dicts = sessions_to_dicts(sessions)
-    
-    # Extract parameters and performance from sessions
-    parameter_values = {}
-    performances = []
-    
-    for session in session_dicts:
-        performance = session.get('performance', {}).get('accuracy', 0)
-        performances.append(performance)
-        
-        config = session.get('config', {})
-        for key, value in config.items():
-            if not isinstance(value, (int, float)):
-                continue
-                
-            if key not in parameter_values:
-                parameter_values[key] = []
-            parameter_values[key].append(value)
+    frame = MetricsFrame.coerce(sessions)
+    performances = frame.accuracy
     
     # If no specific parameters requested, analyze all numeric parameters
     if parameters is None:
-        parameters = list(parameter_values.keys())
+        parameters = list(frame.config_parameters.keys())
     
-    # Filter to parameters with sufficient data
-    parameters = [p for p in parameters if p in parameter_values and len(parameter_values[p]) == len(performances)]
+    # Filter to parameters with a numeric value in every session
+    parameters = [
+        p for p in parameters
+        if frame.config(p) is not None and not np.isnan(frame.config(p)).any()
+    ]
     
     if not parameters:
         return {"error": "No suitable parameters found for sensitivity analysis"}
     
     # Calculate sensitivity for each parameter
     sensitivity = {}
+    mean_perf = np.mean(performances)
     
     for param in parameters:
-        values = parameter_values[param]
+        values = frame.config(param)
         
-        if len(set(values)) <= 1:
+        if np.ptp(values) == 0:
             # Skip parameters with no variation
             continue
             
-        # Create dataframe for analysis
-        df = pd.DataFrame({
-            'parameter': values,
-            'performance': performances
-        })
-        
         # Calculate correlation
-        correlation = df['parameter'].corr(df['performance'])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            correlation = np.corrcoef(values, performances)[0, 1]
         
         # Calculate slope of linear regression
-        if len(set(values)) > 1:
-            slope, _, _, _, _ = stats.linregress(values, performances)
-        else:
-            slope = 0
+        slope = _slope(values, performances)
             
         # Normalized sensitivity (partial derivative * parameter / performance)
         mean_param = np.mean(values)
-        mean_perf = np.mean(performances)
         
         if mean_perf > 0 and mean_param != 0:
             normalized_sensitivity = slope * (mean_param / mean_perf)
@@ -92,24 +77,15 @@ def calculate_control_parameter_sensitivity(sessions: List[Any], parameters: Opt
         non_linearity = 0
         
         if len(values) >= 10:
-            # Sort by parameter value
-            df = df.sort_values('parameter')
-            
-            # Split into two segments
-            mid = len(df) // 2
-            df_low = df.iloc[:mid]
-            df_high = df.iloc[mid:]
+            # Sort by parameter value and split into two segments
+            order = np.argsort(values)
+            sorted_values = values[order]
+            sorted_performances = performances[order]
+            mid = len(values) // 2
             
             # Calculate slopes for each segment
-            if len(set(df_low['parameter'])) > 1:
-                slope_low, _, _, _, _ = stats.linregress(df_low['parameter'], df_low['performance'])
-            else:
-                slope_low = 0
-                
-            if len(set(df_high['parameter'])) > 1:
-                slope_high, _, _, _, _ = stats.linregress(df_high['parameter'], df_high['performance'])
-            else:
-                slope_high = 0
+            slope_low = _slope(sorted_values[:mid], sorted_performances[:mid])
+            slope_high = _slope(sorted_values[mid:], sorted_performances[mid:])
             
             # Non-linearity score = difference in slopes
             if max(abs(slope_low), abs(slope_high)) > 0:
@@ -0,0 +1,53 @@
+"""
+Vectorized rolling-window primitives.
+
+This module provides rolling-window helpers over NumPy arrays so analyses
+never loop over window positions in Python.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of every full window along the last axis.
+
+    Uses a running sum, so the cost is O(N) regardless of window size.
+
+    Args:
+        values: Array of shape (..., N)
+        window: Window length
+
+    Returns:
+        Array of shape (..., N - window + 1) where element j is the mean
+        of values[..., j:j + window]
+    """
+    values = np.asarray(values, dtype=float)
+    if window < 1 or window > values.shape[-1]:
+        raise ValueError(f"window must be between 1 and {values.shape[-1]}")
+
+    # Leading zero so each window sum is a difference of two prefix sums
+    pad = [(0, 0)] * (values.ndim - 1) + [(1, 0)]
+    sums = np.cumsum(np.pad(values, pad), axis=-1)
+    return (sums[..., window:] - sums[..., :-window]) / window
+
+
+def before_after_means(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Means of the windows just before and just after each split point.
+
+    Args:
+        values: Array of shape (..., N)
+        window: Window length on each side
+
+    Returns:
+        (before, after) arrays of shape (..., N - 2 * window) where column
+        k describes split point i = window + k: before is the mean of
+        values[..., i - window:i] and after the mean of values[..., i:i + window]
+    """
+    count = np.asarray(values).shape[-1] - 2 * window
+    if count <= 0:
+        raise ValueError(f"Need more than {2 * window} values for a window of {window}")
+
+    means = rolling_mean(values, window)
+    return means[..., :count], means[..., window:window + count]
+
@@ -16,6 +16,7 @@ from .parameter_sensitivity import calculate_control_parameter_sensitivity
 from .hysteresis import calculate_hysteresis_detection
 from .catastrophe_points import identify_catastrophe_points
 from .architectural_elasticity import find_architectural_elasticity
+from .frame import MetricsFrame
 from ..utils import session_to_dict
 from .analyzer_components.base_analyzer import BaseAnalyzer
 from .analyzer_components.metrics import calculate_spectral_metrics
@@ -78,67 +79,49 @@ class SpectralAnalyzer(BaseAnalyzer):
         """Analyze multiple sessions with optional grouping.
         
         Args:
-            sessions: List of SessionData objects or dicts
-            group_by: Optional field to group sessions by
+            sessions: List of SessionData objects or dicts, or a MetricsFrame
+            group_by: Optional session field (or frame column) to group sessions by
             
         Returns:
             Dict of analysis results
         """
-        if not sessions:
+        if not len(sessions):
             return {"sessions": 0, "groups": {}}
         
-        # Analyze each session
-        session_results = [self.analyze_session(session) for session in sessions]
-        
-        # Calculate overall statistics
+        # Row order does not matter for averages, so skip sorting
+        frame = MetricsFrame.coerce(
+            sessions,
+            sort=False,
+            fields=(group_by,) if group_by else (),
+            derive_spectral=True
+        )
+        
+        # Calculate overall statistics; unfinished sessions have no processing time
+        processing_times = frame.columns["processing_time"]
+        finished = processing_times[~np.isnan(processing_times)]
         overall = {
-            "sessions": len(session_results),
-            "avg_processing_time": np.mean([r["processing_time"] for r in session_results]),
-            "avg_component_count": np.mean([r["component_count"] for r in session_results]),
-            "avg_propagation_steps": np.mean([r["propagation_steps"] for r in session_results]),
+            "sessions": len(frame),
+            "avg_processing_time": np.mean(finished) if len(finished) else 0.0,
+            "avg_component_count": np.mean(frame.columns["component_count"]),
+            "avg_propagation_steps": np.mean(frame.columns["propagation_steps"]),
         }
         
-        # Calculate average spectral metrics
-        spectral_keys = set()
-        for result in session_results:
-            spectral_keys.update(result.get("spectral", {}).keys())
-        
-        spectral_avgs = {}
-        for key in spectral_keys:
-            values = [r.get("spectral", {}).get(key, 0) for r in session_results]
-            spectral_avgs[key] = np.mean(values)
-        
-        overall["spectral_avg"] = spectral_avgs
+        # Calculate average spectral metrics (missing values count as 0)
+        overall["spectral_avg"] = {
+            key: np.mean(frame.spectral(key)) for key in frame.spectral_metrics
+        }
         
         # Group results if requested
         if group_by:
             groups = {}
-            for result in session_results:
-                # Get session data to extract group value
-                session_id = result["session_id"]
-                session = next((s for s in sessions if (s["id"] if isinstance(s, dict) else s.id) == session_id), None)
-                
-                if not session:
-                    continue
-                
-                # Get group value
-                if isinstance(session, dict):
-                    group_val = session.get(group_by, "unknown")
-                else:
-                    group_val = getattr(session, group_by, "unknown")
-                
-                # Add to group
-                if group_val not in groups:
-                    groups[group_val] = []
-                
-                groups[group_val].append(result)
+            for index, group_val in enumerate(frame.column(group_by)):
+                groups.setdefault(group_val, []).append(index)
             
             # Calculate group statistics
-            group_stats = {}
-            for group_val, group_results in groups.items():
-                group_stats[group_val] = self.analyze_sessions(group_results)
-            
-            overall["groups"] = group_stats
+            overall["groups"] = {
+                group_val: self.analyze_sessions(frame.take(np.asarray(indices)))
+                for group_val, indices in groups.items()
+            }
         
         return overall
     
@@ -0,0 +1,138 @@
+"""
+Bounded recording buffers for high-frequency session metrics.
+
+This module provides RecordBuffer, a preallocated columnar buffer used by
+the metrics collector for records that can arrive many times per session
+(component activations, propagation steps), so recording is an array
+write instead of growing a list of dicts without bound.
+"""
+
+import threading
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+# Records kept per buffer before down-sampling starts
+DEFAULT_CAPACITY = 4096
+
+NO_KEY = -1
+
+
+class RecordBuffer:
+    """Fixed-capacity columnar buffer of timestamped records.
+
+    Each record has a timestamp, up to two interned string keys, a float
+    value and an optional payload dict. Once the buffer is full every other
+    record is dropped and from then on only every ``stride``-th record is
+    kept, so the buffer covers the whole session at a uniformly coarser
+    resolution instead of losing its tail.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of records held
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+
+        self.capacity = capacity
+        self.timestamps = np.empty(capacity, dtype=np.float64)
+        self.keys = np.empty((capacity, 2), dtype=np.int32)
+        self.values = np.empty(capacity, dtype=np.float64)
+        self.payloads = np.empty(capacity, dtype=object)
+
+        # Interned key strings; codes index into names
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+        self.size = 0
+        self.seen = 0
+        self.stride = 1
+        self._lock = threading.Lock()
+
+    def _intern(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def append(self,
+               timestamp: float,
+               key: str,
+               target: Optional[str] = None,
+               value: float = np.nan,
+               payload: Optional[Dict[str, Any]] = None) -> bool:
+        """Record an event.
+
+        Args:
+            timestamp: Event time
+            key: Primary key, e.g. the component ID
+            target: Optional secondary key, e.g. a destination component
+            value: Numeric value
+            payload: Extra fields, copied so later changes by the caller are not recorded
+
+        Returns:
+            True if the record was kept, False if it was sampled out
+        """
+        with self._lock:
+            seen = self.seen
+            self.seen += 1
+            if seen % self.stride:
+                return False
+            if self.size == self.capacity:
+                self._downsample()
+                if seen % self.stride:
+                    return False
+
+            i = self.size
+            self.timestamps[i] = timestamp
+            self.keys[i, 0] = self._intern(key)
+            self.keys[i, 1] = NO_KEY if target is None else self._intern(target)
+            self.values[i] = value
+            self.payloads[i] = None if payload is None else dict(payload)
+            self.size = i + 1
+            return True
+
+    def _downsample(self):
+        """Halve the buffer by keeping every other record and double the stride."""
+        count = (self.size + 1) // 2
+        keep = slice(0, self.size, 2)
+        self.timestamps[:count] = self.timestamps[keep]
+        self.keys[:count] = self.keys[keep]
+        self.values[:count] = self.values[keep]
+        self.payloads[:count] = self.payloads[keep]
+        self.payloads[count:self.size] = None
+        self.size = count
+        self.stride *= 2
+
+    @property
+    def dropped(self) -> int:
+        """Number of records sampled out so far."""
+        return self.seen - self.size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def rows(self):
+        """Iterate over kept records as (timestamp, key, target, value, payload).
+
+        Keys are returned as strings; target is None when not set.
+        """
+        with self._lock:
+            size = self.size
+            timestamps = self.timestamps[:size].tolist()
+            keys = self.keys[:size].tolist()
+            values = self.values[:size].tolist()
+            payloads = self.payloads[:size].tolist()
+            names = list(self.names)
+
+        for timestamp, (key, target), value, payload in zip(timestamps, keys, values, payloads):
+            yield (
+                timestamp,
+                names[key],
+                None if target == NO_KEY else names[target],
+                value,
+                payload
+            )
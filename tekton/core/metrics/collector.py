@@ -8,10 +8,17 @@ architectural metrics during system operation.
 import time
 import uuid
 import json
+import asyncio
+import atexit
 import logging
-from typing import Dict, List, Any, Optional, Union, Tuple
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Any, Optional, Union, Tuple, Set
 from dataclasses import dataclass, field, asdict
 
+from .buffers import DEFAULT_CAPACITY, RecordBuffer
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -59,22 +66,121 @@ class SessionData:
         return cls.from_dict(json.loads(json_str))
 
 
+class SessionRecorder:
+    """Recording state for one active session.
+
+    Component activations and propagation steps go into bounded
+    RecordBuffers and are only turned into lists of dicts when the session
+    is materialized; the remaining, low-frequency records are kept on the
+    SessionData directly.
+    """
+    
+    def __init__(self, session: SessionData, buffer_capacity: int = DEFAULT_CAPACITY):
+        """Initialize the recorder.
+        
+        Args:
+            session: Session being recorded
+            buffer_capacity: Records kept per high-frequency buffer
+        """
+        self.session = session
+        self.activations = RecordBuffer(buffer_capacity)
+        self.propagation = RecordBuffer(buffer_capacity)
+    
+    def materialize(self) -> SessionData:
+        """Copy buffered records into the session and return it."""
+        activations: Dict[str, List[Dict[str, Any]]] = {}
+        for timestamp, component_id, _, _, payload in self.activations.rows():
+            record = {"timestamp": timestamp}
+            if payload:
+                record.update(payload)
+            activations.setdefault(component_id, []).append(record)
+        
+        path = []
+        for timestamp, source, destination, info_content, payload in self.propagation.rows():
+            step = {
+                "timestamp": timestamp,
+                "source": source,
+                "destination": destination,
+                "info_content": info_content
+            }
+            if payload:
+                step.update(payload)
+            path.append(step)
+        
+        for name, buffer in (("activations", self.activations), ("propagation steps", self.propagation)):
+            if buffer.dropped:
+                logger.debug(f"Session {self.session.id} kept {len(buffer)} of {buffer.seen} {name}")
+        
+        self.session.component_activations = activations
+        self.session.propagation_path = path
+        return self.session
+
+
 class MetricsCollector:
-    """Collects metrics during system operation."""
+    """Collects metrics during system operation.
     
-    def __init__(self, storage_engine=None):
+    Any number of sessions can be active at once. Recording calls apply to
+    the session started in the current context (thread or asyncio task),
+    or to an explicit ``session_id``; calls from a context without a
+    session are ignored.
+    """
+    
+    def __init__(self, storage_engine=None, buffer_capacity: int = DEFAULT_CAPACITY,
+                 async_storage: bool = True):
         """Initialize metrics collector.
         
         Args:
             storage_engine: Optional storage engine for metrics
+            buffer_capacity: Activations and propagation steps kept per session
+                before down-sampling
+            async_storage: Store completed sessions in the background, so
+                complete_session() does not wait on storage; pending stores
+                are flushed at interpreter exit and by close()
         """
         self.storage = storage_engine
-        self.current_session = None
         self.active = True
+        self.buffer_capacity = buffer_capacity
+        self.async_storage = async_storage
+        
+        self._sessions: Dict[str, SessionRecorder] = {}
+        self._context: contextvars.ContextVar = contextvars.ContextVar(
+            f"metrics_session_{id(self)}", default=None
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._pending: Set[Future] = set()
+        self._atexit_registered = False
+    
+    @property
+    def current_session_id(self) -> Optional[str]:
+        """ID of the session recording calls apply to, if any."""
+        recorder = self._recorder()
+        return recorder.session.id if recorder else None
+    
+    @property
+    def current_session(self) -> Optional[SessionData]:
+        """Snapshot of the session recording calls apply to, if any."""
+        recorder = self._recorder()
+        return recorder.materialize() if recorder else None
+    
+    @property
+    def active_sessions(self) -> List[str]:
+        """IDs of all sessions that have not been completed."""
+        return list(self._sessions)
+    
+    def _recorder(self, session_id: Optional[str] = None) -> Optional[SessionRecorder]:
+        """Resolve the recorder for an explicit or context session."""
+        if session_id is None:
+            session_id = self._context.get()
+            if session_id is None:
+                return None
+        return self._sessions.get(session_id)
     
     def start_session(self, prompt: str, config: Dict[str, Any]) -> str:
         """Start a new metrics collection session.
         
+        The session becomes the current session of the calling context.
+        
         Args:
             prompt: The input prompt text
             config: Configuration of components used
@@ -87,43 +193,43 @@ class MetricsCollector:
             return "disabled"
             
         session_id = str(uuid.uuid4())
-        self.current_session = SessionData(
+        session = SessionData(
             id=session_id,
             prompt=prompt,
             config=config,
             start_time=time.time()
         )
+        self._sessions[session_id] = SessionRecorder(session, self.buffer_capacity)
+        self._context.set(session_id)
         
         logger.debug(f"Started metrics session {session_id}")
         return session_id
     
     def record_component_activation(self, 
                                    component_id: str, 
-                                   activation_data: Dict[str, Any]):
+                                   activation_data: Dict[str, Any],
+                                   session_id: Optional[str] = None):
         """Record activation metrics for a component.
         
         Args:
             component_id: ID of the activated component
             activation_data: Data about the activation
+            session_id: Optional session (defaults to the current session)
         """
-        if not self.active or not self.current_session:
+        if not self.active:
+            return
+        recorder = self._recorder(session_id)
+        if not recorder:
             return
             
-        if component_id not in self.current_session.component_activations:
-            self.current_session.component_activations[component_id] = []
-            
-        activation_record = {
-            "timestamp": time.time(),
-            **activation_data
-        }
-        
-        self.current_session.component_activations[component_id].append(activation_record)
+        recorder.activations.append(time.time(), component_id, payload=activation_data)
     
     def record_propagation_step(self, 
                                source: str, 
                                destination: str, 
                                info_content: float,
-                               data: Optional[Dict[str, Any]] = None):
+                               data: Optional[Dict[str, Any]] = None,
+                               session_id: Optional[str] = None):
         """Record data propagation between components.
         
         Args:
@@ -131,27 +237,22 @@ class MetricsCollector:
             destination: Destination component ID
             info_content: Measured information content
             data: Additional data about the propagation
+            session_id: Optional session (defaults to the current session)
         """
-        if not self.active or not self.current_session:
+        if not self.active:
+            return
+        recorder = self._recorder(session_id)
+        if not recorder:
             return
             
-        step_data = {
-            "timestamp": time.time(),
-            "source": source,
-            "destination": destination,
-            "info_content": info_content
-        }
-        
-        if data:
-            step_data.update(data)
-            
-        self.current_session.propagation_path.append(step_data)
+        recorder.propagation.append(time.time(), source, destination, info_content, data)
     
     def record_parameter_usage(self,
                               component_id: str,
                               total_params: int,
                               active_params: int,
-                              layer_data: Optional[Dict[str, Any]] = None):
+                              layer_data: Optional[Dict[str, Any]] = None,
+                              session_id: Optional[str] = None):
         """Record parameter usage metrics.
         
         Args:
@@ -159,8 +260,12 @@ class MetricsCollector:
             total_params: Total parameters available
             active_params: Number of active parameters
             layer_data: Optional layer-specific data
+            session_id: Optional session (defaults to the current session)
         """
-        if not self.active or not self.current_session:
+        if not self.active:
+            return
+        recorder = self._recorder(session_id)
+        if not recorder:
             return
             
         usage_data = {
@@ -173,7 +278,7 @@ class MetricsCollector:
         if layer_data:
             usage_data["layers"] = layer_data
             
-        self.current_session.parameter_usage[component_id] = usage_data
+        recorder.session.parameter_usage[component_id] = usage_data
         
     def record_latent_reasoning(self,
                                component_id: str,
@@ -181,7 +286,8 @@ class MetricsCollector:
                                initial_confidence: float,
                                final_confidence: float,
                                iterations_required: int,
-                               reasoning_data: Optional[Dict[str, Any]] = None):
+                               reasoning_data: Optional[Dict[str, Any]] = None,
+                               session_id: Optional[str] = None):
         """Record latent space reasoning metrics.
         
         Args:
@@ -191,8 +297,12 @@ class MetricsCollector:
             final_confidence: Final confidence score
             iterations_required: Total iterations required
             reasoning_data: Optional additional data about the reasoning process
+            session_id: Optional session (defaults to the current session)
         """
-        if not self.active or not self.current_session:
+        if not self.active:
+            return
+        recorder = self._recorder(session_id)
+        if not recorder:
             return
             
         reasoning_record = {
@@ -208,14 +318,15 @@ class MetricsCollector:
         if reasoning_data:
             reasoning_record.update(reasoning_data)
             
-        self.current_session.latent_reasoning.append(reasoning_record)
+        recorder.session.latent_reasoning.append(reasoning_record)
         
     def record_cross_modal_operation(self,
                                     source_modality: str,
                                     target_modality: str,
                                     operation_type: str,
                                     success: bool,
-                                    operation_data: Optional[Dict[str, Any]] = None):
+                                    operation_data: Optional[Dict[str, Any]] = None,
+                                    session_id: Optional[str] = None):
         """Record cross-modal integration metrics.
         
         Args:
@@ -224,8 +335,12 @@ class MetricsCollector:
             operation_type: Type of cross-modal operation
             success: Whether the operation was successful
             operation_data: Optional additional data about the operation
+            session_id: Optional session (defaults to the current session)
         """
-        if not self.active or not self.current_session:
+        if not self.active:
+            return
+        recorder = self._recorder(session_id)
+        if not recorder:
             return
             
         operation_record = {
@@ -239,13 +354,14 @@ class MetricsCollector:
         if operation_data:
             operation_record.update(operation_data)
             
-        self.current_session.cross_modal_operations.append(operation_record)
+        recorder.session.cross_modal_operations.append(operation_record)
         
     def record_concept_stability(self,
                                 concept_id: str,
                                 context: str,
                                 vector_representation: List[float],
-                                stability_data: Optional[Dict[str, Any]] = None):
+                                stability_data: Optional[Dict[str, Any]] = None,
+                                session_id: Optional[str] = None):
         """Record concept stability metrics.
         
         Args:
@@ -253,12 +369,13 @@ class MetricsCollector:
             context: Context in which the concept was observed
             vector_representation: Vector representation of the concept
             stability_data: Optional additional data about concept stability
+            session_id: Optional session (defaults to the current session)
         """
-        if not self.active or not self.current_session:
+        if not self.active:
+            return
+        recorder = self._recorder(session_id)
+        if not recorder:
             return
-            
-        if concept_id not in self.current_session.concept_stability:
-            self.current_session.concept_stability[concept_id] = []
             
         stability_record = {
             "timestamp": time.time(),
@@ -269,45 +386,145 @@ class MetricsCollector:
         if stability_data:
             stability_record.update(stability_data)
             
-        self.current_session.concept_stability[concept_id].append(stability_record)
+        recorder.session.concept_stability.setdefault(concept_id, []).append(stability_record)
     
     def complete_session(self, 
                         response: str, 
                         performance_metrics: Dict[str, Any],
-                        calculate_spectral: bool = True):
-        """Complete the metrics collection session.
+                        calculate_spectral: bool = True,
+                        session_id: Optional[str] = None):
+        """Complete a metrics collection session.
+        
+        With async_storage the session is handed to the storage engine in
+        the background; use flush() or complete_session_async() to wait
+        for it to be stored.
         
         Args:
             response: Response text generated
             performance_metrics: Performance metrics
             calculate_spectral: Whether to calculate spectral metrics
+            session_id: Optional session (defaults to the current session)
+            
+        Returns:
+            Completed SessionData, or None if there was no session
         """
-        if not self.active or not self.current_session:
-            return
+        session_data = self._finish(response, performance_metrics, calculate_spectral, session_id)
+        if session_data and self.storage:
+            self._store(session_data)
+        return session_data
+    
+    async def complete_session_async(self,
+                                     response: str,
+                                     performance_metrics: Dict[str, Any],
+                                     calculate_spectral: bool = True,
+                                     session_id: Optional[str] = None):
+        """Complete a session and wait for it to be stored without blocking the event loop.
+        
+        Args:
+            response: Response text generated
+            performance_metrics: Performance metrics
+            calculate_spectral: Whether to calculate spectral metrics
+            session_id: Optional session (defaults to the current session)
             
-        self.current_session.end_time = time.time()
-        self.current_session.response = response
-        self.current_session.performance = performance_metrics
+        Returns:
+            Completed SessionData, or None if there was no session
+        """
+        session_data = self._finish(response, performance_metrics, calculate_spectral, session_id)
+        if session_data and self.storage:
+            future = self._store(session_data)
+            if future is not None:
+                try:
+                    await asyncio.wrap_future(future)
+                except Exception:
+                    pass  # Already logged by the done callback
+        return session_data
+    
+    def _finish(self, response, performance_metrics, calculate_spectral, session_id) -> Optional[SessionData]:
+        """Detach a session from the collector and fill in its results."""
+        if not self.active:
+            return None
+        recorder = self._recorder(session_id)
+        if not recorder:
+            return None
+        
+        session = recorder.session
+        self._sessions.pop(session.id, None)
+        if self._context.get() == session.id:
+            self._context.set(None)
+            
+        recorder.materialize()
+        session.end_time = time.time()
+        session.response = response
+        session.performance = performance_metrics
         
         # Calculate spectral metrics
         if calculate_spectral:
-            self._calculate_spectral_metrics()
+            self._calculate_spectral_metrics(session)
+        return session
+    
+    def _store(self, session: SessionData) -> Optional[Future]:
+        """Save a completed session, in the background when async_storage is set.
         
-        # Save to storage if available
-        if self.storage:
+        Returns:
+            Future for a background store, None if stored synchronously
+        """
+        if not self.async_storage:
             try:
-                self.storage.store_session(self.current_session)
-                logger.debug(f"Stored metrics for session {self.current_session.id}")
+                self.storage.store_session(session)
+                logger.debug(f"Stored metrics for session {session.id}")
             except Exception as e:
                 logger.error(f"Failed to store metrics: {str(e)}")
+            return None
         
-        session_data = self.current_session
-        self.current_session = None
-        return session_data
+        # Background writers are daemon threads, so flush them before exit
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+        
+        # Storage engines with their own background writer batch the writes
+        if hasattr(self.storage, 'enqueue_session'):
+            future = self.storage.enqueue_session(session)
+        else:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metrics-store")
+            future = self._executor.submit(self.storage.store_session, session)
+        
+        self._pending.add(future)
+        
+        def done(future, session_id=session.id):
+            self._pending.discard(future)
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Failed to store metrics: {str(error)}")
+            else:
+                logger.debug(f"Stored metrics for session {session_id}")
+        
+        future.add_done_callback(done)
+        return future
+    
+    def flush(self, timeout: Optional[float] = None):
+        """Wait until every completed session has been handed to storage.
+        
+        Args:
+            timeout: Optional timeout in seconds (None waits indefinitely)
+        """
+        wait(list(self._pending), timeout=timeout)
+    
+    def close(self):
+        """Flush pending stores and stop the background worker."""
+        self.flush()
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        if self._atexit_registered:
+            atexit.unregister(self.flush)
+            self._atexit_registered = False
     
-    def _calculate_spectral_metrics(self):
+    def _calculate_spectral_metrics(self, session: SessionData):
         """Calculate spectral analysis metrics from collected data."""
-        if not self.current_session:
+        if not session:
             return
             
         spectral_metrics = {}
@@ -317,17 +534,17 @@ class MetricsCollector:
         # DE = performance / layer count
         try:
             total_layers = sum(len(data.get("layers", {})) 
-                             for data in self.current_session.parameter_usage.values())
-            if "accuracy" in self.current_session.performance and total_layers > 0:
-                spectral_metrics["depth_efficiency"] = self.current_session.performance["accuracy"] / total_layers
+                             for data in session.parameter_usage.values())
+            if "accuracy" in session.performance and total_layers > 0:
+                spectral_metrics["depth_efficiency"] = session.performance["accuracy"] / total_layers
         except (KeyError, ZeroDivisionError):
             spectral_metrics["depth_efficiency"] = 0
             
         # Calculate Parametric Utilization (PU)
         # PU = active parameters / total parameters
         try:
-            total_params = sum(data["total"] for data in self.current_session.parameter_usage.values())
-            active_params = sum(data["active"] for data in self.current_session.parameter_usage.values())
+            total_params = sum(data["total"] for data in session.parameter_usage.values())
+            active_params = sum(data["active"] for data in session.parameter_usage.values())
             
             if total_params > 0:
                 spectral_metrics["parametric_utilization"] = active_params / total_params
@@ -339,10 +556,10 @@ class MetricsCollector:
         # Calculate Minimum Propagation Threshold (MPT)
         # MPT = shortest successful path through components
         try:
-            if self.current_session.propagation_path:
+            if session.propagation_path:
                 # Count unique components in the propagation path
                 components = set()
-                for step in self.current_session.propagation_path:
+                for step in session.propagation_path:
                     components.add(step["source"])
                     components.add(step["destination"])
                 
@@ -358,7 +575,7 @@ class MetricsCollector:
             cross_module_flow = 0
             within_module_flow = 0
             
-            for step in self.current_session.propagation_path:
+            for step in session.propagation_path:
                 # If source and destination are in the same component family
                 if step["source"].split('.')[0] == step["destination"].split('.')[0]:
                     within_module_flow += step.get("info_content", 1)
@@ -376,9 +593,9 @@ class MetricsCollector:
         # Calculate Cognitive Convergence Rate (CCR)
         # CCR = (final confidence - initial confidence) / iteration count
         try:
-            if self.current_session.latent_reasoning:
+            if session.latent_reasoning:
                 ccr_values = [record.get("cognitive_convergence_rate", 0) 
-                             for record in self.current_session.latent_reasoning]
+                             for record in session.latent_reasoning]
                 spectral_metrics["cognitive_convergence_rate"] = sum(ccr_values) / len(ccr_values)
             else:
                 spectral_metrics["cognitive_convergence_rate"] = 0
@@ -388,14 +605,14 @@ class MetricsCollector:
         # Calculate Latent Space Navigation Efficiency (LSNE)
         # LSNE = (conceptual distance covered) / (computational steps required)
         try:
-            if self.current_session.latent_reasoning:
+            if session.latent_reasoning:
                 # Use iteration counts as proxy for computational steps
                 total_iterations = sum(record.get("iterations_required", 1) 
-                                      for record in self.current_session.latent_reasoning)
+                                      for record in session.latent_reasoning)
                 
                 # Use confidence gain as proxy for conceptual distance
                 total_confidence_gain = sum(record.get("final_confidence", 0) - record.get("initial_confidence", 0)
-                                          for record in self.current_session.latent_reasoning)
+                                          for record in session.latent_reasoning)
                 
                 if total_iterations > 0:
                     spectral_metrics["latent_space_navigation_efficiency"] = total_confidence_gain / total_iterations
@@ -409,9 +626,9 @@ class MetricsCollector:
         # Calculate Cross-Modal Integration Index (CMII)
         # CMII = Σ(cross-modal transfer success) / total cross-modal operations
         try:
-            if self.current_session.cross_modal_operations:
-                successful_ops = sum(1 for op in self.current_session.cross_modal_operations if op.get("success", False))
-                total_ops = len(self.current_session.cross_modal_operations)
+            if session.cross_modal_operations:
+                successful_ops = sum(1 for op in session.cross_modal_operations if op.get("success", False))
+                total_ops = len(session.cross_modal_operations)
                 
                 if total_ops > 0:
                     spectral_metrics["cross_modal_integration_index"] = successful_ops / total_ops
@@ -425,10 +642,10 @@ class MetricsCollector:
         # Calculate Conceptual Stability Coefficient (CSC)
         # CSC = 1 - (concept vector deviation across inputs / maximum possible deviation)
         try:
-            if self.current_session.concept_stability:
+            if session.concept_stability:
                 stability_scores = []
                 
-                for concept_id, observations in self.current_session.concept_stability.items():
+                for concept_id, observations in session.concept_stability.items():
                     if len(observations) >= 2:
                         # Calculate pairwise cosine similarities between vector representations
                         similarities = []
@@ -489,5 +706,5 @@ class MetricsCollector:
         catastrophe_metrics["critical_slowing_down"] = 1.0
             
         # Store the calculated metrics
-        self.current_session.spectral_metrics = spectral_metrics
-        self.current_session.catastrophe_metrics = catastrophe_metrics
\ No newline at end of file
+        session.spectral_metrics = spectral_metrics
+        session.catastrophe_metrics = catastrophe_metrics
\ No newline at end of file
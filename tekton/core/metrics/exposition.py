@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Metrics Exposition Module
+
+This module encodes metrics in the Prometheus text format (0.0.4) and the
+OpenMetrics text format (1.0.0), including exemplars.
+
+ExpositionEncoder caches the encoded samples of each series together with
+the metric version they were encoded at, so a scrape only re-encodes series
+whose values changed since the previous scrape. Callers that can tell
+whether anything changed at all (such as a registry's version) pass that
+as the scrape's version, and an unchanged scrape returns the previous
+output without visiting any series. Output is produced as one chunk per
+metric family, either streamed to a writer or collected into a buffer that
+is reused between scrapes.
+"""
+
+import math
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Hashable, IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .metric_types import MetricType
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# OpenMetrics limits the combined length of exemplar label names and values
+MAX_EXEMPLAR_LABEL_CHARS = 128
+
+# (labels, value, timestamp) recorded alongside an observation
+Exemplar = Tuple[Dict[str, str], float, float]
+
+# (name, [(metric, const_labels), ...]) pairs
+Families = Iterable[Tuple[str, List[Tuple[Any, Optional[Dict[str, str]]]]]]
+
+
+def format_value(value: Any) -> str:
+    """Format a sample value or bucket boundary."""
+    if isinstance(value, int):
+        return str(value)
+    value = float(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(value)
+
+
+def escape_label_value(value: Any) -> str:
+    """Escape a label value for use inside double quotes."""
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r'\"')
+
+
+def escape_help(text: str) -> str:
+    """Escape HELP text."""
+    return text.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def format_labels(labels: Dict[str, Any], extra: Optional[Tuple[str, Any]] = None) -> str:
+    """
+    Format a label set as ``{name="value",...}``.
+
+    Args:
+        labels: Label names and values
+        extra: Optional trailing label, such as ``("le", 0.5)``
+
+    Returns:
+        Formatted label set, or an empty string if there are no labels
+    """
+    pairs = [f'{name}="{escape_label_value(value)}"' for name, value in labels.items()]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{escape_label_value(extra[1])}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def validate_exemplar_labels(labels: Dict[str, str]) -> None:
+    """Check that exemplar labels fit the OpenMetrics length limit."""
+    length = sum(len(name) + len(str(value)) for name, value in labels.items())
+    if length > MAX_EXEMPLAR_LABEL_CHARS:
+        raise ValueError(
+            f"Exemplar labels are {length} characters long "
+            f"(at most {MAX_EXEMPLAR_LABEL_CHARS} allowed)"
+        )
+
+
+def format_exemplar(exemplar: Optional[Exemplar]) -> str:
+    """Format an exemplar suffix for an OpenMetrics sample line."""
+    if exemplar is None:
+        return ""
+    labels, value, timestamp = exemplar
+    return f" # {format_labels(labels) or '{}'} {format_value(value)} {format_value(timestamp)}"
+
+
+def family_name(metric: Any, openmetrics: bool = False) -> str:
+    """Get the family name of a metric (OpenMetrics drops a counter's _total suffix)."""
+    if openmetrics and metric.type == MetricType.COUNTER.value and metric.name.endswith("_total"):
+        return metric.name[:-len("_total")]
+    return metric.name
+
+
+def family_type(metric: Any, openmetrics: bool = False) -> str:
+    """Get the exposition type of a metric."""
+    metric_type = metric._prometheus_type()
+    if openmetrics and metric_type == "untyped":
+        return "unknown"
+    return metric_type
+
+
+def family_header(metric: Any, openmetrics: bool = False) -> str:
+    """Get the HELP and TYPE lines for a metric family."""
+    name = family_name(metric, openmetrics)
+    return (
+        f"# HELP {name} {escape_help(metric.description)}\n"
+        f"# TYPE {name} {family_type(metric, openmetrics)}\n"
+    )
+
+
+def sample_lines(
+    metric: Any,
+    openmetrics: bool = False,
+    const_labels: Optional[Dict[str, str]] = None
+) -> List[str]:
+    """
+    Encode the samples of one series.
+
+    Args:
+        metric: Counter, Gauge or Histogram
+        openmetrics: Use OpenMetrics sample names and include exemplars
+        const_labels: Labels added to every sample unless the metric sets them
+
+    Returns:
+        Sample lines without trailing newlines
+    """
+    labels = {**const_labels, **metric.labels} if const_labels else metric.labels
+    label_str = format_labels(labels)
+    name = metric.name
+
+    if metric.type == MetricType.COUNTER.value:
+        if not openmetrics:
+            return [f"{name}{label_str} {format_value(metric.value)}"]
+        sample_name = f"{family_name(metric, True)}_total"
+        return [f"{sample_name}{label_str} {format_value(metric.value)}{format_exemplar(metric.exemplar)}"]
+
+    if metric.type == MetricType.HISTOGRAM.value:
+        total, count, bucket_counts = metric.snapshot()
+        # Series labels are formatted once and shared by every bucket line
+        prefix = f"{name}_bucket{label_str[:-1]}," if label_str else f"{name}_bucket{{"
+        lines = [
+            f'{prefix}le="{format_value(float(boundary))}"}} {bucket_count}'
+            for boundary, bucket_count in zip(metric.buckets, bucket_counts)
+        ]
+        if openmetrics:
+            lines = [line + format_exemplar(exemplar) for line, exemplar in zip(lines, metric.exemplars)]
+        lines.append(f"{name}_sum{label_str} {format_value(total)}")
+        lines.append(f"{name}_count{label_str} {count}")
+        return lines
+
+    if hasattr(metric, "value"):
+        return [f"{name}{label_str} {format_value(metric.value)}"]
+    return []
+
+
+def encode_metric(metric: Any, openmetrics: bool = False) -> str:
+    """Encode a single metric with its family header."""
+    return family_header(metric, openmetrics) + "".join(
+        f"{line}\n" for line in sample_lines(metric, openmetrics)
+    )
+
+
+class ExpositionEncoder:
+    """
+    Incremental exposition encoder with per-series caching.
+
+    Families are emitted in the order they are passed in; every series in a
+    family shares one HELP/TYPE header. Keep one encoder per output format
+    and reuse it across scrapes so the cache is effective.
+    """
+
+    def __init__(self, openmetrics: bool = False):
+        """
+        Initialize the encoder.
+
+        Args:
+            openmetrics: Produce OpenMetrics instead of Prometheus text format
+        """
+        self.openmetrics = openmetrics
+        self.content_type = OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE
+
+        # (id(metric), const labels) -> (metric, version, encoded samples); the
+        # metric reference keeps the id from being reused while the entry exists
+        self._series: Dict[Tuple[int, Optional[FrozenSet[Tuple[str, str]]]], Tuple[Any, int, bytes]] = {}
+        self._headers: Dict[Tuple[str, str, str], bytes] = {}
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        
+        # (version, output) of the most recent versioned scrape
+        self._output: Optional[Tuple[Hashable, bytes]] = None
+
+        # Series re-encoded by the most recent scrape
+        self.last_encoded = 0
+
+    def series(self, metric: Any, const_labels: Optional[Dict[str, str]] = None) -> bytes:
+        """Get the encoded samples of a series, re-encoding only if it changed."""
+        version = metric.version
+        key = (id(metric), frozenset(const_labels.items()) if const_labels else None)
+        cached = self._series.get(key)
+        if cached is not None and cached[0] is metric and cached[1] == version:
+            return cached[2]
+
+        encoded = "".join(
+            f"{line}\n" for line in sample_lines(metric, self.openmetrics, const_labels)
+        ).encode("utf-8")
+        self._series[key] = (metric, version, encoded)
+        self.last_encoded += 1
+        return encoded
+
+    def header(self, metric: Any) -> bytes:
+        """Get the encoded HELP/TYPE header of a metric's family."""
+        key = (metric.name, metric.description, metric.type)
+        header = self._headers.get(key)
+        if header is None:
+            header = family_header(metric, self.openmetrics).encode("utf-8")
+            self._headers[key] = header
+        return header
+
+    def iter_chunks(self, families: Families) -> Iterator[bytes]:
+        """
+        Encode metric families, yielding one chunk per family.
+
+        Args:
+            families: (name, [(metric, const_labels), ...]) pairs
+
+        Yields:
+            Encoded family text
+        """
+        self.last_encoded = 0
+        seen = set()
+
+        for _, members in families:
+            if not members:
+                continue
+            parts = [self.header(members[0][0])]
+            for metric, const_labels in members:
+                seen.add((id(metric), frozenset(const_labels.items()) if const_labels else None))
+                parts.append(self.series(metric, const_labels))
+            yield b"".join(parts)
+
+        if self.openmetrics:
+            yield b"# EOF\n"
+
+        # Forget series that are no longer exposed
+        if len(self._series) > len(seen):
+            for key in [key for key in self._series if key not in seen]:
+                del self._series[key]
+
+    def _cached_output(self, version: Optional[Hashable]) -> Optional[bytes]:
+        """Get the previous output if it was encoded at the same version."""
+        if version is not None and self._output is not None and self._output[0] == version:
+            self.last_encoded = 0
+            return self._output[1]
+        return None
+
+    def encode(
+        self,
+        families: Union[Families, Callable[[], Families]],
+        version: Optional[Hashable] = None
+    ) -> bytes:
+        """
+        Encode metric families into the reusable buffer and return the result.
+
+        Args:
+            families: (name, [(metric, const_labels), ...]) pairs, or a callable
+                returning them, which is only called when re-encoding
+            version: Version of the metrics; if it equals the version of the
+                previous scrape, that output is returned without visiting
+                any series
+
+        Returns:
+            Encoded exposition
+        """
+        with self._lock:
+            output = self._cached_output(version)
+            if output is not None:
+                return output
+
+            buffer = self._buffer
+            del buffer[:]
+            for chunk in self.iter_chunks(families() if callable(families) else families):
+                buffer += chunk
+            output = bytes(buffer)
+            self._output = (version, output) if version is not None else None
+            return output
+
+    def write(
+        self,
+        families: Union[Families, Callable[[], Families]],
+        stream: IO[bytes],
+        version: Optional[Hashable] = None
+    ) -> None:
+        """
+        Stream encoded metric families to a binary writer.
+
+        Args:
+            families: As for encode()
+            stream: Binary writer
+            version: As for encode()
+        """
+        with self._lock:
+            output = self._cached_output(version)
+            if output is not None:
+                stream.write(output)
+                return
+
+            chunks = []
+            for chunk in self.iter_chunks(families() if callable(families) else families):
+                stream.write(chunk)
+                if version is not None:
+                    chunks.append(chunk)
+            self._output = (version, b"".join(chunks)) if version is not None else None
+
+
+def registry_families(
+    registries: Iterable[Any],
+    const_label: Optional[str] = "component_id"
+) -> List[Tuple[str, List[Tuple[Any, Optional[Dict[str, str]]]]]]:
+    """
+    Group the metrics of several registries into families by name.
+
+    Args:
+        registries: Metrics registries to expose together
+        const_label: Label carrying each registry's component_id (None to omit)
+
+    Returns:
+        (name, [(metric, const_labels), ...]) pairs in first-seen order
+    """
+    families: Dict[str, List[Tuple[Any, Optional[Dict[str, str]]]]] = {}
+    for registry in registries:
+        const_labels = None
+        if const_label and registry.component_id:
+            const_labels = {const_label: registry.component_id}
+        for name, family in registry._index.items():
+            members = families.setdefault(name, [])
+            members.extend((metric, const_labels) for metric in family.values())
+    return list(families.items())
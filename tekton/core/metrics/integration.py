@@ -68,9 +68,6 @@ class MetricsManager:
         self.console_visualizer = ConsoleVisualizer(self.storage)
         self.json_visualizer = JSONVisualizer(self.storage)
         
-        # Current session tracking
-        self.current_session_id = None
-        
         logger.info(f"Metrics Manager initialized (enabled={enabled}, storage={storage_path})")
     
     def start_session(self, prompt: str, config: Dict[str, Any]) -> str:
@@ -86,11 +83,15 @@ class MetricsManager:
         if not self.enabled:
             return None
             
-        self.current_session_id = self.collector.start_session(prompt, config)
-        return self.current_session_id
+        return self.collector.start_session(prompt, config)
+    
+    @property
+    def current_session_id(self) -> Optional[str]:
+        """ID of the current context's metrics session, if any."""
+        return self.collector.current_session_id
     
     def complete_session(self, response: str, performance_metrics: Dict[str, Any]) -> Dict[str, Any]:
-        """Complete the current metrics collection session.
+        """Complete the current context's metrics collection session.
         
         Args:
             response: Response text generated
@@ -99,11 +100,10 @@ class MetricsManager:
         Returns:
             Collected session data
         """
-        if not self.enabled or not self.current_session_id:
+        if not self.enabled:
             return None
             
         session_data = self.collector.complete_session(response, performance_metrics)
-        self.current_session_id = None
         
         if session_data:
             # Analyze the completed session
@@ -119,7 +119,7 @@ class MetricsManager:
             component_id: ID of the activated component
             activation_data: Data about the activation
         """
-        if not self.enabled or not self.current_session_id:
+        if not self.enabled:
             return
             
         self.collector.record_component_activation(component_id, activation_data)
@@ -134,7 +134,7 @@ class MetricsManager:
             info_content: Measured information content
             data: Additional data about the propagation
         """
-        if not self.enabled or not self.current_session_id:
+        if not self.enabled:
             return
             
         self.collector.record_propagation_step(source, destination, info_content, data)
@@ -149,7 +149,7 @@ class MetricsManager:
             active_params: Number of active parameters
             layer_data: Optional layer-specific data
         """
-        if not self.enabled or not self.current_session_id:
+        if not self.enabled:
             return
             
         self.collector.record_parameter_usage(component_id, total_params, active_params, layer_data)
@@ -167,7 +167,7 @@ class MetricsManager:
             iterations_required: Total iterations required
             reasoning_data: Optional additional data about the reasoning process
         """
-        if not self.enabled or not self.current_session_id:
+        if not self.enabled:
             return
             
         self.collector.record_latent_reasoning(
@@ -187,7 +187,7 @@ class MetricsManager:
             success: Whether the operation was successful
             operation_data: Optional additional data about the operation
         """
-        if not self.enabled or not self.current_session_id:
+        if not self.enabled:
             return
             
         self.collector.record_cross_modal_operation(
@@ -204,7 +204,7 @@ class MetricsManager:
             vector_representation: Vector representation of the concept
             stability_data: Optional additional data about concept stability
         """
-        if not self.enabled or not self.current_session_id:
+        if not self.enabled:
             return
             
         self.collector.record_concept_stability(
@@ -355,6 +355,13 @@ class MetricsManager:
         else:
             return self.console_visualizer.visualize_trend(sessions)
 
+    def shutdown(self):
+        """Store pending sessions and release the storage engine."""
+        self.collector.close()
+        self.storage.close()
+        if MetricsManager._instance is self:
+            MetricsManager._instance = None
+
 
 def track_metrics(func: Optional[Callable] = None, component_id: Optional[str] = None):
     """Decorator to track metrics for a function.
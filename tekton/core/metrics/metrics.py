@@ -4,15 +4,118 @@ Metrics Core Module
 
 This module defines the base metric classes used in the Tekton metrics system.
 It provides Counter, Gauge, Histogram, and Timer implementations.
+
+Counters and histograms accumulate into per-thread shards, so concurrent
+updates never contend on a lock; readers sum the shards. Gauges, whose
+``set()`` is last-write-wins, use a per-metric lock instead. Every update
+bumps a version, which exposition uses to skip unchanged series, and marks
+the metric's registry stale, so scrapes of an unchanged registry reuse the
+previous output. Labelled child metrics are obtained once with
+``with_labels()`` and reused on hot paths, as with prometheus_client.
+Prometheus/OpenMetrics encoding lives in the exposition module.
 """
 
+import threading
 import time
-from typing import Dict, List, Any, Optional, Union
+import weakref
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from itertools import accumulate, count
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple, Union
 
 from .metric_types import MetricType, MetricCategory, MetricUnit
+from .exposition import Exemplar, encode_metric, validate_exemplar_labels
+
+
+class _Shard:
+    """One thread's accumulator of a counter or histogram."""
+    
+    __slots__ = ("values", "epoch", "stamp")
+    
+    def __init__(self, width: int, epoch: int):
+        self.values = [0.0] * width
+        self.epoch = epoch
+        self.stamp = 0.0
+
+
+class _ThreadToken:
+    """Lives in a thread's local storage and dies with the thread."""
+    
+    __slots__ = ("__weakref__",)
+
 
+class _Shards:
+    """
+    Per-thread accumulators for a counter or histogram.
+    
+    Each thread finds its own shard through a threading.local, so updates
+    never contend. When a thread exits its shard is folded into
+    ``retired`` and forgotten. reset() starts a new epoch: shards from
+    earlier epochs are replaced on their thread's next update instead of
+    collecting updates no reader sees.
+    """
+    
+    def __init__(self, width: int):
+        self.width = width
+        self.epoch = 0
+        self.retired = _Shard(width, 0)
+        self._live: Dict[int, _Shard] = {}
+        self._keys = count()
+        self._local = threading.local()
+        # Reentrant: a token may be finalized by a collection inside the lock
+        self._lock = threading.RLock()
+        
+    def get(self) -> _Shard:
+        """Get the calling thread's shard for the current epoch."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None or shard.epoch != self.epoch:
+            shard = self._new()
+        return shard
+        
+    def _new(self) -> _Shard:
+        with self._lock:
+            shard = _Shard(self.width, self.epoch)
+            token = _ThreadToken()
+            key = next(self._keys)
+            self._live[key] = shard
+            weakref.finalize(token, self._retire, key)
+            self._local.shard = shard
+            self._local.token = token
+            return shard
+            
+    def _retire(self, key: int) -> None:
+        """Fold the shard of an exited thread (or a past epoch) into the retired totals."""
+        with self._lock:
+            shard = self._live.pop(key, None)
+            if shard is not None and shard.epoch == self.epoch:
+                retired = self.retired
+                retired.values = [x + y for x, y in zip(retired.values, shard.values)]
+                retired.stamp = max(retired.stamp, shard.stamp)
+                
+    def shards(self) -> List[_Shard]:
+        """The retired totals and every live shard."""
+        return [self.retired] + list(self._live.values())
+        
+    def values(self) -> List[List[float]]:
+        """Values of the retired totals and every live shard."""
+        return [shard.values for shard in self.shards()]
+        
+    def last_stamp(self) -> float:
+        """Time of the most recent shard update."""
+        return max(shard.stamp for shard in self.shards())
+        
+    def reset(self) -> None:
+        """Discard all shards and start a new epoch."""
+        with self._lock:
+            self.epoch += 1
+            self._live = {}
+            self.retired = _Shard(self.width, self.epoch)
+            
+    def __len__(self) -> int:
+        return len(self._live)
 
-class Metric:
+
+class Metric(ABC):
     """Base class for metrics."""
     
     def __init__(self,
@@ -43,7 +146,75 @@ class Metric:
         self.component_id = component_id
         self.labels = labels or {}
         self.created_at = time.time()
-        self.last_updated = self.created_at
+        
+        # Update bookkeeping
+        self._lock = threading.Lock()
+        self._version = 0
+        self._last_updated = self.created_at
+        
+        # Labelled children keyed by their extra label items
+        self._children: Dict[FrozenSet[Tuple[str, str]], 'Metric'] = {}
+        self._parent: Optional['Metric'] = None
+        self._registry = None
+        
+    @property
+    def version(self) -> int:
+        """Number of updates applied to this metric."""
+        return self._version
+        
+    @property
+    def last_updated(self) -> float:
+        """Time of the last update."""
+        return self._last_updated
+        
+    @last_updated.setter
+    def last_updated(self, value: float) -> None:
+        self._last_updated = value
+        
+    def with_labels(self, **labels: str) -> 'Metric':
+        """
+        Get a child metric bound to additional labels.
+        
+        Children are created once and cached, so callers on hot paths should
+        keep the returned handle rather than looking it up per update.
+        
+        Args:
+            **labels: Label values for the child
+            
+        Returns:
+            Child metric with this metric's labels plus the given labels
+        """
+        key = frozenset(labels.items())
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child({**self.labels, **labels})
+                    child.component_id = self.component_id
+                    child._parent = self
+                    self._children[key] = child
+            if self._registry is not None:
+                self._registry.register(child)
+        return child
+        
+    def _mark_stale(self) -> None:
+        """Tell the registry that its exposition output is out of date."""
+        registry = self._registry
+        if registry is not None:
+            registry._stale = True
+        
+    def _drop_child(self, child: 'Metric') -> None:
+        """Forget a cached child, so with_labels() creates a new one."""
+        with self._lock:
+            for key, cached in list(self._children.items()):
+                if cached is child:
+                    del self._children[key]
+        child._parent = None
+        
+    @abstractmethod
+    def _new_child(self, labels: Dict[str, str]) -> 'Metric':
+        """Create an unregistered metric like this one with other labels."""
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert metric to dictionary for serialization."""
@@ -61,15 +232,7 @@ class Metric:
         
     def to_prometheus(self) -> str:
         """Convert metric to Prometheus format."""
-        # Convert labels to Prometheus format
-        prometheus_labels = ",".join([f'{k}="{v}"' for k, v in self.labels.items()])
-        prometheus_labels = f"{{{prometheus_labels}}}" if prometheus_labels else ""
-        
-        # Create help and type lines
-        help_line = f"# HELP {self.name} {self.description}"
-        type_line = f"# TYPE {self.name} {self._prometheus_type()}"
-        
-        return f"{help_line}\n{type_line}"
+        return encode_metric(self).rstrip("\n")
         
     def _prometheus_type(self) -> str:
         """Convert metric type to Prometheus type."""
@@ -118,24 +281,66 @@ class Counter(Metric):
             component_id=component_id,
             labels=labels
         )
-        self.value = initial_value
+        self._base = initial_value
+        # Per-thread [total, updates]
+        self._shards = _Shards(2)
+        # Most recent exemplar, exposed in OpenMetrics output
+        self.exemplar: Optional[Exemplar] = None
+        
+    @property
+    def value(self) -> float:
+        """Current counter value (sum of all thread shards)."""
+        return self._base + sum(shard[0] for shard in self._shards.values())
+        
+    @value.setter
+    def value(self, value: float) -> None:
+        with self._lock:
+            self._version += self._shard_updates() + 1
+            self._base = value
+            self._shards.reset()
+            self._last_updated = time.time()
+            self._mark_stale()
+            
+    @property
+    def version(self) -> int:
+        """Number of updates applied to this counter."""
+        return self._version + self._shard_updates()
         
-    def increment(self, amount: float = 1.0) -> float:
+    @property
+    def last_updated(self) -> float:
+        """Time of the last update."""
+        return max(self._last_updated, self._shards.last_stamp())
+        
+    @last_updated.setter
+    def last_updated(self, value: float) -> None:
+        self._last_updated = value
+        
+    def _shard_updates(self) -> int:
+        return sum(int(shard[1]) for shard in self._shards.values())
+        
+    def increment(self, amount: float = 1.0, exemplar: Optional[Dict[str, str]] = None) -> None:
         """
         Increment the counter.
         
         Args:
             amount: Amount to increment by (must be positive)
-            
-        Returns:
-            Current value
+            exemplar: Optional exemplar labels (e.g. a trace ID) for this increment
         """
         if amount < 0:
             raise ValueError("Counter can only be incremented by positive values")
+        if exemplar is not None:
+            validate_exemplar_labels(exemplar)
+            self.exemplar = (exemplar, amount, time.time())
             
-        self.value += amount
-        self.last_updated = time.time()
-        return self.value
+        shard = self._shards.get()
+        values = shard.values
+        values[0] += amount
+        values[1] += 1
+        shard.stamp = time.time()
+        # Inlined _mark_stale()
+        registry = self._registry
+        if registry is not None:
+            registry._stale = True
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert counter to dictionary."""
@@ -143,19 +348,21 @@ class Counter(Metric):
         result["value"] = self.value
         return result
         
-    def to_prometheus(self) -> str:
-        """Convert counter to Prometheus format."""
-        base = super().to_prometheus()
-        labels = ",".join([f'{k}="{v}"' for k, v in self.labels.items()])
-        labels = f"{{{labels}}}" if labels else ""
-        
-        value_line = f"{self.name}{labels} {self.value}"
-        return f"{base}\n{value_line}"
-        
     def reset(self) -> None:
         """Reset the counter to zero."""
+        self.exemplar = None
         self.value = 0.0
-        self.last_updated = time.time()
+            
+    def _new_child(self, labels: Dict[str, str]) -> 'Counter':
+        """Create a counter like this one with other labels."""
+        return Counter(
+            name=self.name,
+            description=self.description,
+            category=self.category,
+            unit=self.unit,
+            component_id=self.component_id,
+            labels=labels
+        )
 
 
 class Gauge(Metric):
@@ -190,7 +397,16 @@ class Gauge(Metric):
             component_id=component_id,
             labels=labels
         )
-        self.value = initial_value
+        self._value = initial_value
+        
+    @property
+    def value(self) -> float:
+        """Current gauge value."""
+        return self._value
+        
+    @value.setter
+    def value(self, value: float) -> None:
+        self.set(value)
         
     def set(self, value: float) -> float:
         """
@@ -202,9 +418,12 @@ class Gauge(Metric):
         Returns:
             Current value
         """
-        self.value = value
-        self.last_updated = time.time()
-        return self.value
+        with self._lock:
+            self._value = value
+            self._version += 1
+            self._last_updated = time.time()
+            self._mark_stale()
+            return value
         
     def increment(self, amount: float = 1.0) -> float:
         """
@@ -216,9 +435,12 @@ class Gauge(Metric):
         Returns:
             Current value
         """
-        self.value += amount
-        self.last_updated = time.time()
-        return self.value
+        with self._lock:
+            self._value += amount
+            self._version += 1
+            self._last_updated = time.time()
+            self._mark_stale()
+            return self._value
         
     def decrement(self, amount: float = 1.0) -> float:
         """
@@ -230,9 +452,12 @@ class Gauge(Metric):
         Returns:
             Current value
         """
-        self.value -= amount
-        self.last_updated = time.time()
-        return self.value
+        with self._lock:
+            self._value -= amount
+            self._version += 1
+            self._last_updated = time.time()
+            self._mark_stale()
+            return self._value
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert gauge to dictionary."""
@@ -240,19 +465,20 @@ class Gauge(Metric):
         result["value"] = self.value
         return result
         
-    def to_prometheus(self) -> str:
-        """Convert gauge to Prometheus format."""
-        base = super().to_prometheus()
-        labels = ",".join([f'{k}="{v}"' for k, v in self.labels.items()])
-        labels = f"{{{labels}}}" if labels else ""
-        
-        value_line = f"{self.name}{labels} {self.value}"
-        return f"{base}\n{value_line}"
-        
     def reset(self) -> None:
         """Reset the gauge to zero."""
-        self.value = 0.0
-        self.last_updated = time.time()
+        self.set(0.0)
+            
+    def _new_child(self, labels: Dict[str, str]) -> 'Gauge':
+        """Create a gauge like this one with other labels."""
+        return Gauge(
+            name=self.name,
+            description=self.description,
+            category=self.category,
+            unit=self.unit,
+            component_id=self.component_id,
+            labels=labels
+        )
 
 
 class Histogram(Metric):
@@ -288,63 +514,111 @@ class Histogram(Metric):
             labels=labels
         )
         self.buckets = sorted(buckets) + [float('inf')]
-        self.bucket_counts = [0] * len(self.buckets)
-        self.count = 0
-        self.sum = 0.0
-        
-    def observe(self, value: float) -> None:
+        # Per-thread [sum, count, per-bucket counts...] (non-cumulative)
+        self._shards = _Shards(2 + len(self.buckets))
+        # Most recent exemplar per bucket, exposed in OpenMetrics output
+        self.exemplars: List[Optional[Exemplar]] = [None] * len(self.buckets)
+        
+    def _merged(self) -> List[float]:
+        """Element-wise sum of all shards."""
+        merged = [0.0, 0] + [0] * len(self.buckets)
+        for shard in self._shards.values():
+            merged = [x + y for x, y in zip(merged, shard)]
+        merged[1:] = [int(n) for n in merged[1:]]
+        return merged
+        
+    @property
+    def version(self) -> int:
+        """Number of updates applied to this histogram."""
+        return self._version + self.count
+        
+    @property
+    def last_updated(self) -> float:
+        """Time of the last update."""
+        return max(self._last_updated, self._shards.last_stamp())
+        
+    @last_updated.setter
+    def last_updated(self, value: float) -> None:
+        self._last_updated = value
+        
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return int(sum(shard[1] for shard in self._shards.values()))
+        
+    @property
+    def sum(self) -> float:
+        """Sum of all observed values."""
+        return sum(shard[0] for shard in self._shards.values())
+        
+    @property
+    def bucket_counts(self) -> List[int]:
+        """Cumulative bucket counts (observations <= each boundary)."""
+        return list(accumulate(self._merged()[2:]))
+        
+    def snapshot(self) -> Tuple[float, int, List[int]]:
+        """Get (sum, count, cumulative bucket counts) from a single pass."""
+        merged = self._merged()
+        return merged[0], merged[1], list(accumulate(merged[2:]))
+        
+    def observe(self, value: float, exemplar: Optional[Dict[str, str]] = None) -> None:
         """
         Record an observation.
         
         Args:
             value: Observed value
+            exemplar: Optional exemplar labels (e.g. a trace ID) for this observation
         """
-        self.count += 1
-        self.sum += value
-        
-        # Increment bucket counts for all buckets that the value falls into
-        for i, boundary in enumerate(self.buckets):
-            if value <= boundary:
-                self.bucket_counts[i] += 1
-                
-        self.last_updated = time.time()
+        # First bucket whose upper boundary is >= value
+        index = bisect_left(self.buckets, value)
+        if exemplar is not None:
+            validate_exemplar_labels(exemplar)
+            self.exemplars[index] = (exemplar, value, time.time())
+            
+        shard = self._shards.get()
+        values = shard.values
+        # Offset past [sum, count]
+        values[2 + index] += 1
+        values[0] += value
+        values[1] += 1
+        shard.stamp = time.time()
+        # Inlined _mark_stale()
+        registry = self._registry
+        if registry is not None:
+            registry._stale = True
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert histogram to dictionary."""
         result = super().to_dict()
+        total, count, bucket_counts = self.snapshot()
         result.update({
             "buckets": self.buckets[:-1],  # Exclude inf
-            "bucket_counts": self.bucket_counts,
-            "count": self.count,
-            "sum": self.sum
+            "bucket_counts": bucket_counts,
+            "count": count,
+            "sum": total
         })
         return result
         
-    def to_prometheus(self) -> str:
-        """Convert histogram to Prometheus format."""
-        base = super().to_prometheus()
-        labels = ",".join([f'{k}="{v}"' for k, v in self.labels.items()])
-        labels_str = f"{{{labels}}}" if labels else ""
-        
-        lines = []
-        
-        # Add bucket lines
-        for i, boundary in enumerate(self.buckets):
-            bucket_labels = f"{labels},{{'le':'{boundary}'}}" if labels else f"{{'le':'{boundary}'}}"
-            lines.append(f"{self.name}_bucket{bucket_labels} {self.bucket_counts[i]}")
-            
-        # Add sum and count
-        lines.append(f"{self.name}_sum{labels_str} {self.sum}")
-        lines.append(f"{self.name}_count{labels_str} {self.count}")
-        
-        return f"{base}\n" + "\n".join(lines)
-        
     def reset(self) -> None:
         """Reset the histogram."""
-        self.bucket_counts = [0] * len(self.buckets)
-        self.count = 0
-        self.sum = 0.0
-        self.last_updated = time.time()
+        with self._lock:
+            self._version = self.version + 1
+            self._shards.reset()
+            self.exemplars = [None] * len(self.buckets)
+            self._last_updated = time.time()
+            self._mark_stale()
+            
+    def _new_child(self, labels: Dict[str, str]) -> 'Histogram':
+        """Create a histogram like this one with other labels."""
+        return Histogram(
+            name=self.name,
+            description=self.description,
+            buckets=self.buckets[:-1],
+            category=self.category,
+            unit=self.unit,
+            component_id=self.component_id,
+            labels=labels
+        )
 
 
 class Timer:
@@ -367,7 +641,7 @@ class Timer:
         Returns:
             Self for method chaining
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
         
     def stop(self) -> float:
@@ -380,7 +654,7 @@ class Timer:
         if self.start_time is None:
             raise ValueError("Timer was not started")
             
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         self.histogram.observe(duration)
         self.start_time = None
         return duration
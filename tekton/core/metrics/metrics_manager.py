@@ -223,48 +223,13 @@ class MetricsManager:
             status_code: HTTP status code
             is_error: Whether the request resulted in an error
         """
-        # Get request count metric with endpoint label
-        request_count = self.registry.get("request_count", {"endpoint": endpoint})
-        if not request_count:
-            request_count = self.registry.create_counter(
-                name="request_count",
-                description="Total number of requests",
-                category=MetricCategory.THROUGHPUT,
-                unit=MetricUnit.REQUESTS,
-                labels={"endpoint": endpoint}
-            )
-            
-        # Increment request count
-        request_count.increment()
-        
-        # Get latency histogram with endpoint label
-        latency = self.registry.get("request_latency", {"endpoint": endpoint})
-        if not latency:
-            latency = self.registry.create_histogram(
-                name="request_latency",
-                description="Request latency in seconds",
-                buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0],
-                category=MetricCategory.LATENCY,
-                unit=MetricUnit.SECONDS,
-                labels={"endpoint": endpoint}
-            )
-            
-        # Record latency
-        latency.observe(duration)
+        # Labelled children are cached by their parent metrics
+        self.registry.get("request_count").with_labels(endpoint=endpoint).increment()
+        self.registry.get("request_latency").with_labels(endpoint=endpoint).observe(duration)
         
         # Record error if applicable
         if is_error:
-            error_count = self.registry.get("error_count", {"endpoint": endpoint})
-            if not error_count:
-                error_count = self.registry.create_counter(
-                    name="error_count",
-                    description="Total number of errors",
-                    category=MetricCategory.ERROR,
-                    unit=MetricUnit.ERRORS,
-                    labels={"endpoint": endpoint}
-                )
-                
-            error_count.increment()
+            self.registry.get("error_count").with_labels(endpoint=endpoint).increment()
             
     def create_request_timer(self, endpoint: str) -> Timer:
         """
@@ -276,16 +241,5 @@ class MetricsManager:
         Returns:
             Timer object
         """
-        # Get or create latency histogram
-        latency = self.registry.get("request_latency", {"endpoint": endpoint})
-        if not latency:
-            latency = self.registry.create_histogram(
-                name="request_latency",
-                description="Request latency in seconds",
-                buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0],
-                category=MetricCategory.LATENCY,
-                unit=MetricUnit.SECONDS,
-                labels={"endpoint": endpoint}
-            )
-            
+        latency = self.registry.get("request_latency").with_labels(endpoint=endpoint)
         return Timer(latency)
\ No newline at end of file
@@ -6,10 +6,12 @@ This module provides a registry for metrics in the Tekton system.
 It allows for creating, storing, and retrieving metrics by name and labels.
 """
 
-from typing import Dict, List, Any, Optional, Union
+import threading
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple, Union
 
 from .metric_types import MetricType, MetricCategory, MetricUnit
 from .metrics import Metric, Counter, Gauge, Histogram, Timer
+from .exposition import ExpositionEncoder, registry_families
 
 
 class MetricsRegistry:
@@ -24,6 +26,29 @@ class MetricsRegistry:
         """
         self.component_id = component_id
         self.metrics: Dict[str, Metric] = {}
+        # name -> label items -> metric, for lookups without building unique names
+        self._index: Dict[str, Dict[FrozenSet[Tuple[str, str]], Metric]] = {}
+        # Exposition encoders by format, kept so unchanged series stay cached
+        self._encoders: Dict[bool, ExpositionEncoder] = {}
+        # Set by metric updates; folded into _version when the version is read
+        self._stale = False
+        self._version = 0
+        self._version_lock = threading.Lock()
+        
+    @property
+    def version(self) -> int:
+        """
+        Version of the registry's metrics, which changes after any update.
+        
+        Metrics only flag the registry as stale, and the flag is cleared
+        before the new version is returned, so updates racing with a scrape
+        are picked up by the next one.
+        """
+        with self._version_lock:
+            if self._stale:
+                self._stale = False
+                self._version += 1
+            return self._version
         
     def register(self, metric: Metric) -> Metric:
         """
@@ -44,6 +69,11 @@ class MetricsRegistry:
         
         # Register metric
         self.metrics[unique_name] = metric
+        self._index.setdefault(metric.name, {})[frozenset(metric.labels.items())] = metric
+        
+        # Labelled children created later register themselves here
+        metric._registry = self
+        self._stale = True
         
         return metric
         
@@ -58,8 +88,10 @@ class MetricsRegistry:
         Returns:
             Metric or None if not found
         """
-        unique_name = self._get_unique_name_from_parts(name, labels or {})
-        return self.metrics.get(unique_name)
+        family = self._index.get(name)
+        if family is None:
+            return None
+        return family.get(frozenset(labels.items()) if labels else frozenset())
         
     def remove(self, name: str, labels: Optional[Dict[str, str]] = None) -> None:
         """
@@ -70,12 +102,31 @@ class MetricsRegistry:
             labels: Optional labels
         """
         unique_name = self._get_unique_name_from_parts(name, labels or {})
-        if unique_name in self.metrics:
-            del self.metrics[unique_name]
+        metric = self.metrics.pop(unique_name, None)
+            
+        family = self._index.get(name)
+        if family is not None:
+            metric = family.pop(frozenset((labels or {}).items()), None) or metric
+            if not family:
+                del self._index[name]
+                
+        if metric is not None:
+            self._detach(metric)
+        self._stale = True
             
     def clear(self) -> None:
         """Clear all metrics."""
+        for metric in list(self.metrics.values()):
+            self._detach(metric)
         self.metrics.clear()
+        self._index.clear()
+        self._stale = True
+        
+    def _detach(self, metric: Metric) -> None:
+        """Stop a removed metric from being resolved through its parent's with_labels()."""
+        if metric._parent is not None:
+            metric._parent._drop_child(metric)
+        metric._registry = None
         
     def get_all(self) -> List[Metric]:
         """
@@ -98,14 +149,23 @@ class MetricsRegistry:
             "metrics": {k: v.to_dict() for k, v in self.metrics.items()}
         }
         
-    def to_prometheus(self) -> str:
+    def to_prometheus(self, openmetrics: bool = False) -> str:
         """
         Convert all metrics to Prometheus format.
         
+        Args:
+            openmetrics: Use the OpenMetrics text format (with exemplars)
+            
         Returns:
             Prometheus format string
         """
-        return "\n".join([m.to_prometheus() for m in self.metrics.values()])
+        encoder = self._encoders.get(openmetrics)
+        if encoder is None:
+            encoder = self._encoders[openmetrics] = ExpositionEncoder(openmetrics)
+        return encoder.encode(
+            lambda: registry_families([self], const_label=None),
+            version=self.version
+        ).decode("utf-8")
         
     def _get_unique_name(self, metric: Metric) -> str:
         """
@@ -9,11 +9,13 @@ in the Tekton system.
 import time
 import asyncio
 import logging
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, IO, List, Tuple
 
 from ..logging_integration import get_logger, LogCategory
+from .metrics import Gauge
 from .metrics_manager import MetricsManager
 from .metrics_registry import MetricsRegistry
+from .exposition import ExpositionEncoder, registry_families
 
 # Configure logger
 logger = get_logger("tekton.prometheus")
@@ -21,6 +23,15 @@ logger = get_logger("tekton.prometheus")
 # Global registry of metrics managers
 _metrics_managers: Dict[str, MetricsManager] = {}
 
+# tekton_component_info series, one per manager
+_component_info: Dict[str, Gauge] = {}
+
+# Long-lived encoders so unchanged series are not re-encoded on every scrape
+_encoders: Dict[bool, ExpositionEncoder] = {
+    False: ExpositionEncoder(),
+    True: ExpositionEncoder(openmetrics=True)
+}
+
 
 def get_metrics_manager(component_id: str) -> MetricsManager:
     """
@@ -34,6 +45,12 @@ def get_metrics_manager(component_id: str) -> MetricsManager:
     """
     if component_id not in _metrics_managers:
         _metrics_managers[component_id] = MetricsManager(component_id)
+        _component_info[component_id] = Gauge(
+            name="tekton_component_info",
+            description="Information about Tekton component",
+            labels={"component_id": component_id},
+            initial_value=1
+        )
     return _metrics_managers[component_id]
 
 
@@ -62,20 +79,78 @@ def get_all_metrics() -> Dict[str, Dict[str, Any]]:
     }
 
 
-def get_prometheus_metrics() -> str:
+def _metric_families() -> List[Any]:
+    """Group the metrics of all managers into exposition families."""
+    families = []
+    if _component_info:
+        families.append(("tekton_component_info", [(info, None) for info in _component_info.values()]))
+    families.extend(registry_families(manager.registry for manager in _metrics_managers.values()))
+    return families
+
+
+def _metrics_version() -> Tuple[Any, ...]:
+    """State of all managers' metrics, which changes whenever any of them is updated."""
+    return (
+        tuple(
+            (component_id, id(manager.registry), manager.registry.component_id, manager.registry.version)
+            for component_id, manager in _metrics_managers.items()
+        ),
+        tuple(info.version for info in _component_info.values())
+    )
+
+
+def get_exposition_encoder(openmetrics: bool = False) -> ExpositionEncoder:
+    """
+    Get the shared encoder for a format.
+    
+    Args:
+        openmetrics: Get the OpenMetrics encoder instead of the Prometheus one
+        
+    Returns:
+        Exposition encoder (its content_type suits the HTTP response)
+    """
+    return _encoders[openmetrics]
+
+
+def generate_metrics(openmetrics: bool = False) -> bytes:
+    """
+    Encode all metrics for a scrape.
+    
+    Series are labelled with their component_id, and only series that
+    changed since the previous scrape are re-encoded; if nothing changed,
+    the previous output is returned as is.
+    
+    Args:
+        openmetrics: Use the OpenMetrics text format (with exemplars)
+        
+    Returns:
+        Encoded exposition
+    """
+    return _encoders[openmetrics].encode(_metric_families, version=_metrics_version())
+
+
+def write_metrics(stream: IO[bytes], openmetrics: bool = False) -> None:
+    """
+    Stream all metrics to a binary writer, one family at a time.
+    
+    Args:
+        stream: Writer such as a socket file or response body
+        openmetrics: Use the OpenMetrics text format (with exemplars)
+    """
+    _encoders[openmetrics].write(_metric_families, stream, version=_metrics_version())
+
+
+def get_prometheus_metrics(openmetrics: bool = False) -> str:
     """
     Get all metrics in Prometheus format.
     
+    Args:
+        openmetrics: Use the OpenMetrics text format (with exemplars)
+        
     Returns:
         Prometheus format string
     """
-    return "\n\n".join([
-        f"# HELP tekton_component_info Information about Tekton component\n"
-        f"# TYPE tekton_component_info gauge\n"
-        f"tekton_component_info{{component_id=\"{component_id}\"}} 1\n"
-        f"{manager.registry.to_prometheus()}"
-        for component_id, manager in _metrics_managers.items()
-    ])
+    return generate_metrics(openmetrics).decode("utf-8")
 
 
 # Example usage
@@ -1,128 +1,359 @@
 """
 JSON file storage for metrics data.
 
-This module provides JSON file-based storage for metrics data.
+This module provides JSON file-based storage for metrics data. Each session
+is written to its own file. The index is a set of append-only JSONL segments
+under ``<directory>/index/`` plus a small manifest recording the start_time
+range of every segment, so storing a session appends one line instead of
+rewriting the whole index and time-range queries only read the segments they
+overlap.
 """
 
 import os
+import copy
 import json
-import time
+import heapq
 import logging
-from typing import Dict, List, Any, Optional
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 
 from .base import MetricsStorage
 
 logger = logging.getLogger(__name__)
 
+# Index entries per segment file
+SEGMENT_SIZE = 1000
+
+MANIFEST_VERSION = 1
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache."""
+
+    def __init__(self, maxsize=1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Get a value and mark it most recently used."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key, value):
+        """Add or replace a value, evicting the least recently used entries."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key):
+        """Remove a value if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove all values."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+# Parsed session files shared by all storage instances, keyed by absolute path
+SESSION_CACHE = LRUCache(maxsize=1024)
+
+
+def _file_signature(path) -> Tuple[int, int]:
+    """Modification time and size used to validate cached file contents."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _start_time(entry) -> float:
+    return entry.get('start_time', 0) or 0
+
+
 class JSONFileMetricsStorage(MetricsStorage):
     """Stores metrics in JSON files."""
-    
-    def __init__(self, directory="metrics"):
+
+    def __init__(self, directory="metrics", segment_size=SEGMENT_SIZE, session_cache=None):
         """Initialize JSON file storage.
-        
+
         Args:
             directory: Directory to store metrics files
+            segment_size: Index entries per segment file
+            session_cache: LRUCache for parsed session files (defaults to the shared SESSION_CACHE)
         """
         self.directory = directory
-        os.makedirs(directory, exist_ok=True)
-        
-        # Create index file if it doesn't exist
+        self.segment_size = segment_size
+        self.session_cache = SESSION_CACHE if session_cache is None else session_cache
+
+        self.index_dir = os.path.join(directory, "index")
+        self.manifest_path = os.path.join(self.index_dir, "manifest.json")
+        # Single-file index written by earlier versions, migrated on first use
         self.index_path = os.path.join(directory, "index.json")
-        if not os.path.exists(self.index_path):
-            with open(self.index_path, 'w') as f:
-                json.dump({"sessions": {}}, f)
-    
+        os.makedirs(self.index_dir, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._segments = LRUCache(maxsize=64)
+        self._manifest_signature = None
+        self._manifest = {"version": MANIFEST_VERSION, "next_seq": 0, "segments": [], "replaced": {}}
+
+        if os.path.exists(self.manifest_path):
+            self._refresh_manifest()
+        elif os.path.exists(self.index_path):
+            self._migrate_legacy_index()
+
+    def _refresh_manifest(self):
+        """Reload the manifest if another writer has changed it."""
+        try:
+            signature = _file_signature(self.manifest_path)
+        except FileNotFoundError:
+            return
+        if signature == self._manifest_signature:
+            return
+
+        try:
+            with open(self.manifest_path, 'r') as f:
+                self._manifest = json.load(f)
+            self._manifest_signature = signature
+        except json.JSONDecodeError as e:
+            logger.error(f"Error loading metrics index manifest: {str(e)}")
+
+    def _write_manifest(self):
+        """Atomically replace the manifest file."""
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+        self._manifest_signature = _file_signature(self.manifest_path)
+
+    def _migrate_legacy_index(self):
+        """Build index segments from a single-file index.json."""
+        try:
+            with open(self.index_path, 'r') as f:
+                sessions = json.load(f).get("sessions", {})
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            logger.error(f"Error loading legacy metrics index: {str(e)}")
+            return
+
+        entries = [{**info, "id": session_id} for session_id, info in sessions.items()]
+        entries.sort(key=_start_time)
+        with self._lock:
+            for entry in entries:
+                self._append_entry(entry, replaced=False, write_manifest=False)
+            self._write_manifest()
+        logger.info(f"Migrated {len(entries)} sessions from {self.index_path}")
+
+    def _segment_path(self, name):
+        return os.path.join(self.index_dir, name)
+
+    def _load_segment(self, name) -> List[Dict[str, Any]]:
+        """Read a segment's entries, using the cached copy if the file is unchanged."""
+        path = self._segment_path(name)
+        try:
+            signature = _file_signature(path)
+        except FileNotFoundError:
+            return []
+
+        cached = self._segments.get(name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        entries = []
+        with open(path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted write
+                    logger.warning(f"Skipping corrupt index entry in {name}")
+        self._segments.put(name, (signature, entries))
+        return entries
+
+    def _append_entry(self, entry, replaced, write_manifest=True):
+        """Append an index entry to the newest segment, starting a new one when full.
+
+        Args:
+            entry: Index entry without a sequence number
+            replaced: Whether the entry supersedes an earlier one for the same session
+            write_manifest: Whether to persist the manifest afterwards
+        """
+        manifest = self._manifest
+        segments = manifest["segments"]
+        if not segments or segments[-1]["count"] >= self.segment_size:
+            segments.append({
+                "name": f"segment-{len(segments):06d}.jsonl",
+                "count": 0,
+                "min_start": None,
+                "max_start": None
+            })
+        segment = segments[-1]
+
+        entry = {**entry, "seq": manifest["next_seq"]}
+        manifest["next_seq"] += 1
+
+        # Keep the cached entries current rather than re-reading the segment
+        path = self._segment_path(segment["name"])
+        cached = self._segments.get(segment["name"])
+        try:
+            fresh = cached is not None and cached[0] == _file_signature(path)
+        except FileNotFoundError:
+            fresh = False
+
+        with open(path, 'a') as f:
+            f.write(json.dumps(entry) + "\n")
+
+        if fresh:
+            cached[1].append(entry)
+            self._segments.put(segment["name"], (_file_signature(path), cached[1]))
+
+        start = _start_time(entry)
+        segment["count"] += 1
+        segment["min_start"] = start if segment["min_start"] is None else min(segment["min_start"], start)
+        segment["max_start"] = start if segment["max_start"] is None else max(segment["max_start"], start)
+        if replaced:
+            manifest["replaced"][entry["id"]] = entry["seq"]
+
+        if write_manifest:
+            self._write_manifest()
+
     def store_session(self, session_data):
         """Store a session's metrics data."""
         # Convert to dict if it's a SessionData object
         data = session_data.to_dict() if hasattr(session_data, 'to_dict') else session_data
-            
+
         # Create session directory and write data
         session_id = data['id']
         session_dir = os.path.join(self.directory, session_id)
-        os.makedirs(session_dir, exist_ok=True)
-        
-        with open(os.path.join(session_dir, "session.json"), 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        # Update index
-        try:
-            with open(self.index_path, 'r') as f:
-                index = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            index = {"sessions": {}}
-        
-        # Add to index with prompt truncation
-        index["sessions"][session_id] = {
-            "prompt": data['prompt'][:100] + "..." if len(data['prompt']) > 100 else data['prompt'],
-            "start_time": data['start_time'],
-            "end_time": data.get('end_time'),
-            "file": f"{session_id}/session.json"
-        }
-        
-        with open(self.index_path, 'w') as f:
-            json.dump(index, f, indent=2)
-    
+        session_file = os.path.join(session_dir, "session.json")
+
+        with self._lock:
+            self._refresh_manifest()
+            replaced = os.path.exists(session_file)
+            os.makedirs(session_dir, exist_ok=True)
+
+            with open(session_file, 'w') as f:
+                json.dump(data, f, indent=2)
+            self.session_cache.discard(os.path.abspath(session_file))
+
+            # Add to index with prompt truncation
+            self._append_entry({
+                "id": session_id,
+                "prompt": data['prompt'][:100] + "..." if len(data['prompt']) > 100 else data['prompt'],
+                "start_time": data['start_time'],
+                "end_time": data.get('end_time'),
+                "file": f"{session_id}/session.json"
+            }, replaced=replaced)
+
     def get_session(self, session_id):
-        """Retrieve a session by ID."""
+        """Retrieve a session by ID.
+
+        The parsed session is cached until the file's mtime or size
+        changes. Each call returns a deep copy, so callers may modify the
+        result without affecting the cache.
+        """
         session_file = os.path.join(self.directory, session_id, "session.json")
-        
+
         try:
-            with open(session_file, 'r') as f:
-                return json.load(f)
+            signature = _file_signature(session_file)
+            key = os.path.abspath(session_file)
+            cached = self.session_cache.get(key)
+            if cached is None or cached[0] != signature:
+                with open(session_file, 'r') as f:
+                    cached = (signature, json.load(f))
+                self.session_cache.put(key, cached)
+            return copy.deepcopy(cached[1])
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Error loading session {session_id}: {str(e)}")
             return None
-    
-    def get_sessions(self, filters=None, limit=100, offset=0):
-        """Retrieve multiple sessions with optional filtering."""
-        try:
-            with open(self.index_path, 'r') as f:
-                index = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
-        
-        # Get all sessions from index with ID added
-        all_sessions = [
-            {**session_info, "id": session_id}
-            for session_id, session_info in index.get("sessions", {}).items()
+
+    def _scan(self, filters) -> Iterator[Dict[str, Any]]:
+        """Yield matching index entries by start time (descending).
+
+        Segments are visited in order of their latest start time and an
+        entry is only yielded once no unvisited segment can hold a later
+        one, so a limited query stops reading segments early.
+
+        Args:
+            filters: Dict with optional start_time_min, start_time_max,
+                prompt_like (substring) and prompt_prefix keys
+        """
+        start_min = filters.get('start_time_min')
+        start_max = filters.get('start_time_max')
+        prompt_like = filters.get('prompt_like')
+        prompt_prefix = filters.get('prompt_prefix')
+        replaced = self._manifest["replaced"]
+
+        segments = [
+            segment for segment in self._manifest["segments"]
+            if segment["count"]
+            and (start_min is None or segment["max_start"] >= start_min)
+            and (start_max is None or segment["min_start"] <= start_max)
         ]
-        
-        # Sort by start time (descending)
-        all_sessions.sort(key=lambda x: x.get("start_time", 0), reverse=True)
-        
-        # Apply filters
-        if filters:
-            filtered_sessions = []
-            for session in all_sessions:
-                include = True
-                
-                if 'start_time_min' in filters and session.get('start_time', 0) < filters['start_time_min']:
-                    include = False
-                
-                if 'start_time_max' in filters and session.get('start_time', 0) > filters['start_time_max']:
-                    include = False
-                
-                if 'prompt_like' in filters and filters['prompt_like'] not in session.get('prompt', ''):
-                    include = False
-                
-                if include:
-                    filtered_sessions.append(session)
-            
-            all_sessions = filtered_sessions
-        
+        segments.sort(key=lambda segment: segment["max_start"], reverse=True)
+
+        pending = []
+        for i, segment in enumerate(segments):
+            for entry in self._load_segment(segment["name"]):
+                start = _start_time(entry)
+                if start_min is not None and start < start_min:
+                    continue
+                if start_max is not None and start > start_max:
+                    continue
+                prompt = entry.get('prompt', '')
+                if prompt_like is not None and prompt_like not in prompt:
+                    continue
+                if prompt_prefix is not None and not prompt.startswith(prompt_prefix):
+                    continue
+                if replaced.get(entry["id"], entry["seq"]) != entry["seq"]:
+                    continue
+                # Ties keep insertion order
+                heapq.heappush(pending, (-start, entry["seq"], entry))
+
+            bound = segments[i + 1]["max_start"] if i + 1 < len(segments) else None
+            while pending and (bound is None or -pending[0][0] > bound):
+                yield heapq.heappop(pending)[2]
+
+    def get_sessions(self, filters=None, limit=100, offset=0):
+        """Retrieve multiple sessions with optional filtering.
+
+        Supported filters are start_time_min, start_time_max, prompt_like
+        (substring) and prompt_prefix; prompts are matched against the
+        index copy, which is truncated to 100 characters.
+        """
+        with self._lock:
+            self._refresh_manifest()
+            entries = list(islice(self._scan(filters or {}), offset, offset + limit))
+
         # Apply pagination and load full data
-        return [
-            self.get_session(session_info["id"])
-            for session_info in all_sessions[offset:offset + limit]
-            if self.get_session(session_info["id"])
-        ]
-    
+        sessions = []
+        for entry in entries:
+            session = self.get_session(entry["id"])
+            if session:
+                sessions.append(session)
+        return sessions
+
     def get_spectral_metrics(self, filters=None, limit=100):
         """Get spectral metrics for multiple sessions."""
         sessions = self.get_sessions(filters=filters, limit=limit)
-        
+
         return [
             {
                 'id': session['id'],
@@ -131,4 +362,4 @@ class JSONFileMetricsStorage(MetricsStorage):
                 'catastrophe_metrics': session.get('catastrophe_metrics', {})
             }
             for session in sessions
-        ]
\ No newline at end of file
+        ]
@@ -2,14 +2,25 @@
 SQLite storage for metrics data.
 
 This module provides SQLite-based storage for metrics data.
+
+Connections are long-lived and pooled, opened in WAL mode so readers do not
+block the writer. Each pooled connection keeps its own prepared statement
+cache, and session child rows are inserted with executemany. Sessions can
+also be handed to a background writer thread that group-commits whatever
+has queued up in a single transaction.
 """
 
 import os
 import json
 import time
+import queue
 import sqlite3
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 
 from .base import MetricsStorage
@@ -17,427 +28,650 @@ from .schema import SQLITE_SCHEMA, SQLITE_INDEXES
 
 logger = logging.getLogger(__name__)
 
+# Pragmas applied to every pooled connection
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -16000,  # KiB
+    "mmap_size": 268435456,
+    "busy_timeout": 5000
+}
+
+# Insert statements keyed by table; the SQL text is constant so sqlite3's
+# per-connection statement cache reuses the prepared statements
+INSERT_SQL = {
+    "sessions": (
+        'INSERT INTO sessions (id, prompt, config, start_time, end_time, '
+        'response, performance, spectral_metrics, catastrophe_metrics, created_at) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+    ),
+    "component_activations": (
+        'INSERT INTO component_activations (session_id, component_id, '
+        'activation_data, timestamp) VALUES (?, ?, ?, ?)'
+    ),
+    "propagation_steps": (
+        'INSERT INTO propagation_steps (session_id, source, destination, '
+        'info_content, data, timestamp) VALUES (?, ?, ?, ?, ?, ?)'
+    ),
+    "parameter_usage": (
+        'INSERT INTO parameter_usage (session_id, component_id, total_params, '
+        'active_params, utilization, layer_data, timestamp) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)'
+    ),
+    "latent_reasoning": (
+        'INSERT INTO latent_reasoning (session_id, component_id, iteration, '
+        'initial_confidence, final_confidence, iterations_required, '
+        'cognitive_convergence_rate, reasoning_data, timestamp) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'
+    ),
+    "cross_modal_operations": (
+        'INSERT INTO cross_modal_operations (session_id, source_modality, '
+        'target_modality, operation_type, success, operation_data, timestamp) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)'
+    ),
+    "concept_stability": (
+        'INSERT INTO concept_stability (session_id, concept_id, context, '
+        'vector_representation, stability_data, timestamp) '
+        'VALUES (?, ?, ?, ?, ?, ?)'
+    )
+}
+
+_PROPAGATION_COLUMNS = {'source', 'destination', 'info_content', 'timestamp'}
+_REASONING_COLUMNS = {
+    'component_id', 'iteration', 'initial_confidence', 'final_confidence',
+    'iterations_required', 'cognitive_convergence_rate', 'timestamp'
+}
+_OPERATION_COLUMNS = {'source_modality', 'target_modality', 'operation_type', 'success', 'timestamp'}
+_STABILITY_COLUMNS = {'context', 'vector_representation', 'timestamp'}
+
+
+def session_rows(data: Dict[str, Any]) -> Dict[str, List[Tuple]]:
+    """Flatten a session dict into insert parameters per table.
+    
+    Args:
+        data: Session data dict
+        
+    Returns:
+        Dict mapping table name to a list of parameter tuples
+    """
+    session_id = data['id']
+    dumps = json.dumps
+    
+    rows = {
+        "sessions": [(
+            session_id,
+            data['prompt'],
+            dumps(data['config']),
+            data['start_time'],
+            data.get('end_time'),
+            data.get('response'),
+            dumps(data.get('performance', {})),
+            dumps(data.get('spectral_metrics', {})),
+            dumps(data.get('catastrophe_metrics', {})),
+            time.time()
+        )]
+    }
+    
+    rows["component_activations"] = [
+        (session_id, component_id, dumps(activation), activation.get('timestamp', 0))
+        for component_id, activations in data.get('component_activations', {}).items()
+        for activation in activations
+    ]
+    
+    rows["propagation_steps"] = [
+        (
+            session_id,
+            step['source'],
+            step['destination'],
+            step.get('info_content', 0),
+            dumps({k: v for k, v in step.items() if k not in _PROPAGATION_COLUMNS}),
+            step.get('timestamp', 0)
+        )
+        for step in data.get('propagation_path', [])
+    ]
+    
+    rows["parameter_usage"] = [
+        (
+            session_id,
+            component_id,
+            usage.get('total', 0),
+            usage.get('active', 0),
+            usage.get('utilization', 0),
+            dumps(usage.get('layers', {})),
+            usage.get('timestamp', 0)
+        )
+        for component_id, usage in data.get('parameter_usage', {}).items()
+    ]
+    
+    rows["latent_reasoning"] = [
+        (
+            session_id,
+            record.get('component_id', ''),
+            record.get('iteration', 0),
+            record.get('initial_confidence', 0.0),
+            record.get('final_confidence', 0.0),
+            record.get('iterations_required', 0),
+            record.get('cognitive_convergence_rate', 0.0),
+            dumps({k: v for k, v in record.items() if k not in _REASONING_COLUMNS}),
+            record.get('timestamp', 0)
+        )
+        for record in data.get('latent_reasoning', [])
+    ]
+    
+    rows["cross_modal_operations"] = [
+        (
+            session_id,
+            operation.get('source_modality', ''),
+            operation.get('target_modality', ''),
+            operation.get('operation_type', ''),
+            1 if operation.get('success', False) else 0,
+            dumps({k: v for k, v in operation.items() if k not in _OPERATION_COLUMNS}),
+            operation.get('timestamp', 0)
+        )
+        for operation in data.get('cross_modal_operations', [])
+    ]
+    
+    rows["concept_stability"] = [
+        (
+            session_id,
+            concept_id,
+            obs.get('context', ''),
+            dumps(obs.get('vector_representation', [])),
+            dumps({k: v for k, v in obs.items() if k not in _STABILITY_COLUMNS}),
+            obs.get('timestamp', 0)
+        )
+        for concept_id, observations in data.get('concept_stability', {}).items()
+        for obs in observations
+    ]
+    
+    return rows
+
+
+class SQLiteConnectionPool:
+    """Pool of long-lived SQLite connections shared across threads."""
+    
+    def __init__(self, db_path, size=4, pragmas=None, cached_statements=256):
+        """Initialize the pool.
+        
+        Connections are opened lazily, up to ``size`` of them. An in-memory
+        database is limited to one connection, since each connection to
+        ``:memory:`` would be a separate database.
+        
+        Args:
+            db_path: Path to SQLite database file
+            size: Maximum number of open connections
+            pragmas: Pragmas applied to each new connection
+            cached_statements: Prepared statements cached per connection
+        """
+        self.db_path = db_path
+        self.size = 1 if db_path == ":memory:" else max(1, size)
+        self.pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+        self.cached_statements = cached_statements
+        
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, returning it to the pool afterwards."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+        
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if len(self._all) < self.size:
+                    conn = self._open()
+                    self._all.append(conn)
+            if conn is None:
+                conn = self._idle.get()
+        
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+    
+    def close(self):
+        """Close every connection in the pool."""
+        self._closed = True
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+
 class SQLiteMetricsStorage(MetricsStorage):
     """Stores metrics in a SQLite database."""
     
-    def __init__(self, db_path="metrics.db"):
+    def __init__(self, db_path="metrics.db", pool_size=4, batch_size=64):
         """Initialize SQLite storage.
         
         Args:
             db_path: Path to SQLite database file
+            pool_size: Maximum number of pooled connections
+            batch_size: Maximum sessions group-committed by the background writer
         """
         self.db_path = db_path
+        self.batch_size = batch_size
+        self.pool = SQLiteConnectionPool(db_path, size=pool_size)
+        
+        # Background writer, started on first enqueue_session()
+        self._queue: "queue.Queue[Optional[Tuple[Any, Future]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        
         self._initialize_db()
     
     def _initialize_db(self):
         """Initialize the database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create tables
-        for table_name, create_sql in SQLITE_SCHEMA.items():
-            cursor.execute(create_sql)
-        
-        # Create indexes
-        for index_sql in SQLITE_INDEXES:
-            cursor.execute(index_sql)
-        
-        conn.commit()
-        conn.close()
+        with self.pool.connection() as conn:
+            # Create tables
+            for table_name, create_sql in SQLITE_SCHEMA.items():
+                conn.execute(create_sql)
+            
+            # Create indexes
+            for index_sql in SQLITE_INDEXES:
+                conn.execute(index_sql)
+            
+            conn.commit()
+    
+    def _insert_session(self, conn, session_data):
+        """Insert one session's rows without committing."""
+        data = session_data.to_dict() if hasattr(session_data, 'to_dict') else session_data
+        for table, rows in session_rows(data).items():
+            if rows:
+                conn.executemany(INSERT_SQL[table], rows)
     
     def store_session(self, session_data):
         """Store a session's metrics data."""
-        # Convert to dict if it's a SessionData object
-        data = session_data.to_dict() if hasattr(session_data, 'to_dict') else session_data
-            
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.store_sessions([session_data])
+    
+    def store_sessions(self, sessions):
+        """Store several sessions in a single transaction.
         
-        try:
-            # Store main session data
-            cursor.execute(
-                'INSERT INTO sessions (id, prompt, config, start_time, end_time, '
-                'response, performance, spectral_metrics, catastrophe_metrics, created_at) '
-                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
-                (
-                    data['id'],
-                    data['prompt'],
-                    json.dumps(data['config']),
-                    data['start_time'],
-                    data.get('end_time'),
-                    data.get('response'),
-                    json.dumps(data.get('performance', {})),
-                    json.dumps(data.get('spectral_metrics', {})),
-                    json.dumps(data.get('catastrophe_metrics', {})),
-                    time.time()
-                )
-            )
-            
-            # Store component activations
-            for component_id, activations in data.get('component_activations', {}).items():
-                for activation in activations:
-                    cursor.execute(
-                        'INSERT INTO component_activations (session_id, component_id, '
-                        'activation_data, timestamp) VALUES (?, ?, ?, ?)',
-                        (
-                            data['id'],
-                            component_id,
-                            json.dumps(activation),
-                            activation.get('timestamp', 0)
-                        )
-                    )
-            
-            # Store propagation steps
-            for step in data.get('propagation_path', []):
-                cursor.execute(
-                    'INSERT INTO propagation_steps (session_id, source, destination, '
-                    'info_content, data, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-                    (
-                        data['id'],
-                        step['source'],
-                        step['destination'],
-                        step.get('info_content', 0),
-                        json.dumps({k: v for k, v in step.items() 
-                                 if k not in ['source', 'destination', 'info_content', 'timestamp']}),
-                        step.get('timestamp', 0)
-                    )
-                )
+        Args:
+            sessions: Iterable of SessionData objects or session dicts
+        """
+        with self.pool.connection() as conn:
+            try:
+                for session_data in sessions:
+                    self._insert_session(conn, session_data)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error storing session data: {str(e)}")
+                raise
+    
+    def enqueue_session(self, session_data) -> Future:
+        """Queue a session for the background writer.
+        
+        Sessions queued while the writer is busy are committed together,
+        so callers do not pay a transaction per session.
+        
+        Args:
+            session_data: SessionData object or session dict
             
-            # Store parameter usage
-            for component_id, usage in data.get('parameter_usage', {}).items():
-                cursor.execute(
-                    'INSERT INTO parameter_usage (session_id, component_id, total_params, '
-                    'active_params, utilization, layer_data, timestamp) '
-                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
-                    (
-                        data['id'],
-                        component_id,
-                        usage.get('total', 0),
-                        usage.get('active', 0),
-                        usage.get('utilization', 0),
-                        json.dumps(usage.get('layers', {})),
-                        usage.get('timestamp', 0)
-                    )
-                )
-                
-            # Store latent reasoning records
-            for record in data.get('latent_reasoning', []):
-                cursor.execute(
-                    'INSERT INTO latent_reasoning (session_id, component_id, iteration, '
-                    'initial_confidence, final_confidence, iterations_required, '
-                    'cognitive_convergence_rate, reasoning_data, timestamp) '
-                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
-                    (
-                        data['id'],
-                        record.get('component_id', ''),
-                        record.get('iteration', 0),
-                        record.get('initial_confidence', 0.0),
-                        record.get('final_confidence', 0.0),
-                        record.get('iterations_required', 0),
-                        record.get('cognitive_convergence_rate', 0.0),
-                        json.dumps({k: v for k, v in record.items() 
-                                 if k not in ['component_id', 'iteration', 'initial_confidence', 
-                                             'final_confidence', 'iterations_required', 
-                                             'cognitive_convergence_rate', 'timestamp']}),
-                        record.get('timestamp', 0)
-                    )
-                )
-                
-            # Store cross-modal operations
-            for operation in data.get('cross_modal_operations', []):
-                cursor.execute(
-                    'INSERT INTO cross_modal_operations (session_id, source_modality, '
-                    'target_modality, operation_type, success, operation_data, timestamp) '
-                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
-                    (
-                        data['id'],
-                        operation.get('source_modality', ''),
-                        operation.get('target_modality', ''),
-                        operation.get('operation_type', ''),
-                        1 if operation.get('success', False) else 0,
-                        json.dumps({k: v for k, v in operation.items() 
-                                 if k not in ['source_modality', 'target_modality', 
-                                             'operation_type', 'success', 'timestamp']}),
-                        operation.get('timestamp', 0)
-                    )
+        Returns:
+            Future resolved once the session is committed
+        """
+        # Snapshot now so later changes by the caller are not written
+        data = session_data.to_dict() if hasattr(session_data, 'to_dict') else session_data
+        future: Future = Future()
+        
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="sqlite-metrics-writer", daemon=True
                 )
-                
-            # Store concept stability data
-            for concept_id, observations in data.get('concept_stability', {}).items():
-                for obs in observations:
-                    cursor.execute(
-                        'INSERT INTO concept_stability (session_id, concept_id, context, '
-                        'vector_representation, stability_data, timestamp) '
-                        'VALUES (?, ?, ?, ?, ?, ?)',
-                        (
-                            data['id'],
-                            concept_id,
-                            obs.get('context', ''),
-                            json.dumps(obs.get('vector_representation', [])),
-                            json.dumps({k: v for k, v in obs.items() 
-                                     if k not in ['context', 'vector_representation', 'timestamp']}),
-                            obs.get('timestamp', 0)
-                        )
-                    )
-            
-            conn.commit()
-            
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Error storing session data: {str(e)}")
-            raise
-        finally:
-            conn.close()
+                self._writer.start()
+        
+        self._queue.put((data, future))
+        return future
+    
+    async def store_session_async(self, session_data):
+        """Store a session through the background writer without blocking the event loop.
+        
+        Args:
+            session_data: SessionData object or session dict
+        """
+        await asyncio.wrap_future(self.enqueue_session(session_data))
+    
+    def flush(self, timeout=None):
+        """Wait until every queued session has been written.
+        
+        Args:
+            timeout: Optional timeout in seconds (None waits indefinitely)
+        """
+        if self._writer is None:
+            return
+        marker: Future = Future()
+        self._queue.put((None, marker))
+        marker.result(timeout)
+    
+    def close(self):
+        """Flush queued sessions, stop the writer and close all connections."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+        self.pool.close()
+    
+    def _writer_loop(self):
+        """Drain the queue, committing each batch in one transaction."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            
+            self._write_batch(batch)
+            if stop:
+                return
+    
+    def _write_batch(self, batch):
+        """Commit a batch of queued sessions, isolating failures."""
+        sessions = [(data, future) for data, future in batch if data is not None]
+        
+        try:
+            if sessions:
+                self.store_sessions([data for data, _ in sessions])
+        except Exception:
+            # Retry one by one so a single bad session does not fail the rest
+            for data, future in sessions:
+                try:
+                    self.store_sessions([data])
+                    future.set_result(None)
+                except Exception as e:
+                    future.set_exception(e)
+        else:
+            for _, future in sessions:
+                future.set_result(None)
+        
+        # Flush markers resolve after everything queued before them
+        for data, future in batch:
+            if data is None:
+                future.set_result(None)
     
     def get_session(self, session_id):
         """Retrieve a session by ID."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        with self.pool.connection() as conn:
+            try:
+                return self._read_session(conn, session_id)
+            except Exception as e:
+                logger.error(f"Error retrieving session data: {str(e)}")
+                raise
+    
+    def _read_session(self, conn, session_id):
+        """Read a session and its child rows using a borrowed connection."""
         cursor = conn.cursor()
         
-        try:
-            # Get main session data
-            cursor.execute('SELECT * FROM sessions WHERE id = ?', (session_id,))
-            
-            session_row = cursor.fetchone()
-            if not session_row:
-                return None
-                
-            session_data = dict(session_row)
-            
-            # Parse JSON fields
-            for field in ['config', 'performance', 'spectral_metrics', 'catastrophe_metrics']:
-                if session_data.get(field):
-                    session_data[field] = json.loads(session_data[field])
-            
-            # Get component activations
-            cursor.execute(
-                'SELECT component_id, activation_data, timestamp FROM component_activations '
-                'WHERE session_id = ? ORDER BY timestamp', (session_id,)
-            )
-            
-            activations = {}
-            for row in cursor.fetchall():
-                component_id = row['component_id']
-                if component_id not in activations:
-                    activations[component_id] = []
-                
-                activation_data = json.loads(row['activation_data'])
-                activation_data['timestamp'] = row['timestamp']
-                activations[component_id].append(activation_data)
-            
-            session_data['component_activations'] = activations
-            
-            # Get propagation steps
-            cursor.execute(
-                'SELECT source, destination, info_content, data, timestamp FROM propagation_steps '
-                'WHERE session_id = ? ORDER BY timestamp', (session_id,)
-            )
-            
-            propagation_path = []
-            for row in cursor.fetchall():
-                step = {
-                    'source': row['source'],
-                    'destination': row['destination'],
-                    'info_content': row['info_content'],
-                    'timestamp': row['timestamp']
-                }
-                
-                # Add additional data if present
-                step.update(json.loads(row['data']))
-                propagation_path.append(step)
-            
-            session_data['propagation_path'] = propagation_path
-            
-            # Get parameter usage
-            cursor.execute(
-                'SELECT component_id, total_params, active_params, utilization, layer_data, timestamp '
-                'FROM parameter_usage WHERE session_id = ?', (session_id,)
-            )
-            
-            parameter_usage = {}
-            for row in cursor.fetchall():
-                parameter_usage[row['component_id']] = {
-                    'total': row['total_params'],
-                    'active': row['active_params'],
-                    'utilization': row['utilization'],
-                    'timestamp': row['timestamp'],
-                    'layers': json.loads(row['layer_data'])
-                }
-            
-            session_data['parameter_usage'] = parameter_usage
-            
-            # Get latent reasoning data
-            cursor.execute(
-                'SELECT component_id, iteration, initial_confidence, final_confidence, '
-                'iterations_required, cognitive_convergence_rate, reasoning_data, timestamp '
-                'FROM latent_reasoning WHERE session_id = ? ORDER BY timestamp', (session_id,)
-            )
-            
-            latent_reasoning = []
-            for row in cursor.fetchall():
-                record = {
-                    'component_id': row['component_id'],
-                    'iteration': row['iteration'],
-                    'initial_confidence': row['initial_confidence'],
-                    'final_confidence': row['final_confidence'],
-                    'iterations_required': row['iterations_required'],
-                    'cognitive_convergence_rate': row['cognitive_convergence_rate'],
-                    'timestamp': row['timestamp']
-                }
-                
-                # Add additional data if present
-                record.update(json.loads(row['reasoning_data']))
-                latent_reasoning.append(record)
-            
-            session_data['latent_reasoning'] = latent_reasoning
-            
-            # Get cross-modal operations
-            cursor.execute(
-                'SELECT source_modality, target_modality, operation_type, success, '
-                'operation_data, timestamp FROM cross_modal_operations '
-                'WHERE session_id = ? ORDER BY timestamp', (session_id,)
-            )
-            
-            cross_modal_operations = []
-            for row in cursor.fetchall():
-                operation = {
-                    'source_modality': row['source_modality'],
-                    'target_modality': row['target_modality'],
-                    'operation_type': row['operation_type'],
-                    'success': bool(row['success']),
-                    'timestamp': row['timestamp']
-                }
-                
-                # Add additional data if present
-                operation.update(json.loads(row['operation_data']))
-                cross_modal_operations.append(operation)
-            
-            session_data['cross_modal_operations'] = cross_modal_operations
-            
-            # Get concept stability data
-            cursor.execute(
-                'SELECT concept_id, context, vector_representation, stability_data, timestamp '
-                'FROM concept_stability WHERE session_id = ? ORDER BY timestamp', (session_id,)
-            )
-            
-            concept_stability = {}
-            for row in cursor.fetchall():
-                concept_id = row['concept_id']
-                
-                if concept_id not in concept_stability:
-                    concept_stability[concept_id] = []
-                
-                observation = {
-                    'context': row['context'],
-                    'vector_representation': json.loads(row['vector_representation']),
-                    'timestamp': row['timestamp']
-                }
-                
-                # Add additional data if present
-                observation.update(json.loads(row['stability_data']))
-                concept_stability[concept_id].append(observation)
-            
-            session_data['concept_stability'] = concept_stability
-            
-            return session_data
+        # Get main session data
+        cursor.execute('SELECT * FROM sessions WHERE id = ?', (session_id,))
+        
+        session_row = cursor.fetchone()
+        if not session_row:
+            return None
             
-        except Exception as e:
-            logger.error(f"Error retrieving session data: {str(e)}")
-            raise
-        finally:
-            conn.close()
+        session_data = dict(session_row)
+        
+        # Parse JSON fields
+        for field in ['config', 'performance', 'spectral_metrics', 'catastrophe_metrics']:
+            if session_data.get(field):
+                session_data[field] = json.loads(session_data[field])
+        
+        # Get component activations
+        cursor.execute(
+            'SELECT component_id, activation_data, timestamp FROM component_activations '
+            'WHERE session_id = ? ORDER BY timestamp', (session_id,)
+        )
+        
+        activations = {}
+        for row in cursor.fetchall():
+            component_id = row['component_id']
+            if component_id not in activations:
+                activations[component_id] = []
+            
+            activation_data = json.loads(row['activation_data'])
+            activation_data['timestamp'] = row['timestamp']
+            activations[component_id].append(activation_data)
+        
+        session_data['component_activations'] = activations
+        
+        # Get propagation steps
+        cursor.execute(
+            'SELECT source, destination, info_content, data, timestamp FROM propagation_steps '
+            'WHERE session_id = ? ORDER BY timestamp', (session_id,)
+        )
+        
+        propagation_path = []
+        for row in cursor.fetchall():
+            step = {
+                'source': row['source'],
+                'destination': row['destination'],
+                'info_content': row['info_content'],
+                'timestamp': row['timestamp']
+            }
+            
+            # Add additional data if present
+            step.update(json.loads(row['data']))
+            propagation_path.append(step)
+        
+        session_data['propagation_path'] = propagation_path
+        
+        # Get parameter usage
+        cursor.execute(
+            'SELECT component_id, total_params, active_params, utilization, layer_data, timestamp '
+            'FROM parameter_usage WHERE session_id = ?', (session_id,)
+        )
+        
+        parameter_usage = {}
+        for row in cursor.fetchall():
+            parameter_usage[row['component_id']] = {
+                'total': row['total_params'],
+                'active': row['active_params'],
+                'utilization': row['utilization'],
+                'timestamp': row['timestamp'],
+                'layers': json.loads(row['layer_data'])
+            }
+        
+        session_data['parameter_usage'] = parameter_usage
+        
+        # Get latent reasoning data
+        cursor.execute(
+            'SELECT component_id, iteration, initial_confidence, final_confidence, '
+            'iterations_required, cognitive_convergence_rate, reasoning_data, timestamp '
+            'FROM latent_reasoning WHERE session_id = ? ORDER BY timestamp', (session_id,)
+        )
+        
+        latent_reasoning = []
+        for row in cursor.fetchall():
+            record = {
+                'component_id': row['component_id'],
+                'iteration': row['iteration'],
+                'initial_confidence': row['initial_confidence'],
+                'final_confidence': row['final_confidence'],
+                'iterations_required': row['iterations_required'],
+                'cognitive_convergence_rate': row['cognitive_convergence_rate'],
+                'timestamp': row['timestamp']
+            }
+            
+            # Add additional data if present
+            record.update(json.loads(row['reasoning_data']))
+            latent_reasoning.append(record)
+        
+        session_data['latent_reasoning'] = latent_reasoning
+        
+        # Get cross-modal operations
+        cursor.execute(
+            'SELECT source_modality, target_modality, operation_type, success, '
+            'operation_data, timestamp FROM cross_modal_operations '
+            'WHERE session_id = ? ORDER BY timestamp', (session_id,)
+        )
+        
+        cross_modal_operations = []
+        for row in cursor.fetchall():
+            operation = {
+                'source_modality': row['source_modality'],
+                'target_modality': row['target_modality'],
+                'operation_type': row['operation_type'],
+                'success': bool(row['success']),
+                'timestamp': row['timestamp']
+            }
+            
+            # Add additional data if present
+            operation.update(json.loads(row['operation_data']))
+            cross_modal_operations.append(operation)
+        
+        session_data['cross_modal_operations'] = cross_modal_operations
+        
+        # Get concept stability data
+        cursor.execute(
+            'SELECT concept_id, context, vector_representation, stability_data, timestamp '
+            'FROM concept_stability WHERE session_id = ? ORDER BY timestamp', (session_id,)
+        )
+        
+        concept_stability = {}
+        for row in cursor.fetchall():
+            concept_id = row['concept_id']
+            
+            if concept_id not in concept_stability:
+                concept_stability[concept_id] = []
+            
+            observation = {
+                'context': row['context'],
+                'vector_representation': json.loads(row['vector_representation']),
+                'timestamp': row['timestamp']
+            }
+            
+            # Add additional data if present
+            observation.update(json.loads(row['stability_data']))
+            concept_stability[concept_id].append(observation)
+        
+        session_data['concept_stability'] = concept_stability
+        
+        return session_data
     
     def get_sessions(self, filters=None, limit=100, offset=0):
         """Retrieve multiple sessions with optional filtering."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        try:
-            # Build query based on filters
-            query = "SELECT id FROM sessions"
-            params = []
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            
+            try:
+                # Build query based on filters
+                query = "SELECT id FROM sessions"
+                params = []
             
-            if filters:
-                conditions = []
+                if filters:
+                    conditions = []
                 
-                if 'start_time_min' in filters:
-                    conditions.append("start_time >= ?")
-                    params.append(filters['start_time_min'])
+                    if 'start_time_min' in filters:
+                        conditions.append("start_time >= ?")
+                        params.append(filters['start_time_min'])
                 
-                if 'start_time_max' in filters:
-                    conditions.append("start_time <= ?")
-                    params.append(filters['start_time_max'])
+                    if 'start_time_max' in filters:
+                        conditions.append("start_time <= ?")
+                        params.append(filters['start_time_max'])
                 
-                if 'prompt_like' in filters:
-                    conditions.append("prompt LIKE ?")
-                    params.append(f"%{filters['prompt_like']}%")
+                    if 'prompt_like' in filters:
+                        conditions.append("prompt LIKE ?")
+                        params.append(f"%{filters['prompt_like']}%")
+
+                    if 'prompt_prefix' in filters:
+                        conditions.append("prompt LIKE ?")
+                        params.append(f"{filters['prompt_prefix']}%")
                 
-                if conditions:
-                    query += " WHERE " + " AND ".join(conditions)
+                    if conditions:
+                        query += " WHERE " + " AND ".join(conditions)
             
-            query += " ORDER BY start_time DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
+                query += " ORDER BY start_time DESC LIMIT ? OFFSET ?"
+                params.extend([limit, offset])
             
-            cursor.execute(query, params)
-            session_ids = [row['id'] for row in cursor.fetchall()]
+                cursor.execute(query, params)
+                session_ids = [row['id'] for row in cursor.fetchall()]
             
-            # Get full data for each session
-            sessions = []
-            for session_id in session_ids:
-                session_data = self.get_session(session_id)
-                if session_data:
-                    sessions.append(session_data)
+                # Get full data for each session
+                sessions = []
+                for session_id in session_ids:
+                    session_data = self._read_session(conn, session_id)
+                    if session_data:
+                        sessions.append(session_data)
             
-            return sessions
+                return sessions
             
-        except Exception as e:
-            logger.error(f"Error retrieving sessions: {str(e)}")
-            raise
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Error retrieving sessions: {str(e)}")
+                raise
             
     def get_spectral_metrics(self, filters=None, limit=100):
         """Get spectral metrics for multiple sessions."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        try:
-            # Build query based on filters
-            query = "SELECT id, start_time, spectral_metrics, catastrophe_metrics FROM sessions"
-            params = []
-            
-            if filters:
-                conditions = []
-                for field, value in filters.items():
-                    if field == 'start_time_min':
-                        conditions.append("start_time >= ?")
-                        params.append(value)
-                    elif field == 'start_time_max':
-                        conditions.append("start_time <= ?")
-                        params.append(value)
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            
+            try:
+                # Build query based on filters
+                query = "SELECT id, start_time, spectral_metrics, catastrophe_metrics FROM sessions"
+                params = []
+            
+                if filters:
+                    conditions = []
+                    for field, value in filters.items():
+                        if field == 'start_time_min':
+                            conditions.append("start_time >= ?")
+                            params.append(value)
+                        elif field == 'start_time_max':
+                            conditions.append("start_time <= ?")
+                            params.append(value)
                 
-                if conditions:
-                    query += " WHERE " + " AND ".join(conditions)
-            
-            query += " ORDER BY start_time DESC LIMIT ?"
-            params.append(limit)
-            
-            cursor.execute(query, params)
-            return [
-                {
-                    'id': row['id'],
-                    'start_time': row['start_time'],
-                    'spectral_metrics': json.loads(row['spectral_metrics']),
-                    'catastrophe_metrics': json.loads(row['catastrophe_metrics']) if row['catastrophe_metrics'] else {}
-                }
-                for row in cursor.fetchall()
-            ]
-            
-        except Exception as e:
-            logger.error(f"Error retrieving spectral metrics: {str(e)}")
-            raise
-        finally:
-            conn.close()
\ No newline at end of file
+                    if conditions:
+                        query += " WHERE " + " AND ".join(conditions)
+            
+                query += " ORDER BY start_time DESC LIMIT ?"
+                params.append(limit)
+            
+                cursor.execute(query, params)
+                return [
+                    {
+                        'id': row['id'],
+                        'start_time': row['start_time'],
+                        'spectral_metrics': json.loads(row['spectral_metrics']),
+                        'catastrophe_metrics': json.loads(row['catastrophe_metrics']) if row['catastrophe_metrics'] else {}
+                    }
+                    for row in cursor.fetchall()
+                ]
+            
+            except Exception as e:
+                logger.error(f"Error retrieving spectral metrics: {str(e)}")
+                raise
\ No newline at end of file
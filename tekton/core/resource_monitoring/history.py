@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Fixed-size resource metric history.
+
+This module provides NumPy-backed ring buffers for resource samples, one
+per metric series, with downsampled min/max/avg rollup tiers. Memory use is
+set by the retention period and sampling interval, samples older than the
+retention period are pruned by timestamp, and time-range queries are binary
+searches over the (time-ordered) ring.
+"""
+
+import math
+import numpy as np
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .metrics import ResourceMetrics
+
+# Rollup tier resolutions in seconds
+ROLLUP_RESOLUTIONS = (1, 60, 3600)
+
+
+class RingBuffer:
+    """Fixed-capacity, time-ordered ring of timestamped rows.
+
+    Appends overwrite the oldest row once full. Rows are assumed to arrive
+    in non-decreasing timestamp order, which keeps every query a binary
+    search.
+    """
+
+    def __init__(self, capacity: int, columns: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the ring.
+
+        Args:
+            capacity: Maximum number of rows
+            columns: Column dtypes by name (defaults to a single float "value")
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.columns = {
+            name: np.zeros(capacity, dtype=dtype)
+            for name, dtype in (columns or {"value": np.float64}).items()
+        }
+        self._start = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _physical(self, logical: int) -> int:
+        return (self._start + logical) % self.capacity
+
+    def append(self, timestamp: float, **values: Any) -> None:
+        """Add a row, overwriting the oldest one when full."""
+        if self.size < self.capacity:
+            index = self._physical(self.size)
+            self.size += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self.capacity
+
+        self.timestamps[index] = timestamp
+        for name, value in values.items():
+            self.columns[name][index] = value
+
+    def drop_before(self, timestamp: float) -> None:
+        """Remove rows older than a timestamp."""
+        count = self.search(timestamp, "left")
+        if not count:
+            return
+
+        # Release references held by object columns
+        indices = (self._start + np.arange(count)) % self.capacity
+        for values in self.columns.values():
+            if values.dtype == object:
+                values[indices] = None
+
+        self._start = self._physical(count)
+        self.size -= count
+
+    def last(self, column: str) -> Any:
+        """Value of a column in the newest row."""
+        return self.columns[column][self._physical(self.size - 1)]
+
+    def last_timestamp(self) -> Optional[float]:
+        """Timestamp of the newest row, or None when empty."""
+        return float(self.timestamps[self._physical(self.size - 1)]) if self.size else None
+
+    def update_last(self, **values: Any) -> None:
+        """Overwrite columns of the newest row."""
+        index = self._physical(self.size - 1)
+        for name, value in values.items():
+            self.columns[name][index] = value
+
+    def search(self, timestamp: float, side: str = "left") -> int:
+        """Logical position of a timestamp, as numpy.searchsorted on the ordered rows."""
+        head_end = min(self._start + self.size, self.capacity)
+        position = int(np.searchsorted(self.timestamps[self._start:head_end], timestamp, side=side))
+        if position < head_end - self._start:
+            return position
+
+        # Past the older segment, continue in the wrapped-around part
+        wrapped = self.size - (head_end - self._start)
+        return position + int(np.searchsorted(self.timestamps[:wrapped], timestamp, side=side))
+
+    def range(self,
+              start: Optional[float] = None,
+              end: Optional[float] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Rows with start <= timestamp <= end, oldest first.
+
+        Args:
+            start: Earliest timestamp (None for the oldest row)
+            end: Latest timestamp (None for the newest row)
+
+        Returns:
+            (timestamps, columns by name) as new arrays
+        """
+        low = 0 if start is None else self.search(start, "left")
+        high = self.size if end is None else self.search(end, "right")
+        indices = (self._start + np.arange(low, max(low, high))) % self.capacity
+        return self.timestamps[indices], {name: values[indices] for name, values in self.columns.items()}
+
+
+class MetricSeries:
+    """Raw samples of one metric plus min/max/avg rollup tiers."""
+
+    def __init__(self, capacity: int, retention_seconds: float,
+                 resolutions: Tuple[int, ...] = ROLLUP_RESOLUTIONS):
+        """
+        Initialize the series.
+
+        Args:
+            capacity: Raw samples kept
+            retention_seconds: Period the rollup tiers must cover
+            resolutions: Rollup bucket sizes in seconds
+        """
+        self.raw = RingBuffer(capacity)
+        # A tier never needs more buckets than there are samples
+        self.rollups = {
+            resolution: RingBuffer(
+                min(capacity, math.ceil(retention_seconds / resolution) + 1),
+                {"min": np.float64, "max": np.float64, "sum": np.float64, "count": np.int64}
+            )
+            for resolution in resolutions
+        }
+        # Newest bucket per tier as [start, min, max, sum, count], kept out of NumPy for cheap updates
+        self._open: Dict[int, List[float]] = {}
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample and fold it into every rollup tier."""
+        self.raw.append(timestamp, value=value)
+
+        for resolution, tier in self.rollups.items():
+            bucket = timestamp - timestamp % resolution
+            current = self._open.get(resolution)
+            if current is not None and current[0] == bucket:
+                current[1] = min(current[1], value)
+                current[2] = max(current[2], value)
+                current[3] += value
+                current[4] += 1
+                tier.update_last(min=current[1], max=current[2], sum=current[3], count=current[4])
+            else:
+                self._open[resolution] = [bucket, value, value, value, 1]
+                tier.append(bucket, min=value, max=value, sum=value, count=1)
+
+    def prune(self, cutoff: float) -> None:
+        """Drop raw samples older than cutoff and buckets that end before it."""
+        self.raw.drop_before(cutoff)
+        for resolution, tier in self.rollups.items():
+            tier.drop_before(cutoff - resolution)
+
+    def rollup(self, resolution: int, start: Optional[float] = None,
+               end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Rollup buckets overlapping a time range.
+
+        Args:
+            resolution: Bucket size in seconds (one of the configured tiers)
+            start: Earliest time (None for all retained)
+            end: Latest time (None for the newest bucket)
+
+        Returns:
+            Dict of arrays: timestamp (bucket start), min, max, avg, count
+        """
+        tier = self.rollups[resolution]
+        if start is not None:
+            start = start - start % resolution
+        timestamps, columns = tier.range(start, end)
+        return {
+            "timestamp": timestamps,
+            "min": columns["min"],
+            "max": columns["max"],
+            "avg": columns["sum"] / np.maximum(columns["count"], 1),
+            "count": columns["count"]
+        }
+
+
+def flatten_metrics(metrics: ResourceMetrics) -> Iterator[Tuple[str, float]]:
+    """
+    Numeric values of a ResourceMetrics sample as (series name, value).
+
+    Series are named ``cpu_percent``, ``memory_percent``,
+    ``disk_percent.<mount>``, ``network_mbps.<interface>.<field>``,
+    ``gpu.<device>.<field>`` and ``component.<component_id>.<field>``.
+    """
+    yield "cpu_percent", metrics.cpu_percent
+    yield "memory_percent", metrics.memory_percent
+
+    for mount, value in metrics.disk_percent.items():
+        yield f"disk_percent.{mount}", value
+
+    nested = [("network_mbps", metrics.network_mbps), ("gpu", metrics.gpu_percent or {}),
+              ("component", metrics.component_metrics)]
+    for prefix, groups in nested:
+        for key, fields in groups.items():
+            if not isinstance(fields, dict):
+                continue
+            for field_name, value in fields.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    yield f"{prefix}.{key}.{field_name}", value
+
+
+class ResourceHistory:
+    """Bounded history of ResourceMetrics samples and their metric series.
+
+    Each sample prunes everything older than ``retention_seconds`` before
+    its timestamp, including whole series (for components, mounts or
+    interfaces that have gone away) left without samples.
+    """
+
+    def __init__(self, retention_seconds: float, sample_interval: float,
+                 resolutions: Tuple[int, ...] = ROLLUP_RESOLUTIONS):
+        """
+        Initialize the history.
+
+        Args:
+            retention_seconds: How long samples are kept
+            sample_interval: Expected seconds between samples, used to size the rings
+            resolutions: Rollup bucket sizes in seconds
+        """
+        self.retention_seconds = retention_seconds
+        self.resolutions = tuple(resolutions)
+        self.capacity = max(1, math.ceil(retention_seconds / max(sample_interval, 1e-3)) + 1)
+
+        self.samples = RingBuffer(self.capacity, {"sample": object})
+        self.series: Dict[str, MetricSeries] = {}
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def add(self, metrics: ResourceMetrics) -> None:
+        """Record a sample and prune those outside the retention period."""
+        timestamp = metrics.timestamp.timestamp()
+        self.samples.append(timestamp, sample=metrics)
+
+        for name, value in flatten_metrics(metrics):
+            series = self.series.get(name)
+            if series is None:
+                series = self.series[name] = MetricSeries(self.capacity, self.retention_seconds, self.resolutions)
+            series.append(timestamp, value)
+
+        cutoff = timestamp - self.retention_seconds
+        self.samples.drop_before(cutoff)
+        for name in list(self.series):
+            series = self.series[name]
+            series.prune(cutoff)
+            if not series.raw.size:
+                del self.series[name]
+
+    def latest(self) -> Optional[ResourceMetrics]:
+        """Most recent sample, or None when empty."""
+        return self.samples.last("sample") if self.samples.size else None
+
+    def samples_between(self, start: Optional[float] = None,
+                        end: Optional[float] = None) -> List[ResourceMetrics]:
+        """
+        Samples in a time range, oldest first.
+
+        Args:
+            start: Earliest timestamp (None for the oldest retained)
+            end: Latest timestamp (None for the newest)
+
+        Returns:
+            List of ResourceMetrics
+        """
+        return self.samples.range(start, end)[1]["sample"].tolist()
+
+    def series_range(self, name: str, start: Optional[float] = None,
+                     end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Raw values of one series in a time range.
+
+        Args:
+            name: Series name (see flatten_metrics)
+            start: Earliest timestamp
+            end: Latest timestamp
+
+        Returns:
+            (timestamps, values) arrays
+        """
+        series = self.series.get(name)
+        if series is None:
+            return np.empty(0), np.empty(0)
+        timestamps, columns = series.raw.range(start, end)
+        return timestamps, columns["value"]
+
+    def rollup(self, name: str, resolution: int, start: Optional[float] = None,
+               end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Rollup buckets of one series in a time range.
+
+        Args:
+            name: Series name (see flatten_metrics)
+            resolution: Bucket size in seconds, one of the configured resolutions
+            start: Earliest timestamp
+            end: Latest timestamp
+
+        Returns:
+            Dict of arrays: timestamp, min, max, avg, count
+        """
+        if resolution not in self.resolutions:
+            raise ValueError(f"No rollup tier with resolution {resolution}s (have {self.resolutions})")
+
+        series = self.series.get(name)
+        if series is None:
+            empty = np.empty(0)
+            return {"timestamp": empty, "min": empty, "max": empty, "avg": empty, "count": empty}
+        return series.rollup(resolution, start, end)
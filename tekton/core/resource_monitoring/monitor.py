@@ -4,13 +4,20 @@ Resource monitoring system for Tekton.
 
 This module provides functionality to monitor system resources (CPU, memory, disk, network)
 and component-specific resource usage. It includes threshold-based alerting.
+
+Sampling never sleeps: CPU usage is computed from the counter deltas since
+the previous sample, and the periodic sampler runs on a dedicated thread
+that hands each sample to the event loop.
 """
 
 import asyncio
 import time
+import threading
 import psutil
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
+
+import numpy as np
 
 import logging
 logger = logging.getLogger(__name__)
@@ -18,8 +25,24 @@ logger = logging.getLogger(__name__)
 from .config import ResourceConfig, ResourceThreshold
 from .metrics import ResourceMetrics
 from .gpu_utils import check_gpu_availability, get_gpu_metrics
+from .history import ResourceHistory
 from .system_info import get_system_info
 
+# How often the list of mounted partitions is re-read
+PARTITION_REFRESH_SECONDS = 60.0
+
+# Samples buffered per subscriber before the oldest is dropped
+SUBSCRIBER_QUEUE_SIZE = 16
+
+
+def _cpu_busy_and_total(times) -> Tuple[float, float]:
+    """Split system CPU times into busy and total seconds, as psutil does."""
+    total = sum(times)
+    # On Linux guest time is already counted in user and nice
+    total -= getattr(times, "guest", 0.0) + getattr(times, "guest_nice", 0.0)
+    idle = times.idle + getattr(times, "iowait", 0.0)
+    return total - idle, total
+
 
 class ResourceMonitor:
     """
@@ -32,7 +55,7 @@ class ResourceMonitor:
     - System-wide resource monitoring
     - Component-specific resource tracking
     - Threshold-based alerting with configurable thresholds
-    - Historical data retention
+    - Historical data retention in fixed-size ring buffers with 1s/1m/1h rollups
     - Optional GPU monitoring
     """
     
@@ -53,7 +76,10 @@ class ResourceMonitor:
         self.alert_handlers = alert_handlers or []
         
         # Initialize metrics storage
-        self.metrics_history: List[ResourceMetrics] = []
+        self.history = ResourceHistory(
+            retention_seconds=self.config.retention_hours * 3600,
+            sample_interval=self.config.check_interval_seconds
+        )
         self.component_pids: Dict[str, List[int]] = {}
         
         # For rate calculations
@@ -63,13 +89,33 @@ class ResourceMonitor:
         # Alert cooldown tracking
         self._last_alerts: Dict[str, float] = {}
         
+        # Cached process handles, so per-process CPU deltas carry over between samples
+        self._processes: Dict[int, psutil.Process] = {}
+        
+        # Cached mount points
+        self._partitions: List[str] = []
+        self._partitions_time = 0.0
+        
         # Monitor state
         self._running = False
-        self._monitor_task = None
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: List[asyncio.Queue] = []
+        
+        # Sampling updates the CPU, process and network baselines, and
+        # recording updates the history; either may run on the sampler
+        # thread and a caller's thread at once
+        self._sample_lock = threading.Lock()
+        self._record_lock = threading.Lock()
         
         # Detect GPU availability
         self._has_gpu = check_gpu_availability()
         
+        # CPU times at the previous sample; kept per monitor rather than
+        # sharing psutil.cpu_percent's process-wide baseline
+        self._last_cpu_times = psutil.cpu_times()
+        
     def register_component(self, component_id: str, pids: List[int]) -> None:
         """
         Register a component for specific resource monitoring.
@@ -85,34 +131,80 @@ class ResourceMonitor:
         if component_id in self.component_pids:
             del self.component_pids[component_id]
             
+    def _get_process(self, pid: int) -> psutil.Process:
+        """Get a cached process handle, creating and priming it on first use."""
+        process = self._processes.get(pid)
+        if process is None:
+            process = psutil.Process(pid)
+            process.cpu_percent(interval=None)
+            self._processes[pid] = process
+        return process
+            
+    def _cpu_percent(self) -> float:
+        """System CPU usage since this monitor's previous sample."""
+        times = psutil.cpu_times()
+        last_busy, last_total = _cpu_busy_and_total(self._last_cpu_times)
+        busy, total = _cpu_busy_and_total(times)
+        self._last_cpu_times = times
+        
+        if total <= last_total:
+            return 0.0
+        return round(min(max((busy - last_busy) / (total - last_total), 0.0), 1.0) * 100, 1)
+            
     def _get_component_metrics(self) -> Dict[str, Dict[str, float]]:
         """Collect resource usage metrics for registered components."""
         component_metrics = {}
+        live_pids = set()
         
-        for component_id, pids in self.component_pids.items():
+        # Snapshot, since components may be registered from another thread
+        for component_id, pids in list(self.component_pids.items()):
             cpu_percent = 0.0
             memory_percent = 0.0
             valid_pids = []
             
             for pid in pids:
                 try:
-                    process = psutil.Process(pid)
-                    cpu_percent += process.cpu_percent(interval=0.1)
-                    memory_percent += process.memory_percent()
+                    process = self._get_process(pid)
+                    # Read all process stats in one pass
+                    with process.oneshot():
+                        cpu_percent += process.cpu_percent(interval=None)
+                        memory_percent += process.memory_percent()
                     valid_pids.append(pid)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    self._processes.pop(pid, None)
                     continue
             
-            # Update the list of valid PIDs
-            self.component_pids[component_id] = valid_pids
+            # Update the list of valid PIDs unless the component changed meanwhile
+            live_pids.update(valid_pids)
+            if self.component_pids.get(component_id) is pids:
+                self.component_pids[component_id] = valid_pids
             
             component_metrics[component_id] = {
                 "cpu_percent": cpu_percent,
                 "memory_percent": memory_percent
             }
             
+        # Drop handles for processes no component refers to any more
+        for pid in set(self._processes) - live_pids:
+            del self._processes[pid]
+            
         return component_metrics
         
+    def _get_disk_metrics(self) -> Dict[str, float]:
+        """Collect disk usage by mount point, re-reading the partition list periodically."""
+        now = time.monotonic()
+        if not self._partitions_time or now - self._partitions_time >= PARTITION_REFRESH_SECONDS:
+            self._partitions = [partition.mountpoint for partition in psutil.disk_partitions()]
+            self._partitions_time = now
+            
+        disk_percent = {}
+        for mountpoint in self._partitions:
+            try:
+                disk_percent[mountpoint] = psutil.disk_usage(mountpoint).percent
+            except (PermissionError, OSError):
+                continue
+        return disk_percent
+        
     def _calculate_network_rates(self) -> Dict[str, Dict[str, float]]:
         """Calculate network throughput in Mbps."""
         current_time = time.time()
@@ -145,40 +237,38 @@ class ResourceMonitor:
         self._last_network_time = current_time
         return network_rates
                 
-    def collect_metrics(self) -> ResourceMetrics:
+    def sample_metrics(self) -> ResourceMetrics:
         """
-        Collect current system resource metrics.
+        Read current resource usage without recording it.
+        
+        Does not sleep: CPU percentages cover the time since the previous
+        sample. Safe to call while the sampler thread is running.
         
         Returns:
             ResourceMetrics object with current usage data
         """
-        # Get CPU usage
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        
-        # Get memory usage
-        memory = psutil.virtual_memory()
-        memory_percent = memory.percent
-        
-        # Get disk usage
-        disk_percent = {}
-        for partition in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                disk_percent[partition.mountpoint] = usage.percent
-            except (PermissionError, OSError):
-                continue
-                
-        # Get network throughput
-        network_mbps = self._calculate_network_rates()
-        
-        # Get component-specific metrics
-        component_metrics = self._get_component_metrics()
+        with self._sample_lock:
+            # Get CPU usage since the previous sample
+            cpu_percent = self._cpu_percent()
+            
+            # Get memory usage
+            memory = psutil.virtual_memory()
+            memory_percent = memory.percent
+            
+            # Get disk usage
+            disk_percent = self._get_disk_metrics()
+                    
+            # Get network throughput
+            network_mbps = self._calculate_network_rates()
+            
+            # Get component-specific metrics
+            component_metrics = self._get_component_metrics()
         
         # Get GPU metrics if available
         gpu_percent = get_gpu_metrics() if self._has_gpu else None
         
         # Create metrics object
-        metrics = ResourceMetrics(
+        return ResourceMetrics(
             timestamp=datetime.now(),
             cpu_percent=cpu_percent,
             memory_percent=memory_percent,
@@ -188,27 +278,35 @@ class ResourceMonitor:
             component_metrics=component_metrics
         )
         
-        # Add to history and clean up old entries
-        self.metrics_history.append(metrics)
-        self._prune_history()
-        
-        # Check thresholds and trigger alerts
-        self._check_thresholds(metrics)
+    def collect_metrics(self) -> ResourceMetrics:
+        """
+        Collect current system resource metrics and record them.
         
+        Returns:
+            ResourceMetrics object with current usage data
+        """
+        metrics = self.sample_metrics()
+        self._record(metrics)
         return metrics
         
-    def _prune_history(self) -> None:
-        """Remove metrics older than the retention period."""
-        if not self.metrics_history:
-            return
+    def _record(self, metrics: ResourceMetrics) -> None:
+        """Add a sample to the history, check thresholds and notify subscribers."""
+        with self._record_lock:
+            # Add to history, overwriting the oldest sample once full
+            self.history.add(metrics)
             
-        retention_seconds = self.config.retention_hours * 3600
-        cutoff_time = datetime.now().timestamp() - retention_seconds
+            # Check thresholds and trigger alerts
+            self._check_thresholds(metrics)
+        
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(metrics)
         
-        self.metrics_history = [
-            m for m in self.metrics_history 
-            if m.timestamp.timestamp() >= cutoff_time
-        ]
+    @property
+    def metrics_history(self) -> List[ResourceMetrics]:
+        """Samples within the retention period, oldest first."""
+        return self.get_metrics_history()
         
     def _check_thresholds(self, metrics: ResourceMetrics) -> None:
         """Check if any metrics exceed configured thresholds."""
@@ -341,42 +439,93 @@ class ResourceMonitor:
             f"(value: {value:.1f}, threshold: {threshold_value:.1f})"
         )
     
-    async def _monitoring_loop(self) -> None:
-        """Background task for periodic resource monitoring."""
-        while self._running:
+    def _sampling_thread(self, stop_event: threading.Event) -> None:
+        """Sample periodically and hand each sample to the event loop.
+        
+        History, alert handlers and subscribers are only touched on the
+        loop thread, so none of them need locking.
+        """
+        while not stop_event.is_set():
             try:
-                self.collect_metrics()
+                metrics = self.sample_metrics()
+                if self._loop is not None:
+                    self._loop.call_soon_threadsafe(self._record, metrics)
+                else:
+                    self._record(metrics)
+            except RuntimeError:
+                # Event loop closed underneath us
+                break
             except Exception as e:
                 logger.error(f"Error collecting resource metrics: {e}")
                 
-            await asyncio.sleep(self.config.check_interval_seconds)
+            stop_event.wait(self.config.check_interval_seconds)
             
     def start(self) -> None:
-        """Start the resource monitoring background task."""
+        """Start sampling on a background thread.
+        
+        When called with a running event loop, samples are recorded on
+        that loop; otherwise they are recorded on the sampler thread.
+        """
         if self._running:
             return
             
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+            
         self._running = True
-        self._monitor_task = asyncio.create_task(self._monitoring_loop())
+        self._stop_event = threading.Event()
+        self._sampler_thread = threading.Thread(
+            target=self._sampling_thread,
+            args=(self._stop_event,),
+            name="resource-monitor",
+            daemon=True
+        )
+        self._sampler_thread.start()
         logger.info("Resource monitoring started")
         
     def stop(self) -> None:
-        """Stop the resource monitoring background task."""
+        """Stop the sampler thread."""
         if not self._running:
             return
             
         self._running = False
-        if self._monitor_task:
-            self._monitor_task.cancel()
-            self._monitor_task = None
+        self._stop_event.set()
+        if self._sampler_thread and self._sampler_thread is not threading.current_thread():
+            self._sampler_thread.join(timeout=1.0)
+        self._sampler_thread = None
             
         logger.info("Resource monitoring stopped")
         
+    def subscribe(self, maxsize: int = SUBSCRIBER_QUEUE_SIZE) -> asyncio.Queue:
+        """
+        Get a queue that receives every new sample.
+        
+        The oldest queued sample is dropped when a slow consumer falls
+        behind. Call from the event loop the monitor was started on.
+        
+        Args:
+            maxsize: Samples buffered before dropping
+            
+        Returns:
+            asyncio.Queue of ResourceMetrics
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._subscribers.append(queue)
+        return queue
+        
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop delivering samples to a queue from subscribe()."""
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+        
     def get_current_metrics(self) -> ResourceMetrics:
         """Get the most recent metrics."""
-        if not self.metrics_history:
+        latest = self.history.latest()
+        if latest is None:
             return self.collect_metrics()
-        return self.metrics_history[-1]
+        return latest
         
     def get_metrics_history(
         self, 
@@ -391,14 +540,50 @@ class ResourceMonitor:
         Returns:
             List of ResourceMetrics objects
         """
-        if hours is None:
-            return self.metrics_history
-            
-        cutoff_time = datetime.now().timestamp() - (hours * 3600)
-        return [
-            m for m in self.metrics_history 
-            if m.timestamp.timestamp() >= cutoff_time
-        ]
+        retention_seconds = self.config.retention_hours * 3600
+        seconds = retention_seconds if hours is None else min(hours * 3600, retention_seconds)
+        return self.history.samples_between(start=datetime.now().timestamp() - seconds)
+        
+    def get_metric_series(
+        self,
+        name: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get raw samples of a single metric.
+        
+        Args:
+            name: Series name, e.g. "cpu_percent", "disk_percent./" or
+                  "component.<component_id>.cpu_percent"
+            start: Earliest Unix timestamp (None for all retained)
+            end: Latest Unix timestamp (None for the newest)
+            
+        Returns:
+            (timestamps, values) arrays
+        """
+        return self.history.series_range(name, start, end)
+        
+    def get_metric_rollup(
+        self,
+        name: str,
+        resolution: int = 60,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get downsampled min/max/avg buckets of a single metric.
+        
+        Args:
+            name: Series name (see get_metric_series)
+            resolution: Bucket size in seconds (1, 60 or 3600)
+            start: Earliest Unix timestamp (None for all retained)
+            end: Latest Unix timestamp (None for the newest)
+            
+        Returns:
+            Dict of arrays: timestamp, min, max, avg, count
+        """
+        return self.history.rollup(name, resolution, start, end)
         
     def add_alert_handler(
         self, 
@@ -30,8 +30,8 @@ from tekton.core.startup_handler import (
 from tekton.core.startup_manager import (
     get_component_status,
     synchronize_with_service_registry,
-    start_components_in_order,
-    start_components_parallel
+    start_components_parallel,
+    start_components_dag
 )
 
 logger = logging.getLogger("tekton.startup_coordinator")
@@ -48,7 +48,8 @@ class EnhancedStartUpCoordinator:
     def __init__(self, 
                 registry: Optional[ComponentRegistry] = None,
                 data_dir: Optional[str] = None,
-                message_bus_provider = None):
+                message_bus_provider = None,
+                max_concurrent_starts: Optional[int] = None):
         """
         Initialize the startup coordinator.
         
@@ -56,6 +57,7 @@ class EnhancedStartUpCoordinator:
             registry: Optional ComponentRegistry instance
             data_dir: Optional data directory for persistent storage
             message_bus_provider: Optional message bus provider
+            max_concurrent_starts: Optional limit on components starting at once
         """
         self.registry = registry
         self.data_dir = data_dir or os.path.expanduser("~/.tekton/startup")
@@ -72,6 +74,10 @@ class EnhancedStartUpCoordinator:
         # Instruction handler
         self.instruction_handler = None
         
+        # Parallel startup settings and the report of the last run
+        self.max_concurrent_starts = max_concurrent_starts
+        self.startup_report: Optional[Dict[str, Any]] = None
+        
         # Create data directory if it doesn't exist
         os.makedirs(self.data_dir, exist_ok=True)
     
@@ -220,15 +226,10 @@ class EnhancedStartUpCoordinator:
         if dependencies:
             logger.info(f"Waiting for dependencies of {component_id}: {dependencies}")
             
-            # Add jitter to prevent thundering herd
-            jitter = 0.1 * (hash(component_id) % 10) / 10.0
-            await asyncio.sleep(jitter)
-            
-            # Wait for dependencies to be ready
+            # Wait for dependencies to be ready (woken by their state changes)
             success, failed_deps = await self.registry.wait_for_dependencies(
                 dependencies=dependencies,
-                timeout=timeout,
-                check_interval=0.5
+                timeout=timeout
             )
             
             if not success:
@@ -342,6 +343,10 @@ class EnhancedStartUpCoordinator:
         """
         Start multiple components with deadlock prevention.
         
+        With dependency resolution, each component starts as soon as its
+        dependencies are ready (at most max_concurrent_starts at once), and
+        the timeline and critical path of the run are kept in startup_report.
+        
         Args:
             component_configs: Dictionary mapping component IDs to configs
             resolve_dependencies: Whether to resolve dependencies and order components
@@ -349,20 +354,33 @@ class EnhancedStartUpCoordinator:
         Returns:
             Dictionary mapping component IDs to success status
         """
+        start_func = self.start_component
+        
         if resolve_dependencies:
-            # Start components in dependency order
-            return await start_components_in_order(
+            # Start components along the dependency graph
+            results, self.startup_report = await start_components_dag(
                 component_configs=component_configs,
-                start_func=self.start_component,
-                resolve_cycles=True
+                start_func=start_func,
+                max_concurrency=self.max_concurrent_starts
             )
+            return results
         else:
             # Start components in parallel
             return await start_components_parallel(
                 component_configs=component_configs,
-                start_func=self.start_component
+                start_func=start_func
             )
     
+    def get_startup_report(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the report of the last dependency-ordered start_components run.
+        
+        Returns:
+            Dictionary with elapsed time, critical path and per-component
+            timeline, or None if no run has completed
+        """
+        return self.startup_report
+    
     async def handle_startup_instructions(self, 
                                     instructions: StartUpInstructions,
                                     component_handlers: Dict[str, Dict[str, Any]]) -> bool:
@@ -505,13 +523,15 @@ class StartUpCoordinator(EnhancedStartUpCoordinator):
                            component_id: str, 
                            start_func: Callable[[], Any],
                            dependencies: List[str] = None,
-                           timeout: int = 30) -> bool:
+                           timeout: int = 30,
+                           **kwargs) -> bool:
         """Legacy method to start a component."""
         success, _ = await super().start_component(
             component_id=component_id,
             start_func=start_func,
             dependencies=dependencies,
-            timeout=timeout
+            timeout=timeout,
+            **kwargs
         )
         return success
     
@@ -3,7 +3,8 @@
 Tekton StartUpManager Module
 
 This module provides functions and classes for managing component startup,
-including synchronization with service registries.
+including synchronization with service registries and dependency-aware
+parallel startup.
 """
 
 import logging
@@ -130,7 +131,7 @@ async def start_components_in_order(
         if component_id in component_configs:
             config = component_configs[component_id]
             
-            success, _ = await start_func(
+            success, _ = _start_outcome(await start_func(
                 component_id=component_id,
                 start_func=config.get("start_func"),
                 dependencies=config.get("dependencies", []),
@@ -140,7 +141,7 @@ async def start_components_in_order(
                 version=config.get("version", "0.1.0"),
                 capabilities=config.get("capabilities", []),
                 metadata=config.get("metadata", {})
-            )
+            ))
             
             results[component_id] = success
             
@@ -192,7 +193,165 @@ async def start_components_parallel(
             results[component_id] = False
             logger.error(f"Exception starting {component_id}: {start_results[i]}")
         else:
-            success, _ = start_results[i]
+            success, _ = _start_outcome(start_results[i])
             results[component_id] = success
     
-    return results
\ No newline at end of file
+    return results
+
+
+def _start_outcome(result: Any) -> Tuple[bool, Optional[str]]:
+    """Normalize a start result: (success, error), or a bare success flag."""
+    if isinstance(result, tuple):
+        return result
+    return bool(result), None
+
+
+def _start_kwargs(component_id: str, config: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    """Keyword arguments for a component start function, from its config."""
+    return {
+        "component_id": component_id,
+        "start_func": config.get("start_func"),
+        "dependencies": config.get("dependencies", []),
+        "timeout": timeout,
+        "component_type": config.get("type", "component"),
+        "component_name": config.get("name", component_id),
+        "version": config.get("version", "0.1.0"),
+        "capabilities": config.get("capabilities", []),
+        "metadata": config.get("metadata", {})
+    }
+
+
+async def start_components_dag(
+        component_configs: Dict[str, Dict[str, Any]],
+        start_func,
+        max_concurrency: Optional[int] = None,
+        default_timeout: float = 60) -> Tuple[Dict[str, bool], Dict[str, Any]]:
+    """
+    Start multiple components as soon as their dependencies are ready.
+    
+    Each component is launched the moment every dependency among the
+    configured components has started successfully, so independent
+    components start concurrently and total startup time approaches the
+    longest dependency chain. Components whose dependencies failed are
+    not started.
+    
+    Args:
+        component_configs: Dictionary mapping component IDs to configs
+        start_func: Function to start a component, returning (success, error)
+            or a bare success flag
+        max_concurrency: Maximum number of components starting at once (None for no limit)
+        default_timeout: Timeout in seconds for components without a "timeout" config
+        
+    Returns:
+        Tuple of (component ID -> success, startup report). The report has
+        the total elapsed time, the critical path and its duration, and a
+        per-component timeline (times in seconds from the start of the run).
+    """
+    # Only dependencies among the configured components are scheduled here;
+    # start_func still waits for any others through the registry
+    dependency_graph = {
+        component_id: [dep for dep in config.get("dependencies", []) if dep in component_configs]
+        for component_id, config in component_configs.items()
+    }
+    _, had_cycles = DependencyResolver.resolve_dependencies(dependency_graph)
+    if had_cycles:
+        logger.warning("Detected and resolved circular dependencies in component graph")
+    
+    remaining = {}
+    dependents = {component_id: [] for component_id in dependency_graph}
+    for component_id, deps in dependency_graph.items():
+        remaining[component_id] = len(set(deps))
+        for dep in set(deps):
+            dependents[dep].append(component_id)
+    
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    loop = asyncio.get_running_loop()
+    run_start = loop.time()
+    results: Dict[str, bool] = {}
+    timeline: Dict[str, Dict[str, Any]] = {}
+    
+    async def launch(component_id: str) -> Tuple[str, bool]:
+        config = component_configs[component_id]
+        timeout = config.get("timeout", default_timeout)
+        entry = timeline[component_id] = {
+            "component_id": component_id,
+            "ready_at": loop.time() - run_start
+        }
+        
+        if semaphore:
+            await semaphore.acquire()
+        try:
+            entry["started_at"] = loop.time() - run_start
+            try:
+                success, error = _start_outcome(await asyncio.wait_for(
+                    start_func(**_start_kwargs(component_id, config, timeout)),
+                    timeout=timeout
+                ))
+            except asyncio.TimeoutError:
+                success, error = False, f"Timeout after {timeout}s"
+            except Exception as e:
+                logger.error(f"Exception starting {component_id}: {e}")
+                success, error = False, str(e)
+        finally:
+            if semaphore:
+                semaphore.release()
+        
+        entry["finished_at"] = loop.time() - run_start
+        entry["duration"] = entry["finished_at"] - entry["started_at"]
+        entry["success"] = bool(success)
+        entry["error"] = error
+        return component_id, bool(success)
+    
+    def skip(component_id: str, failed_dep: str) -> None:
+        """Mark a component and everything depending on it as not started."""
+        if component_id in results:
+            return
+        results[component_id] = False
+        timeline[component_id] = {
+            "component_id": component_id,
+            "success": False,
+            "error": f"Dependency failed: {failed_dep}"
+        }
+        logger.error(f"Not starting {component_id}: dependency {failed_dep} failed")
+        for dependent in dependents[component_id]:
+            skip(dependent, component_id)
+    
+    logger.info(f"Starting {len(component_configs)} components by dependency graph"
+                + (f" (at most {max_concurrency} at once)" if max_concurrency else ""))
+    
+    pending = {
+        asyncio.create_task(launch(component_id))
+        for component_id, count in remaining.items() if count == 0
+    }
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            component_id, success = task.result()
+            results[component_id] = success
+            for dependent in dependents[component_id]:
+                if not success:
+                    skip(dependent, component_id)
+                    continue
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0 and dependent not in results:
+                    pending.add(asyncio.create_task(launch(dependent)))
+    
+    elapsed = loop.time() - run_start
+    durations = {
+        component_id: entry["duration"]
+        for component_id, entry in timeline.items() if "duration" in entry
+    }
+    critical_path, critical_path_seconds = DependencyResolver.critical_path(dependency_graph, durations)
+    
+    report = {
+        "elapsed": elapsed,
+        "critical_path": critical_path,
+        "critical_path_seconds": critical_path_seconds,
+        "max_concurrency": max_concurrency,
+        "had_cycles": had_cycles,
+        "timeline": sorted(timeline.values(), key=lambda entry: entry.get("started_at", float("inf")))
+    }
+    
+    logger.info(f"Started {sum(results.values())}/{len(results)} components in {elapsed:.2f}s "
+                f"(critical path {' -> '.join(critical_path)}: {critical_path_seconds:.2f}s)")
+    return results, report
@@ -3,15 +3,81 @@ Context Manager - System for managing context in MCP.
 
 This module provides a context management system for MCP,
 allowing components to create, enhance, and share context.
+
+Contexts are kept until deleted unless bounds are configured: the least
+recently used ones are then evicted past max_contexts and idle ones expire
+after context_ttl, optionally spilling to a local directory from which they
+are restored on access. Context data is
+structurally shared - updates and merges copy only the dictionaries on the
+changed paths and reuse every other subtree - so stored contexts must be
+treated as immutable and changed through update_context.
 """
 
+import hashlib
+import json
+import os
+import re
 import time
 import uuid
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Callable, Union
 
 logger = logging.getLogger(__name__)
 
+# Bounds of the process-wide manager, which MessageProcessor uses by default
+# and which receives one context per processed message
+GLOBAL_MAX_CONTEXTS = 10000
+GLOBAL_CONTEXT_TTL = 3600.0
+GLOBAL_MAX_HISTORY = 100
+
+_UNSAFE_FILENAME = re.compile(r"[^\w.-]")
+
+
+def _merge_into(target: Dict[str, Any], updates: Dict[str, Any], owned: Dict[int, Dict[str, Any]]):
+    """
+    Deep merge updates into target in place, copying shared dictionaries on write.
+    
+    Nested dictionaries are only copied when an update reaches into them, and
+    only once per merge; everything else is shared with the inputs.
+    
+    Args:
+        target: Dictionary owned by this merge
+        updates: Updates to apply
+        owned: Dictionaries created by this merge, by id
+    """
+    for key, value in updates.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            if id(current) not in owned:
+                current = dict(current)
+                owned[id(current)] = current
+                target[key] = current
+            _merge_into(current, value, owned)
+        else:
+            target[key] = value
+
+
+def merge_shared(*dicts: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep merge dictionaries left to right, sharing unchanged subtrees.
+    
+    The result equals folding the dictionaries with a recursive merge (later
+    values win, nested dictionaries merge), but costs one shallow copy of
+    the first dictionary plus work proportional to the keys of the rest.
+    
+    Args:
+        *dicts: Dictionaries to merge
+        
+    Returns:
+        Merged dictionary (a new object; the inputs are not modified)
+    """
+    result = dict(dicts[0]) if dicts else {}
+    owned = {id(result): result}
+    for updates in dicts[1:]:
+        _merge_into(result, updates, owned)
+    return result
+
 class ContextMetadata:
     """
     Metadata for MCP contexts.
@@ -25,7 +91,8 @@ class ContextMetadata:
         context_id: Optional[str] = None,
         source: Optional[Dict[str, Any]] = None,
         category: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        max_history: Optional[int] = None
     ):
         """
         Initialize context metadata.
@@ -35,6 +102,8 @@ class ContextMetadata:
             source: Information about the context source
             category: Context category (e.g., conversation, session)
             metadata: Additional metadata
+            max_history: Maximum history entries kept, oldest dropped first
+                (None for unlimited)
         """
         self.context_id = context_id or f"ctx-{uuid.uuid4()}"
         self.source = source or {}
@@ -43,6 +112,7 @@ class ContextMetadata:
         self.created_at = time.time()
         self.updated_at = time.time()
         self.history = []
+        self.max_history = max_history
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -62,12 +132,13 @@ class ContextMetadata:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ContextMetadata":
+    def from_dict(cls, data: Dict[str, Any], max_history: Optional[int] = None) -> "ContextMetadata":
         """
         Create metadata from a dictionary.
         
         Args:
             data: Dictionary representation of metadata
+            max_history: Maximum history entries kept (None for unlimited)
             
         Returns:
             ContextMetadata instance
@@ -76,7 +147,8 @@ class ContextMetadata:
             context_id=data.get("context_id"),
             source=data.get("source"),
             category=data.get("category"),
-            metadata=data.get("metadata")
+            metadata=data.get("metadata"),
+            max_history=max_history
         )
         
         # Set timestamps if provided
@@ -102,6 +174,8 @@ class ContextMetadata:
             "timestamp": time.time(),
             "details": details or {}
         })
+        if self.max_history is not None and len(self.history) > self.max_history:
+            del self.history[:len(self.history) - self.max_history]
         self.updated_at = time.time()
 
 
@@ -113,15 +187,44 @@ class ContextManager:
     contexts for multimodal information processing.
     """
     
-    def __init__(self):
-        """Initialize the context manager."""
+    def __init__(
+        self,
+        max_contexts: Optional[int] = None,
+        context_ttl: Optional[float] = None,
+        max_history: Optional[int] = None,
+        spill_dir: Optional[str] = None
+    ):
+        """
+        Initialize the context manager.
+        
+        Args:
+            max_contexts: Maximum contexts held in memory; the least recently
+                used is evicted beyond this (None for unlimited)
+            context_ttl: Seconds a context may go unused before it expires
+                (None for no expiry)
+            max_history: Maximum history entries kept per context
+                (None for unlimited)
+            spill_dir: Directory evicted and expired contexts are written to
+                and restored from on access (None discards them)
+        """
         self.contexts: Dict[str, Dict[str, Any]] = {}
         self.metadata: Dict[str, ContextMetadata] = {}
+        self.max_contexts = max_contexts
+        self.context_ttl = context_ttl
+        self.max_history = max_history
+        self.spill_dir = spill_dir
         self._callbacks: Dict[str, List[Callable[[str, Dict[str, Any]], None]]] = {
             "context_created": [],
             "context_updated": []
         }
         
+        # Last use of each context, least recently used first
+        self._last_used: "OrderedDict[str, float]" = OrderedDict()
+        self._stats = {"evicted": 0, "expired": 0, "spilled": 0, "restored": 0}
+        
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+        
         logger.info("Context manager initialized")
     
     async def create_context(
@@ -150,12 +253,12 @@ class ContextManager:
             context_id=context_id,
             source=source,
             category=category,
-            metadata=metadata
+            metadata=metadata,
+            max_history=self.max_history
         )
         
         # Store context and metadata
-        self.contexts[ctx_metadata.context_id] = data or {}
-        self.metadata[ctx_metadata.context_id] = ctx_metadata
+        self._store(ctx_metadata.context_id, data or {}, ctx_metadata)
         
         # Add history entry
         ctx_metadata.add_history_entry("created", {
@@ -184,7 +287,9 @@ class ContextManager:
         Returns:
             Context data or None if not found
         """
-        return self.contexts.get(context_id)
+        if not self._touch(context_id):
+            return None
+        return self.contexts[context_id]
     
     async def get_context_metadata(self, context_id: str) -> Optional[ContextMetadata]:
         """
@@ -196,6 +301,8 @@ class ContextManager:
         Returns:
             ContextMetadata or None if not found
         """
+        if not self._touch(context_id):
+            return None
         return self.metadata.get(context_id)
     
     async def update_context(
@@ -215,7 +322,7 @@ class ContextManager:
         Returns:
             True if update successful
         """
-        if context_id not in self.contexts:
+        if not self._touch(context_id):
             logger.warning(f"Context not found: {context_id}")
             return False
             
@@ -255,23 +362,24 @@ class ContextManager:
             New context ID or None if any context is not found
         """
         # Check if all contexts exist
-        merged_data = {}
+        contexts = []
         sources = []
         categories = set()
         
         for context_id in context_ids:
-            if context_id not in self.contexts:
+            if not self._touch(context_id):
                 logger.warning(f"Context not found: {context_id}")
                 return None
-                
-            # Merge data
-            merged_data = self._deep_merge(merged_data, self.contexts[context_id])
+            contexts.append(self.contexts[context_id])
             
             # Collect sources and categories
             if context_id in self.metadata:
                 sources.append(self.metadata[context_id].source)
                 categories.add(self.metadata[context_id].category)
                 
+        # Merge data
+        merged_data = merge_shared({}, *contexts)
+        
         # Determine category based on merged contexts
         merged_category = next(iter(categories)) if len(categories) == 1 else "merged"
                 
@@ -318,22 +426,186 @@ class ContextManager:
         Returns:
             True if deletion successful
         """
-        if context_id not in self.contexts:
+        spilled = self._spill_path(context_id)
+        if context_id not in self.contexts and not (spilled and os.path.exists(spilled)):
             logger.warning(f"Context not found: {context_id}")
             return False
             
         # Remove context and metadata
-        del self.contexts[context_id]
-        if context_id in self.metadata:
-            del self.metadata[context_id]
+        self._drop(context_id)
+        if spilled and os.path.exists(spilled):
+            os.remove(spilled)
             
         logger.info(f"Deleted context: {context_id}")
         return True
     
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get context storage statistics.
+        
+        Returns:
+            Dictionary with in-memory count, limits, and eviction counters
+        """
+        return dict(
+            self._stats,
+            contexts=len(self.contexts),
+            max_contexts=self.max_contexts,
+            context_ttl=self.context_ttl
+        )
+    
+    def _store(self, context_id: str, data: Dict[str, Any], ctx_metadata: ContextMetadata):
+        """
+        Store a context as the most recently used, evicting to stay in bounds.
+        
+        Args:
+            context_id: Context ID
+            data: Context data
+            ctx_metadata: Context metadata
+        """
+        now = time.time()
+        self._expire(now)
+        self.contexts[context_id] = data
+        self.metadata[context_id] = ctx_metadata
+        self._last_used[context_id] = now
+        self._last_used.move_to_end(context_id)
+        
+        if self.max_contexts is not None:
+            while len(self._last_used) > self.max_contexts:
+                oldest_id = next(iter(self._last_used))
+                self._evict(oldest_id)
+                self._stats["evicted"] += 1
+    
+    def _touch(self, context_id: str) -> bool:
+        """
+        Mark a context as used, restoring it from the spill directory if needed.
+        
+        Args:
+            context_id: Context ID
+            
+        Returns:
+            True if the context is now in memory
+        """
+        now = time.time()
+        self._expire(now)
+        if context_id in self._last_used:
+            self._last_used[context_id] = now
+            self._last_used.move_to_end(context_id)
+            return True
+        return self._restore(context_id)
+    
+    def _expire(self, now: float):
+        """
+        Evict contexts unused for longer than the TTL.
+        
+        Contexts are kept in least-recently-used order, so this stops at the
+        first context still within its TTL.
+        
+        Args:
+            now: Current time
+        """
+        if self.context_ttl is None:
+            return
+        cutoff = now - self.context_ttl
+        while self._last_used:
+            context_id, last_used = next(iter(self._last_used.items()))
+            if last_used > cutoff:
+                break
+            self._evict(context_id)
+            self._stats["expired"] += 1
+    
+    def _evict(self, context_id: str):
+        """
+        Remove a context from memory, spilling it first if configured.
+        
+        Args:
+            context_id: Context ID
+        """
+        if self.spill_dir:
+            self._spill(context_id)
+        self._drop(context_id)
+        logger.debug(f"Evicted context {context_id}")
+    
+    def _drop(self, context_id: str):
+        """Remove a context and its metadata from memory."""
+        self.contexts.pop(context_id, None)
+        self.metadata.pop(context_id, None)
+        self._last_used.pop(context_id, None)
+    
+    def _spill_path(self, context_id: str) -> Optional[str]:
+        """Get the spill file for a context, or None without a spill directory."""
+        if not self.spill_dir:
+            return None
+        # The readable prefix may collide after sanitizing; the hash does not
+        digest = hashlib.sha256(context_id.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.spill_dir, f"{_UNSAFE_FILENAME.sub('_', context_id)[:64]}-{digest}.json")
+    
+    def _spill(self, context_id: str):
+        """
+        Write a context and its metadata to the spill directory.
+        
+        Args:
+            context_id: Context ID
+        """
+        ctx_metadata = self.metadata.get(context_id)
+        record = {
+            "context_id": context_id,
+            "data": self.contexts.get(context_id, {}),
+            "metadata": ctx_metadata.to_dict() if ctx_metadata else None
+        }
+        path = self._spill_path(context_id)
+        try:
+            payload = json.dumps(record)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cannot spill context {context_id}, discarding it: {e}")
+            return
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w") as f:
+                f.write(payload)
+            os.replace(temp_path, path)
+            self._stats["spilled"] += 1
+        except OSError as e:
+            logger.error(f"Error spilling context {context_id}: {e}")
+    
+    def _restore(self, context_id: str) -> bool:
+        """
+        Load a spilled context back into memory.
+        
+        Args:
+            context_id: Context ID
+            
+        Returns:
+            True if the context was restored
+        """
+        path = self._spill_path(context_id)
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            with open(path, "r") as f:
+                record = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error restoring context {context_id}: {e}")
+            return False
+        if record.get("context_id") != context_id:
+            return False
+        
+        os.remove(path)
+        if record.get("metadata"):
+            ctx_metadata = ContextMetadata.from_dict(record["metadata"], max_history=self.max_history)
+        else:
+            ctx_metadata = ContextMetadata(context_id=context_id, max_history=self.max_history)
+        self._store(context_id, record.get("data") or {}, ctx_metadata)
+        self._stats["restored"] += 1
+        logger.debug(f"Restored context {context_id}")
+        return True
+    
     def _deep_merge(self, base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deep merge two dictionaries.
         
+        Only the dictionaries on updated paths are copied; all other
+        subtrees are shared with base and updates.
+        
         Args:
             base: Base dictionary
             updates: Updates to apply
@@ -341,17 +613,7 @@ class ContextManager:
         Returns:
             Merged dictionary
         """
-        result = base.copy()
-        
-        for key, value in updates.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                # Replace or add value
-                result[key] = value
-                
-        return result
+        return merge_shared(base, updates)
     
     def on_context_created(self, callback: Callable[[str, Dict[str, Any]], None]):
         """
@@ -379,12 +641,19 @@ def get_context_manager() -> ContextManager:
     """
     Get the global context manager, creating it if needed.
     
+    Unlike a ContextManager constructed directly, the global manager is
+    bounded by GLOBAL_MAX_CONTEXTS, GLOBAL_CONTEXT_TTL and GLOBAL_MAX_HISTORY.
+    
     Returns:
         Global ContextManager instance
     """
     global _global_context_manager
     if _global_context_manager is None:
-        _global_context_manager = ContextManager()
+        _global_context_manager = ContextManager(
+            max_contexts=GLOBAL_MAX_CONTEXTS,
+            context_ttl=GLOBAL_CONTEXT_TTL,
+            max_history=GLOBAL_MAX_HISTORY
+        )
     return _global_context_manager
 
 async def create_context(
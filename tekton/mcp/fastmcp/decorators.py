@@ -31,7 +31,12 @@ class MCPToolMeta:
         category: Optional[str] = None,
         version: Optional[str] = None,
         endpoint: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        execution_mode: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        cacheable: bool = False,
+        cache_ttl: Optional[float] = None
     ):
         """
         Initialize tool metadata.
@@ -47,6 +52,11 @@ class MCPToolMeta:
             version: Tool version
             endpoint: Tool endpoint
             metadata: Additional metadata
+            execution_mode: How the tool registry runs the tool (inline, thread, process)
+            max_concurrency: Maximum concurrent executions
+            timeout: Execution deadline in seconds
+            cacheable: Whether results may be cached (pure, idempotent tools)
+            cache_ttl: Seconds a cached result stays valid
         """
         self.id = f"tool-{uuid.uuid4()}"
         self.name = name
@@ -59,6 +69,11 @@ class MCPToolMeta:
         self.version = version or "1.0.0"
         self.endpoint = endpoint
         self.metadata = metadata or {}
+        self.execution_mode = execution_mode
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cacheable = cacheable
+        self.cache_ttl = cache_ttl
         self.registered_at = None
         self.function = None
         
@@ -82,6 +97,11 @@ class MCPToolMeta:
             "version": self.version,
             "endpoint": self.endpoint,
             "metadata": self.metadata,
+            "execution_mode": self.execution_mode,
+            "max_concurrency": self.max_concurrency,
+            "timeout": self.timeout,
+            "cacheable": self.cacheable,
+            "cache_ttl": self.cache_ttl,
             "registered_at": self.registered_at
         }
         
@@ -103,7 +123,12 @@ def mcp_tool(
     category: Optional[str] = None,
     version: Optional[str] = None,
     endpoint: Optional[str] = None,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    execution_mode: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    cacheable: bool = False,
+    cache_ttl: Optional[float] = None
 ) -> Callable:
     """
     Decorator for MCP tools.
@@ -119,6 +144,12 @@ def mcp_tool(
         version: Tool version
         endpoint: Tool endpoint
         metadata: Additional metadata
+        execution_mode: How the tool registry runs the tool: "inline", "thread"
+            or "process" (defaults to inline for coroutines, thread otherwise)
+        max_concurrency: Maximum concurrent executions in the tool registry
+        timeout: Execution deadline in seconds in the tool registry
+        cacheable: Whether the tool registry may cache results (pure, idempotent tools)
+        cache_ttl: Seconds a cached result stays valid
         
     Returns:
         Decorated function
@@ -174,7 +205,12 @@ def mcp_tool(
             category=category,
             version=version,
             endpoint=endpoint,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            execution_mode=execution_mode,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            cacheable=cacheable,
+            cache_ttl=cache_ttl
         )
         
         # Set metadata on function
@@ -183,6 +219,14 @@ def mcp_tool(
         # Register tool
         tool_meta.register(func)
         
+        # Keep coroutine functions recognizable as such
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await func(*args, **kwargs)
+                
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             return func(*args, **kwargs)
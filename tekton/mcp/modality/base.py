@@ -5,13 +5,19 @@ This module defines the base class for modality processors,
 which handle different types of content in the MCP protocol.
 """
 
+import asyncio
+import functools
 import logging
+from concurrent.futures import Executor
 from typing import Dict, List, Any, Optional, Union, Type, Callable
 
 from tekton.mcp.message import MCPContentItem
 
 logger = logging.getLogger(__name__)
 
+# Payloads at least this large (in characters) are analyzed off the event loop
+DEFAULT_OFFLOAD_THRESHOLD = 16384
+
 class ModalityProcessor:
     """
     Base class for modality processors.
@@ -22,7 +28,32 @@ class ModalityProcessor:
     
     def __init__(self):
         """Initialize the modality processor."""
-        pass
+        # Executor for CPU-bound analysis (None uses the loop's default
+        # thread pool); set by MessageProcessor
+        self.executor: Optional[Executor] = None
+        self.offload_threshold = DEFAULT_OFFLOAD_THRESHOLD
+    
+    async def run_analysis(self, func: Callable[..., Any], *args: Any, size: int = 0) -> Any:
+        """
+        Run a CPU-bound analysis function.
+        
+        Small payloads run inline, since handing them to a pool costs more
+        than the analysis. Larger ones run in the executor so the event loop
+        keeps serving other messages. With a process pool the function and
+        its arguments must be picklable, so pass module-level functions.
+        
+        Args:
+            func: Analysis function
+            *args: Arguments for the function
+            size: Payload size used against the offload threshold
+            
+        Returns:
+            The function's result
+        """
+        if size < self.offload_threshold:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args))
     
     async def process(
         self,
@@ -2,8 +2,13 @@
 Code Processor - Processor for code content.
 
 This module provides a processor for code content in the MCP protocol.
+
+The analysis itself lives in module-level functions using precompiled
+patterns, so it can run in a thread or process pool (see
+ModalityProcessor.run_analysis) without pickling the processor.
 """
 
+import bisect
 import logging
 import re
 from typing import Dict, List, Any, Optional, Union
@@ -13,6 +18,245 @@ from tekton.mcp.modality.base import ModalityProcessor
 
 logger = logging.getLogger(__name__)
 
+# Format hints mapped to languages
+FORMAT_TO_LANGUAGE = {
+    "text/x-python": "python",
+    "text/javascript": "javascript",
+    "text/x-java": "java",
+    "text/x-c": "c",
+    "text/x-c++": "cpp",
+    "text/x-csharp": "csharp",
+    "text/x-ruby": "ruby",
+    "text/x-go": "go",
+    "text/x-rust": "rust",
+    "application/json": "json"
+}
+
+# Language indicators, checked in order
+# These are very simplistic rules that would be much more sophisticated in reality
+_LANGUAGE_PATTERNS = [
+    ("python", (re.compile(r"def\s+\w+\s*\(.*\):"),)),
+    ("javascript", (re.compile(r"function\s+\w+\s*\(.*\)"), re.compile(r"const\s+\w+\s*="))),
+    ("java", (re.compile(r"public\s+class\s+\w+"),)),
+    ("cpp", (re.compile(r"#include"),)),
+    ("csharp", (re.compile(r"using\s+System;"),)),
+    ("rust", (re.compile(r"fn\s+\w+\s*\("),)),
+    ("go", (re.compile(r"package\s+main"),)),
+    ("ruby", (re.compile(r"require\s+[\"']"),)),
+]
+_JSON_START = re.compile(r"^\s*\{")
+_JSON_END = re.compile(r"\}\s*$")
+
+_NEWLINE = re.compile(r"\n")
+
+_PYTHON_FUNCTION = re.compile(r"def\s+(\w+)\s*\((.*?)\):")
+_PYTHON_CLASS = re.compile(r"class\s+(\w+)(?:\((.*?)\))?:")
+_JS_FUNCTION = re.compile(r"function\s+(\w+)\s*\((.*?)\)")
+_JS_ARROW_FUNCTION = re.compile(r"(const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\((.*?)\)\s*=>")
+_JS_CLASS = re.compile(r"class\s+(\w+)(?:\s+extends\s+(\w+))?")
+
+_CONTROL_STRUCTURES = {
+    "python": re.compile(r"\bif\b|\belif\b|\belse\b|\bfor\b|\bwhile\b|\btry\b|\bexcept\b"),
+    "javascript": re.compile(r"\bif\b|\belse\b|\bfor\b|\bwhile\b|\bswitch\b|\btry\b|\bcatch\b"),
+}
+
+_IMPORTS = {
+    "python": re.compile(r"(?:import|from)\s+([\w\.]+)"),
+    "javascript": re.compile(r"(?:import|require)\s+[\"']([\w\.\/\-]+)[\"']"),
+}
+
+
+def detect_language(code: str, format_hint: str) -> str:
+    """
+    Detect the programming language of code.
+    
+    Args:
+        code: Code to analyze
+        format_hint: Format hint from content item
+        
+    Returns:
+        Detected language
+    """
+    # Check format hint first
+    if format_hint in FORMAT_TO_LANGUAGE:
+        return FORMAT_TO_LANGUAGE[format_hint]
+        
+    # Check for language indicators in the code
+    for language, patterns in _LANGUAGE_PATTERNS:
+        if any(pattern.search(code) for pattern in patterns):
+            return language
+    if _JSON_START.search(code) and _JSON_END.search(code):
+        return "json"
+    return "unknown"
+
+
+def analyze_code(code: str, language: str) -> Dict[str, Any]:
+    """
+    Analyze code and build the CodeProcessor result.
+    
+    Args:
+        code: Code to analyze
+        language: Programming language
+        
+    Returns:
+        Processing result with metrics and analysis
+    """
+    # Count lines and characters
+    line_count = len(code.splitlines())
+    char_count = len(code)
+    
+    # Analyze code structure (simplified)
+    structure_analysis = analyze_structure(code, language)
+    
+    return {
+        "original_code": code,
+        "language": language,
+        "metrics": {
+            "line_count": line_count,
+            "char_count": char_count,
+            "function_count": len(structure_analysis.get("functions", [])),
+            "class_count": len(structure_analysis.get("classes", []))
+        },
+        "analysis": {
+            "structure": structure_analysis,
+            "complexity": analyze_complexity(code, language),
+            "imports": extract_imports(code, language)
+        },
+        "processed": True
+    }
+
+
+def analyze_structure(code: str, language: str) -> Dict[str, Any]:
+    """
+    Analyze the structure of code.
+    
+    Args:
+        code: Code to analyze
+        language: Programming language
+        
+    Returns:
+        Structure analysis result
+    """
+    # In a real implementation, this would use language-specific parsers
+    # For now, just use some basic regex patterns for common constructs
+    
+    result = {
+        "functions": [],
+        "classes": [],
+        "imports": []
+    }
+    
+    if language not in ("python", "javascript"):
+        return result
+    
+    # Offsets of every newline, so a match's line number is a bisect
+    # rather than a count over everything before it
+    newlines = [match.start() for match in _NEWLINE.finditer(code)]
+    
+    def line_of(match):
+        return bisect.bisect_left(newlines, match.start()) + 1
+    
+    # Extract function and class definitions
+    if language == "python":
+        # Find Python functions
+        for match in _PYTHON_FUNCTION.finditer(code):
+            result["functions"].append({
+                "name": match.group(1),
+                "params": match.group(2),
+                "line": line_of(match)
+            })
+            
+        # Find Python classes
+        for match in _PYTHON_CLASS.finditer(code):
+            result["classes"].append({
+                "name": match.group(1),
+                "inherits": match.group(2) or "",
+                "line": line_of(match)
+            })
+            
+    else:
+        # Find JavaScript functions
+        for match in _JS_FUNCTION.finditer(code):
+            result["functions"].append({
+                "name": match.group(1),
+                "params": match.group(2),
+                "line": line_of(match)
+            })
+            
+        # Find JavaScript arrow functions and const functions
+        for match in _JS_ARROW_FUNCTION.finditer(code):
+            result["functions"].append({
+                "name": match.group(2),
+                "params": match.group(3),
+                "type": "arrow",
+                "line": line_of(match)
+            })
+            
+        # Find JavaScript classes
+        for match in _JS_CLASS.finditer(code):
+            result["classes"].append({
+                "name": match.group(1),
+                "inherits": match.group(2) or "",
+                "line": line_of(match)
+            })
+    
+    return result
+
+
+def analyze_complexity(code: str, language: str) -> Dict[str, Any]:
+    """
+    Analyze the complexity of code.
+    
+    Args:
+        code: Code to analyze
+        language: Programming language
+        
+    Returns:
+        Complexity analysis result
+    """
+    # In a real implementation, this would use more sophisticated metrics
+    # For now, just use some basic counting
+    
+    # Count control structures
+    control_count = 0
+    pattern = _CONTROL_STRUCTURES.get(language)
+    if pattern is not None:
+        control_count = sum(1 for _ in pattern.finditer(code))
+    
+    # Calculate nesting level (simplified)
+    max_indentation = 0
+    for line in code.splitlines():
+        stripped = line.lstrip()
+        if stripped:  # Skip empty lines
+            max_indentation = max(max_indentation, len(line) - len(stripped))
+    
+    # Estimate nesting level based on indentation
+    estimated_nesting = max_indentation // 2 if language == "python" else max_indentation // 4
+    
+    return {
+        "control_structures": control_count,
+        "max_nesting": estimated_nesting,
+        "estimation": "simplified"
+    }
+
+
+def extract_imports(code: str, language: str) -> List[str]:
+    """
+    Extract imports from code.
+    
+    Args:
+        code: Code to analyze
+        language: Programming language
+        
+    Returns:
+        List of extracted imports
+    """
+    pattern = _IMPORTS.get(language)
+    if pattern is None:
+        return []
+    return [match.group(1) for match in pattern.finditer(code)]
+
+
 class CodeProcessor(ModalityProcessor):
     """
     Processor for code content.
@@ -54,38 +298,12 @@ class CodeProcessor(ModalityProcessor):
         # Determine code language
         language = content_item.metadata.get("language")
         if not language:
-            language = self._detect_language(code_data, content_item.format)
+            language = detect_language(code_data, content_item.format)
             
         # Process the code
         # For now, just do basic analysis; this would normally involve
         # more sophisticated parsing and analysis
-        
-        # Count lines and characters
-        line_count = len(code_data.splitlines())
-        char_count = len(code_data)
-        
-        # Analyze code structure (simplified)
-        structure_analysis = self._analyze_structure(code_data, language)
-        
-        # Create processed result
-        processed_result = {
-            "original_code": code_data,
-            "language": language,
-            "metrics": {
-                "line_count": line_count,
-                "char_count": char_count,
-                "function_count": len(structure_analysis.get("functions", [])),
-                "class_count": len(structure_analysis.get("classes", []))
-            },
-            "analysis": {
-                "structure": structure_analysis,
-                "complexity": self._analyze_complexity(code_data, language),
-                "imports": self._extract_imports(code_data, language)
-            },
-            "processed": True
-        }
-        
-        return processed_result
+        return await self.run_analysis(analyze_code, code_data, language, size=len(code_data))
     
     async def validate(self, content_item: MCPContentItem) -> bool:
         """
@@ -135,185 +353,3 @@ class CodeProcessor(ModalityProcessor):
             "text/x-rust",
             "application/json"
         ]
-    
-    def _detect_language(self, code: str, format_hint: str) -> str:
-        """
-        Detect the programming language of code.
-        
-        Args:
-            code: Code to analyze
-            format_hint: Format hint from content item
-            
-        Returns:
-            Detected language
-        """
-        # Check format hint first
-        format_to_language = {
-            "text/x-python": "python",
-            "text/javascript": "javascript",
-            "text/x-java": "java",
-            "text/x-c": "c",
-            "text/x-c++": "cpp",
-            "text/x-csharp": "csharp",
-            "text/x-ruby": "ruby",
-            "text/x-go": "go",
-            "text/x-rust": "rust",
-            "application/json": "json"
-        }
-        
-        if format_hint in format_to_language:
-            return format_to_language[format_hint]
-            
-        # Check for language indicators in the code
-        # These are very simplistic rules that would be much more sophisticated in reality
-        if re.search(r"def\s+\w+\s*\(.*\):", code):
-            return "python"
-        elif re.search(r"function\s+\w+\s*\(.*\)", code) or re.search(r"const\s+\w+\s*=", code):
-            return "javascript"
-        elif re.search(r"public\s+class\s+\w+", code):
-            return "java"
-        elif re.search(r"#include", code):
-            return "cpp"
-        elif re.search(r"using\s+System;", code):
-            return "csharp"
-        elif re.search(r"fn\s+\w+\s*\(", code):
-            return "rust"
-        elif re.search(r"package\s+main", code):
-            return "go"
-        elif re.search(r"require\s+[\"']", code):
-            return "ruby"
-        elif re.search(r"^\s*\{", code) and re.search(r"\}\s*$", code):
-            return "json"
-        else:
-            return "unknown"
-    
-    def _analyze_structure(self, code: str, language: str) -> Dict[str, Any]:
-        """
-        Analyze the structure of code.
-        
-        Args:
-            code: Code to analyze
-            language: Programming language
-            
-        Returns:
-            Structure analysis result
-        """
-        # In a real implementation, this would use language-specific parsers
-        # For now, just use some basic regex patterns for common constructs
-        
-        result = {
-            "functions": [],
-            "classes": [],
-            "imports": []
-        }
-        
-        # Extract function and class definitions
-        if language == "python":
-            # Find Python functions
-            for match in re.finditer(r"def\s+(\w+)\s*\((.*?)\):", code):
-                result["functions"].append({
-                    "name": match.group(1),
-                    "params": match.group(2),
-                    "line": code[:match.start()].count("\n") + 1
-                })
-                
-            # Find Python classes
-            for match in re.finditer(r"class\s+(\w+)(?:\((.*?)\))?:", code):
-                result["classes"].append({
-                    "name": match.group(1),
-                    "inherits": match.group(2) or "",
-                    "line": code[:match.start()].count("\n") + 1
-                })
-                
-        elif language == "javascript":
-            # Find JavaScript functions
-            for match in re.finditer(r"function\s+(\w+)\s*\((.*?)\)", code):
-                result["functions"].append({
-                    "name": match.group(1),
-                    "params": match.group(2),
-                    "line": code[:match.start()].count("\n") + 1
-                })
-                
-            # Find JavaScript arrow functions and const functions
-            for match in re.finditer(r"(const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\((.*?)\)\s*=>", code):
-                result["functions"].append({
-                    "name": match.group(2),
-                    "params": match.group(3),
-                    "type": "arrow",
-                    "line": code[:match.start()].count("\n") + 1
-                })
-                
-            # Find JavaScript classes
-            for match in re.finditer(r"class\s+(\w+)(?:\s+extends\s+(\w+))?", code):
-                result["classes"].append({
-                    "name": match.group(1),
-                    "inherits": match.group(2) or "",
-                    "line": code[:match.start()].count("\n") + 1
-                })
-        
-        return result
-    
-    def _analyze_complexity(self, code: str, language: str) -> Dict[str, Any]:
-        """
-        Analyze the complexity of code.
-        
-        Args:
-            code: Code to analyze
-            language: Programming language
-            
-        Returns:
-            Complexity analysis result
-        """
-        # In a real implementation, this would use more sophisticated metrics
-        # For now, just use some basic counting
-        
-        # Count control structures
-        control_count = 0
-        
-        if language == "python":
-            # Count Python control structures
-            control_count += len(re.findall(r"\bif\b|\belif\b|\belse\b|\bfor\b|\bwhile\b|\btry\b|\bexcept\b", code))
-        elif language == "javascript":
-            # Count JavaScript control structures
-            control_count += len(re.findall(r"\bif\b|\belse\b|\bfor\b|\bwhile\b|\bswitch\b|\btry\b|\bcatch\b", code))
-        
-        # Calculate nesting level (simplified)
-        lines = code.splitlines()
-        max_indentation = 0
-        for line in lines:
-            if line.strip():  # Skip empty lines
-                indentation = len(line) - len(line.lstrip())
-                max_indentation = max(max_indentation, indentation)
-        
-        # Estimate nesting level based on indentation
-        estimated_nesting = max_indentation // 2 if language == "python" else max_indentation // 4
-        
-        return {
-            "control_structures": control_count,
-            "max_nesting": estimated_nesting,
-            "estimation": "simplified"
-        }
-    
-    def _extract_imports(self, code: str, language: str) -> List[str]:
-        """
-        Extract imports from code.
-        
-        Args:
-            code: Code to analyze
-            language: Programming language
-            
-        Returns:
-            List of extracted imports
-        """
-        imports = []
-        
-        if language == "python":
-            # Find Python imports
-            for match in re.finditer(r"(?:import|from)\s+([\w\.]+)", code):
-                imports.append(match.group(1))
-        elif language == "javascript":
-            # Find JavaScript imports
-            for match in re.finditer(r"(?:import|require)\s+[\"']([\w\.\/\-]+)[\"']", code):
-                imports.append(match.group(1))
-        
-        return imports
\ No newline at end of file
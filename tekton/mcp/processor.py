@@ -3,10 +3,13 @@ Message Processor - Core processing pipeline for MCP messages.
 
 This module provides the processing pipeline for MCP messages,
 coordinating content extraction, modality processing, and response generation.
+Content items of a message are processed concurrently, and large payloads
+are analyzed in an executor so a big item does not stall the event loop.
 """
 
 import asyncio
 import logging
+from concurrent.futures import Executor
 from typing import Dict, List, Any, Optional, Union, Type, Callable
 
 from tekton.mcp.message import (
@@ -40,14 +43,29 @@ class MessageProcessor:
     coordinating extraction, modality processing, and response generation.
     """
     
-    def __init__(self, context_manager: Optional[ContextManager] = None):
+    def __init__(
+        self,
+        context_manager: Optional[ContextManager] = None,
+        executor: Optional[Executor] = None,
+        max_concurrency: Optional[int] = None,
+        offload_threshold: Optional[int] = None
+    ):
         """
         Initialize the message processor.
         
         Args:
-            context_manager: Context manager to use (uses global one if None)
+            context_manager: Context manager to use (uses the bounded global
+                one if None)
+            executor: Executor for CPU-bound modality analysis; a
+                ProcessPoolExecutor gives true parallelism (None uses the
+                event loop's default thread pool)
+            max_concurrency: Maximum content items of one message processed
+                at once (None for no limit)
+            offload_threshold: Payload size from which analysis runs in the
+                executor (None keeps each processor's default)
         """
         self.context_manager = context_manager
+        self.max_concurrency = max_concurrency
         
         # Initialize modality processors
         self.modality_processors = {
@@ -56,6 +74,10 @@ class MessageProcessor:
             "image": ImageProcessor(),
             "structured": StructuredDataProcessor()
         }
+        for processor in self.modality_processors.values():
+            processor.executor = executor
+            if offload_threshold is not None:
+                processor.offload_threshold = offload_threshold
         
         logger.info("Message processor initialized")
     
@@ -120,17 +142,7 @@ class MessageProcessor:
                 msg.context["context_id"] = context_id
             
             # Process content items
-            processed_items = []
-            for item in msg.content:
-                try:
-                    processed_item = await self._process_content_item(
-                        item, 
-                        msg.context
-                    )
-                    processed_items.append(processed_item)
-                except Exception as e:
-                    logger.error(f"Error processing content item: {e}")
-                    # Continue with other items
+            processed_items = await self._process_content_items(msg.content, msg.context)
             
             # Generate response
             response_content = await self._generate_response(
@@ -154,6 +166,43 @@ class MessageProcessor:
                 error_message=f"Error processing message: {e}"
             )
     
+    async def _process_content_items(
+        self,
+        content_items: List[MCPContentItem],
+        context: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process the content items of a message concurrently.
+        
+        Items that fail are logged and left out; the rest keep their
+        original order.
+        
+        Args:
+            content_items: Content items to process
+            context: Message context
+            
+        Returns:
+            Processed content results, in message order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        
+        async def process(item: MCPContentItem) -> Optional[Dict[str, Any]]:
+            try:
+                if semaphore is None:
+                    return await self._process_content_item(item, context)
+                async with semaphore:
+                    return await self._process_content_item(item, context)
+            except Exception as e:
+                logger.error(f"Error processing content item: {e}")
+                # Continue with other items
+                return None
+        
+        if len(content_items) == 1:
+            results = [await process(content_items[0])]
+        else:
+            results = await asyncio.gather(*(process(item) for item in content_items))
+        return [result for result in results if result is not None]
+    
     async def _process_content_item(
         self,
         content_item: MCPContentItem,
@@ -3,16 +3,163 @@ Tool Registry - Registry for MCP tools and their capabilities.
 
 This module provides a registry for MCP tools, allowing them to
 advertise their capabilities and be discovered by clients.
+
+Tools run in one of three execution modes, set per tool with the
+"execution_mode" key of the tool spec (or the mcp_tool decorator):
+
+- "inline": called on the event loop (the default for coroutine functions)
+- "thread": called in a shared thread pool (the default for plain functions)
+- "process": called in a shared process pool, for CPU-heavy tools; the
+  function and parameters must be picklable
+
+"max_concurrency" limits concurrent executions of a tool and "timeout" sets
+its deadline in seconds, covering the wait for a concurrency slot as well as
+execution. Thread-mode tools accepting a ``cancel_event`` parameter receive a
+threading.Event that is set when their call is cancelled or times out.
+
+Tools declared "cacheable" (pure, idempotent tools) have their successful
+results memoized in a TTL/LRU cache keyed by tool ID and canonicalized
+parameters; "cache_ttl" overrides the registry's default lifetime. Each
+caller gets its own copy of a cached result, and executed callbacks fire
+for cache hits with "cached" set.
+
+Tag and capability lookups use inverted indexes built from the tool spec at
+registration, so a tool whose tags or capabilities change must be
+registered again.
 """
 
+import copy
+import json
 import time
 import uuid
+import inspect
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Set, Callable, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor
+from typing import Dict, List, Any, Optional, Set, Callable, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+EXECUTION_MODES = ("inline", "thread", "process")
+
+# Spec keys controlling execution, also read from mcp_tool metadata
+EXECUTION_SETTINGS = ("execution_mode", "max_concurrency", "timeout", "cacheable", "cache_ttl")
+
+# Default result cache size (entries) and entry lifetime (seconds)
+DEFAULT_RESULT_CACHE_SIZE = 1024
+DEFAULT_RESULT_CACHE_TTL = 300.0
+
+# Distinct capability queries memoized between tool set changes
+CAPABILITY_QUERY_CACHE_SIZE = 256
+
+
+def _call_tool(func: Callable, parameters: Dict[str, Any]) -> Tuple[float, Any, float]:
+    """
+    Call a tool function, timing the call where it actually runs.
+    
+    Module level so that it can be sent to a process pool.
+    
+    Returns:
+        Tuple of (start time, result, end time) as wall-clock timestamps
+    """
+    started = time.time()
+    result = func(**parameters)
+    return started, result, time.time()
+
+
+def _release_threadsafe(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+    """Release a semaphore from a worker thread, unless its loop has gone."""
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(semaphore.release)
+
+
+class ResultCache:
+    """LRU cache of tool results whose entries expire after a per-entry TTL."""
+    
+    def __init__(self, max_size: int = DEFAULT_RESULT_CACHE_SIZE):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Tuple[str, str]) -> Tuple[bool, Any]:
+        """
+        Look up an entry.
+        
+        Returns:
+            Tuple of (found, value)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+            self.expirations += 1
+        self.misses += 1
+        return False, None
+    
+    def put(self, key: Tuple[str, str], value: Any, ttl: float) -> None:
+        """Store an entry, evicting the least recently used one when full."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, tool_id: Optional[str] = None) -> int:
+        """
+        Drop entries for one tool, or all entries.
+        
+        Returns:
+            Number of entries dropped
+        """
+        if tool_id is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        keys = [key for key in self._entries if key[0] == tool_id]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size, hit/miss counts and hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
+def _cache_key(tool_id: str, parameters: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """Result cache key for a call, or None if the parameters are not JSON-serializable."""
+    try:
+        return tool_id, json.dumps(parameters, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+
+
 class ToolRegistry:
     """
     Registry for MCP tools and their capabilities.
@@ -21,14 +168,60 @@ class ToolRegistry:
     tools, and executing tool functions.
     """
     
-    def __init__(self):
-        """Initialize the tool registry."""
+    def __init__(self,
+                 default_sync_mode: str = "thread",
+                 max_workers: Optional[int] = None,
+                 max_processes: Optional[int] = None,
+                 default_timeout: Optional[float] = None,
+                 result_cache_size: int = DEFAULT_RESULT_CACHE_SIZE,
+                 default_cache_ttl: float = DEFAULT_RESULT_CACHE_TTL):
+        """
+        Initialize the tool registry.
+        
+        Args:
+            default_sync_mode: Execution mode for non-coroutine tools without one
+            max_workers: Thread pool size (None for the executor default)
+            max_processes: Process pool size (None for the number of CPUs)
+            default_timeout: Deadline in seconds for tools without one (None for no limit)
+            result_cache_size: Maximum cached results of cacheable tools
+            default_cache_ttl: Seconds a cached result lives for tools without a cache_ttl
+        """
+        if default_sync_mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {default_sync_mode}")
+            
         self.tools: Dict[str, Dict[str, Any]] = {}
         self._callbacks: Dict[str, List[Callable[[str, Dict[str, Any]], None]]] = {
             "registered": [],
             "executed": []
         }
         
+        # Execution settings, concurrency limits and metrics by tool ID
+        self.default_sync_mode = default_sync_mode
+        self.default_timeout = default_timeout
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+        self._execution: Dict[str, Dict[str, Any]] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Inverted indexes (tag / metadata capability -> tool IDs), registration
+        # order for stable results, and lowercased name + description for
+        # substring matches
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._capability_index: Dict[str, Set[str]] = {}
+        self._order: Dict[str, int] = {}
+        self._sequence = 0
+        self._search_text: Dict[str, Tuple[str, str]] = {}
+        
+        # Capability lookups by query (LRU, at most CAPABILITY_QUERY_CACHE_SIZE),
+        # cleared whenever the tool set changes
+        self._capability_queries: "OrderedDict[str, List[str]]" = OrderedDict()
+        
+        # Results of cacheable tools
+        self.default_cache_ttl = default_cache_ttl
+        self.result_cache = ResultCache(result_cache_size)
+        
         logger.info("Tool registry initialized")
     
     async def register_tool(
@@ -53,12 +246,21 @@ class ToolRegistry:
         # Generate ID if not provided
         tool_id = tool_spec.get("id") or f"tool-{uuid.uuid4()}"
         
+        # Resolve how the tool runs (raises ValueError for invalid settings)
+        execution = self._resolve_execution(tool_spec)
+        
         # Add registration metadata
         tool_spec["id"] = tool_id
         tool_spec["registered_at"] = time.time()
+        tool_spec["execution_mode"] = execution["mode"]
         
-        # Store tool
+        # Store tool (replacing any earlier registration under the same ID)
+        if tool_id in self.tools:
+            self._unindex_tool(tool_id)
         self.tools[tool_id] = tool_spec
+        self._execution[tool_id] = execution
+        self._stats[tool_id] = self._new_stats()
+        self._index_tool(tool_id, tool_spec)
         logger.info(f"Registered tool: {tool_spec['name']} ({tool_id})")
         
         # Trigger registered callbacks
@@ -70,6 +272,24 @@ class ToolRegistry:
         
         return tool_id
     
+    async def register_function(self, func: Callable) -> str:
+        """
+        Register a function decorated with fastmcp's mcp_tool.
+        
+        Args:
+            func: Decorated tool function
+            
+        Returns:
+            Tool ID
+        """
+        meta = getattr(func, "_mcp_tool_meta", None)
+        if meta is None:
+            raise ValueError(f"Function {getattr(func, '__name__', func)} has no MCP tool metadata")
+            
+        tool_spec = meta.to_dict()
+        tool_spec["function"] = func
+        return await self.register_tool(tool_spec)
+    
     async def unregister_tool(self, tool_id: str) -> bool:
         """
         Unregister a tool from the registry.
@@ -82,7 +302,10 @@ class ToolRegistry:
         """
         if tool_id in self.tools:
             tool = self.tools[tool_id]
+            self._unindex_tool(tool_id)
             del self.tools[tool_id]
+            self._execution.pop(tool_id, None)
+            self._stats.pop(tool_id, None)
             logger.info(f"Unregistered tool: {tool['name']} ({tool_id})")
             return True
             
@@ -101,38 +324,67 @@ class ToolRegistry:
         """
         return self.tools.get(tool_id)
     
+    def _index_tool(self, tool_id: str, tool: Dict[str, Any]) -> None:
+        """Add a tool to the lookup indexes."""
+        for tag in tool.get("tags", []) or []:
+            self._tag_index.setdefault(tag, set()).add(tool_id)
+        for capability in (tool.get("metadata", {}) or {}).get("capabilities", []) or []:
+            self._capability_index.setdefault(capability, set()).add(tool_id)
+        self._search_text[tool_id] = (
+            (tool.get("name", "") or "").lower(),
+            (tool.get("description", "") or "").lower()
+        )
+        self._sequence += 1
+        self._order[tool_id] = self._sequence
+        self._capability_queries.clear()
+    
+    def _unindex_tool(self, tool_id: str) -> None:
+        """Remove a tool from the lookup indexes and drop its cached results."""
+        for index in (self._tag_index, self._capability_index):
+            for key in [key for key, tool_ids in index.items() if tool_id in tool_ids]:
+                index[key].discard(tool_id)
+                if not index[key]:
+                    del index[key]
+        self._search_text.pop(tool_id, None)
+        self._order.pop(tool_id, None)
+        self._capability_queries.clear()
+        self.result_cache.invalidate(tool_id)
+    
+    def _in_order(self, tool_ids: Set[str]) -> List[str]:
+        """Tool IDs sorted by registration order."""
+        return sorted(tool_ids, key=self._order.__getitem__)
+    
     async def find_tools_by_capability(self, capability: str) -> List[Dict[str, Any]]:
         """
         Find tools with a specific capability.
         
+        A tool matches if the capability is one of its tags or metadata
+        capabilities, or appears in its name or description.
+        
         Args:
             capability: Capability to search for
             
         Returns:
             List of tools with the requested capability
         """
-        matching_tools = []
-        
-        for tool_id, tool in self.tools.items():
-            # Check capabilities in tool tags
-            tags = tool.get("tags", [])
-            if capability in tags:
-                matching_tools.append(tool)
-                continue
-                
-            # Check capabilities in tool metadata
-            metadata = tool.get("metadata", {})
-            capabilities = metadata.get("capabilities", [])
-            if capability in capabilities:
-                matching_tools.append(tool)
-                continue
-                
+        tool_ids = self._capability_queries.get(capability)
+        if tool_ids is not None:
+            self._capability_queries.move_to_end(capability)
+        else:
+            matching = set(self._tag_index.get(capability, ()))
+            matching.update(self._capability_index.get(capability, ()))
+            
             # Check if the capability is in the name or description
-            if (capability.lower() in tool.get("name", "").lower() or 
-                capability.lower() in tool.get("description", "").lower()):
-                matching_tools.append(tool)
+            needle = capability.lower()
+            for tool_id, (name, description) in self._search_text.items():
+                if needle in name or needle in description:
+                    matching.add(tool_id)
+            
+            tool_ids = self._capability_queries[capability] = self._in_order(matching)
+            if len(self._capability_queries) > CAPABILITY_QUERY_CACHE_SIZE:
+                self._capability_queries.popitem(last=False)
         
-        return matching_tools
+        return [self.tools[tool_id] for tool_id in tool_ids]
     
     async def find_tools_by_tag(self, tag: str) -> List[Dict[str, Any]]:
         """
@@ -144,14 +396,7 @@ class ToolRegistry:
         Returns:
             List of tools with the requested tag
         """
-        matching_tools = []
-        
-        for tool_id, tool in self.tools.items():
-            tags = tool.get("tags", [])
-            if tag in tags:
-                matching_tools.append(tool)
-        
-        return matching_tools
+        return [self.tools[tool_id] for tool_id in self._in_order(self._tag_index.get(tag, set()))]
     
     async def execute_tool(
         self,
@@ -190,63 +435,316 @@ class ToolRegistry:
             
         # Get the function
         func = tool["function"]
+        execution = self._execution.get(tool_id)
+        if execution is None:
+            # Spec stored without going through register_tool
+            execution = self._execution[tool_id] = self._resolve_execution(tool)
+            self._stats[tool_id] = self._new_stats()
+        stats = self._stats[tool_id]
+        timeout = execution["timeout"]
         
+        # Serve pure tools from the result cache
+        cache_key = _cache_key(tool_id, parameters) if execution["cacheable"] else None
+        if cache_key is not None:
+            found, cached_result = self.result_cache.get(cache_key)
+            if found:
+                stats["cache_hits"] += 1
+                result = copy.deepcopy(cached_result["result"])
+                self._notify_executed(tool_id, {
+                    "success": True,
+                    "parameters": parameters,
+                    "result": result,
+                    "execution_time": 0.0,
+                    "queue_time": 0.0,
+                    "cached": True
+                })
+                return dict(cached_result, result=result, cached=True, queue_time=0.0)
+            stats["cache_misses"] += 1
+        
+        submitted = time.time()
+        stats["calls"] += 1
+        stats["in_flight"] += 1
         try:
-            # Execute the function
-            start_time = time.time()
-            
-            # Check if function is coroutine
-            if asyncio.iscoroutinefunction(func):
-                result = await func(**parameters)
+            if timeout is not None:
+                started, result, finished = await asyncio.wait_for(
+                    self._invoke(func, parameters, execution), timeout
+                )
             else:
-                result = func(**parameters)
+                started, result, finished = await self._invoke(func, parameters, execution)
                 
-            execution_time = time.time() - start_time
+        except asyncio.TimeoutError:
+            stats["timeouts"] += 1
+            return self._execution_failed(
+                tool_id, tool, parameters, f"Tool {tool_id} timed out after {timeout}s", timed_out=True
+            )
+        except asyncio.CancelledError:
+            stats["cancelled"] += 1
+            raise
+        except Exception as e:
+            stats["errors"] += 1
+            logger.error(f"Error executing tool {tool_id}: {e}")
+            return self._execution_failed(tool_id, tool, parameters, str(e))
+        finally:
+            stats["in_flight"] -= 1
             
-            # Create result
-            execution_result = {
-                "success": True,
-                "tool_id": tool_id,
-                "tool_name": tool["name"],
-                "result": result,
-                "execution_time": execution_time
-            }
+        queue_time = max(0.0, started - submitted)
+        execution_time = max(0.0, finished - started)
+        stats["queue_time_total"] += queue_time
+        stats["queue_time_max"] = max(stats["queue_time_max"], queue_time)
+        stats["execution_time_total"] += execution_time
+        stats["execution_time_max"] = max(stats["execution_time_max"], execution_time)
+        
+        # Create result
+        execution_result = {
+            "success": True,
+            "tool_id": tool_id,
+            "tool_name": tool["name"],
+            "result": result,
+            "execution_time": execution_time,
+            "queue_time": queue_time
+        }
+        
+        if cache_key is not None:
+            try:
+                self.result_cache.put(
+                    cache_key, dict(execution_result, result=copy.deepcopy(result)), execution["cache_ttl"]
+                )
+            except Exception as e:
+                logger.debug(f"Not caching result of {tool_id}: {e}")
+        
+        # Trigger executed callbacks
+        self._notify_executed(tool_id, {
+            "success": True,
+            "parameters": parameters,
+            "result": result,
+            "execution_time": execution_time,
+            "queue_time": queue_time
+        })
+        
+        return execution_result
+    
+    def _notify_executed(self, tool_id: str, event: Dict[str, Any]):
+        """Call the executed callbacks, logging their errors."""
+        for callback in self._callbacks["executed"]:
+            try:
+                callback(tool_id, event)
+            except Exception as e:
+                logger.error(f"Error in tool executed callback: {e}")
+    
+    def _execution_failed(self,
+                          tool_id: str,
+                          tool: Dict[str, Any],
+                          parameters: Dict[str, Any],
+                          error: str,
+                          timed_out: bool = False) -> Dict[str, Any]:
+        """Build the result of a failed execution and notify callbacks."""
+        error_result = {
+            "success": False,
+            "tool_id": tool_id,
+            "tool_name": tool["name"],
+            "error": error
+        }
+        if timed_out:
+            error_result["timed_out"] = True
+            logger.warning(error)
             
-            # Trigger executed callbacks
-            for callback in self._callbacks["executed"]:
-                try:
-                    callback(tool_id, {
-                        "success": True,
-                        "parameters": parameters,
-                        "result": result,
-                        "execution_time": execution_time
-                    })
-                except Exception as e:
-                    logger.error(f"Error in tool executed callback: {e}")
+        # Trigger executed callbacks with error
+        self._notify_executed(tool_id, {
+            "success": False,
+            "parameters": parameters,
+            "error": error
+        })
+        
+        return error_result
+    
+    def _resolve_execution(self, tool_spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Work out how a tool runs from its spec and any mcp_tool metadata.
+        
+        Args:
+            tool_spec: Tool specification
             
-            return execution_result
+        Returns:
+            Execution settings: mode, is_async, timeout, semaphore, cancel_event,
+            cacheable, cache_ttl
+        """
+        func = tool_spec.get("function")
+        meta = getattr(func, "_mcp_tool_meta", None)
+        settings = {
+            key: tool_spec.get(key) if tool_spec.get(key) is not None else getattr(meta, key, None)
+            for key in EXECUTION_SETTINGS
+        }
+        
+        # Look through decorator wrappers to find coroutine functions
+        is_async = func is not None and asyncio.iscoroutinefunction(inspect.unwrap(func))
+        mode = settings["execution_mode"] or ("inline" if is_async else self.default_sync_mode)
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode for tool {tool_spec.get('name')}: {mode}")
+        if is_async and mode != "inline":
+            logger.warning(f"Tool {tool_spec.get('name')} is a coroutine function; running it inline")
+            mode = "inline"
             
-        except Exception as e:
-            error_result = {
-                "success": False,
-                "tool_id": tool_id,
-                "tool_name": tool["name"],
-                "error": str(e)
-            }
-            logger.error(f"Error executing tool {tool_id}: {e}")
+        max_concurrency = settings["max_concurrency"]
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1 for tool {tool_spec.get('name')}")
+            
+        accepts_cancel_event = False
+        if func is not None and mode == "thread":
+            try:
+                accepts_cancel_event = "cancel_event" in inspect.signature(func).parameters
+            except (TypeError, ValueError):
+                pass
+                
+        return {
+            "mode": mode,
+            "is_async": is_async,
+            "timeout": settings["timeout"] if settings["timeout"] is not None else self.default_timeout,
+            "semaphore": asyncio.Semaphore(max_concurrency) if max_concurrency else None,
+            "max_concurrency": max_concurrency,
+            "cancel_event": accepts_cancel_event,
+            "cacheable": bool(settings["cacheable"]),
+            "cache_ttl": settings["cache_ttl"] if settings["cache_ttl"] is not None else self.default_cache_ttl
+        }
+    
+    async def _invoke(self,
+                      func: Callable,
+                      parameters: Dict[str, Any],
+                      execution: Dict[str, Any]) -> Tuple[float, Any, float]:
+        """
+        Run a tool in its execution mode, within its concurrency limit.
+        
+        Returns:
+            Tuple of (start time, result, end time)
+        """
+        semaphore = execution["semaphore"]
+        if semaphore is not None:
+            await semaphore.acquire()
+        release_now = True
+        try:
+            mode = execution["mode"]
+            if mode == "inline":
+                started = time.time()
+                result = func(**parameters)
+                if inspect.isawaitable(result):
+                    result = await result
+                return started, result, time.time()
+                
+            cancel_event = None
+            if execution["cancel_event"]:
+                cancel_event = threading.Event()
+                parameters = dict(parameters, cancel_event=cancel_event)
+                
+            loop = asyncio.get_running_loop()
+            future = self._get_executor(mode).submit(_call_tool, func, parameters)
+            try:
+                started, result, finished = await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                # A queued call is dropped; a running one is asked to stop and
+                # keeps its concurrency slot until it actually returns
+                if not future.cancel():
+                    if cancel_event is not None:
+                        cancel_event.set()
+                    if semaphore is not None:
+                        release_now = False
+                        future.add_done_callback(lambda _: _release_threadsafe(loop, semaphore))
+                raise
+                
+            if inspect.isawaitable(result):
+                # A plain function handing back a coroutine
+                result = await result
+                finished = time.time()
+            return started, result, finished
+        finally:
+            if semaphore is not None and release_now:
+                semaphore.release()
+    
+    def _get_executor(self, mode: str) -> Executor:
+        """Get (creating on first use) the shared pool for an execution mode."""
+        if mode == "process":
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_processes)
+            return self._process_pool
             
-            # Trigger executed callbacks with error
-            for callback in self._callbacks["executed"]:
-                try:
-                    callback(tool_id, {
-                        "success": False,
-                        "parameters": parameters,
-                        "error": str(e)
-                    })
-                except Exception as e:
-                    logger.error(f"Error in tool executed callback: {e}")
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mcp-tool")
+        return self._thread_pool
+    
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        return {
+            "calls": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+            "in_flight": 0,
+            "queue_time_total": 0.0,
+            "queue_time_max": 0.0,
+            "execution_time_total": 0.0,
+            "execution_time_max": 0.0,
+            "cache_hits": 0,
+            "cache_misses": 0
+        }
+    
+    def get_tool_stats(self, tool_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get execution metrics, separating time spent waiting for a
+        concurrency slot or worker from time spent executing.
+        
+        Args:
+            tool_id: Tool ID (None for all tools)
             
-            return error_result
+        Returns:
+            Metrics for the tool, or metrics by tool ID
+        """
+        if tool_id is None:
+            return {tid: self.get_tool_stats(tid) for tid in self._stats}
+            
+        stats = dict(self._stats.get(tool_id) or self._new_stats())
+        completed = stats["calls"] - stats["errors"] - stats["timeouts"] - stats["cancelled"] - stats["in_flight"]
+        stats["queue_time_avg"] = stats["queue_time_total"] / completed if completed > 0 else 0.0
+        stats["execution_time_avg"] = stats["execution_time_total"] / completed if completed > 0 else 0.0
+        execution = self._execution.get(tool_id)
+        if execution:
+            stats["execution_mode"] = execution["mode"]
+            stats["max_concurrency"] = execution["max_concurrency"]
+            stats["timeout"] = execution["timeout"]
+            stats["cacheable"] = execution["cacheable"]
+        return stats
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get result cache metrics.
+        
+        Returns:
+            Dictionary with size, hits, misses, hit rate, evictions and expirations
+        """
+        return self.result_cache.get_stats()
+    
+    def clear_result_cache(self, tool_id: Optional[str] = None) -> int:
+        """
+        Drop cached results, e.g. after a tool's underlying data changed.
+        
+        Args:
+            tool_id: Tool whose results to drop (None for all tools)
+            
+        Returns:
+            Number of entries dropped
+        """
+        return self.result_cache.invalidate(tool_id)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the worker pools.
+        
+        Args:
+            wait: Whether to wait for running tool calls to finish
+        """
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+            self._process_pool = None
     
     async def get_all_tools(self) -> Dict[str, Dict[str, Any]]:
         """
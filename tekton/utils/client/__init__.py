@@ -16,6 +16,14 @@ from .exceptions import (
 )
 from .models import SecurityContext, RetryPolicy
 from .client import ComponentClient
+from .pool import (
+    ConnectionPool,
+    ComponentInfoCache,
+    SingleFlight,
+    get_connection_pool,
+    close_connection_pool,
+    get_component_info_cache
+)
 from .discovery import (
     discover_component,
     discover_components_by_type,
@@ -38,6 +46,12 @@ __all__ = [
     "SecurityContext",
     "RetryPolicy",
     "ComponentClient",
+    "ConnectionPool",
+    "ComponentInfoCache",
+    "SingleFlight",
+    "get_connection_pool",
+    "close_connection_pool",
+    "get_component_info_cache",
     "discover_component",
     "discover_components_by_type",
     "discover_components_by_capability",
@@ -1,16 +1,27 @@
 """
 Component Client
 
-This module provides the base client for Tekton components.
+This module provides the base client for Tekton components. Requests go
+through a per-process connection pool, and component lookups in the Hermes
+registry are cached with a TTL and coalesced across concurrent callers.
 """
 
 import os
 import json
+import random
+import hashlib
 import asyncio
 import logging
 from typing import Dict, Any, Optional
 
 from .models import SecurityContext, RetryPolicy
+from .pool import (
+    CONNECTION_ERRORS,
+    DEFAULT_COMPONENT_INFO_TTL,
+    ConnectionPool,
+    get_connection_pool,
+    get_component_info_cache
+)
 from .exceptions import (
     ComponentNotFoundError,
     CapabilityNotFoundError,
@@ -32,7 +43,9 @@ class ComponentClient:
         component_id: str,
         hermes_url: Optional[str] = None,
         security_context: Optional[SecurityContext] = None,
-        retry_policy: Optional[RetryPolicy] = None
+        retry_policy: Optional[RetryPolicy] = None,
+        component_info_ttl: Optional[float] = DEFAULT_COMPONENT_INFO_TTL,
+        pool: Optional[ConnectionPool] = None
     ):
         """
         Initialize the component client.
@@ -42,29 +55,29 @@ class ComponentClient:
             hermes_url: URL of the Hermes API (defaults to HERMES_URL env var)
             security_context: Security context for authentication/authorization
             retry_policy: Policy for retrying capability invocations
+            component_info_ttl: Seconds component info is reused before it is
+                looked up again (None to keep it until invalidated)
+            pool: Connection pool (defaults to the process-wide pool)
         """
         self.component_id = component_id
         self.hermes_url = hermes_url or os.environ.get("HERMES_URL", "http://localhost:8000/api")
         self.security_context = security_context or SecurityContext()
         self.retry_policy = retry_policy or RetryPolicy()
+        self.component_info_ttl = component_info_ttl
+        self.pool = pool or get_connection_pool()
         
-        # Component info will be loaded lazily
+        # Component info is loaded lazily and shared with other clients
+        # of the same component and credentials through the process-wide cache
+        self._info_cache = get_component_info_cache()
         self._component_info = None
-        self._http_client = None
         self._closed = False
     
-    async def _get_http_client(self):
-        """Get the HTTP client for making requests."""
-        if self._http_client is None:
-            try:
-                import aiohttp
-                self._http_client = aiohttp.ClientSession(
-                    headers=self._get_auth_headers()
-                )
-            except ImportError:
-                logger.error("aiohttp not installed, cannot make HTTP requests")
-                raise ImportError("aiohttp is required for making HTTP requests")
-        return self._http_client
+    @property
+    def _info_key(self):
+        """Cache key of the component info, scoped to the credentials it is fetched with."""
+        token = self.security_context.token
+        fingerprint = hashlib.sha256(token.encode("utf-8")).hexdigest() if token else None
+        return (self.hermes_url, self.component_id, self.security_context.client_id, fingerprint)
     
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers for requests."""
@@ -79,6 +92,9 @@ class ComponentClient:
         """
         Get information about the component from the service registry.
         
+        Cached info is reused until it is older than component_info_ttl, and
+        concurrent lookups of the same component share one request.
+        
         Args:
             force_refresh: Whether to force a refresh of the component info
             
@@ -89,26 +105,47 @@ class ComponentClient:
             ComponentNotFoundError: If the component is not found
             ComponentUnavailableError: If the Hermes API is unavailable
         """
-        if self._component_info is None or force_refresh:
-            try:
-                http_client = await self._get_http_client()
-                async with http_client.get(
-                    f"{self.hermes_url}/registry/component/{self.component_id}"
-                ) as response:
-                    if response.status == 404:
-                        raise ComponentNotFoundError(f"Component {self.component_id} not found")
-                    elif response.status != 200:
-                        error_text = await response.text()
-                        raise ComponentUnavailableError(
-                            f"Failed to get component info: {response.status} {error_text}"
-                        )
-                    
-                    self._component_info = await response.json()
-            except (ConnectionError, TimeoutError) as e:
-                raise ComponentUnavailableError(f"Failed to connect to Hermes API: {e}")
-        
+        self._component_info = await self._info_cache.get(
+            self._info_key,
+            self._fetch_component_info,
+            ttl=self.component_info_ttl,
+            force_refresh=force_refresh
+        )
         return self._component_info
     
+    async def _fetch_component_info(self) -> Dict[str, Any]:
+        """
+        Fetch information about the component from the service registry.
+        
+        Returns:
+            Component information
+            
+        Raises:
+            ComponentNotFoundError: If the component is not found
+            ComponentUnavailableError: If the Hermes API is unavailable
+        """
+        try:
+            async with self.pool.request(
+                "GET",
+                f"{self.hermes_url}/registry/component/{self.component_id}",
+                headers=self._get_auth_headers()
+            ) as response:
+                if response.status == 404:
+                    raise ComponentNotFoundError(f"Component {self.component_id} not found")
+                elif response.status != 200:
+                    error_text = await response.text()
+                    raise ComponentUnavailableError(
+                        f"Failed to get component info: {response.status} {error_text}"
+                    )
+                
+                return await response.json()
+        except CONNECTION_ERRORS as e:
+            raise ComponentUnavailableError(f"Failed to connect to Hermes API: {e}")
+    
+    def invalidate_component_info(self):
+        """Drop the cached component info so the next call looks it up again."""
+        self._info_cache.invalidate(self._info_key)
+    
     async def _get_capability_info(self, capability: str) -> Dict[str, Any]:
         """
         Get information about a capability from the component.
@@ -163,25 +200,7 @@ class ComponentClient:
         if self._closed:
             raise RuntimeError("Client is closed")
         
-        # Get component info to ensure it exists and get the endpoint
-        component_info = await self._get_component_info()
-        endpoint = component_info.get("endpoint")
-        if not endpoint:
-            raise ComponentUnavailableError(
-                f"Component {self.component_id} does not have an endpoint"
-            )
-        
-        # Get capability info to ensure it exists
-        try:
-            await self._get_capability_info(capability)
-        except CapabilityNotFoundError:
-            # If the component was loaded from cache, try refreshing
-            if self._component_info is not None:
-                component_info = await self._get_component_info(force_refresh=True)
-                try:
-                    await self._get_capability_info(capability)
-                except CapabilityNotFoundError:
-                    raise
+        endpoint = await self._resolve_endpoint(capability)
         
         # Apply retry policy
         retry_count = 0
@@ -189,8 +208,15 @@ class ComponentClient:
         
         while True:
             try:
+                if endpoint is None:
+                    # Look the endpoint up again; a failure here is a failed retry
+                    endpoint = await self._resolve_endpoint(capability)
                 return await self._do_invoke_capability(endpoint, capability, parameters, timeout)
             except tuple(self.retry_policy.retry_on) as e:
+                # The component may have moved or gone; look it up afresh
+                self.invalidate_component_info()
+                endpoint = None
+                
                 retry_count += 1
                 if retry_count > self.retry_policy.max_retries:
                     logger.warning(
@@ -204,11 +230,46 @@ class ComponentClient:
                     f"after error: {e} (retry {retry_count}/{self.retry_policy.max_retries})"
                 )
                 
-                await asyncio.sleep(current_delay)
+                # Jitter spreads the retries of clients that failed together
+                await asyncio.sleep(current_delay * (1 - self.retry_policy.retry_jitter * random.random()))
                 current_delay = min(
                     current_delay * self.retry_policy.retry_multiplier,
                     self.retry_policy.retry_max_delay
                 )
+            except CapabilityNotFoundError:
+                self.invalidate_component_info()
+                raise
+    
+    async def _resolve_endpoint(self, capability: str) -> str:
+        """
+        Get the component endpoint, checking that it has the capability.
+        
+        Args:
+            capability: Name of the capability
+            
+        Returns:
+            Component endpoint
+            
+        Raises:
+            ComponentNotFoundError: If the component is not found
+            CapabilityNotFoundError: If the capability is not found
+            ComponentUnavailableError: If the component has no endpoint
+        """
+        component_info = await self._get_component_info()
+        
+        # Get capability info to ensure it exists, refreshing stale info once
+        try:
+            await self._get_capability_info(capability)
+        except CapabilityNotFoundError:
+            component_info = await self._get_component_info(force_refresh=True)
+            await self._get_capability_info(capability)
+        
+        endpoint = component_info.get("endpoint")
+        if not endpoint:
+            raise ComponentUnavailableError(
+                f"Component {self.component_id} does not have an endpoint"
+            )
+        return endpoint
     
     async def _do_invoke_capability(
         self,
@@ -236,15 +297,15 @@ class ComponentClient:
             AuthorizationError: If authorization fails
         """
         try:
-            http_client = await self._get_http_client()
-            
             # Construct the request URL
             request_url = f"{endpoint}/capabilities/{capability}"
             
             # Make the request
-            async with http_client.post(
+            async with self.pool.request(
+                "POST",
                 request_url,
                 json=parameters,
+                headers=self._get_auth_headers(),
                 timeout=timeout
             ) as response:
                 if response.status == 200:
@@ -276,15 +337,16 @@ class ComponentClient:
                         f"Error invoking capability {capability} on {self.component_id}: {error_message}",
                         error_detail
                     )
-        except (ConnectionError, TimeoutError, asyncio.TimeoutError) as e:
+        except CONNECTION_ERRORS as e:
             raise ComponentUnavailableError(
                 f"Failed to connect to component {self.component_id}: {e}"
             )
     
     async def close(self):
-        """Close the client and release resources."""
-        if not self._closed and self._http_client is not None:
-            await self._http_client.close()
-            self._http_client = None
+        """
+        Close the client.
         
+        Pooled connections are shared with other clients and stay open;
+        use close_connection_pool() to close them at shutdown.
+        """
         self._closed = True
\ No newline at end of file
@@ -9,7 +9,6 @@ from typing import Dict, List, Any, Optional, Type, Union, TypeVar
 from .exceptions import ComponentNotFoundError
 from .models import SecurityContext, RetryPolicy
 from .client import ComponentClient
-from .discovery import discover_component
 
 # Type variables
 T_Client = TypeVar("T_Client", bound=ComponentClient)
@@ -39,26 +38,23 @@ async def create_client(
         ComponentNotFoundError: If the component is not found
         TypeError: If client_type is not a subclass of ComponentClient
     """
-    # Check if the component exists
-    await discover_component(component_id, hermes_url)
-    
-    # Create the client
     if client_type is None:
-        return ComponentClient(
-            component_id=component_id,
-            hermes_url=hermes_url,
-            security_context=security_context,
-            retry_policy=retry_policy
-        )
-    elif issubclass(client_type, ComponentClient):
-        return client_type(
-            component_id=component_id,
-            hermes_url=hermes_url,
-            security_context=security_context,
-            retry_policy=retry_policy
-        )
-    else:
+        client_type = ComponentClient
+    elif not issubclass(client_type, ComponentClient):
         raise TypeError(f"client_type must be a subclass of ComponentClient, got {client_type}")
+    
+    # Create the client
+    client = client_type(
+        component_id=component_id,
+        hermes_url=hermes_url,
+        security_context=security_context,
+        retry_policy=retry_policy
+    )
+    
+    # Check if the component exists; this also warms the shared component
+    # info cache the client's first invocation will use
+    await client._get_component_info()
+    return client
 
 
 def create_security_context(
@@ -85,7 +81,8 @@ def create_retry_policy(
     retry_delay: float = 1.0,
     retry_multiplier: float = 2.0,
     retry_max_delay: float = 30.0,
-    retry_on: Optional[List[Type[Exception]]] = None
+    retry_on: Optional[List[Type[Exception]]] = None,
+    retry_jitter: float = 0.2
 ) -> RetryPolicy:
     """
     Create a retry policy for capability invocations.
@@ -96,6 +93,7 @@ def create_retry_policy(
         retry_multiplier: Multiplier for delay after each retry
         retry_max_delay: Maximum delay between retries in seconds
         retry_on: Types of exceptions to retry on
+        retry_jitter: Fraction of each delay that is randomized
         
     Returns:
         Retry policy
@@ -105,5 +103,6 @@ def create_retry_policy(
         retry_delay=retry_delay,
         retry_multiplier=retry_multiplier,
         retry_max_delay=retry_max_delay,
-        retry_on=retry_on
+        retry_on=retry_on,
+        retry_jitter=retry_jitter
     )
\ No newline at end of file
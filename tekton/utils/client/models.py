@@ -38,7 +38,8 @@ class RetryPolicy:
         retry_delay: float = 1.0,
         retry_multiplier: float = 2.0,
         retry_max_delay: float = 30.0,
-        retry_on: Optional[List[Type[Exception]]] = None
+        retry_on: Optional[List[Type[Exception]]] = None,
+        retry_jitter: float = 0.2
     ):
         """
         Initialize the retry policy.
@@ -49,11 +50,14 @@ class RetryPolicy:
             retry_multiplier: Multiplier for delay after each retry
             retry_max_delay: Maximum delay between retries in seconds
             retry_on: Types of exceptions to retry on
+            retry_jitter: Fraction of each delay that is randomized, so
+                clients failing together do not retry in lockstep
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.retry_multiplier = retry_multiplier
         self.retry_max_delay = retry_max_delay
+        self.retry_jitter = retry_jitter
         
         # Import here to avoid circular imports
         from .exceptions import ComponentUnavailableError
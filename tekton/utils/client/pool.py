@@ -0,0 +1,379 @@
+"""
+Component Client Connection Pool
+
+This module provides the per-process HTTP connection pool shared by all
+component clients, and the single-flight, TTL-cached lookup of component
+information from the Hermes service registry.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Any, Optional, Callable, Awaitable, Hashable, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Pooled connections per endpoint
+DEFAULT_LIMIT_PER_HOST = 32
+
+# Idle pooled connections are closed after this many seconds
+KEEPALIVE_TIMEOUT = 60
+
+# Seconds resolved host names are cached
+DNS_CACHE_TTL = 300
+
+# Seconds component info is served from cache
+DEFAULT_COMPONENT_INFO_TTL = 30.0
+
+# Errors meaning the remote end could not be reached
+CONNECTION_ERRORS: Tuple[type, ...] = (ConnectionError, TimeoutError, asyncio.TimeoutError)
+if HAS_AIOHTTP:
+    CONNECTION_ERRORS += (aiohttp.ClientConnectionError,)
+
+
+def endpoint_key(url: str) -> str:
+    """
+    Get the pool key for a URL.
+    
+    Args:
+        url: Request URL
+    
+    Returns:
+        The URL's scheme and host, e.g. "http://localhost:8000"
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP sessions shared by all component clients, one per endpoint.
+    
+    Sessions are bound to the event loop they were created on; a pool used
+    from another loop opens separate sessions for it. Connection reuse and concurrency are
+    tracked per endpoint. aiohttp does not pipeline requests on a connection,
+    so concurrent requests to an endpoint use parallel pooled connections.
+    """
+    
+    def __init__(
+        self,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT
+    ):
+        """
+        Initialize the connection pool.
+        
+        Args:
+            limit_per_host: Maximum connections per endpoint
+            keepalive_timeout: Seconds idle connections are kept open
+        """
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._sessions: Dict[Tuple[str, asyncio.AbstractEventLoop], Any] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+    
+    def session(self, url: str):
+        """
+        Get the session for a URL's endpoint, creating it if needed.
+        
+        Args:
+            url: Request URL
+        
+        Returns:
+            aiohttp.ClientSession for the endpoint
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError("aiohttp is required for making HTTP requests")
+        
+        key = endpoint_key(url)
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get((key, loop))
+        if session is not None and not session.closed:
+            return session
+        self._prune()
+        
+        stats = self._stats.setdefault(key, {
+            "requests": 0,
+            "errors": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "sessions": 0
+        })
+        stats["sessions"] += 1
+        
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        session = aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config(stats)])
+        self._sessions[(key, loop)] = session
+        return session
+    
+    def _prune(self):
+        """Forget sessions whose event loop has closed; they can no longer be closed cleanly."""
+        for (key, loop), session in list(self._sessions.items()):
+            if loop.is_closed():
+                if not session.closed:
+                    logger.warning(f"Dropping unclosed session for {key}: its event loop has closed")
+                del self._sessions[(key, loop)]
+    
+    def request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs):
+        """
+        Make a request through the pooled session for the URL's endpoint.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Total request timeout in seconds (None for the session default)
+            **kwargs: Arguments for aiohttp.ClientSession.request
+        
+        Returns:
+            aiohttp request context manager
+        """
+        session = self.session(url)
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        return session.request(method, url, **kwargs)
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get connection statistics per endpoint.
+        
+        Returns:
+            Dictionary mapping endpoints to request, concurrency and
+            connection reuse counters
+        """
+        result = {}
+        for key, stats in self._stats.items():
+            opened = stats["connections_created"] + stats["connections_reused"]
+            result[key] = dict(
+                stats,
+                reuse_rate=stats["connections_reused"] / opened if opened else 0.0
+            )
+        return result
+    
+    async def close(self):
+        """
+        Close the pool's sessions.
+        
+        Sessions of the running loop are closed here. Sessions of a loop
+        running in another thread are closed on that loop; those of an idle
+        loop are kept so that loop can close them with its own close() call.
+        """
+        loop = asyncio.get_running_loop()
+        pending = []
+        for (key, session_loop), session in list(self._sessions.items()):
+            if session_loop is loop:
+                pending.append(session.close())
+            elif session_loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            else:
+                if not session_loop.is_closed():
+                    logger.debug(f"Keeping session for {key} until its event loop closes it")
+                continue
+            del self._sessions[(key, session_loop)]
+        if pending:
+            await asyncio.gather(*pending)
+        self._prune()
+    
+    @staticmethod
+    def _trace_config(stats: Dict[str, Any]):
+        """
+        Build trace hooks that count requests and connection reuse.
+        
+        Args:
+            stats: Endpoint statistics to update
+        
+        Returns:
+            aiohttp.TraceConfig
+        """
+        async def on_request_start(session, context, params):
+            stats["requests"] += 1
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        
+        async def on_request_end(session, context, params):
+            stats["in_flight"] -= 1
+        
+        async def on_request_exception(session, context, params):
+            stats["in_flight"] -= 1
+            stats["errors"] += 1
+        
+        async def on_connection_create_end(session, context, params):
+            stats["connections_created"] += 1
+        
+        async def on_connection_reuseconn(session, context, params):
+            stats["connections_reused"] += 1
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one.
+    
+    While a call for a key is running, further callers wait for its result
+    instead of starting their own. Cancelling a waiter does not cancel the
+    shared call.
+    """
+    
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+    
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func for key, or join the call already running for it.
+        
+        Args:
+            key: Call key
+            func: Coroutine function making the call
+        
+        Returns:
+            Result of the (shared) call
+        """
+        future = self._calls.get(key)
+        if future is not None and not future.done():
+            self.coalesced += 1
+            return await asyncio.shield(future)
+        
+        future = asyncio.ensure_future(func())
+        self._calls[key] = future
+        
+        def forget(done):
+            if self._calls.get(key) is done:
+                del self._calls[key]
+        
+        future.add_done_callback(forget)
+        return await asyncio.shield(future)
+
+
+class ComponentInfoCache:
+    """
+    Per-process cache of component information with TTL and single-flight fetches.
+    
+    Clients key entries by (hermes_url, component_id, client_id, token
+    fingerprint), so clients of a component share one lookup only when
+    they fetch it with the same credentials.
+    """
+    
+    def __init__(self):
+        """Initialize the component info cache."""
+        self._entries: Dict[Hashable, Tuple[float, Dict[str, Any]]] = {}
+        self._flight = SingleFlight()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+    
+    async def get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl: Optional[float] = DEFAULT_COMPONENT_INFO_TTL,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get component info, fetching it if missing, expired or forced.
+        
+        Args:
+            key: Cache key
+            fetch: Coroutine function fetching the info
+            ttl: Seconds a fetched entry stays fresh (None for no expiry)
+            force_refresh: Whether to ignore the cached entry
+        
+        Returns:
+            Component information
+        """
+        entry = self._entries.get(key)
+        if entry is not None and not force_refresh:
+            fetched_at, info = entry
+            if ttl is None or time.monotonic() - fetched_at < ttl:
+                self._stats["hits"] += 1
+                return info
+        
+        self._stats["misses"] += 1
+        
+        async def fetch_and_store():
+            info = await fetch()
+            self._entries[key] = (time.monotonic(), info)
+            return info
+        
+        return await self._flight.do(key, fetch_and_store)
+    
+    def invalidate(self, key: Hashable):
+        """
+        Drop a cached entry so the next lookup fetches it again.
+        
+        Args:
+            key: Cache key
+        """
+        if self._entries.pop(key, None) is not None:
+            self._stats["invalidations"] += 1
+    
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entries, hits, misses, invalidations and
+            coalesced fetches
+        """
+        return dict(self._stats, entries=len(self._entries), coalesced=self._flight.coalesced)
+
+
+# Process-wide instances shared by all component clients
+_global_pool: Optional[ConnectionPool] = None
+_global_info_cache: Optional[ComponentInfoCache] = None
+
+
+def get_connection_pool() -> ConnectionPool:
+    """
+    Get the process-wide connection pool, creating it if needed.
+    
+    Returns:
+        Global ConnectionPool instance
+    """
+    global _global_pool
+    if _global_pool is None:
+        _global_pool = ConnectionPool()
+    return _global_pool
+
+
+async def close_connection_pool():
+    """Close the process-wide connection pool's sessions."""
+    if _global_pool is not None:
+        await _global_pool.close()
+
+
+def get_component_info_cache() -> ComponentInfoCache:
+    """
+    Get the process-wide component info cache, creating it if needed.
+    
+    Returns:
+        Global ComponentInfoCache instance
+    """
+    global _global_info_cache
+    if _global_info_cache is None:
+        _global_info_cache = ComponentInfoCache()
+    return _global_info_cache
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark wildcard channel matching for A2A streaming.
+
+Builds a set of channels and subscription patterns and compares the
+segment trie against a linear scan of compiled regexes for both
+directions:
+
+- list_channels(pattern): every channel matching one pattern
+- routing: every pattern matching one channel
+
+Usage:
+    python bench_channel_patterns.py [--channels N] [--patterns N] [--queries N]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.a2a.streaming.patterns import SegmentTrie, pattern_to_regex
+
+
+AREAS = ["metrics", "tasks", "agents", "conversations", "alerts", "logs"]
+KINDS = ["cpu", "memory", "disk", "network", "state", "progress", "events"]
+
+
+def make_channels(rng: random.Random, count: int):
+    """Generate realistic dotted channel names"""
+    channels = set()
+    while len(channels) < count:
+        channels.add(".".join([
+            rng.choice(AREAS),
+            f"component{rng.randint(0, 199)}",
+            rng.choice(KINDS),
+            f"i{rng.randint(0, 9)}"
+        ][:rng.randint(2, 4)]))
+    return sorted(channels)
+
+
+def make_patterns(rng: random.Random, channels, count: int):
+    """Generate patterns by wildcarding segments of existing channels"""
+    patterns = set()
+    while len(patterns) < count:
+        segments = rng.choice(channels).split(".")
+        index = rng.randrange(1, len(segments))
+        wildcard = rng.choice(["*", "**"])
+        segments = segments[:index] + [wildcard] + (segments[index + 1:] if wildcard == "*" else [])
+        patterns.add(".".join(segments))
+    return sorted(patterns)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(args):
+    rng = random.Random(args.seed)
+    channels = make_channels(rng, args.channels)
+    patterns = make_patterns(rng, channels, args.patterns)
+    
+    # Index construction
+    channel_trie, build_channels = timed(lambda: _build(channels))
+    pattern_trie, build_patterns = timed(lambda: _build(patterns))
+    compiled = {p: re.compile(pattern_to_regex(p)) for p in patterns}
+    
+    print(f"channels={len(channels)} patterns={len(patterns)} queries={args.queries}")
+    print(f"  build channel trie:  {build_channels * 1000:8.1f} ms")
+    print(f"  build pattern trie:  {build_patterns * 1000:8.1f} ms")
+    
+    # list_channels(pattern)
+    query_patterns = [rng.choice(patterns) for _ in range(args.queries)]
+    _, trie_time = timed(lambda: [channel_trie.find(p) for p in query_patterns])
+    _, scan_time = timed(lambda: [
+        [c for c in channels if compiled[p].match(c)] for p in query_patterns
+    ])
+    print("  list_channels(pattern):")
+    print(f"    trie:   {trie_time / args.queries * 1e6:10.1f} us/query")
+    print(f"    scan:   {scan_time / args.queries * 1e6:10.1f} us/query")
+    
+    # Routing a channel event to pattern subscriptions
+    query_channels = [rng.choice(channels) for _ in range(args.queries)]
+    _, trie_time = timed(lambda: [pattern_trie.match(c) for c in query_channels])
+    _, scan_time = timed(lambda: [
+        [p for p, regex in compiled.items() if regex.match(c)] for c in query_channels
+    ])
+    print("  route(channel):")
+    print(f"    trie:   {trie_time / args.queries * 1e6:10.1f} us/event")
+    print(f"    scan:   {scan_time / args.queries * 1e6:10.1f} us/event")
+
+
+def _build(keys):
+    trie = SegmentTrie()
+    for key in keys:
+        trie.add(key)
+    return trie
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Channel pattern matching benchmark")
+    parser.add_argument("--channels", type=int, default=50000)
+    parser.add_argument("--patterns", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    main(parser.parse_args())
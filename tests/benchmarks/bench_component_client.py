@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark ComponentClient fan-out latency.
+
+Starts a local Hermes registry and component endpoint, then runs rounds in
+which many short-lived clients invoke a capability concurrently, as a
+component fanning out to others does. Compares per-client sessions and
+registry lookups (the previous ComponentClient) with the shared connection
+pool and coalesced, TTL-cached lookups.
+
+Usage:
+    python bench_component_client.py [--fan-out N] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+from aiohttp import ClientSession, web
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.utils.client import ComponentClient, ConnectionPool
+from tekton.utils.client.pool import endpoint_key
+
+
+class LegacyClient:
+    """ComponentClient as it was: its own session and its own registry lookup"""
+
+    def __init__(self, hermes_url):
+        self.hermes_url = hermes_url
+        self.session = ClientSession()
+        self.info = None
+
+    async def invoke_capability(self, capability, parameters):
+        if self.info is None:
+            async with self.session.get(f"{self.hermes_url}/registry/component/echo") as response:
+                self.info = await response.json()
+        async with self.session.post(f"{self.info['endpoint']}/capabilities/{capability}",
+                                     json=parameters) as response:
+            return await response.json()
+
+    async def close(self):
+        await self.session.close()
+
+
+async def start_server(lookup_delay):
+    counters = {"lookups": 0}
+
+    async def component(request):
+        counters["lookups"] += 1
+        await asyncio.sleep(lookup_delay)
+        return web.json_response({"endpoint": f"{base_url}/echo", "capabilities": ["echo"]})
+
+    async def invoke(request):
+        return web.json_response(await request.json())
+
+    app = web.Application()
+    app.router.add_get("/api/registry/component/{component_id}", component)
+    app.router.add_post("/echo/capabilities/{capability}", invoke)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    return runner, base_url, counters
+
+
+async def run(pooled, fan_out, rounds, lookup_delay):
+    runner, base_url, counters = await start_server(lookup_delay)
+    hermes_url = f"{base_url}/api"
+    pool = ConnectionPool()
+    latencies = []
+
+    async def timed(client, i):
+        start = time.perf_counter()
+        await client.invoke_capability("echo", {"i": i})
+        latencies.append(time.perf_counter() - start)
+
+    for _ in range(rounds):
+        if pooled:
+            clients = [ComponentClient("echo", hermes_url=hermes_url, pool=pool) for _ in range(fan_out)]
+        else:
+            clients = [LegacyClient(hermes_url) for _ in range(fan_out)]
+        await asyncio.gather(*(timed(client, i) for i, client in enumerate(clients)))
+        for client in clients:
+            await client.close()
+
+    stats = pool.get_stats().get(endpoint_key(base_url))
+    await pool.close()
+    await runner.cleanup()
+    return latencies, counters["lookups"], stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fan-out", type=int, default=20, help="Concurrent clients per round")
+    parser.add_argument("--rounds", type=int, default=20, help="Fan-out rounds")
+    parser.add_argument("--lookup-delay", type=float, default=0.005, help="Registry lookup latency in seconds")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{args.rounds} rounds of {args.fan_out} concurrent invocations")
+    for label, pooled in (("per-client", False), ("pooled", True)):
+        latencies, lookups, stats = asyncio.run(run(pooled, args.fan_out, args.rounds, args.lookup_delay))
+        latencies.sort()
+        line = (f"  {label:<11} p50 {statistics.median(latencies) * 1000:6.2f} ms  "
+                f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:6.2f} ms  {lookups:4d} lookups")
+        if stats:
+            line += (f"  {stats['connections_created']} connections, "
+                     f"reuse {stats['reuse_rate']:.0%}, max in flight {stats['max_in_flight']}")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCP ContextManager memory and merge cost.
+
+Creates one context per message, as MessageProcessor does, and reports the
+contexts and memory retained by an unbounded manager (the previous
+behaviour) and a bounded one. Then merges many wide contexts with the
+previous fold of full-copy deep merges and with the structurally shared
+merge.
+
+Usage:
+    python bench_context_manager.py [--messages N] [--max-contexts N]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.mcp.context import ContextManager, merge_shared
+
+
+def legacy_deep_merge(base, updates):
+    """Deep merge as ContextManager._deep_merge used to do it"""
+    result = base.copy()
+    for key, value in updates.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = legacy_deep_merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+async def churn(manager, messages):
+    for i in range(messages):
+        context_id = await manager.create_context(
+            data={"conversation": f"conv-{i % 50}", "user": {"id": i, "prefs": {"lang": "en"}}},
+            source={"component": "bench"}, category="message", metadata={"message_id": f"msg-{i}"}
+        )
+        await manager.update_context(context_id, {"user": {"prefs": {"tz": "UTC"}}})
+
+
+def bench_memory(messages, **kwargs):
+    manager = ContextManager(**kwargs)
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(churn(manager, messages))
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, current, manager.get_stats()
+
+
+def bench_merge(contexts, width, repeats):
+    dicts = [{f"key-{c}-{k}": {"value": k, "nested": {"c": c}} for k in range(width)} for c in range(contexts)]
+    for d in dicts:
+        d["common"] = {f"c{len(d)}": 1}
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        merged = {}
+        for d in dicts:
+            merged = legacy_deep_merge(merged, d)
+    legacy = (time.perf_counter() - start) / repeats
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        shared = merge_shared({}, *dicts)
+    current = (time.perf_counter() - start) / repeats
+    assert shared == merged
+    return legacy, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=50000, help="Messages (contexts created)")
+    parser.add_argument("--max-contexts", type=int, default=1000, help="Bound for the bounded manager")
+    parser.add_argument("--merge-contexts", type=int, default=50, help="Contexts per merge")
+    parser.add_argument("--width", type=int, default=200, help="Top-level keys per merged context")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{args.messages} messages, one context each")
+    for label, kwargs in (("unbounded", {}),
+                          (f"max {args.max_contexts}", dict(max_contexts=args.max_contexts))):
+        elapsed, retained, stats = bench_memory(args.messages, **kwargs)
+        print(f"  {label:<12} {elapsed:7.3f} s  {stats['contexts']:7d} contexts  {retained / 1e6:8.1f} MB retained")
+
+    legacy, current = bench_merge(args.merge_contexts, args.width, 5)
+    print(f"merge {args.merge_contexts} contexts x {args.width} keys")
+    print(f"  legacy fold  {legacy * 1000:8.2f} ms")
+    print(f"  shared merge {current * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSONFileMetricsStorage writes and indexed queries.
+
+Stores synthetic sessions into a temporary directory, then times
+recent-first pages, narrow start_time ranges and prompt filters.
+
+Usage:
+    python bench_json_file_storage.py [--sessions N] [--queries N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.core.metrics.collector import SessionData
+from tekton.core.metrics.storage.json_file import JSONFileMetricsStorage
+
+
+def timed(label, func, count):
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f} s ({elapsed / count * 1e3:7.3f} ms/op)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=5_000, help="Number of sessions to store")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per query type")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as directory:
+        storage = JSONFileMetricsStorage(directory)
+        print(f"{args.sessions} sessions")
+
+        def store(i):
+            storage.store_session(SessionData(
+                id=f"session-{i}",
+                prompt=f"task-{i % 50} benchmark prompt",
+                config={"temperature": 0.5},
+                start_time=1_700_000_000 + i + rng.random()
+            ))
+
+        timed("store_session", store, args.sessions)
+
+        last = 1_700_000_000 + args.sessions
+        timed("latest page (100)", lambda i: storage.get_sessions(limit=100), args.queries)
+        timed("range (50 sessions)", lambda i: storage.get_sessions(filters={
+            "start_time_min": last - 50 - (i * 97) % args.sessions,
+            "start_time_max": last - (i * 97) % args.sessions
+        }), args.queries)
+        timed("prompt_prefix (page of 20)", lambda i: storage.get_sessions(
+            filters={"prompt_prefix": f"task-{i % 50} "}, limit=20), args.queries)
+
+
+if __name__ == "__main__":
+    main()
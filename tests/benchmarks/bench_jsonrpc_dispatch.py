@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON-RPC dispatch throughput for A2A.
+
+Measures requests per second for single-request dispatch and for batched
+dispatch, end to end (parse, dispatch, serialize), with either the
+standard library json codec or the optional orjson codec.
+
+Usage:
+    python bench_jsonrpc_dispatch.py [--requests N] [--batch-size N] [--codec json|orjson]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.a2a.jsonrpc import JSONRPCRequest, JSONRPCBatch, parse_jsonrpc_message, set_json_codec
+from tekton.a2a.methods import MethodDispatcher
+
+
+def create_dispatcher(io_delay: float) -> MethodDispatcher:
+    """Create a dispatcher with a representative handler"""
+    dispatcher = MethodDispatcher()
+    
+    async def lookup(agent_id: str, fields=None):
+        if io_delay:
+            await asyncio.sleep(io_delay)
+        return {"agent_id": agent_id, "status": "online", "fields": fields or []}
+    
+    dispatcher.register_method("agent.lookup", lookup)
+    return dispatcher
+
+
+async def bench_single(dispatcher: MethodDispatcher, payloads) -> float:
+    """Dispatch each request on its own; returns requests/sec"""
+    start = time.perf_counter()
+    for payload in payloads:
+        request = parse_jsonrpc_message(payload)
+        response = await dispatcher.dispatch(request)
+        response.to_json()
+    return len(payloads) / (time.perf_counter() - start)
+
+
+async def bench_batch(dispatcher: MethodDispatcher, payloads, total: int) -> float:
+    """Dispatch batch payloads; returns requests/sec"""
+    start = time.perf_counter()
+    for payload in payloads:
+        batch = parse_jsonrpc_message(payload)
+        response = await dispatcher.dispatch_batch(batch)
+        response.to_json()
+    return total / (time.perf_counter() - start)
+
+
+async def main(args):
+    set_json_codec(args.codec)
+    dispatcher = create_dispatcher(args.io_delay)
+    
+    requests = [
+        JSONRPCRequest("agent.lookup", {"agent_id": f"agent-{i}", "fields": ["a", "b"]}, id=i)
+        for i in range(args.requests)
+    ]
+    single_payloads = [request.to_json() for request in requests]
+    batch_payloads = [
+        JSONRPCBatch(requests[i:i + args.batch_size]).to_json()
+        for i in range(0, len(requests), args.batch_size)
+    ]
+    
+    single_rps = await bench_single(dispatcher, single_payloads)
+    batch_rps = await bench_batch(dispatcher, batch_payloads, len(requests))
+    
+    print(f"codec={args.codec} requests={args.requests} batch_size={args.batch_size} io_delay={args.io_delay}")
+    print(f"  single:  {single_rps:12,.0f} req/s")
+    print(f"  batched: {batch_rps:12,.0f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON-RPC dispatch benchmark")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--codec", choices=["json", "orjson"], default="json")
+    parser.add_argument("--io-delay", type=float, default=0.0,
+                        help="Simulated handler I/O latency in seconds")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark connection reuse and client-side limiting in TektonLLMClient.
+
+Sends bursts of generation calls to a local stub Rhetor server that serves
+a fixed number of requests at once and answers 429 to the rest, as Rhetor
+does when a provider's quota is exhausted. Without a client-side limit the
+burst opens a connection per call and most calls are rejected; with
+max_concurrency matched to the server, every call succeeds, waits in the
+client queue instead, and reuses pooled connections.
+
+Usage:
+    python bench_llm_client_pool.py [--calls N] [--capacity N] [--latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'tekton-llm-client')))
+
+from aiohttp import web
+
+from tekton_llm_client import TektonLLMClient
+
+
+class StubRhetor:
+    def __init__(self, capacity, latency):
+        self.capacity = capacity
+        self.latency = latency
+        self.active = 0
+        self.rejected = 0
+
+    async def health(self, request):
+        return web.json_response({"status": "ok"})
+
+    async def providers(self, request):
+        return web.json_response({"providers": {"anthropic": {"default_model": "claude"}}})
+
+    async def chat(self, request):
+        await request.json()
+        if self.active >= self.capacity:
+            self.rejected += 1
+            return web.json_response({"error": "rate limited"}, status=429, headers={"Retry-After": "0"})
+        self.active += 1
+        await asyncio.sleep(self.latency)
+        self.active -= 1
+        return web.json_response({"content": "ok", "model": "claude", "provider": "anthropic"})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/api/v1/health", self.health)
+        app.router.add_get("/api/v1/providers", self.providers)
+        app.router.add_post("/api/v1/chat", self.chat)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+async def run(calls, capacity, latency, **client_kwargs):
+    server = StubRhetor(capacity, latency)
+    url = await server.start()
+    client = TektonLLMClient(component_id="bench", rhetor_url=url, use_fallback=False, **client_kwargs)
+    await client.initialize()
+
+    async def call(i):
+        try:
+            await client.generate_text(f"prompt {i}")
+            return True
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    ok = 0
+    for _ in range(2):
+        results = await asyncio.gather(*(call(i) for i in range(calls)))
+        ok += sum(results)
+    elapsed = time.perf_counter() - start
+
+    stats = client.get_stats()
+    await client.shutdown()
+    await server.runner.cleanup()
+    return elapsed, ok, server.rejected, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=64, help="Calls per burst (two bursts are sent)")
+    parser.add_argument("--capacity", type=int, default=8, help="Requests the stub serves at once")
+    parser.add_argument("--latency", type=float, default=0.02, help="Stub response time in seconds")
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    print(f"2 bursts of {args.calls} calls, server capacity {args.capacity}, {args.latency * 1000:.0f} ms per call")
+    configs = (
+        ("unlimited", {"max_connections": 0}),
+        ("limited", {"max_concurrency": args.capacity}),
+    )
+    for name, kwargs in configs:
+        elapsed, ok, rejected, stats = asyncio.run(run(args.calls, args.capacity, args.latency, **kwargs))
+        connections = stats["connections"]
+        limits = stats["limits"].get("anthropic/claude", {})
+        print(f"  {name:<10} {elapsed:6.3f} s  ok {ok:4d}  429s {rejected:4d}  "
+              f"connections opened {connections['connections_created']:4d}  "
+              f"reuse {connections['reuse_rate'] * 100:5.1f}%  "
+              f"queue avg {limits.get('queue_time_avg', 0) * 1000:6.1f} ms  "
+              f"max {limits.get('queue_time_max', 0) * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
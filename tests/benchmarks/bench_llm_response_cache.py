@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark the TektonLLMClient response cache on classification traffic.
+
+Sends a stream of deterministic (temperature 0) classification prompts to
+a local stub Rhetor server with a fixed response time. Prompts are drawn
+with a skewed distribution from a pool of texts, and some arrive reworded
+(case, punctuation and word order), as they do when several components ask
+about the same item. Compares no cache, the exact-match cache, the exact
+plus semantic cache (with a hashed bag-of-words embedding standing in for
+an embedding model) and the exact cache on disk. Reports wall time,
+upstream requests, hit rate and request latency saved.
+
+Usage:
+    python bench_llm_response_cache.py [--requests N] [--texts N] [--latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'tekton-llm-client')))
+
+from aiohttp import web
+
+from tekton_llm_client import TektonLLMClient
+from tekton_llm_client.cache import ResponseCache, DiskCacheBackend
+
+SUBJECTS = ["the release", "this build", "the deploy", "the new planner", "the search index", "the API",
+            "the dashboard", "the nightly job", "the memory store", "the scheduler"]
+VERDICTS = ["works great", "keeps crashing", "is slow today", "looks fine", "broke the pipeline",
+            "fixed the bug", "needs a rollback", "is much faster"]
+
+
+class StubRhetor:
+    def __init__(self, latency):
+        self.latency = latency
+        self.requests = 0
+
+    async def health(self, request):
+        return web.json_response({"status": "ok"})
+
+    async def providers(self, request):
+        return web.json_response({"providers": {"anthropic": {"default_model": "claude"}}})
+
+    async def chat(self, request):
+        await request.json()
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return web.json_response({"content": "positive", "model": "claude", "provider": "anthropic"})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/api/v1/health", self.health)
+        app.router.add_get("/api/v1/providers", self.providers)
+        app.router.add_post("/api/v1/chat", self.chat)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+def embed(text, dimensions=256):
+    """Hashed bag-of-words embedding"""
+    vector = [0.0] * dimensions
+    for word in re.findall(r"\w+", text.lower()):
+        vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % dimensions] += 1.0
+    return vector
+
+
+def reword(text, rng):
+    subject, verdict = text.split(" | ")
+    choice = rng.random()
+    if choice < 0.5:
+        return f"{subject} {verdict}"
+    if choice < 0.75:
+        return f"{subject.capitalize()} {verdict}!"
+    return f"{verdict}: {subject}"
+
+
+def workload(requests, texts, seed=5):
+    rng = random.Random(seed)
+    pool = [f"{rng.choice(SUBJECTS)} | {rng.choice(VERDICTS)}" for _ in range(texts)]
+    weights = [1 / (rank + 1) for rank in range(texts)]
+    return [f"Classify the sentiment of: {reword(rng.choices(pool, weights)[0], rng)}" for _ in range(requests)]
+
+
+async def run(prompts, latency, cache):
+    server = StubRhetor(latency)
+    url = await server.start()
+    client = TektonLLMClient(component_id="bench", rhetor_url=url, use_fallback=False, cache=cache)
+    await client.initialize()
+
+    start = time.perf_counter()
+    for prompt in prompts:
+        await client.generate_text(prompt, options={"temperature": 0})
+    elapsed = time.perf_counter() - start
+
+    stats = client.get_stats().get("cache", {})
+    await client.shutdown()
+    await server.runner.cleanup()
+    return elapsed, server.requests, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="Classification requests to send")
+    parser.add_argument("--texts", type=int, default=60, help="Distinct texts the prompts are drawn from")
+    parser.add_argument("--latency", type=float, default=0.02, help="Stub response time in seconds")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    prompts = workload(args.requests, args.texts)
+    print(f"{args.requests} requests over {args.texts} texts ({len(set(prompts))} distinct prompts), "
+          f"{args.latency * 1000:.0f} ms per upstream call")
+
+    with tempfile.TemporaryDirectory() as directory:
+        configs = (
+            ("no cache", lambda: None),
+            ("exact", lambda: ResponseCache()),
+            ("semantic", lambda: ResponseCache(embedding_function=embed, similarity_threshold=0.99)),
+            ("exact, disk", lambda: ResponseCache(DiskCacheBackend(os.path.join(directory, "responses.db")))),
+        )
+        for name, factory in configs:
+            elapsed, upstream, stats = asyncio.run(run(prompts, args.latency, factory()))
+            print(f"  {name:<12} {elapsed:6.2f} s  upstream {upstream:4d}  "
+                  f"hit rate {stats.get('hit_rate', 0) * 100:5.1f}%  "
+                  f"(exact {stats.get('exact_hits', 0):4d}, semantic {stats.get('semantic_hits', 0):4d})  "
+                  f"latency saved {stats.get('latency_saved', 0):6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
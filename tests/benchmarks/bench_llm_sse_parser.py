@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark SSE parsing of LLM token streams.
+
+Replays a recorded Rhetor token stream, cut into network-sized chunks,
+through an aiohttp StreamReader and parses it with the legacy line loop
+(readline, decode, strip, slice "data: ", json.loads) and with the
+incremental SSE parser using the standard library or orjson. Also compares
+collecting the token text with repeated string concatenation against
+StreamHandler's list-join accumulation. Reports tokens per second.
+
+Usage:
+    python bench_llm_sse_parser.py [--tokens N] [--repeat N]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'tekton-llm-client')))
+
+import aiohttp
+from aiohttp.base_protocol import BaseProtocol
+
+from tekton_llm_client.models import StreamingChunk
+from tekton_llm_client.response_handlers import StreamHandler
+from tekton_llm_client.utils import sse
+
+WORDS = ["the", " model", " returns", " tokens", " as", " server", "-sent", " events", ",", " one", " per",
+         " chunk", ".", "\n", " Ünïcode", " ✓", " {json}", " \"quoted\""]
+
+
+def record_stream(tokens, seed=3):
+    """A Rhetor-style SSE stream of token events, cut into network chunks"""
+    rng = random.Random(seed)
+    body = bytearray()
+    for i in range(tokens):
+        event = {"chunk": rng.choice(WORDS), "context_id": "bench", "model": "claude-3-sonnet",
+                 "provider": "anthropic", "timestamp": f"2024-01-01T00:00:{i % 60:02d}Z"}
+        body += b"data: " + json.dumps(event).encode() + b"\n\n"
+    body += b"data: [DONE]\n\n"
+
+    chunks = []
+    position = 0
+    while position < len(body):
+        size = rng.choice((rng.randint(20, 200), rng.randint(200, 1400), 1400, 4096))
+        chunks.append(bytes(body[position:position + size]))
+        position += size
+    return chunks
+
+
+def make_reader(chunks):
+    loop = asyncio.get_running_loop()
+    # Whole recording is buffered up front, so keep the reader from pausing
+    limit = sum(len(chunk) for chunk in chunks)
+    reader = aiohttp.StreamReader(BaseProtocol(loop), limit, loop=loop)
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
+
+
+async def legacy_parse(chunks):
+    events = []
+    async for line in make_reader(chunks):
+        line = line.decode('utf-8').strip()
+        if not line:
+            continue
+        if line.startswith('data: '):
+            line = line[6:]
+            if line == '[DONE]':
+                break
+            events.append(json.loads(line))
+    return events
+
+
+async def sse_parse(chunks):
+    events = []
+    async for event in sse.iter_sse_events(make_reader(chunks).iter_any()):
+        if event.raw == b"[DONE]":
+            break
+        events.append(event.json())
+    return events
+
+
+def to_chunks(events):
+    return [StreamingChunk(chunk=event["chunk"], context_id="bench", model="m", provider="p", timestamp="")
+            for event in events]
+
+
+class LegacyAccumulator:
+    def __init__(self):
+        self.buffer = ""
+
+    async def process_stream(self, stream):
+        async for chunk in stream:
+            self.buffer += chunk.chunk
+        return self.buffer
+
+
+async def accumulate(handler, chunks):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+    return await handler.process_stream(stream())
+
+
+def best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = asyncio.run(func(*args))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=50000, help="Token events in the recorded stream")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant (best is reported)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    chunks = record_stream(args.tokens)
+    size = sum(len(chunk) for chunk in chunks)
+    print(f"{args.tokens} token events, {size / 1e6:.1f} MB in {len(chunks)} network chunks")
+
+    print("  parsing")
+    reference = None
+    orjson_available = sse.ORJSON_AVAILABLE
+    variants = [("legacy lines", legacy_parse, False), ("sse + json", sse_parse, False)]
+    if orjson_available:
+        variants.append(("sse + orjson", sse_parse, True))
+    for name, func, use_orjson in variants:
+        sse.ORJSON_AVAILABLE = use_orjson
+        elapsed, events = best_of(args.repeat, func, chunks)
+        reference = reference or events
+        assert events == reference
+        print(f"    {name:<14} {elapsed * 1000:8.1f} ms  {args.tokens / elapsed / 1e3:8.1f} k tokens/s")
+    sse.ORJSON_AVAILABLE = orjson_available
+
+    print("  accumulating text")
+    streaming_chunks = to_chunks(reference)
+    for name, factory in (("string +=", LegacyAccumulator), ("list join", StreamHandler)):
+        elapsed, text = best_of(args.repeat, lambda: accumulate(factory(), streaming_chunks))
+        print(f"    {name:<14} {elapsed * 1000:8.1f} ms  {args.tokens / elapsed / 1e3:8.1f} k tokens/s  "
+              f"({len(text)} chars)")
+
+
+if __name__ == "__main__":
+    main()
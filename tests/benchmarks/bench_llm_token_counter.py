@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark token counting for context-window management.
+
+Grows a chat conversation turn by turn and counts the whole history after
+every turn, as trimming before each request does. Compares encoding every
+message on every count (the previous behaviour), count_message_tokens with
+the content-hash count cache, and ConversationTokenCounter, which only
+encodes appended messages. Also counts a cold batch of distinct documents
+one at a time and with count_tokens_batch's threaded encode_batch.
+
+Uses cl100k_base when tiktoken can load it, otherwise a byte-level BPE
+trained on the generated text so the benchmark also runs offline.
+
+Usage:
+    python bench_llm_token_counter.py [--turns N] [--documents N] [--threads N]
+"""
+
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'tekton-llm-client')))
+
+import tiktoken
+
+from tekton_llm_client.utils import token_counter
+from tekton_llm_client.utils import count_message_tokens, count_tokens_batch, ConversationTokenCounter
+
+PATTERN = r"""'s|'t|'re|'ve|'m|'ll|'d| ?\w+| ?\d+| ?[^\s\w]+|\s+(?!\S)|\s+"""
+WORDS = ("the model context window history message token count budget trim summary request response "
+         "component planner memory search index deploy build release latency cache user assistant system "
+         "should would could please explain why how what when where because therefore however").split()
+
+
+def text(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words)) + rng.choice([".", "?", "!", ", right?"])
+
+
+def train_encoding(corpus, merges):
+    """A byte-level BPE with the given number of merges learned from the corpus"""
+    words = Counter(tuple(bytes([b]) for b in piece.encode()) for piece in re.findall(PATTERN, corpus))
+    ranks = {bytes([i]): i for i in range(256)}
+    for _ in range(merges):
+        pairs = Counter()
+        for word, count in words.items():
+            for pair in zip(word, word[1:]):
+                pairs[pair] += count
+        if not pairs:
+            break
+        (a, b), _ = pairs.most_common(1)[0]
+        ranks[a + b] = len(ranks)
+        merged = Counter()
+        for word, count in words.items():
+            out, i = [], 0
+            while i < len(word):
+                if i + 1 < len(word) and word[i] == a and word[i + 1] == b:
+                    out.append(a + b)
+                    i += 2
+                else:
+                    out.append(word[i])
+                    i += 1
+            merged[tuple(out)] += count
+        words = merged
+    return tiktoken.Encoding(name="bench-bpe", pat_str=PATTERN, mergeable_ranks=ranks, special_tokens={})
+
+
+def load_encoding(rng):
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        corpus = " ".join(text(rng, 40) for _ in range(200))
+        return train_encoding(corpus, 300)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def legacy_count(encoding, messages):
+    total = 0
+    for message in messages:
+        total += len(encoding.encode(message.get("content", ""))) + 4
+    return total + 3
+
+
+def grow(turns, seed):
+    rng = random.Random(seed)
+    messages = [{"role": "system", "content": text(rng, 60)}]
+    for i in range(turns):
+        messages.append({"role": "user" if i % 2 == 0 else "assistant", "content": text(rng, rng.randint(20, 300))})
+        yield messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=400, help="Turns in the growing conversation")
+    parser.add_argument("--documents", type=int, default=2000, help="Distinct documents in the cold batch")
+    parser.add_argument("--threads", type=int, default=token_counter.DEFAULT_NUM_THREADS,
+                        help="Threads for encode_batch")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    rng = random.Random(7)
+    encoding = load_encoding(rng)
+    print(f"encoding {encoding.name}, {args.turns} turns counted after each turn, "
+          f"{args.documents} documents, {args.threads} threads")
+
+    with patch.object(token_counter, "get_encoder", return_value=encoding):
+        print("  growing conversation")
+        elapsed, legacy = timed(lambda: [legacy_count(encoding, m) for m in grow(args.turns, 1)])
+        print(f"    {'encode all':<22} {elapsed * 1000:8.1f} ms")
+
+        token_counter.token_count_cache.clear()
+        elapsed, cached = timed(lambda: [count_message_tokens(m)["total_tokens"] for m in grow(args.turns, 1)])
+        assert cached == legacy
+        print(f"    {'count cache':<22} {elapsed * 1000:8.1f} ms  "
+              f"hit rate {token_counter.token_count_cache.get_stats()['hit_rate'] * 100:.1f}%")
+
+        token_counter.token_count_cache.clear()
+        counter = ConversationTokenCounter()
+        elapsed, incremental = timed(lambda: [counter.count(m)["total_tokens"] for m in grow(args.turns, 1)])
+        assert incremental == legacy
+        print(f"    {'incremental counter':<22} {elapsed * 1000:8.1f} ms")
+
+        documents = [text(rng, rng.randint(200, 2000)) for _ in range(args.documents)]
+        print("  cold batch")
+        elapsed, serial = timed(lambda: [len(encoding.encode(document)) for document in documents])
+        print(f"    {'one at a time':<22} {elapsed * 1000:8.1f} ms")
+        token_counter.token_count_cache.clear()
+        elapsed, batch = timed(lambda: count_tokens_batch(documents, num_threads=args.threads))
+        assert batch == serial
+        print(f"    {'count_tokens_batch':<22} {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
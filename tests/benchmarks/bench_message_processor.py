@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCP MessageProcessor throughput on mixed-modality messages.
+
+Each message carries text, structured and code items, one of them a large
+source file. Reports messages/sec with items processed one at a time and
+analysis kept on the event loop (the previous pipeline shape), then with
+concurrent items and large analyses offloaded to a thread or process pool.
+Also times the code structure analysis against the previous per-call
+regex compilation and line counting.
+
+Usage:
+    python bench_message_processor.py [--messages N] [--functions N]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.mcp.context import ContextManager
+from tekton.mcp.message import MCPContentItem, MCPMessage
+from tekton.mcp.modality.code import analyze_structure
+from tekton.mcp.processor import MessageProcessor
+
+
+def make_source(functions):
+    blocks = []
+    for i in range(functions):
+        blocks.append(f"class Model{i}(Base):\n    def method_{i}(self, value):\n"
+                      f"        if value:\n            return value * {i}\n        return None\n")
+    return "import os\nfrom typing import Any\n\n" + "\n".join(blocks)
+
+
+def legacy_structure(code):
+    """Python structure analysis as CodeProcessor._analyze_structure used to do it"""
+    result = {"functions": [], "classes": []}
+    for match in re.finditer(r"def\s+(\w+)\s*\((.*?)\):", code):
+        result["functions"].append({"name": match.group(1), "params": match.group(2),
+                                    "line": code[:match.start()].count("\n") + 1})
+    for match in re.finditer(r"class\s+(\w+)(?:\((.*?)\))?:", code):
+        result["classes"].append({"name": match.group(1), "inherits": match.group(2) or "",
+                                  "line": code[:match.start()].count("\n") + 1})
+    return result
+
+
+def make_message(large_source, small_source):
+    items = [
+        MCPContentItem("text", "Please review the attached models and summarize the results carefully"),
+        MCPContentItem("structured", {"records": [{"id": i, "tags": ["a", "b"]} for i in range(50)]},
+                       format="application/json"),
+        MCPContentItem("code", large_source, format="text/x-python"),
+        MCPContentItem("code", small_source, format="text/x-python"),
+        MCPContentItem("code", large_source, format="text/x-python"),
+    ]
+    return MCPMessage(content=items, source={"component": "bench"})
+
+
+async def run(processor, messages):
+    start = time.perf_counter()
+    for message in messages:
+        response = await processor.process_message(message)
+        assert not response.context.get("error")
+    return len(messages) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=40, help="Messages to process")
+    parser.add_argument("--functions", type=int, default=400, help="Classes/methods in the large source")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    large_source = make_source(args.functions)
+    small_source = make_source(5)
+    print(f"{args.messages} messages, large source {len(large_source) / 1024:.0f} KB, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    legacy_structure(large_source)
+    legacy = time.perf_counter() - start
+    start = time.perf_counter()
+    analyze_structure(large_source, "python")
+    current = time.perf_counter() - start
+    print(f"  structure analysis   legacy {legacy * 1000:8.1f} ms  current {current * 1000:8.1f} ms")
+
+    thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    configs = [
+        ("sequential, inline", dict(max_concurrency=1, offload_threshold=sys.maxsize)),
+        ("concurrent, threads", dict(executor=thread_pool)),
+        ("concurrent, processes", dict(executor=process_pool)),
+    ]
+    for label, kwargs in configs:
+        processor = MessageProcessor(context_manager=ContextManager(), **kwargs)
+        messages = [make_message(large_source, small_source) for _ in range(args.messages)]
+        asyncio.run(run(processor, messages[:1]))  # Warm up the pool
+        rate = asyncio.run(run(processor, messages))
+        print(f"  {label:<22} {rate:8.1f} messages/s")
+    thread_pool.shutdown()
+    process_pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
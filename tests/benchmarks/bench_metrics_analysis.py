@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark the spectral/catastrophe analyses over many sessions.
+
+Generates synthetic sessions, materializes a MetricsFrame once and runs
+every analysis against it, reporting the time for each step.
+
+Usage:
+    python bench_metrics_analysis.py [--sessions N] [--window N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.core.metrics.analysis import (
+    MetricsFrame,
+    SpectralAnalyzer,
+    calculate_bifurcation_proximity,
+    calculate_control_parameter_sensitivity,
+    calculate_hysteresis_detection,
+    find_architectural_elasticity,
+    identify_catastrophe_points,
+)
+from tekton.core.metrics.collector import SessionData
+
+
+SPECTRAL = [
+    "depth_efficiency",
+    "parametric_utilization",
+    "modularity_quotient",
+    "cognitive_convergence_rate",
+    "latent_space_navigation_efficiency",
+    "cross_modal_integration_index",
+    "conceptual_stability_coefficient",
+]
+
+
+def make_sessions(count: int):
+    """Generate sessions with drifting metrics and occasional jumps"""
+    rng = random.Random(42)
+    sessions = []
+    level = 0.5
+    for i in range(count):
+        if rng.random() < 0.001:
+            level = rng.uniform(0.2, 0.9)
+        session = SessionData(
+            id=f"session-{i}",
+            prompt="benchmark",
+            config={"temperature": rng.choice([0.2, 0.5, 0.8, 1.1]), "top_k": rng.randint(1, 100)},
+            start_time=1_700_000_000 + i
+        )
+        session.end_time = session.start_time + rng.random()
+        session.performance = {"accuracy": min(max(level + rng.gauss(0, 0.05), 0), 1)}
+        session.spectral_metrics = {name: level + rng.gauss(0, 0.05) for name in SPECTRAL}
+        session.component_activations = {f"c{j}": [] for j in range(rng.randint(1, 6))}
+        session.parameter_usage = {"model": {"total": rng.randint(1_000, 100_000)}}
+        sessions.append(session)
+    return sessions
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"  {label:<32} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=100_000, help="Number of sessions")
+    parser.add_argument("--window", type=int, default=5, help="Catastrophe detection window")
+    args = parser.parse_args()
+
+    sessions = make_sessions(args.sessions)
+    print(f"{args.sessions} sessions")
+
+    start = time.perf_counter()
+    frame = timed("MetricsFrame.from_sessions", MetricsFrame.from_sessions, sessions)
+    points = timed("identify_catastrophe_points", identify_catastrophe_points, frame, args.window)
+    timed("calculate_bifurcation_proximity", calculate_bifurcation_proximity, frame, 1000)
+    timed("parameter_sensitivity", calculate_control_parameter_sensitivity, frame)
+    timed("hysteresis_detection", calculate_hysteresis_detection, frame, "temperature")
+    timed("architectural_elasticity", find_architectural_elasticity, frame)
+    timed("SpectralAnalyzer.analyze_sessions", SpectralAnalyzer().analyze_sessions, frame)
+    print(f"  {'total':<32} {time.perf_counter() - start:8.3f} s ({len(points)} catastrophe points)")
+
+
+if __name__ == "__main__":
+    main()
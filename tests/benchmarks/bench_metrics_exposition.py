@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark Prometheus scrape encoding.
+
+Registers many labelled series, changes a fraction of them between
+scrapes and compares a cold encode (empty cache) with a warm encode that
+reuses the cached text of unchanged series.
+
+Usage:
+    python bench_metrics_exposition.py [--series N] [--changed FRACTION] [--scrapes N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.core.metrics.exposition import ExpositionEncoder, registry_families
+from tekton.core.metrics.metrics_registry import MetricsRegistry
+
+
+BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--series", type=int, default=5000, help="Labelled series per metric")
+    parser.add_argument("--changed", type=float, default=0.05, help="Fraction of series updated between scrapes")
+    parser.add_argument("--scrapes", type=int, default=20, help="Scrapes to time")
+    parser.add_argument("--openmetrics", action="store_true", help="Encode OpenMetrics instead of Prometheus text")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    registry = MetricsRegistry("bench")
+    counter = registry.create_counter("request_count", "Requests")
+    histogram = registry.create_histogram("request_latency", "Latency", buckets=BUCKETS)
+    children = []
+    for i in range(args.series):
+        children.append(counter.with_labels(endpoint=f"/api/{i}"))
+        children.append(histogram.with_labels(endpoint=f"/api/{i}"))
+
+    def update():
+        for child in rng.sample(children, int(len(children) * args.changed)):
+            if hasattr(child, "observe"):
+                child.observe(rng.random())
+            else:
+                child.increment()
+
+    cold = warm = 0.0
+    size = 0
+    encoder = ExpositionEncoder(args.openmetrics)
+    for _ in range(args.scrapes):
+        update()
+
+        start = time.perf_counter()
+        size = len(ExpositionEncoder(args.openmetrics).encode(registry_families([registry])))
+        cold += time.perf_counter() - start
+
+        start = time.perf_counter()
+        encoder.encode(registry_families([registry]))
+        warm += time.perf_counter() - start
+
+    print(f"{len(children)} series, {args.changed:.0%} changed per scrape, {size / 1024:.0f} KiB per scrape")
+    print(f"  cold encode  {cold / args.scrapes * 1000:8.2f} ms/scrape")
+    print(f"  cached       {warm / args.scrapes * 1000:8.2f} ms/scrape ({encoder.last_encoded} series re-encoded)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark ResourceMonitor history storage.
+
+Feeds a day of synthetic samples into a ResourceHistory, then times
+recent-window sample queries, raw series slices and rollup reads.
+
+Usage:
+    python bench_resource_history.py [--hours N] [--interval SECONDS] [--components N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.core.resource_monitoring.history import ResourceHistory
+from tekton.core.resource_monitoring.metrics import ResourceMetrics
+
+
+def timed(label, func, count=1):
+    start = time.perf_counter()
+    for _ in range(count):
+        result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<32} {elapsed / count * 1e3:9.3f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=int, default=24, help="Retention in hours")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between samples")
+    parser.add_argument("--components", type=int, default=10, help="Monitored components")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    history = ResourceHistory(retention_seconds=args.hours * 3600, sample_interval=args.interval)
+    count = int(args.hours * 3600 / args.interval) * 2
+    now = time.time()
+    first = now - count * args.interval
+
+    samples = [
+        ResourceMetrics(
+            timestamp=datetime.fromtimestamp(first + i * args.interval),
+            cpu_percent=rng.uniform(0, 100),
+            memory_percent=rng.uniform(0, 100),
+            disk_percent={"/": 40.0},
+            network_mbps={"eth0": {"sent_mbps": 1.0, "recv_mbps": 2.0, "total_mbps": 3.0}},
+            component_metrics={f"c{j}": {"cpu_percent": 1.0, "memory_percent": 2.0} for j in range(args.components)}
+        )
+        for i in range(count)
+    ]
+
+    print(f"{count} samples, {history.capacity} retained")
+    start = time.perf_counter()
+    for sample in samples:
+        history.add(sample)
+    elapsed = time.perf_counter() - start
+    print(f"  {'add':<32} {elapsed / count * 1e6:9.3f} us/sample")
+
+    timed("samples in last hour", lambda: history.samples_between(start=now - 3600), 100)
+    timed("cpu series, last hour", lambda: history.series_range("cpu_percent", start=now - 3600), 100)
+    timed("cpu 1m rollup, full retention", lambda: history.rollup("cpu_percent", 60), 100)
+    timed("cpu 1h rollup, full retention", lambda: history.rollup("cpu_percent", 3600), 100)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark SQLiteMetricsStorage ingestion and query latency.
+
+Ingests synthetic sessions (each with activations, propagation steps and
+latent-reasoning records) until the child tables hold the requested number
+of rows, comparing one transaction per store_session() call with the
+group-committing background writer. Then measures get_session() and
+get_sessions() latency against the populated database.
+
+Usage:
+    python bench_sqlite_metrics_storage.py [--rows N] [--rows-per-session N] [--queries N]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.core.metrics.collector import SessionData
+from tekton.core.metrics.storage.sqlite import SQLiteMetricsStorage
+
+
+def make_session(index: int, rows: int) -> SessionData:
+    """Build a session with roughly `rows` child rows"""
+    now = time.time()
+    session = SessionData(
+        id=f"session-{index}",
+        prompt=f"prompt {index}",
+        config={"model": "bench", "temperature": 0.2},
+        start_time=now + index
+    )
+    third = max(rows // 3, 1)
+    session.component_activations = {
+        f"component{c}": [{"timestamp": now, "activation": random.random()} for _ in range(third // 4)]
+        for c in range(4)
+    }
+    session.propagation_path = [
+        {"source": "a", "destination": "b", "info_content": random.random(), "timestamp": now, "hop": i}
+        for i in range(third)
+    ]
+    session.latent_reasoning = [
+        {"component_id": "reasoner", "iteration": i, "final_confidence": random.random(), "timestamp": now}
+        for i in range(third)
+    ]
+    session.end_time = now + 1
+    return session
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Total child rows to ingest")
+    parser.add_argument("--rows-per-session", type=int, default=60, help="Child rows per session")
+    parser.add_argument("--sync-sessions", type=int, default=500, help="Sessions timed with per-call commits")
+    parser.add_argument("--queries", type=int, default=500, help="Queries to time")
+    args = parser.parse_args()
+
+    random.seed(42)
+    sessions = max(args.rows // args.rows_per_session, 1)
+    workdir = tempfile.mkdtemp(prefix="tekton-sqlite-bench-")
+    try:
+        storage = SQLiteMetricsStorage(os.path.join(workdir, "metrics.db"))
+
+        # One transaction per session
+        start = time.perf_counter()
+        for i in range(args.sync_sessions):
+            storage.store_session(make_session(i, args.rows_per_session))
+        elapsed = time.perf_counter() - start
+        print(f"store_session:      {args.sync_sessions / elapsed:8.0f} sessions/sec")
+
+        # Group commits through the background writer
+        start = time.perf_counter()
+        for i in range(args.sync_sessions, sessions):
+            storage.enqueue_session(make_session(i, args.rows_per_session))
+        storage.flush()
+        elapsed = time.perf_counter() - start
+        queued = sessions - args.sync_sessions
+        print(f"enqueue_session:    {queued / elapsed:8.0f} sessions/sec ({queued} sessions)")
+
+        with storage.pool.connection() as conn:
+            rows = sum(
+                conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("component_activations", "propagation_steps", "latent_reasoning")
+            )
+        print(f"child rows:         {rows}")
+
+        start = time.perf_counter()
+        for _ in range(args.queries):
+            storage.get_session(f"session-{random.randrange(sessions)}")
+        elapsed = time.perf_counter() - start
+        print(f"get_session:        {elapsed / args.queries * 1000:8.3f} ms")
+
+        start = time.perf_counter()
+        for _ in range(max(args.queries // 10, 1)):
+            storage.get_sessions(limit=10, offset=random.randrange(max(sessions - 10, 1)))
+        elapsed = time.perf_counter() - start
+        print(f"get_sessions(10):   {elapsed / max(args.queries // 10, 1) * 1000:8.3f} ms")
+
+        storage.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCP tool lookups and result caching.
+
+Registers a catalogue of tools and compares capability/tag lookups done by
+scanning every tool (the previous find_tools_by_* behaviour) with the
+ToolRegistry indexes. Then measures repeated calls of a pure tool with and
+without its result cache.
+
+Usage:
+    python bench_tool_registry_lookup.py [--tools N] [--queries N] [--calls N]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from tekton.mcp.tool_registry import ToolRegistry
+
+CAPABILITIES = [f"capability-{i}" for i in range(50)]
+TAGS = [f"tag-{i}" for i in range(50)]
+
+
+def scan_capability(tools, capability):
+    """Capability lookup by scanning every tool, as find_tools_by_capability used to"""
+    matching = []
+    for tool in tools.values():
+        if capability in tool.get("tags", []) or capability in tool.get("metadata", {}).get("capabilities", []):
+            matching.append(tool)
+        elif (capability.lower() in tool.get("name", "").lower() or
+              capability.lower() in tool.get("description", "").lower()):
+            matching.append(tool)
+    return matching
+
+
+def scan_tag(tools, tag):
+    return [tool for tool in tools.values() if tag in tool.get("tags", [])]
+
+
+def pure_tool(n):
+    return sum(i * i for i in range(n))
+
+
+async def bench_lookups(tool_count, queries):
+    rng = random.Random(7)
+    registry = ToolRegistry()
+    for i in range(tool_count):
+        await registry.register_tool({
+            "name": f"tool-{i}", "description": f"Tool number {i}", "schema": {}, "function": len,
+            "tags": rng.sample(TAGS, 3), "metadata": {"capabilities": rng.sample(CAPABILITIES, 2)}
+        })
+
+    capability_queries = [rng.choice(CAPABILITIES) for _ in range(queries)]
+    tag_queries = [rng.choice(TAGS) for _ in range(queries)]
+    timings = {}
+
+    start = time.perf_counter()
+    for capability in capability_queries:
+        scan_capability(registry.tools, capability)
+    timings["capability scan"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for capability in capability_queries:
+        await registry.find_tools_by_capability(capability)
+    timings["capability index"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tag in tag_queries:
+        scan_tag(registry.tools, tag)
+    timings["tag scan"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tag in tag_queries:
+        await registry.find_tools_by_tag(tag)
+    timings["tag index"] = time.perf_counter() - start
+
+    return timings
+
+
+async def bench_calls(calls, distinct, cacheable):
+    registry = ToolRegistry()
+    tool_id = await registry.register_tool({
+        "name": "pure", "description": "pure", "schema": {}, "function": pure_tool, "cacheable": cacheable
+    })
+    start = time.perf_counter()
+    for i in range(calls):
+        await registry.execute_tool(tool_id, {"n": 20000 + i % distinct})
+    elapsed = time.perf_counter() - start
+    stats = registry.get_cache_stats()
+    registry.shutdown()
+    return elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tools", type=int, default=1000, help="Registered tools")
+    parser.add_argument("--queries", type=int, default=2000, help="Lookups per kind")
+    parser.add_argument("--calls", type=int, default=500, help="Calls of the pure tool")
+    parser.add_argument("--distinct", type=int, default=10, help="Distinct parameter sets")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{args.tools} tools, {args.queries} lookups per kind")
+    for label, elapsed in asyncio.run(bench_lookups(args.tools, args.queries)).items():
+        print(f"  {label:<18} {elapsed * 1000:9.1f} ms  ({elapsed / args.queries * 1e6:8.1f} us/lookup)")
+
+    print(f"{args.calls} calls of a pure tool over {args.distinct} distinct parameter sets")
+    for cacheable in (False, True):
+        elapsed, stats = asyncio.run(bench_calls(args.calls, args.distinct, cacheable))
+        label = "cached" if cacheable else "uncached"
+        print(f"  {label:<18} {elapsed * 1000:9.1f} ms  hit rate {stats['hit_rate']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
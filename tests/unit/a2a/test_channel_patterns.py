@@ -0,0 +1,138 @@
+"""
+Unit tests for compiled channel pattern matching
+"""
+
+import random
+import re
+from datetime import datetime
+
+import pytest
+
+from tekton.a2a.streaming.events import ChannelEvent, EventType
+from tekton.a2a.streaming.patterns import PatternCache, SegmentTrie, pattern_to_regex
+from tekton.a2a.streaming.subscription import SubscriptionManager, SubscriptionType
+
+
+class TestPatternCache:
+    """Test the compiled pattern LRU"""
+    
+    def test_matching(self):
+        """Test wildcard semantics"""
+        cache = PatternCache()
+        assert cache.matches("metrics.cpu", "metrics.*") is True
+        assert cache.matches("metrics.system.cpu", "metrics.*") is False
+        assert cache.matches("metrics.system.cpu", "metrics.**") is True
+        assert cache.matches("metrics", "metrics.**") is False
+        assert cache.matches("metrics.cpu", "metrics.c*") is True
+        assert cache.matches("metrics+cpu", "metrics+cpu") is True
+        assert cache.matches("metricsXcpu", "metrics.cpu") is False
+    
+    def test_lru_eviction(self):
+        """Test the cache is bounded"""
+        cache = PatternCache(maxsize=2)
+        cache.get("a.*")
+        cache.get("b.*")
+        cache.get("a.*")
+        cache.get("c.*")
+        assert len(cache) == 2
+        assert "a.*" in cache
+        assert "b.*" not in cache
+
+
+class TestSegmentTrie:
+    """Test the segment trie in both directions"""
+    
+    def test_match_patterns(self):
+        """Test finding patterns that match a channel"""
+        trie = SegmentTrie()
+        trie.add("metrics.*", "s1")
+        trie.add("metrics.**", "s2")
+        trie.add("metrics.cpu", "s3")
+        trie.add("**", "s4")
+        trie.add("a.**.d", "s5")
+        trie.add("metrics.c*", "s6")
+        
+        assert trie.match("metrics.cpu") == {"s1", "s2", "s3", "s4", "s6"}
+        assert trie.match("metrics.system.cpu") == {"s2", "s4"}
+        assert trie.match("a.b.c.d") == {"s4", "s5"}
+        assert trie.match("a.d") == {"s4"}
+    
+    def test_find_channels(self):
+        """Test finding channels that match a pattern"""
+        trie = SegmentTrie()
+        for name in ["metrics.cpu", "metrics.memory", "metrics.system.cpu", "tasks.created"]:
+            trie.add(name)
+        
+        assert trie.find("metrics.*") == {"metrics.cpu", "metrics.memory"}
+        assert trie.find("metrics.**") == {"metrics.cpu", "metrics.memory", "metrics.system.cpu"}
+        assert trie.find("*.cpu") == {"metrics.cpu"}
+        assert trie.find("**.cpu") == {"metrics.cpu", "metrics.system.cpu"}
+        assert trie.find("metrics.m*") == {"metrics.memory"}
+    
+    def test_remove(self):
+        """Test removing keys prunes the trie"""
+        trie = SegmentTrie()
+        trie.add("a.b.c", "x")
+        trie.add("a.*", "y")
+        assert trie.remove("a.b.c", "x") is True
+        assert trie.remove("a.b.c", "x") is False
+        assert len(trie) == 1
+        assert "b" not in trie._root.children["a"].children
+        assert trie.match("a.b") == {"y"}
+    
+    def test_agrees_with_regex(self):
+        """Test the trie agrees with regex matching on random inputs"""
+        rng = random.Random(42)
+        words = ["a", "b", "c", ""]
+        
+        def random_name(tokens):
+            return ".".join(rng.choice(tokens) for _ in range(rng.randint(1, 4)))
+        
+        patterns = {random_name(words[:3] + ["*", "**"]) for _ in range(200)}
+        channels = {random_name(words) for _ in range(200)}
+        
+        pattern_trie = SegmentTrie()
+        channel_trie = SegmentTrie()
+        for pattern in patterns:
+            pattern_trie.add(pattern)
+        for channel in channels:
+            channel_trie.add(channel)
+        
+        for channel in channels:
+            expected = {p for p in patterns if re.match(pattern_to_regex(p), channel)}
+            assert pattern_trie.match(channel) == expected, channel
+        
+        for pattern in patterns:
+            expected = {c for c in channels if re.match(pattern_to_regex(pattern), c)}
+            assert channel_trie.find(pattern) == expected, pattern
+
+
+class TestPatternSubscriptions:
+    """Test pattern subscriptions in the subscription manager"""
+    
+    @pytest.mark.asyncio
+    async def test_route_pattern_subscription(self):
+        """Test channel events reach pattern subscriptions"""
+        manager = SubscriptionManager()
+        received = []
+        
+        async def callback(event):
+            received.append(event.channel)
+        
+        subscription = await manager.create_subscription(
+            subscriber_id="agent-1",
+            subscription_type=SubscriptionType.CHANNEL,
+            filters={"channel_pattern": "metrics.*"},
+            callback=callback
+        )
+        
+        for channel in ["metrics.cpu", "metrics.system.cpu", "tasks.created"]:
+            await manager.route_event(ChannelEvent(
+                id="evt", type=EventType.CHANNEL_MESSAGE, timestamp=datetime.utcnow(),
+                source="agent-2", channel=channel, sender_id="agent-2", data={}
+            ))
+        
+        assert received == ["metrics.cpu"]
+        
+        await manager.remove_subscription(subscription.id)
+        assert len(manager._pattern_index) == 0
@@ -11,6 +11,7 @@ from uuid import uuid4
 from tekton.a2a.streaming.channels import Channel, ChannelBridge
 from tekton.a2a.streaming.events import ChannelEvent, EventType
 from tekton.a2a.streaming.subscription import SubscriptionManager, SubscriptionType
+from tekton.a2a.streaming.patterns import default_pattern_cache
 
 
 class TestChannel:
@@ -350,19 +351,23 @@ class TestChannelBridge:
     
     @pytest.mark.asyncio
     async def test_pattern_caching(self, channel_bridge):
-        """Test that pattern compilation is cached"""
+        """Test that pattern compilation is cached in the shared cache"""
+        assert channel_bridge._pattern_cache is default_pattern_cache
+        default_pattern_cache.clear()
+        
         # First call compiles pattern
-        assert len(channel_bridge._pattern_cache) == 0
         result1 = channel_bridge.matches_pattern("metrics.cpu", "metrics.*")
-        assert len(channel_bridge._pattern_cache) == 1
+        compiled = default_pattern_cache.get("metrics.*")
+        assert len(default_pattern_cache) == 1
         
         # Second call uses cached pattern
         result2 = channel_bridge.matches_pattern("metrics.memory", "metrics.*")
-        assert len(channel_bridge._pattern_cache) == 1
+        assert default_pattern_cache.get("metrics.*") is compiled
+        assert len(default_pattern_cache) == 1
         
         # Different pattern creates new cache entry
         result3 = channel_bridge.matches_pattern("tasks.created", "tasks.**")
-        assert len(channel_bridge._pattern_cache) == 2
+        assert len(default_pattern_cache) == 2
         
         assert result1 is True
         assert result2 is True
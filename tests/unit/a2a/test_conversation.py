@@ -10,8 +10,10 @@ from uuid import uuid4
 
 from tekton.a2a.conversation import (
     Conversation, ConversationRole, ConversationState,
-    TurnTakingMode, ConversationParticipant, ConversationMessage
+    TurnTakingMode, ConversationParticipant, ConversationMessage,
+    MAX_TURN_MESSAGE_IDS
 )
+from tekton.a2a.conversation_history import ConversationHistory, SPILL_BATCH_SIZE
 from tekton.a2a.conversation_manager import ConversationManager
 from tekton.a2a.errors import ConversationNotFoundError, UnauthorizedError, InvalidRequestError
 
@@ -130,6 +132,19 @@ class TestConversation:
         assert conv.message_count == 1
         assert conv.participants["agent-123"].message_count == 1
     
+    def test_turn_keeps_recent_message_ids(self):
+        """Test a turn only remembers its most recent message IDs"""
+        conv = Conversation.create("Test", "agent-123")
+        turn = conv.start_turn("agent-123")
+        
+        for i in range(MAX_TURN_MESSAGE_IDS + 5):
+            conv.record_message(ConversationMessage(
+                id=f"msg-{i}", conversation_id=conv.id, sender_id="agent-123", content="Hi"
+            ))
+        
+        assert len(turn.messages) == MAX_TURN_MESSAGE_IDS
+        assert turn.messages[0] == "msg-5"
+    
     def test_conversation_lifecycle(self):
         """Test conversation state transitions"""
         conv = Conversation.create("Test", "agent-123")
@@ -163,9 +178,9 @@ class TestConversationManager:
         return bridge
     
     @pytest.fixture
-    def conversation_manager(self, mock_channel_bridge):
+    def conversation_manager(self, mock_channel_bridge, tmp_path):
         """Create a conversation manager"""
-        return ConversationManager(mock_channel_bridge)
+        return ConversationManager(mock_channel_bridge, history_dir=str(tmp_path))
     
     @pytest.mark.asyncio
     async def test_create_conversation(self, conversation_manager, mock_channel_bridge):
@@ -437,4 +452,141 @@ class TestConversationManager:
             "conversation.turn_timeout" in str(call) 
             for call in calls
         )
-        assert timeout_event_sent
\ No newline at end of file
+        assert timeout_event_sent
+
+class TestConversationHistory:
+    """Test windowed conversation history"""
+    
+    def _message(self, i: int) -> ConversationMessage:
+        return ConversationMessage(
+            conversation_id="conv-1",
+            sender_id="agent-123",
+            content=f"message {i}"
+        )
+    
+    def test_window_and_spill(self, tmp_path):
+        """Test old messages spill to disk and remain readable"""
+        history = ConversationHistory(
+            "conv-1", window_size=10, storage_dir=str(tmp_path), index_interval=4
+        )
+        for i in range(35):
+            assert history.append(self._message(i)) == i
+        
+        assert history.total == 35
+        assert len(history._window) == 10
+        
+        # Evicted messages are readable before they are written
+        assert history.pending == 25
+        assert not (tmp_path / "conv-1.jsonl").exists()
+        assert [m.content for m in history.get_page(offset=3, limit=2)] == ["message 3", "message 4"]
+        
+        history.flush()
+        assert history.pending == 0
+        assert (tmp_path / "conv-1.jsonl").exists()
+        for i in range(35, 38):
+            history.append(self._message(i))
+        
+        # Page spanning the spill file, unwritten messages and the in-memory window
+        page = history.get_page(offset=22, limit=14)
+        assert [m.content for m in page] == [f"message {i}" for i in range(22, 36)]
+        
+        # Full iteration returns every message in order
+        contents = [m.content for page in history.iter_pages(page_size=7) for m in page]
+        assert contents == [f"message {i}" for i in range(38)]
+        
+        history.close()
+        assert history.get_page(0, 1)[0].content == "message 0"
+        
+        history.delete()
+        assert not (tmp_path / "conv-1.jsonl").exists()
+        assert history.get_page(0, 100) == []
+    
+    def test_drop_without_storage(self):
+        """Test evicted messages are dropped without a storage directory"""
+        history = ConversationHistory("conv-1", window_size=5)
+        for i in range(12):
+            history.append(self._message(i))
+        
+        assert history.available_from == 7
+        assert [m.content for m in history.get_page(0, 3)] == [
+            "message 7", "message 8", "message 9"
+        ]
+        assert [m.content for m in history.get_recent(2)] == ["message 10", "message 11"]
+    
+    @pytest.mark.asyncio
+    async def test_manager_history(self, tmp_path):
+        """Test paginated and streamed history through the manager"""
+        bridge = AsyncMock()
+        manager = ConversationManager(bridge, history_window=3, history_dir=str(tmp_path))
+        conv = await manager.create_conversation(topic="Chat", created_by="agent-123")
+        
+        for i in range(8):
+            await manager.send_message(conv.id, "agent-123", f"message {i}")
+        
+        page = await manager.get_history(conv.id, offset=0, limit=5)
+        assert [m["content"] for m in page["messages"]] == [f"message {i}" for i in range(5)]
+        assert page["total"] == 8
+        assert page["has_more"] is True
+        
+        recent = await manager.get_history(conv.id, limit=2)
+        assert recent["offset"] == 6
+        assert recent["has_more"] is False
+        
+        with pytest.raises(UnauthorizedError):
+            await manager.get_history(conv.id, agent_id="agent-999")
+        
+        streamed = []
+        async for page in manager.stream_history(conv.id, page_size=3):
+            streamed.extend(m["content"] for m in page)
+        assert streamed == [f"message {i}" for i in range(8)]
+    
+    @pytest.mark.asyncio
+    async def test_manager_spill_lifecycle(self, tmp_path):
+        """Test spilled history outlives the conversation until it is purged"""
+        bridge = AsyncMock()
+        manager = ConversationManager(bridge, history_window=2, history_dir=str(tmp_path))
+        conv = await manager.create_conversation(topic="Chat", created_by="agent-123")
+        
+        for i in range(SPILL_BATCH_SIZE + 2):
+            await manager.send_message(conv.id, "agent-123", f"message {i}")
+        spill_file = tmp_path / f"{conv.id}.jsonl"
+        assert spill_file.exists()
+        assert manager.histories[conv.id].pending == 0
+        
+        page = await manager.get_history(conv.id, offset=0, limit=3)
+        assert [m["content"] for m in page["messages"]] == ["message 0", "message 1", "message 2"]
+        
+        with pytest.raises(InvalidRequestError):
+            await manager.purge_conversation(conv.id, "agent-123")
+        
+        # Ending moves the window to disk and keeps the history readable
+        await manager.end_conversation(conv.id, "agent-123")
+        history = manager.histories[conv.id]
+        assert len(history._window) == 0
+        page = await manager.get_history(conv.id, limit=2)
+        assert [m["content"] for m in page["messages"]] == [
+            f"message {SPILL_BATCH_SIZE}", f"message {SPILL_BATCH_SIZE + 1}"
+        ]
+        
+        with pytest.raises(UnauthorizedError):
+            await manager.purge_conversation(conv.id, "agent-999")
+        await manager.purge_conversation(conv.id, "agent-123")
+        assert conv.id not in manager.histories
+        assert not spill_file.exists()
+        with pytest.raises(ConversationNotFoundError):
+            await manager.get_history(conv.id)
+    
+    @pytest.mark.asyncio
+    async def test_manager_spills_by_default(self, tmp_path, monkeypatch):
+        """Test the manager spills to the default directory unless given one"""
+        monkeypatch.setenv("TEKTON_CONVERSATION_HISTORY_PATH", str(tmp_path))
+        manager = ConversationManager(AsyncMock(), history_window=2)
+        conv = await manager.create_conversation(topic="Chat", created_by="agent-123")
+        for i in range(5):
+            await manager.send_message(conv.id, "agent-123", f"message {i}")
+        await manager.end_conversation(conv.id, "agent-123")
+        
+        assert manager.history_dir == str(tmp_path)
+        assert (tmp_path / f"{conv.id}.jsonl").exists()
+        page = await manager.get_history(conv.id, offset=0)
+        assert [m["content"] for m in page["messages"]] == [f"message {i}" for i in range(5)]
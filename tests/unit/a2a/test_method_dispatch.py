@@ -0,0 +1,203 @@
+"""
+Unit tests for JSON-RPC method dispatch in A2A Protocol v0.2.1
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from tekton.a2a.jsonrpc import (
+    JSONRPCRequest, JSONRPCBatch, ORJSON_AVAILABLE,
+    parse_jsonrpc_message, set_json_codec, get_json_codec
+)
+from tekton.a2a.methods import MethodDispatcher
+
+
+@pytest.fixture
+def dispatcher():
+    """Create a dispatcher with a few test methods"""
+    dispatcher = MethodDispatcher()
+    
+    async def echo(value):
+        return {"value": value}
+    
+    def add(a, b=0):
+        return a + b
+    
+    async def collect(**kwargs):
+        return kwargs
+    
+    dispatcher.register_method("test.echo", echo)
+    dispatcher.register_method("test.add", add)
+    dispatcher.register_method("test.collect", collect)
+    return dispatcher
+
+
+class TestMethodDispatch:
+    """Test single request dispatch"""
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_kwargs(self, dispatcher):
+        """Test dispatching with keyword parameters"""
+        response = await dispatcher.dispatch(
+            JSONRPCRequest("test.echo", {"value": 5}, id=1)
+        )
+        assert response.result == {"value": 5}
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_sync_handler_args(self, dispatcher):
+        """Test dispatching a sync handler with positional parameters"""
+        response = await dispatcher.dispatch(JSONRPCRequest("test.add", [2, 3], id=1))
+        assert response.result == 5
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_var_kwargs(self, dispatcher):
+        """Test handlers accepting arbitrary keyword parameters"""
+        response = await dispatcher.dispatch(
+            JSONRPCRequest("test.collect", {"x": 1, "y": 2}, id=1)
+        )
+        assert response.result == {"x": 1, "y": 2}
+    
+    @pytest.mark.asyncio
+    async def test_method_not_found(self, dispatcher):
+        """Test unknown methods"""
+        response = await dispatcher.dispatch(JSONRPCRequest("test.missing", id=1))
+        assert response.error["code"] == -32601
+    
+    @pytest.mark.asyncio
+    async def test_missing_parameter(self, dispatcher):
+        """Test missing required parameters are invalid params"""
+        response = await dispatcher.dispatch(JSONRPCRequest("test.echo", {}, id=1))
+        assert response.error["code"] == -32602
+        assert "value" in response.error["data"]
+    
+    @pytest.mark.asyncio
+    async def test_unexpected_parameter(self, dispatcher):
+        """Test unexpected parameters are invalid params"""
+        response = await dispatcher.dispatch(
+            JSONRPCRequest("test.echo", {"value": 1, "other": 2}, id=1)
+        )
+        assert response.error["code"] == -32602
+        assert "other" in response.error["data"]
+    
+    @pytest.mark.asyncio
+    async def test_too_many_positional(self, dispatcher):
+        """Test too many positional parameters"""
+        response = await dispatcher.dispatch(JSONRPCRequest("test.add", [1, 2, 3], id=1))
+        assert response.error["code"] == -32602
+
+
+class TestBatchDispatch:
+    """Test concurrent batch dispatch"""
+    
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order(self):
+        """Test responses come back in request order"""
+        dispatcher = MethodDispatcher()
+        
+        async def sleep(delay):
+            await asyncio.sleep(delay)
+            return delay
+        
+        dispatcher.register_method("test.sleep", sleep)
+        delays = [0.03, 0.01, 0.02, 0.0]
+        batch = JSONRPCBatch([
+            JSONRPCRequest("test.sleep", {"delay": d}, id=i)
+            for i, d in enumerate(delays)
+        ])
+        
+        result = await dispatcher.dispatch_batch(batch)
+        assert [r.id for r in result.messages] == [0, 1, 2, 3]
+        assert [r.result for r in result.messages] == delays
+    
+    @pytest.mark.asyncio
+    async def test_batch_concurrency_cap(self):
+        """Test the concurrency cap bounds in-flight requests"""
+        dispatcher = MethodDispatcher(max_batch_concurrency=3)
+        in_flight = 0
+        peak = 0
+        
+        async def work():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+        
+        dispatcher.register_method("test.work", work)
+        batch = JSONRPCBatch([JSONRPCRequest("test.work", id=i) for i in range(10)])
+        
+        result = await dispatcher.dispatch_batch(batch)
+        assert len(result.messages) == 10
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    async def test_batch_skips_notifications(self, dispatcher):
+        """Test notifications do not produce batch responses"""
+        batch = JSONRPCBatch([
+            JSONRPCRequest("test.echo", {"value": 1}),
+            JSONRPCRequest("test.echo", {"value": 2}, id="b")
+        ])
+        
+        result = await dispatcher.dispatch_batch(batch)
+        assert [r.id for r in result.messages] == ["b"]
+        
+        notifications = JSONRPCBatch([JSONRPCRequest("test.echo", {"value": 1})])
+        assert await dispatcher.dispatch_batch(notifications) is None
+    
+    @pytest.mark.asyncio
+    async def test_batch_explicit_concurrency(self, dispatcher):
+        """Test an explicit concurrency limit is used as given and validated"""
+        batch = JSONRPCBatch([JSONRPCRequest("test.add", [i], id=i) for i in range(3)])
+        
+        result = await dispatcher.dispatch_batch(batch, max_concurrency=1)
+        assert [r.result for r in result.messages] == [0, 1, 2]
+        
+        with pytest.raises(ValueError):
+            await dispatcher.dispatch_batch(batch, max_concurrency=0)
+    
+    @pytest.mark.asyncio
+    async def test_handle_message(self, dispatcher):
+        """Test dispatching parsed single and batch messages"""
+        single = parse_jsonrpc_message(
+            '{"jsonrpc": "2.0", "method": "test.add", "params": [1, 1], "id": 1}'
+        )
+        assert (await dispatcher.handle_message(single)).result == 2
+        
+        calls = []
+        dispatcher.register_method("test.record", lambda value: calls.append(value))
+        notification = parse_jsonrpc_message(
+            '{"jsonrpc": "2.0", "method": "test.record", "params": {"value": 7}}'
+        )
+        assert await dispatcher.handle_message(notification) is None
+        assert calls == [7]
+        
+        batch = parse_jsonrpc_message(
+            '[{"jsonrpc": "2.0", "method": "test.add", "params": [1], "id": 1},'
+            ' {"jsonrpc": "2.0", "method": "test.missing", "id": 2}]'
+        )
+        result = await dispatcher.handle_message(batch)
+        assert json.loads(result.to_json())[1]["error"]["code"] == -32601
+
+
+@pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+class TestORJSONCodec:
+    """Test the optional orjson codec"""
+    
+    def test_roundtrip(self):
+        """Test parsing and serializing with orjson"""
+        previous = get_json_codec()
+        set_json_codec("orjson")
+        try:
+            request = parse_jsonrpc_message(b'{"jsonrpc": "2.0", "method": "m", "id": 1}')
+            assert request.method == "m"
+            assert json.loads(request.to_json()) == request.to_dict()
+        finally:
+            set_json_codec(previous)
+    
+    def test_unknown_codec(self):
+        """Test selecting an unknown codec"""
+        with pytest.raises(ValueError):
+            set_json_codec("yaml")
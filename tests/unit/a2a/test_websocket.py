@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from fastapi import WebSocket
+from fastapi import WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
 from tekton.a2a.streaming.websocket import (
@@ -22,7 +22,8 @@ from tekton.a2a.streaming.websocket import (
 from tekton.a2a.streaming.events import StreamEvent, EventType, TaskEvent
 from tekton.a2a import (
     JSONRPCRequest,
-    JSONRPCResponse
+    JSONRPCResponse,
+    MethodDispatcher
 )
 
 
@@ -428,6 +429,31 @@ class TestWebSocketManager:
         
         assert handler_called is True
     
+    @pytest.mark.asyncio
+    async def test_handle_batch(self, manager, mock_websocket):
+        """Test batches received on a connection go through the dispatcher"""
+        dispatcher = MethodDispatcher()
+        dispatcher.register_method("test.add", lambda a, b: a + b)
+        manager.dispatcher = dispatcher
+        
+        connection = await manager.connect(mock_websocket)
+        mock_websocket.receive_text.side_effect = [
+            json.dumps([
+                {"jsonrpc": "2.0", "method": "test.add", "params": [1, 2], "id": 1},
+                {"jsonrpc": "2.0", "method": "test.add", "params": [3, 4]},
+                {"jsonrpc": "2.0", "method": "test.add", "params": [5, 6], "id": 2}
+            ]),
+            json.dumps([{"jsonrpc": "2.0", "method": "test.add", "params": [0, 0]}]),
+            WebSocketDisconnect()
+        ]
+        
+        await manager.handle_connection(connection)
+        
+        # One reply for the first batch, none for the batch of notifications
+        replies = [json.loads(call[0][0]) for call in mock_websocket.send_text.call_args_list[1:]]
+        assert len(replies) == 1
+        assert [(r["id"], r["result"]) for r in replies[0]] == [(1, 3), (2, 11)]
+    
     @pytest.mark.asyncio
     async def test_close_all(self, manager):
         """Test closing all connections"""
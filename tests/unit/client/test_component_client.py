@@ -0,0 +1,192 @@
+"""
+Unit tests for connection pooling and component info caching in ComponentClient
+"""
+
+import asyncio
+import threading
+
+from aiohttp import web
+
+from tekton.utils.client import (
+    ComponentClient,
+    ComponentInfoCache,
+    ComponentUnavailableError,
+    ConnectionPool,
+    RetryPolicy,
+    SecurityContext
+)
+from tekton.utils.client.pool import endpoint_key
+
+
+class FakeHermes:
+    """Hermes registry and component endpoint on one local server"""
+
+    def __init__(self):
+        self.lookups = 0
+        self.invocations = 0
+        self.fail_next = 0
+        self.fail_lookups = 0
+        self.tokens = []
+        self.url = None
+
+    async def component(self, request):
+        self.lookups += 1
+        self.tokens.append(request.headers.get("Authorization"))
+        await asyncio.sleep(0.02)
+        if self.fail_lookups:
+            self.fail_lookups -= 1
+            return web.Response(status=503, text="registry busy")
+        return web.json_response({"endpoint": f"{self.url}/echo", "capabilities": ["echo", {"name": "sum"}]})
+
+    async def invoke(self, request):
+        self.invocations += 1
+        if self.fail_next:
+            self.fail_next -= 1
+            return web.Response(status=503, text="busy")
+        return web.json_response({"capability": request.match_info["capability"], "params": await request.json()})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/api/registry/component/{component_id}", self.component)
+        app.router.add_post("/echo/capabilities/{capability}", self.invoke)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+def make_client(hermes, pool, **kwargs):
+    client = ComponentClient("echo", hermes_url=f"{hermes.url}/api", pool=pool,
+                             retry_policy=RetryPolicy(retry_delay=0.01), **kwargs)
+    client._info_cache = ComponentInfoCache()
+    return client
+
+
+class TestComponentClient:
+    """Test pooled invocations and shared lookups"""
+
+    def test_fan_out_shares_lookup_and_connections(self):
+        """Test concurrent clients coalesce the registry lookup and reuse pooled connections"""
+        async def main():
+            hermes = FakeHermes()
+            await hermes.start()
+            pool = ConnectionPool()
+            cache = ComponentInfoCache()
+            clients = [make_client(hermes, pool) for _ in range(5)]
+            for client in clients:
+                client._info_cache = cache
+            first = await asyncio.gather(*(client.invoke_capability("echo", {"i": i})
+                                           for i, client in enumerate(clients)))
+            second = await asyncio.gather(*(client.invoke_capability("sum", {"i": i})
+                                            for i, client in enumerate(clients)))
+            stats = pool.get_stats()[endpoint_key(hermes.url)]
+            await pool.close()
+            await hermes.stop()
+            return hermes, cache.get_stats(), stats, first + second
+
+        hermes, cache_stats, pool_stats, results = asyncio.run(main())
+        assert [result["params"]["i"] for result in results] == [0, 1, 2, 3, 4] * 2
+        assert hermes.lookups == 1
+        assert cache_stats["coalesced"] == 4 and cache_stats["misses"] == 5
+        assert pool_stats["requests"] == 11 and pool_stats["connections_reused"] > 0
+        assert pool_stats["connections_created"] <= 6
+
+    def test_ttl_and_invalidation_on_failure(self):
+        """Test component info expires after its TTL and is re-fetched after a failed call"""
+        async def main():
+            hermes = FakeHermes()
+            await hermes.start()
+            pool = ConnectionPool()
+            client = make_client(hermes, pool, component_info_ttl=0.05)
+            await client.invoke_capability("echo", {})
+            await client.invoke_capability("echo", {})
+            cached_lookups = hermes.lookups
+            await asyncio.sleep(0.06)
+            await client.invoke_capability("echo", {})
+            expired_lookups = hermes.lookups
+
+            hermes.fail_next = 1
+            await client.invoke_capability("echo", {})
+            retried_lookups = hermes.lookups
+
+            hermes.fail_next = 10
+            try:
+                await client.invoke_capability("echo", {})
+                error = None
+            except ComponentUnavailableError as e:
+                error = e
+            await pool.close()
+            await hermes.stop()
+            return cached_lookups, expired_lookups, retried_lookups, error
+
+        cached_lookups, expired_lookups, retried_lookups, error = asyncio.run(main())
+        assert (cached_lookups, expired_lookups, retried_lookups) == (1, 2, 3)
+        assert error is not None
+
+    def test_lookups_scoped_to_credentials(self):
+        """Test clients with different credentials do not share fetched component info"""
+        async def main():
+            hermes = FakeHermes()
+            await hermes.start()
+            pool = ConnectionPool()
+            cache = ComponentInfoCache()
+            clients = [make_client(hermes, pool, security_context=SecurityContext(token=token))
+                       for token in ("alice", "bob", "alice", None)]
+            for client in clients:
+                client._info_cache = cache
+                await client.invoke_capability("echo", {})
+            await pool.close()
+            await hermes.stop()
+            return hermes
+
+        hermes = asyncio.run(main())
+        assert hermes.tokens == ["Bearer alice", "Bearer bob", None]
+
+    def test_failed_lookup_during_retry_is_retried(self):
+        """Test an error looking the endpoint up again counts as a retry instead of aborting"""
+        async def main():
+            hermes = FakeHermes()
+            await hermes.start()
+            pool = ConnectionPool()
+            client = make_client(hermes, pool)
+            await client.invoke_capability("echo", {})
+            hermes.fail_next = 1
+            hermes.fail_lookups = 1
+            result = await client.invoke_capability("echo", {"retried": True})
+            await pool.close()
+            await hermes.stop()
+            return hermes, result
+
+        hermes, result = asyncio.run(main())
+        assert result["params"] == {"retried": True}
+        assert hermes.lookups == 3
+
+    def test_close_reaches_other_loops(self):
+        """Test closing the pool closes sessions opened on a loop running in another thread"""
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        pool = ConnectionPool()
+
+        async def open_session():
+            return pool.session("http://127.0.0.1:1/")
+
+        session = asyncio.run_coroutine_threadsafe(open_session(), other).result(5)
+
+        async def main():
+            await pool.close()
+            for _ in range(100):
+                if session.closed:
+                    break
+                await asyncio.sleep(0.01)
+
+        asyncio.run(main())
+        other.call_soon_threadsafe(other.stop)
+        thread.join(5)
+        other.close()
+        assert session.closed
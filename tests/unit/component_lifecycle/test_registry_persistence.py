@@ -0,0 +1,104 @@
+"""
+Unit tests for journaled registration persistence
+"""
+
+import asyncio
+import os
+
+from tekton.core.component_lifecycle.registry import ComponentRegistry, RegistrationStore
+from tekton.core.lifecycle import ComponentRegistration, ComponentState
+
+
+def journal_lines(data_dir):
+    path = os.path.join(data_dir, "registrations.journal")
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return sum(1 for _ in f)
+
+
+class TestRegistrationStore:
+    """Test the snapshot and journal"""
+
+    def test_heartbeats_are_batched(self, tmp_path):
+        """Test heartbeat-only updates are held until flush and written once"""
+        store = RegistrationStore(str(tmp_path), flush_interval=60)
+        components = [ComponentRegistration(f"c{i}", f"C{i}", "service") for i in range(3)]
+        instances = {component.component_id: {"state": component.state} for component in components}
+        for component in components:
+            store.record(component, instances[component.component_id])
+        assert journal_lines(tmp_path) == 3
+
+        async def beat():
+            for sequence in range(50):
+                for component in components:
+                    instances[component.component_id]["last_sequence"] = sequence
+                    store.record_heartbeat(component, instances[component.component_id])
+            return store.get_stats()
+
+        stats = asyncio.run(beat())
+        assert journal_lines(tmp_path) == 3
+        assert stats["pending_heartbeats"] == 3
+        assert stats["heartbeats_coalesced"] == 147
+
+        store.flush()
+        assert journal_lines(tmp_path) == 6
+        stats = store.get_stats()
+        assert stats["journal_writes"] == 4
+        assert stats["bytes_written"] > 0 and stats["max_persist_ms"] > 0
+
+        _, loaded = RegistrationStore(str(tmp_path)).load()
+        assert loaded["c1"]["last_sequence"] == 49
+
+    def test_snapshot_compaction(self, tmp_path):
+        """Test the journal is folded into a snapshot and replayed after it"""
+        store = RegistrationStore(str(tmp_path), snapshot_threshold=5)
+        component = ComponentRegistration("a", "A", "service")
+        other = ComponentRegistration("b", "B", "service")
+        store.record(other, {"note": "kept"})
+        for state in [ComponentState.READY, ComponentState.ACTIVE, ComponentState.DEGRADED,
+                      ComponentState.ACTIVE, ComponentState.DEGRADED, ComponentState.ACTIVE]:
+            component.update_state(state.value)
+            store.record(component, {"state": component.state})
+
+        assert store.get_stats()["snapshots"] == 1
+        assert journal_lines(tmp_path) == 2
+
+        # A torn final record is ignored
+        with open(os.path.join(tmp_path, "registrations.journal"), "a") as f:
+            f.write('{"op": "put", "compon')
+
+        components, instances = RegistrationStore(str(tmp_path)).load()
+        assert set(components) == {"a", "b"}
+        assert components["a"].state == ComponentState.ACTIVE.value
+        assert instances == {"a": {"state": ComponentState.ACTIVE.value}, "b": {"note": "kept"}}
+
+
+class TestRegistryPersistence:
+    """Test the registry writes through the store"""
+
+    def test_registry_round_trip(self, tmp_path):
+        """Test registration, readiness and heartbeats survive a reload"""
+        async def main():
+            registry = ComponentRegistry(data_dir=str(tmp_path))
+            await asyncio.sleep(0)  # Let the background load finish
+            registration = ComponentRegistration("api", "API", "service")
+            await registry.register_component(registration)
+            await registry.mark_component_ready("api", registration.instance_uuid)
+            written = journal_lines(tmp_path)
+
+            for sequence in range(1, 20):
+                await registry.process_heartbeat("api", registration.instance_uuid, sequence)
+            assert journal_lines(tmp_path) == written
+
+            await registry.flush()
+            return written, registry.get_persistence_stats()
+
+        written, stats = asyncio.run(main())
+        assert written == 2
+        assert journal_lines(tmp_path) == 3
+        assert stats["pending_heartbeats"] == 0
+
+        components, instances = RegistrationStore(str(tmp_path)).load()
+        assert components["api"].state == ComponentState.READY.value
+        assert instances["api"]["last_sequence"] == 19
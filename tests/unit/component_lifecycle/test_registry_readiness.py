@@ -0,0 +1,74 @@
+"""
+Unit tests for event-driven readiness waiting in ComponentRegistry
+"""
+
+import asyncio
+
+from tekton.core.component_lifecycle.registry import ComponentRegistry
+from tekton.core.lifecycle import ComponentRegistration, ComponentState
+
+
+async def make_registry(tmp_path, *component_ids):
+    registry = ComponentRegistry(data_dir=str(tmp_path))
+    await asyncio.sleep(0)  # Let the background load finish
+    registrations = {}
+    for component_id in component_ids:
+        registration = ComponentRegistration(component_id, component_id, "service")
+        await registry.register_component(registration)
+        registrations[component_id] = registration
+    return registry, registrations
+
+
+class TestReadinessWaiting:
+    """Test waiters wake on state changes instead of polling"""
+
+    def test_waiter_wakes_immediately(self, tmp_path):
+        """Test a waiter returns as soon as the component is marked ready"""
+        async def main():
+            registry, registrations = await make_registry(tmp_path, "a")
+            loop = asyncio.get_running_loop()
+
+            async def mark_later():
+                await asyncio.sleep(0.05)
+                await registry.mark_component_ready("a", registrations["a"].instance_uuid)
+
+            start = loop.time()
+            asyncio.create_task(mark_later())
+            ready, info = await registry.wait_for_component_ready("a", timeout=5)
+            elapsed = loop.time() - start
+
+            # Already ready: answered without waiting (and without deadlocking)
+            again = await asyncio.wait_for(registry.wait_for_component_ready("a"), timeout=1)
+            return ready, info, elapsed, again
+
+        ready, info, elapsed, again = asyncio.run(main())
+        assert ready and info["state"] == ComponentState.READY.value
+        assert elapsed < 0.5
+        assert again[0]
+
+    def test_wait_for_dependencies(self, tmp_path):
+        """Test multiple dependencies in one call, failures and timeouts"""
+        async def main():
+            registry, registrations = await make_registry(tmp_path, "a", "b", "c")
+            waiter = asyncio.create_task(registry.wait_for_dependencies(["a", "b"], timeout=5))
+
+            await registry.mark_component_ready("a", registrations["a"].instance_uuid)
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            await registry.mark_component_ready("b", registrations["b"].instance_uuid)
+            all_ready = await asyncio.wait_for(waiter, timeout=1)
+
+            failing = asyncio.create_task(registry.wait_for_dependencies(["a", "c"], timeout=5))
+            await asyncio.sleep(0)
+            await registry.update_component_state("c", registrations["c"].instance_uuid, ComponentState.FAILED.value)
+            failed = await asyncio.wait_for(failing, timeout=1)
+
+            unknown = await registry.wait_for_dependencies(["missing"])
+            timed_out = await registry.wait_for_dependencies(["a", "c"], timeout=0.01)
+            return all_ready, failed, unknown, timed_out
+
+        all_ready, failed, unknown, timed_out = asyncio.run(main())
+        assert all_ready == (True, [])
+        assert failed == (False, ["c"])
+        assert unknown == (False, ["missing"])
+        assert timed_out == (False, ["c"])
@@ -0,0 +1,140 @@
+"""
+Unit tests for latency-aware ordering and hedged execution of capability fallbacks
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from tekton.core.graceful_degradation import (
+    CapabilityFallback,
+    CircuitBreakerState,
+    GracefulDegradationManager,
+    NoFallbackAvailableError
+)
+
+
+def provider(name, delay=0.0, fail=False, log=None):
+    """Async handler that sleeps, then returns its name or raises"""
+    async def handler(value):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(f"{name} cancelled")
+            raise
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        return f"{name}:{value}"
+    return handler
+
+
+class TestOrdering:
+    """Test candidate order"""
+
+    def test_circuit_level_and_latency(self):
+        """Test open circuits go last, then level decides, then latency EWMA"""
+        fallback = CapabilityFallback("svc", "process")
+        fallback.register_fallback("slow", provider("slow"), level=50)
+        fallback.register_fallback("fast", provider("fast"), level=50)
+        fallback.register_fallback("best", provider("best"), level=100)
+        fallback.register_fallback("broken", provider("broken"), level=200)
+        fallback.fallbacks["slow"]["latency_ewma"] = 0.2
+        fallback.fallbacks["fast"]["latency_ewma"] = 0.01
+        breaker = fallback.circuit_breakers["broken"]
+        breaker.state = CircuitBreakerState.OPEN
+        breaker.open_time = time.time()
+
+        assert fallback.get_candidates() == ["best", "fast", "slow", "broken"]
+
+    def test_sequential_fallback(self):
+        """Test without hedging providers run one after another until one succeeds"""
+        manager = GracefulDegradationManager()
+        manager.register_capability_fallback("svc", "process", "primary", provider("primary", fail=True), level=100)
+        manager.register_capability_fallback("svc", "process", "secondary", provider("secondary"), level=50)
+
+        assert asyncio.run(manager.execute_with_fallback("svc", "process", value=1)) == "secondary:1"
+
+        manager.register_capability_fallback("svc", "process", "secondary", provider("secondary", fail=True), level=50)
+        with pytest.raises(NoFallbackAvailableError):
+            asyncio.run(manager.execute_with_fallback("svc", "process", value=1))
+
+
+class TestHedging:
+    """Test hedged execution"""
+
+    def test_hedge_wins_and_loser_cancelled(self):
+        """Test a slow provider is hedged after the delay and cancelled once the hedge wins"""
+        log = []
+        manager = GracefulDegradationManager(hedge=True, hedge_delay=0.02)
+        manager.register_capability_fallback("svc", "process", "primary", provider("primary", 1.0, log=log), level=100)
+        manager.register_capability_fallback("svc", "process", "secondary", provider("secondary", 0.01), level=50)
+
+        start = time.perf_counter()
+        result = asyncio.run(manager.execute_with_fallback("svc", "process", value=7))
+        elapsed = time.perf_counter() - start
+
+        assert result == "secondary:7" and elapsed < 0.2
+        assert log == ["primary cancelled"]
+        status = manager.get_fallback_status("svc", "process")["components"]["svc"]["capabilities"]["process"]
+        assert status["hedges_started"] == 1 and status["hedge_wins"] == 1
+
+    def test_delay_follows_latency_quantile(self):
+        """Test the hedge starts after the provider's p95 latency rather than the default delay"""
+        delays = {"primary": 0.01}
+
+        async def primary(value):
+            await asyncio.sleep(delays["primary"])
+            return "primary"
+
+        async def main():
+            fallback = CapabilityFallback("svc", "process", hedge=True, default_hedge_delay=5.0)
+            fallback.register_fallback("primary", primary, level=100)
+            fallback.register_fallback("secondary", provider("secondary"), level=50)
+            for _ in range(20):
+                assert await fallback.execute(value=0) == "primary"
+            delays["primary"] = 2.0
+            start = time.perf_counter()
+            result = await fallback.execute(value=0)
+            return result, time.perf_counter() - start, fallback.get_latency_quantile("primary", 0.95)
+
+        result, elapsed, p95 = asyncio.run(main())
+        assert result == "secondary:0"
+        assert p95 < 0.05 and elapsed < 0.3
+
+    def test_failure_starts_next_immediately(self):
+        """Test a failed provider does not wait out the hedge delay"""
+        manager = GracefulDegradationManager(hedge=True, hedge_delay=1.0)
+        manager.register_capability_fallback("svc", "process", "primary", provider("primary", fail=True), level=100)
+        manager.register_capability_fallback("svc", "process", "secondary", provider("secondary"), level=50)
+
+        start = time.perf_counter()
+        assert asyncio.run(manager.execute_with_fallback("svc", "process", value=1)) == "secondary:1"
+        assert time.perf_counter() - start < 0.5
+
+    def test_cancelled_half_open_probe_frees_slot(self):
+        """Test losing hedges that were half-open probes do not exhaust the breaker"""
+        async def main():
+            fallback = CapabilityFallback("svc", "process", hedge=True, hedge_delay=0.01)
+            fallback.register_fallback("primary", provider("primary", 0.05), level=100)
+            fallback.register_fallback("probe", provider("probe", 1.0), level=50)
+            breaker = fallback.circuit_breakers["probe"]
+            breaker.state = CircuitBreakerState.HALF_OPEN
+            for _ in range(breaker.half_open_max_calls + 2):
+                assert await fallback.execute(value=0) == "primary:0"
+            return breaker
+
+        breaker = asyncio.run(main())
+        assert breaker.half_open_calls == 0
+        assert breaker.state == CircuitBreakerState.HALF_OPEN
+
+    def test_failure_latency_recorded(self):
+        """Test a provider that is slow to fail does not look fast"""
+        fallback = CapabilityFallback("svc", "process")
+        fallback.register_fallback("primary", provider("primary", 0.05, fail=True), level=100)
+        fallback.register_fallback("secondary", provider("secondary"), level=50)
+
+        assert asyncio.run(fallback.execute(value=0)) == "secondary:0"
+        assert fallback.fallbacks["primary"]["latency_ewma"] >= 0.05
+        assert fallback.get_latency_quantile("primary", 0.95) >= 0.05
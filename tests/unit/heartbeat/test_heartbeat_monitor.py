@@ -0,0 +1,118 @@
+"""
+Unit tests for pooled and batched heartbeats
+"""
+
+import asyncio
+
+from aiohttp import web
+
+from tekton.core.heartbeat import HeartbeatMonitor
+from tekton.core.lifecycle import ComponentRegistration
+
+
+class FakeHermes:
+    """Minimal Hermes API recording heartbeats and client connections"""
+
+    def __init__(self, batch=True):
+        self.heartbeats = []
+        self.batches = 0
+        self.connections = set()
+        self.app = web.Application()
+        self.app.router.add_post("/api/registration/heartbeat", self.heartbeat)
+        if batch:
+            self.app.router.add_post("/api/registration/heartbeat/batch", self.batch)
+        self.app.router.add_get("/api/health", self.health)
+
+    def track(self, request):
+        self.connections.add(request.transport.get_extra_info("peername"))
+
+    async def heartbeat(self, request):
+        self.track(request)
+        self.heartbeats.append(await request.json())
+        return web.json_response({"success": True})
+
+    async def batch(self, request):
+        self.track(request)
+        body = await request.json()
+        self.batches += 1
+        self.heartbeats.extend(body["heartbeats"])
+        return web.json_response({"results": {"c3": {"success": False, "error": "unknown"}}})
+
+    async def health(self, request):
+        self.track(request)
+        return web.json_response({"status": "ok"})
+
+    async def __aenter__(self):
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/api"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+
+async def beat_all(monitor, count):
+    registrations = [ComponentRegistration(f"c{i}", f"C{i}", "api") for i in range(count)]
+    for registration in registrations:
+        monitor.registrations[registration.component_id] = registration
+    return await asyncio.gather(*(
+        monitor._send_heartbeat(registration.component_id, {"component": registration.component_id})
+        for registration in registrations
+    ))
+
+
+class TestHeartbeatMonitor:
+    """Test the shared session and heartbeat batching"""
+
+    def test_shared_session(self):
+        """Test sequential heartbeats reuse one pooled connection"""
+        async def main():
+            async with FakeHermes() as hermes:
+                monitor = HeartbeatMonitor(hermes_url=hermes.url)
+                for _ in range(3):
+                    for i in range(10):
+                        assert await monitor._send_heartbeat(f"c{i}", {"component": f"c{i}"}) == (True, None)
+                assert await monitor._check_hermes_availability()
+                monitor.running = True
+                await monitor.stop()
+                return hermes
+
+        hermes = asyncio.run(main())
+        assert len(hermes.heartbeats) == 30
+        assert len(hermes.connections) == 1
+
+    def test_batched_heartbeats(self):
+        """Test heartbeats in one window go out as a single request"""
+        async def main():
+            async with FakeHermes() as hermes:
+                monitor = HeartbeatMonitor(hermes_url=hermes.url, batch_heartbeats=True, batch_window=0.05)
+                results = await beat_all(monitor, 50)
+                monitor.running = True
+                await monitor.stop()
+                return hermes, results
+
+        hermes, results = asyncio.run(main())
+        assert hermes.batches == 1
+        assert len(hermes.heartbeats) == 50
+        assert len(hermes.connections) == 1
+        assert results[3] == (False, "unknown")
+        assert results.count((True, None)) == 49
+
+    def test_batch_fallback(self):
+        """Test heartbeats are sent individually when Hermes has no batch endpoint"""
+        async def main():
+            async with FakeHermes(batch=False) as hermes:
+                monitor = HeartbeatMonitor(hermes_url=hermes.url, batch_heartbeats=True, batch_window=0.01)
+                results = await beat_all(monitor, 5)
+                monitor.running = True
+                await monitor.stop()
+                return hermes, monitor, results
+
+        hermes, monitor, results = asyncio.run(main())
+        assert all(result == (True, None) for result in results)
+        assert len(hermes.heartbeats) == 5
+        assert monitor.batch_heartbeats is False
@@ -0,0 +1,125 @@
+"""
+Unit tests for bounded, structurally shared MCP contexts
+"""
+
+import asyncio
+import time
+
+from tekton.mcp import context
+from tekton.mcp.context import ContextManager, merge_shared
+
+
+class TestBounds:
+    """Test eviction, expiry, spilling and history caps"""
+
+    def test_unbounded_by_default(self):
+        """Test contexts and their history are kept unless bounds are configured"""
+        async def main():
+            manager = ContextManager()
+            context_ids = [await manager.create_context({"n": i}) for i in range(50)]
+            for i in range(150):
+                await manager.update_context(context_ids[0], {"i": i})
+            return manager, context_ids
+
+        manager, context_ids = asyncio.run(main())
+        assert all(context_id in manager.contexts for context_id in context_ids)
+        assert len(manager.metadata[context_ids[0]].history) == 151
+        assert manager.get_stats()["evicted"] == 0 and manager.get_stats()["expired"] == 0
+
+    def test_lru_eviction(self):
+        """Test the least recently used context is evicted past max_contexts"""
+        async def main():
+            manager = ContextManager(max_contexts=2)
+            first = await manager.create_context({"n": 1})
+            second = await manager.create_context({"n": 2})
+            await manager.get_context(first)
+            third = await manager.create_context({"n": 3})
+            return manager, [await manager.get_context(cid) for cid in (first, second, third)]
+
+        manager, contexts = asyncio.run(main())
+        assert contexts == [{"n": 1}, None, {"n": 3}]
+        assert manager.get_stats()["evicted"] == 1 and manager.get_stats()["contexts"] == 2
+
+    def test_ttl_spill_and_restore(self, tmp_path):
+        """Test idle contexts expire to the spill directory and come back on access"""
+        async def main():
+            manager = ContextManager(context_ttl=0.05, spill_dir=str(tmp_path))
+            context_id = await manager.create_context({"user": {"name": "ada"}}, category="session")
+            await manager.update_context(context_id, {"user": {"role": "admin"}})
+            time.sleep(0.06)
+            await manager.create_context({})
+            in_memory = context_id in manager.contexts
+            restored = await manager.get_context(context_id)
+            metadata = await manager.get_context_metadata(context_id)
+            deleted = await manager.delete_context(context_id)
+            return manager, in_memory, restored, metadata, deleted
+
+        manager, in_memory, restored, metadata, deleted = asyncio.run(main())
+        assert not in_memory
+        assert restored == {"user": {"name": "ada", "role": "admin"}}
+        assert metadata.category == "session" and [h["operation"] for h in metadata.history] == ["created", "update"]
+        assert deleted and list(tmp_path.iterdir()) == []
+        stats = manager.get_stats()
+        assert stats["expired"] == 1 and stats["spilled"] == 1 and stats["restored"] == 1
+
+    def test_global_manager_is_bounded(self, monkeypatch):
+        """Test the process-wide manager used for per-message contexts has bounds"""
+        monkeypatch.setattr(context, "_global_context_manager", None)
+        manager = context.get_context_manager()
+        assert manager.max_contexts == context.GLOBAL_MAX_CONTEXTS
+        assert manager.context_ttl == context.GLOBAL_CONTEXT_TTL
+        assert manager.max_history == context.GLOBAL_MAX_HISTORY
+        assert context.get_context_manager() is manager
+
+    def test_spill_files_do_not_collide(self, tmp_path):
+        """Test IDs that sanitize to the same name spill to separate files"""
+        async def main():
+            manager = ContextManager(max_contexts=1, spill_dir=str(tmp_path))
+            await manager.create_context({"n": 1}, context_id="a/b")
+            await manager.create_context({"n": 2}, context_id="a:b")
+            await manager.create_context({"n": 3}, context_id="c")
+            return await manager.get_context("a/b"), await manager.get_context("a:b")
+
+        assert asyncio.run(main()) == ({"n": 1}, {"n": 2})
+
+    def test_history_cap(self):
+        """Test history keeps only the newest max_history entries"""
+        async def main():
+            manager = ContextManager(max_history=3)
+            context_id = await manager.create_context({})
+            for i in range(5):
+                await manager.update_context(context_id, {"i": i}, operation=f"op{i}")
+            return await manager.get_context_metadata(context_id)
+
+        metadata = asyncio.run(main())
+        assert [entry["operation"] for entry in metadata.history] == ["op2", "op3", "op4"]
+
+
+class TestStructuralSharing:
+    """Test updates and merges copy only changed paths"""
+
+    def test_update_shares_unchanged_subtrees(self):
+        """Test an update leaves the previous snapshot intact and reuses untouched branches"""
+        async def main():
+            manager = ContextManager()
+            context_id = await manager.create_context({"big": {"x": 1}, "user": {"prefs": {"a": 1}}})
+            before = await manager.get_context(context_id)
+            await manager.update_context(context_id, {"user": {"prefs": {"b": 2}}})
+            return before, await manager.get_context(context_id)
+
+        before, after = asyncio.run(main())
+        assert before == {"big": {"x": 1}, "user": {"prefs": {"a": 1}}}
+        assert after == {"big": {"x": 1}, "user": {"prefs": {"a": 1, "b": 2}}}
+        assert after["big"] is before["big"]
+
+    def test_merge_semantics(self):
+        """Test later values win, nested dicts merge, and non-dicts replace"""
+        first = {"a": {"x": 1}, "b": 1, "shared": {"deep": [1]}}
+        second = {"a": {"y": 2}, "b": {"z": 3}}
+        third = {"a": 5, "b": {"w": 4}}
+
+        merged = merge_shared({}, first, second, third)
+
+        assert merged == {"a": 5, "b": {"z": 3, "w": 4}, "shared": {"deep": [1]}}
+        assert merged["shared"] is first["shared"]
+        assert second == {"a": {"y": 2}, "b": {"z": 3}}
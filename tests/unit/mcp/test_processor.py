@@ -0,0 +1,102 @@
+"""
+Unit tests for concurrent content-item processing in MessageProcessor
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tekton.mcp.context import ContextManager
+from tekton.mcp.message import MCPContentItem, MCPMessage
+from tekton.mcp.modality import ModalityProcessor
+from tekton.mcp.modality.code import analyze_structure
+from tekton.mcp.processor import MessageProcessor
+
+
+class SleepProcessor(ModalityProcessor):
+    """Text processor that takes item.metadata["delay"] seconds and can fail"""
+
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+
+    async def process(self, content_item, context):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(content_item.metadata["delay"])
+            if content_item.data == "fail":
+                raise ValueError("fail")
+            return {"data": content_item.data}
+        finally:
+            self.active -= 1
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that counts submitted jobs"""
+
+    submitted = 0
+
+    def submit(self, *args, **kwargs):
+        CountingExecutor.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def message(items):
+    return MCPMessage(content=items, source={"component": "test"}, processing={"response_format": ["structured"]})
+
+
+def processed_data(response):
+    return [item["result"]["data"] for item in response.content[0].data["processed_items"]]
+
+
+class TestMessageProcessor:
+    """Test item concurrency, ordering and offloading"""
+
+    def test_items_run_concurrently_in_order(self):
+        """Test items overlap, keep message order, and failures are dropped"""
+        processor = MessageProcessor(context_manager=ContextManager())
+        sleeper = processor.modality_processors["text"] = SleepProcessor()
+        items = [MCPContentItem("text", str(i), metadata={"delay": 0.1 - i * 0.02}) for i in range(4)]
+        items.insert(2, MCPContentItem("text", "fail", metadata={"delay": 0}))
+
+        start = time.perf_counter()
+        response = asyncio.run(processor.process_message(message(items)))
+        elapsed = time.perf_counter() - start
+
+        assert processed_data(response) == ["0", "1", "2", "3"]
+        assert sleeper.peak == 5
+        assert elapsed < 0.2
+
+    def test_concurrency_limit(self):
+        """Test max_concurrency bounds the items in flight"""
+        processor = MessageProcessor(context_manager=ContextManager(), max_concurrency=2)
+        sleeper = processor.modality_processors["text"] = SleepProcessor()
+        items = [MCPContentItem("text", str(i), metadata={"delay": 0.01}) for i in range(6)]
+
+        response = asyncio.run(processor.process_message(message(items)))
+
+        assert processed_data(response) == [str(i) for i in range(6)]
+        assert sleeper.peak == 2
+
+    def test_large_code_offloaded(self):
+        """Test code above the offload threshold is analyzed in the executor"""
+        source = "\n".join(f"def f{i}(x):\n    return x" for i in range(200))
+        with CountingExecutor() as executor:
+            processor = MessageProcessor(context_manager=ContextManager(), executor=executor, offload_threshold=1000)
+            items = [MCPContentItem("code", source, format="text/x-python"),
+                     MCPContentItem("code", "def small():\n    pass", format="text/x-python")]
+            response = asyncio.run(processor.process_message(message(items)))
+
+        results = [item["result"] for item in response.content[0].data["processed_items"]]
+        assert CountingExecutor.submitted == 1
+        assert results[0]["metrics"]["function_count"] == 200
+        assert results[1]["metrics"]["function_count"] == 1
+
+    def test_structure_line_numbers(self):
+        """Test definitions report the line they start on"""
+        source = "import os\n\nclass A(B):\n    def f(self):\n        pass\n\ndef g():\n    pass\n"
+        structure = analyze_structure(source, "python")
+        assert [(f["name"], f["line"]) for f in structure["functions"]] == [("f", 4), ("g", 7)]
+        assert structure["classes"] == [{"name": "A", "inherits": "B", "line": 3}]
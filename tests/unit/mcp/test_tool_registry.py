@@ -0,0 +1,257 @@
+"""
+Unit tests for MCP tool execution modes, concurrency limits, deadlines,
+indexed lookups and result caching
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from tekton.mcp.fastmcp.decorators import mcp_tool
+from tekton.mcp.tool_registry import CAPABILITY_QUERY_CACHE_SIZE, ToolRegistry
+
+
+@mcp_tool(name="Worker PID", description="Report the worker process", execution_mode="process")
+def worker_pid(offset: int = 0) -> int:
+    return os.getpid() + offset
+
+
+@mcp_tool(name="Echo", description="Echo a value asynchronously", timeout=1)
+async def echo(value: str) -> str:
+    await asyncio.sleep(0)
+    return value
+
+
+def tool_spec(name, function, **settings):
+    return dict({"name": name, "description": name, "schema": {}, "function": function}, **settings)
+
+
+class TestExecutionModes:
+    """Test where tools run"""
+
+    def test_sync_tool_does_not_block_loop(self):
+        """Test a blocking tool runs in the thread pool while the loop keeps running"""
+        def blocking(seconds):
+            time.sleep(seconds)
+            return threading.current_thread().name
+
+        async def main():
+            registry = ToolRegistry()
+            tool_id = await registry.register_tool(tool_spec("blocking", blocking))
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticking = asyncio.create_task(ticker())
+            result = await registry.execute_tool(tool_id, {"seconds": 0.2})
+            ticking.cancel()
+            registry.shutdown()
+            return result, ticks
+
+        result, ticks = asyncio.run(main())
+        assert result["success"] and result["result"].startswith("mcp-tool")
+        assert result["execution_time"] >= 0.19
+        assert ticks >= 10
+
+    def test_decorated_tools(self):
+        """Test mcp_tool settings apply to registered functions, including process mode"""
+        async def main():
+            registry = ToolRegistry()
+            pid_tool = await registry.register_function(worker_pid)
+            echo_tool = await registry.register_function(echo)
+            results = (await registry.execute_tool(pid_tool, {"offset": 0}),
+                       await registry.execute_tool(echo_tool, {"value": "hi"}))
+            stats = registry.get_tool_stats(echo_tool)
+            registry.shutdown()
+            return results, stats
+
+        (pid_result, echo_result), stats = asyncio.run(main())
+        assert pid_result["success"] and pid_result["result"] != os.getpid()
+        assert echo_result["result"] == "hi"
+        assert stats["execution_mode"] == "inline" and stats["timeout"] == 1
+
+    def test_invalid_mode(self):
+        """Test unknown execution modes are rejected at registration"""
+        registry = ToolRegistry()
+        with pytest.raises(ValueError):
+            asyncio.run(registry.register_tool(tool_spec("bad", len, execution_mode="gpu")))
+
+
+class TestLimits:
+    """Test concurrency limits, deadlines and cancellation"""
+
+    def test_concurrency_limit(self):
+        """Test calls beyond max_concurrency wait, and the wait is reported separately"""
+        active = []
+        peak = []
+
+        def work():
+            active.append(1)
+            peak.append(len(active))
+            time.sleep(0.05)
+            active.pop()
+
+        async def main():
+            registry = ToolRegistry()
+            tool_id = await registry.register_tool(tool_spec("limited", work, max_concurrency=1))
+            results = await asyncio.gather(*(registry.execute_tool(tool_id, {}) for _ in range(3)))
+            registry.shutdown()
+            return results, registry.get_tool_stats(tool_id)
+
+        results, stats = asyncio.run(main())
+        assert all(result["success"] for result in results)
+        assert max(peak) == 1
+        assert stats["calls"] == 3 and stats["queue_time_max"] >= 0.09
+        assert max(result["queue_time"] for result in results) >= 0.09
+
+    def test_timeout_signals_cancel_event(self):
+        """Test a timed-out thread tool gets its cancel_event set"""
+        stopped = threading.Event()
+
+        def spin(cancel_event):
+            cancel_event.wait(5)
+            stopped.set()
+
+        async def main():
+            registry = ToolRegistry(default_timeout=0.05)
+            tool_id = await registry.register_tool(tool_spec("spin", spin))
+            result = await registry.execute_tool(tool_id, {})
+            registry.shutdown()
+            return result, registry.get_tool_stats(tool_id)
+
+        result, stats = asyncio.run(main())
+        assert not result["success"] and result["timed_out"]
+        assert stopped.wait(1)
+        assert stats["timeouts"] == 1
+
+    def test_cancellation_propagates(self):
+        """Test cancelling the caller cancels an inline tool and is counted"""
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def main():
+            registry = ToolRegistry()
+            tool_id = await registry.register_tool(tool_spec("slow", slow))
+            task = asyncio.create_task(registry.execute_tool(tool_id, {}))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return registry.get_tool_stats(tool_id)
+
+        stats = asyncio.run(main())
+        assert cancelled == [True]
+        assert stats["cancelled"] == 1 and stats["in_flight"] == 0
+
+
+class TestLookupAndCache:
+    """Test indexed lookups and the result cache"""
+
+    def test_indexed_lookups(self):
+        """Test tag and capability lookups follow registration and unregistration"""
+        async def main():
+            registry = ToolRegistry()
+            search = await registry.register_tool(tool_spec("Search", len, tags=["web", "query"]))
+            parse = await registry.register_tool(tool_spec("Parser", len, metadata={"capabilities": ["query"]}))
+            await registry.register_tool(dict(tool_spec("Summarizer", len), description="Condense a query result"))
+            await registry.register_tool(tool_spec("Clock", len, tags=["time"]))
+
+            by_capability = [tool["name"] for tool in await registry.find_tools_by_capability("query")]
+            by_tag = [tool["name"] for tool in await registry.find_tools_by_tag("web")]
+
+            await registry.unregister_tool(parse)
+            await registry.register_tool(tool_spec("Search", len, id=search, tags=["time"]))
+            after = ([tool["name"] for tool in await registry.find_tools_by_capability("query")],
+                     await registry.find_tools_by_tag("web"),
+                     [tool["name"] for tool in await registry.find_tools_by_tag("time")])
+            return by_capability, by_tag, after
+
+        by_capability, by_tag, after = asyncio.run(main())
+        assert by_capability == ["Search", "Parser", "Summarizer"]
+        assert by_tag == ["Search"]
+        assert after == (["Summarizer"], [], ["Clock", "Search"])
+
+    def test_capability_queries_are_bounded(self):
+        """Test the capability query memo keeps only the most recent queries"""
+        async def main():
+            registry = ToolRegistry()
+            await registry.register_tool(tool_spec("Search", len, tags=["query"]))
+            await registry.find_tools_by_capability("query")
+            for i in range(CAPABILITY_QUERY_CACHE_SIZE):
+                await registry.find_tools_by_capability(f"miss-{i}")
+                # Keep the real query recently used
+                await registry.find_tools_by_capability("query")
+            return registry
+
+        registry = asyncio.run(main())
+        assert len(registry._capability_queries) == CAPABILITY_QUERY_CACHE_SIZE
+        assert "query" in registry._capability_queries
+        assert "miss-0" not in registry._capability_queries
+
+    def test_result_cache(self):
+        """Test cacheable tools run once per canonical parameter set until their TTL"""
+        calls = []
+
+        def add(a, b):
+            calls.append((a, b))
+            return a + b
+
+        async def main():
+            registry = ToolRegistry()
+            pure = await registry.register_tool(tool_spec("add", add, cacheable=True, cache_ttl=0.05))
+            plain = await registry.register_tool(tool_spec("add-uncached", add))
+
+            first = await registry.execute_tool(pure, {"a": 1, "b": 2})
+            second = await registry.execute_tool(pure, {"b": 2, "a": 1})
+            await registry.execute_tool(pure, {"a": 2, "b": 2})
+            await registry.execute_tool(plain, {"a": 1, "b": 2})
+            await registry.execute_tool(plain, {"a": 1, "b": 2})
+            stats = registry.get_cache_stats()
+
+            await asyncio.sleep(0.06)
+            expired = await registry.execute_tool(pure, {"a": 1, "b": 2})
+            registry.shutdown()
+            return first, second, expired, stats, registry.get_tool_stats(pure)
+
+        first, second, expired, stats, tool_stats = asyncio.run(main())
+        assert first["result"] == second["result"] == 3
+        assert "cached" not in first and second["cached"] and "cached" not in expired
+        assert len(calls) == 5
+        assert stats["hits"] == 1 and stats["misses"] == 2 and stats["hit_rate"] == pytest.approx(1 / 3)
+        assert tool_stats["cache_hits"] == 1 and tool_stats["cache_misses"] == 3
+
+    def test_cached_results_are_private(self):
+        """Test callers cannot change a cached result for later callers, and hits notify callbacks"""
+        def lookup(key):
+            return {"key": key, "tags": ["a"]}
+
+        async def main():
+            registry = ToolRegistry()
+            events = []
+            registry.on_executed(lambda tool_id, event: events.append(event.get("cached", False)))
+            tool_id = await registry.register_tool(tool_spec("lookup", lookup, cacheable=True))
+
+            first = await registry.execute_tool(tool_id, {"key": "k"})
+            first["result"]["tags"].append("mutated")
+            second = await registry.execute_tool(tool_id, {"key": "k"})
+            second["result"]["tags"].append("mutated again")
+            third = await registry.execute_tool(tool_id, {"key": "k"})
+            registry.shutdown()
+            return third, events
+
+        third, events = asyncio.run(main())
+        assert third["cached"] and third["result"] == {"key": "k", "tags": ["a"]}
+        assert events == [False, True, True]
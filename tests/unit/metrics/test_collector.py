@@ -0,0 +1,164 @@
+"""
+Unit tests for the concurrent metrics collector and its record buffers
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from tekton.core.metrics.buffers import RecordBuffer
+from tekton.core.metrics.collector import MetricsCollector
+
+
+class RecordingStorage:
+    def __init__(self, delay=None):
+        self.sessions = []
+        self.delay = delay
+
+    def store_session(self, session):
+        if self.delay:
+            self.delay.wait(5)
+        self.sessions.append(session)
+
+
+class TestRecordBuffer:
+    """Test bounded buffering and down-sampling"""
+
+    def test_downsampling_keeps_uniform_grid(self):
+        """Test a full buffer keeps every stride-th record"""
+        buffer = RecordBuffer(capacity=8)
+        for i in range(100):
+            buffer.append(float(i), "c", value=i)
+
+        values = [row[3] for row in buffer.rows()]
+        assert buffer.stride == 16
+        assert values == [float(i) for i in range(0, 100, 16)]
+        assert buffer.seen == 100
+        assert buffer.dropped == 100 - len(values)
+
+        with pytest.raises(ValueError):
+            RecordBuffer(capacity=1)
+
+    def test_rows(self):
+        """Test keys are interned and payloads kept"""
+        buffer = RecordBuffer(capacity=4)
+        buffer.append(1.0, "a", "b", 0.5, {"x": 1})
+        buffer.append(2.0, "a")
+        assert list(buffer.rows())[0] == (1.0, "a", "b", 0.5, {"x": 1})
+        assert list(buffer.rows())[1][2] is None
+        assert buffer.names == ["a", "b"]
+
+    def test_payloads_are_copied(self):
+        """Test changing a payload after recording does not change the record"""
+        buffer = RecordBuffer(capacity=4)
+        payload = {"x": 1}
+        buffer.append(1.0, "a", payload=payload)
+        payload["x"] = 2
+        assert list(buffer.rows())[0][4] == {"x": 1}
+
+
+class TestMetricsCollector:
+    """Test session isolation, materialization and storage handoff"""
+
+    def test_records_materialize(self):
+        """Test buffered records become the usual session fields"""
+        collector = MetricsCollector(async_storage=False)
+        session_id = collector.start_session("prompt", {})
+        collector.record_component_activation("c1", {"level": 0.5})
+        collector.record_propagation_step("a.x", "a.y", 2, {"hop": 1})
+        collector.record_propagation_step("a.y", "b.z", 1)
+
+        assert collector.current_session_id == session_id
+        session = collector.complete_session("done", {"accuracy": 0.8})
+        assert session.component_activations["c1"][0]["level"] == 0.5
+        assert [step["destination"] for step in session.propagation_path] == ["a.y", "b.z"]
+        assert session.propagation_path[0]["hop"] == 1
+        assert session.spectral_metrics["min_propagation_threshold"] == 3
+        assert session.spectral_metrics["modularity_quotient"] == pytest.approx(2 / 3)
+        assert collector.active_sessions == []
+
+    def test_concurrent_tasks_are_isolated(self):
+        """Test sessions started in separate tasks do not overwrite each other"""
+        collector = MetricsCollector()
+
+        async def request(index):
+            collector.start_session(f"prompt {index}", {})
+            for _ in range(index + 1):
+                collector.record_component_activation("component", {"index": index})
+                await asyncio.sleep(0)
+            return collector.complete_session("done", {})
+
+        async def main():
+            return await asyncio.gather(*(request(i) for i in range(5)))
+
+        sessions = asyncio.run(main())
+        for index, session in enumerate(sessions):
+            records = session.component_activations["component"]
+            assert session.prompt == f"prompt {index}"
+            assert [record["index"] for record in records] == [index] * (index + 1)
+
+    def test_explicit_session_and_no_context_session(self):
+        """Test session_id targeting, and that contexts without a session record nothing"""
+        collector = MetricsCollector()
+        first = collector.start_session("first", {})
+
+        # No session in the new thread's context, even though one is active
+        thread = threading.Thread(target=collector.record_component_activation, args=("t", {}))
+        thread.start()
+        thread.join()
+
+        second = collector.start_session("second", {})
+        collector.record_component_activation("explicit", {}, session_id=first)
+
+        session = collector.complete_session("done", {}, session_id=first)
+        assert set(session.component_activations) == {"explicit"}
+        assert collector.active_sessions == [second]
+
+    def test_async_storage_handoff(self):
+        """Test completion does not wait for storage and flush does"""
+        release = threading.Event()
+        storage = RecordingStorage(delay=release)
+        collector = MetricsCollector(storage, async_storage=True)
+
+        collector.start_session("prompt", {})
+        session = collector.complete_session("done", {})
+        assert storage.sessions == []
+
+        release.set()
+        collector.flush(timeout=5)
+        assert storage.sessions == [session]
+        collector.close()
+
+    def test_complete_session_async(self):
+        """Test the async API waits for the store"""
+        storage = RecordingStorage()
+        collector = MetricsCollector(storage, async_storage=True)
+
+        async def main():
+            collector.start_session("prompt", {})
+            return await collector.complete_session_async("done", {})
+
+        session = asyncio.run(main())
+        assert storage.sessions == [session]
+        collector.close()
+
+    def test_synchronous_storage(self):
+        """Test a completed session is stored before complete_session returns when async storage is off"""
+        storage = RecordingStorage()
+        collector = MetricsCollector(storage, async_storage=False)
+
+        collector.start_session("prompt", {})
+        session = collector.complete_session("done", {})
+        assert storage.sessions == [session]
+
+    def test_storage_is_asynchronous_by_default(self):
+        """Test completed sessions are stored in the background and flushed by close()"""
+        storage = RecordingStorage()
+        collector = MetricsCollector(storage)
+        assert collector.async_storage
+
+        collector.start_session("prompt", {})
+        session = collector.complete_session("done", {})
+        collector.close()
+        assert storage.sessions == [session]
@@ -0,0 +1,125 @@
+"""
+Unit tests for Prometheus and OpenMetrics exposition
+"""
+
+import io
+
+import pytest
+
+from tekton.core.metrics.exposition import ExpositionEncoder, format_labels, registry_families
+from tekton.core.metrics.metrics import Histogram
+from tekton.core.metrics.metrics_registry import MetricsRegistry
+
+
+def make_registry():
+    registry = MetricsRegistry("component")
+    registry.create_counter("requests", "Total requests")
+    registry.create_histogram("latency", "Latency", buckets=[0.1, 1.0])
+    return registry
+
+
+class TestFormatting:
+    """Test label and sample formatting"""
+
+    def test_label_escaping(self):
+        """Test quotes, backslashes and newlines are escaped"""
+        assert format_labels({}) == ""
+        assert format_labels({"path": 'a"b\\c\nd'}) == '{path="a\\"b\\\\c\\nd"}'
+        assert format_labels({"a": "1"}, ("le", "+Inf")) == '{a="1",le="+Inf"}'
+
+    def test_histogram_buckets(self):
+        """Test bucket lines use a valid le label"""
+        histogram = Histogram("latency", "Latency", buckets=[0.1, 1], labels={"endpoint": "/api"})
+        histogram.observe(0.5)
+        text = histogram.to_prometheus()
+
+        assert 'latency_bucket{endpoint="/api",le="0.1"} 0' in text
+        assert 'latency_bucket{endpoint="/api",le="1.0"} 1' in text
+        assert 'latency_bucket{endpoint="/api",le="+Inf"} 1' in text
+        assert "'le'" not in text
+
+
+class TestExpositionEncoder:
+    """Test incremental encoding"""
+
+    def test_families_share_header(self):
+        """Test labelled series are grouped under one HELP/TYPE"""
+        registry = make_registry()
+        registry.get("requests").with_labels(endpoint="/a").increment()
+        registry.get("requests").with_labels(endpoint="/b").increment(2)
+
+        text = ExpositionEncoder().encode(registry_families([registry])).decode()
+        assert text.count("# TYPE requests counter") == 1
+        assert 'requests{component_id="component",endpoint="/a"} 1.0' in text
+        assert 'requests{component_id="component",endpoint="/b"} 2.0' in text
+
+    def test_only_changed_series_reencoded(self):
+        """Test unchanged series come from the cache"""
+        registry = make_registry()
+        encoder = ExpositionEncoder()
+
+        first = encoder.encode(registry_families([registry]))
+        assert encoder.last_encoded == 2
+        assert encoder.encode(registry_families([registry])) == first
+        assert encoder.last_encoded == 0
+
+        registry.get("requests").increment()
+        text = encoder.encode(registry_families([registry])).decode()
+        assert encoder.last_encoded == 1
+        assert 'requests{component_id="component"} 1.0' in text
+
+    def test_const_labels_in_cache_key(self):
+        """Test one series exposed with different constant labels is encoded for each"""
+        counter = make_registry().get("requests")
+        encoder = ExpositionEncoder()
+
+        def families(component_id):
+            return [("requests", [(counter, {"component_id": component_id})])]
+
+        assert b'requests{component_id="a"} 0.0' in encoder.encode(families("a"))
+        assert b'requests{component_id="b"} 0.0' in encoder.encode(families("b"))
+
+    def test_unchanged_registry_skips_series(self, monkeypatch):
+        """Test a scrape at an unchanged registry version visits no series"""
+        registry = make_registry()
+        first = registry.to_prometheus()
+        encoder = registry._encoders[False]
+        version = registry.version
+
+        def fail(*args):
+            raise AssertionError("series visited")
+
+        monkeypatch.setattr(encoder, "series", fail)
+        assert registry.to_prometheus() == first
+        assert registry.version == version
+        monkeypatch.undo()
+
+        registry.get("requests").increment()
+        assert registry.version > version
+        assert "requests 1.0" in registry.to_prometheus()
+        assert encoder.last_encoded == 1
+
+        registry.get("latency").with_labels(endpoint="/a")
+        assert 'latency_count{endpoint="/a"} 0' in registry.to_prometheus()
+        registry.remove("latency", {"endpoint": "/a"})
+        assert "/a" not in registry.to_prometheus()
+
+    def test_openmetrics_exemplars(self):
+        """Test OpenMetrics naming, exemplars and EOF"""
+        registry = make_registry()
+        registry.get("requests").increment(exemplar={"trace_id": "abc"})
+        registry.get("latency").observe(0.5, exemplar={"trace_id": "def"})
+
+        stream = io.BytesIO()
+        ExpositionEncoder(openmetrics=True).write(registry_families([registry], const_label=None), stream)
+        lines = stream.getvalue().decode().splitlines()
+
+        assert lines[-1] == "# EOF"
+        assert any(line.startswith('requests_total 1.0 # {trace_id="abc"} 1.0 ') for line in lines)
+        assert any(line.startswith('latency_bucket{le="1.0"} 1 # {trace_id="def"} 0.5 ') for line in lines)
+
+    def test_exemplar_length_limit(self):
+        """Test oversized exemplars are rejected"""
+        registry = make_registry()
+        with pytest.raises(ValueError):
+            registry.get("requests").increment(exemplar={"trace_id": "x" * 200})
@@ -0,0 +1,109 @@
+"""
+Unit tests for segmented JSON file metrics storage
+"""
+
+import json
+import os
+import random
+
+import pytest
+
+from tekton.core.metrics.collector import SessionData
+from tekton.core.metrics.storage.json_file import JSONFileMetricsStorage, LRUCache
+
+
+def make_session(index, start_time=None, prompt=None):
+    return SessionData(
+        id=f"s{index}",
+        prompt=prompt or f"prompt {index % 3}",
+        config={},
+        start_time=float(index if start_time is None else start_time)
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return JSONFileMetricsStorage(str(tmp_path), segment_size=4, session_cache=LRUCache(16))
+
+
+def ids(sessions):
+    return [session["id"] for session in sessions]
+
+
+class TestJSONFileMetricsStorage:
+    """Test index segments, queries and the session cache"""
+
+    def test_queries_match_full_sort(self, storage):
+        """Test ordering, filters and pagination across out-of-order segments"""
+        rng = random.Random(3)
+        starts = {i: float(rng.randint(0, 20)) for i in range(30)}
+        for i, start in starts.items():
+            storage.store_session(make_session(i, start))
+
+        # Stable descending sort in insertion order, as the single-file index did
+        expected = sorted(starts, key=lambda i: starts[i], reverse=True)
+        assert ids(storage.get_sessions(limit=100)) == [f"s{i}" for i in expected]
+        assert ids(storage.get_sessions(limit=5, offset=7)) == [f"s{i}" for i in expected[7:12]]
+
+        filters = {"start_time_min": 5, "start_time_max": 12, "prompt_like": "1"}
+        matching = [i for i in expected if 5 <= starts[i] <= 12 and i % 3 == 1]
+        assert ids(storage.get_sessions(filters=filters)) == [f"s{i}" for i in matching]
+
+        prefixed = storage.get_sessions(filters={"prompt_prefix": "prompt 2"})
+        assert ids(prefixed) == [f"s{i}" for i in expected if i % 3 == 2]
+
+    def test_restore_replaces_entry(self, storage):
+        """Test storing a session again supersedes its index entry"""
+        storage.store_session(make_session(1, 1))
+        storage.store_session(make_session(2, 2))
+        storage.store_session(make_session(1, 3, prompt="updated"))
+
+        sessions = storage.get_sessions()
+        assert ids(sessions) == ["s1", "s2"]
+        assert sessions[0]["prompt"] == "updated"
+
+    def test_session_cache(self, storage):
+        """Test cached sessions are reloaded when the file changes and cannot be corrupted by callers"""
+        storage.store_session(make_session(1))
+        first = storage.get_session("s1")
+        first["prompt"] = "modified by caller"
+        first["spectral_metrics"]["added"] = 1
+        second = storage.get_session("s1")
+        assert second["prompt"] == "prompt 1"
+        assert "added" not in second["spectral_metrics"]
+        key = os.path.abspath(os.path.join(storage.directory, "s1", "session.json"))
+        assert storage.session_cache.get(key)[1] == second
+        assert storage.get_sessions()[0]["prompt"] == "prompt 1"
+        assert len(storage.session_cache) == 1
+
+        storage.store_session(make_session(1, prompt="changed"))
+        assert storage.get_session("s1")["prompt"] == "changed"
+        assert storage.get_session("missing") is None
+
+    def test_instances_share_directory(self, tmp_path):
+        """Test a second instance sees writes made through the first"""
+        first = JSONFileMetricsStorage(str(tmp_path))
+        second = JSONFileMetricsStorage(str(tmp_path))
+        assert second.get_sessions() == []
+
+        first.store_session(make_session(1))
+        assert ids(second.get_sessions()) == ["s1"]
+
+    def test_legacy_index_migration(self, tmp_path):
+        """Test an index.json from earlier versions is migrated"""
+        sessions = {}
+        for i in range(3):
+            session = make_session(i).to_dict()
+            (tmp_path / session["id"]).mkdir()
+            (tmp_path / session["id"] / "session.json").write_text(json.dumps(session))
+            sessions[session["id"]] = {
+                "prompt": session["prompt"],
+                "start_time": session["start_time"],
+                "end_time": None,
+                "file": f"{session['id']}/session.json"
+            }
+        (tmp_path / "index.json").write_text(json.dumps({"sessions": sessions}))
+
+        storage = JSONFileMetricsStorage(str(tmp_path), segment_size=2)
+        assert ids(storage.get_sessions()) == ["s2", "s1", "s0"]
+        assert len(storage._manifest["segments"]) == 2
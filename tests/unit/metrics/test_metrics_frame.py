@@ -0,0 +1,99 @@
+"""
+Unit tests for the columnar metrics frame and rolling windows
+"""
+
+import numpy as np
+import pytest
+
+from tekton.core.metrics.analysis import (
+    MetricsFrame,
+    SpectralAnalyzer,
+    find_architectural_elasticity,
+    identify_catastrophe_points,
+)
+from tekton.core.metrics.analysis.rolling import before_after_means, rolling_mean
+from tekton.core.metrics.collector import SessionData
+
+
+def make_sessions(accuracies, start=0):
+    sessions = []
+    for i, accuracy in enumerate(accuracies):
+        session = SessionData(
+            id=f"s{i}",
+            prompt="even" if i % 2 == 0 else "odd",
+            config={"temperature": 0.1 * i, "model": "m"},
+            start_time=float(start + i)
+        )
+        session.end_time = session.start_time + 2
+        session.performance = {"accuracy": accuracy}
+        session.spectral_metrics = {"depth_efficiency": 0.5}
+        sessions.append(session)
+    return sessions
+
+
+class TestRolling:
+    """Test rolling-window primitives"""
+
+    def test_rolling_mean(self):
+        """Test against a direct per-window mean"""
+        values = np.random.default_rng(0).random((3, 50))
+        expected = np.array([[row[j:j + 4].mean() for j in range(47)] for row in values])
+        assert np.allclose(rolling_mean(values, 4), expected)
+
+        with pytest.raises(ValueError):
+            rolling_mean(values, 51)
+
+    def test_before_after_means(self):
+        """Test windows either side of each split point"""
+        before, after = before_after_means(np.arange(10.0), 2)
+        # First split point is index 2: [0, 1] vs [2, 3]
+        assert before[0] == 0.5 and after[0] == 2.5
+        assert len(before) == len(after) == 6
+
+
+class TestMetricsFrame:
+    """Test frame construction and the analyses that use it"""
+
+    def test_columns(self):
+        """Test rows are sorted and columns are typed"""
+        sessions = make_sessions([0.1, 0.2, 0.3])
+        sessions.reverse()
+        frame = MetricsFrame.from_sessions(sessions, fields=("prompt",))
+
+        assert list(frame.ids) == ["s0", "s1", "s2"]
+        assert list(frame.accuracy) == [0.1, 0.2, 0.3]
+        assert list(frame.column("processing_time")) == [2.0, 2.0, 2.0]
+        assert list(frame.column("prompt")) == ["even", "odd", "even"]
+        assert frame.config("model") is None
+        assert frame.column("config.temperature")[2] == pytest.approx(0.2)
+        assert list(frame.spectral("missing", default=0.5)) == [0.5] * 3
+        assert list(frame.tail(2).ids) == ["s1", "s2"]
+
+    def test_catastrophe_points(self):
+        """Test a step change in accuracy is detected at the step"""
+        frame = MetricsFrame.from_sessions(make_sessions([0.2] * 20 + [0.8] * 20))
+        points = identify_catastrophe_points(frame, window_size=5)
+
+        top = points[0]
+        assert top["session_id"] == "s20"
+        assert top["changes"][0][0] == "accuracy"
+        assert top["magnitude"] == pytest.approx(3.0)
+        assert identify_catastrophe_points(make_sessions([0.5] * 10), window_size=5) == []
+
+    def test_elasticity_without_complexity_change(self):
+        """Test no points when complexity never changes"""
+        result = find_architectural_elasticity(make_sessions([0.1, 0.5, 0.9]))
+        assert result["points"] == []
+        assert result["average"] == 0
+
+    def test_analyze_sessions_groups(self):
+        """Test overall averages and grouping"""
+        sessions = make_sessions([0.1, 0.2, 0.3, 0.4])
+        sessions[3].end_time = None
+        result = SpectralAnalyzer().analyze_sessions(sessions, group_by="prompt")
+
+        assert result["sessions"] == 4
+        assert result["avg_processing_time"] == pytest.approx(2.0)
+        assert result["spectral_avg"] == {"depth_efficiency": pytest.approx(0.5)}
+        assert result["groups"]["even"]["sessions"] == 2
+        assert result["groups"]["odd"]["sessions"] == 2
@@ -0,0 +1,161 @@
+"""
+Unit tests for metrics and the label-indexed metrics registry
+"""
+
+import threading
+import time
+
+import pytest
+
+from tekton.core.metrics.metrics import Counter, Gauge, Histogram
+from tekton.core.metrics.metrics_registry import MetricsRegistry
+
+
+class TestMetrics:
+    """Test metric updates"""
+
+    def test_counter_threads(self):
+        """Test concurrent increments are not lost"""
+        counter = Counter("requests", "Requests")
+
+        def worker():
+            for _ in range(10000):
+                counter.increment()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value == 40000
+        assert counter.version == 40000
+
+        with pytest.raises(ValueError):
+            counter.increment(-1)
+
+    def test_counter_reset(self):
+        """Test reset keeps the version moving forward"""
+        counter = Counter("requests", "Requests", initial_value=5)
+        counter.increment(2)
+        version = counter.version
+
+        counter.reset()
+        assert counter.value == 0
+        assert counter.version > version
+
+    def test_histogram_buckets(self):
+        """Test bucket placement and cumulative counts"""
+        histogram = Histogram("latency", "Latency", buckets=[0.1, 1.0, 10.0])
+        for value in [0.05, 0.1, 0.5, 5.0, 50.0]:
+            histogram.observe(value)
+
+        # Boundaries are inclusive upper bounds
+        assert histogram.bucket_counts == [2, 3, 4, 5]
+        assert histogram.count == 5
+        assert histogram.sum == pytest.approx(55.65)
+
+        histogram.reset()
+        assert histogram.count == 0
+        assert histogram.bucket_counts == [0, 0, 0, 0]
+
+    def test_last_updated_is_write_time(self):
+        """Test last_updated reports the last change, not the last read"""
+        gauge = Gauge("queue", "Queue depth")
+        gauge.last_updated = 100.0
+        assert gauge.last_updated == 100.0
+
+        gauge.set(3)
+        written = gauge.last_updated
+        assert written > 100.0
+        time.sleep(0.01)
+        assert gauge.to_dict()["last_updated"] == written
+
+        counter = Counter("requests", "Requests")
+        counter.increment()
+        written = counter.last_updated
+        time.sleep(0.01)
+        assert counter.last_updated == written
+        counter.increment()
+        assert counter.last_updated > written
+
+    def test_exited_threads_fold_their_shards(self):
+        """Test shards of finished threads are merged instead of accumulating"""
+        counter = Counter("requests", "Requests")
+        histogram = Histogram("latency", "Latency", buckets=[1.0])
+
+        def worker():
+            counter.increment()
+            histogram.observe(0.5)
+
+        for _ in range(50):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        assert counter.value == 50 and counter.version == 50
+        assert histogram.count == 50 and histogram.bucket_counts == [50, 50]
+        assert len(counter._shards) == 0 and len(histogram._shards) == 0
+
+    def test_reset_replaces_held_shards(self):
+        """Test updates made after a reset by a thread that already had a shard are kept"""
+        counter = Counter("requests", "Requests")
+        histogram = Histogram("latency", "Latency", buckets=[1.0])
+        counter.increment(5)
+        histogram.observe(0.5)
+
+        counter.reset()
+        histogram.reset()
+        counter.increment(2)
+        histogram.observe(2.0)
+
+        assert counter.value == 2
+        assert histogram.count == 1 and histogram.bucket_counts == [0, 1]
+
+        counter.value = 10
+        counter.increment()
+        assert counter.value == 11
+
+
+class TestMetricsRegistry:
+    """Test registry lookups and labelled children"""
+
+    def test_get_by_labels(self):
+        """Test lookups by name and label set"""
+        registry = MetricsRegistry("component")
+        plain = registry.create_counter("hits", "Hits")
+        labelled = registry.create_counter("hits", "Hits", labels={"a": "1", "b": "2"})
+
+        assert registry.get("hits") is plain
+        assert registry.get("hits", {"b": "2", "a": "1"}) is labelled
+        assert registry.get("hits", {"a": "1"}) is None
+        assert registry.get("missing") is None
+
+        registry.remove("hits", {"a": "1", "b": "2"})
+        assert registry.get("hits", {"a": "1", "b": "2"}) is None
+        assert registry.get("hits") is plain
+
+    def test_with_labels_registers_child(self):
+        """Test children are cached and visible through the registry"""
+        registry = MetricsRegistry("component")
+        parent = registry.create_histogram("latency", "Latency", buckets=[0.1, 1.0])
+
+        child = parent.with_labels(endpoint="/api")
+        assert parent.with_labels(endpoint="/api") is child
+        assert child.labels == {"endpoint": "/api"}
+        assert registry.get("latency", {"endpoint": "/api"}) is child
+
+        child.observe(0.5)
+        assert child.count == 1
+        assert parent.count == 0
+
+    def test_remove_child(self):
+        """Test a removed child is no longer resolved through its parent"""
+        registry = MetricsRegistry("component")
+        parent = registry.create_counter("hits", "Hits")
+        child = parent.with_labels(endpoint="/api")
+
+        registry.remove("hits", {"endpoint": "/api"})
+        replacement = parent.with_labels(endpoint="/api")
+        assert replacement is not child
+        assert registry.get("hits", {"endpoint": "/api"}) is replacement
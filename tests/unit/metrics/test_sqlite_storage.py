@@ -0,0 +1,73 @@
+"""
+Unit tests for pooled SQLite metrics storage
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from tekton.core.metrics.collector import SessionData
+from tekton.core.metrics.storage.sqlite import SQLiteMetricsStorage
+
+
+def make_session(index):
+    session = SessionData(id=f"s{index}", prompt="prompt", config={"a": 1}, start_time=float(index))
+    session.component_activations = {"c1": [{"timestamp": 1.0, "level": 0.5}]}
+    session.propagation_path = [
+        {"source": "a", "destination": "b", "info_content": 0.3, "timestamp": 2.0, "hop": 1}
+    ]
+    session.latent_reasoning = [{"component_id": "c1", "iteration": 1, "note": "x"}]
+    return session
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = SQLiteMetricsStorage(str(tmp_path / "metrics.db"), batch_size=8)
+    yield storage
+    storage.close()
+
+
+class TestSQLiteMetricsStorage:
+    """Test storage round trips and the background writer"""
+
+    def test_round_trip(self, storage):
+        """Test a stored session reads back with its child rows"""
+        storage.store_session(make_session(1))
+        session = storage.get_session("s1")
+
+        assert session["config"] == {"a": 1}
+        assert session["component_activations"] == {"c1": [{"timestamp": 1.0, "level": 0.5}]}
+        assert session["propagation_path"][0]["hop"] == 1
+        assert session["latent_reasoning"][0]["note"] == "x"
+        assert storage.get_session("missing") is None
+
+    def test_wal_mode(self, storage):
+        """Test pooled connections use WAL"""
+        with storage.pool.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_enqueue_group_commit(self, storage):
+        """Test queued sessions are written and failures are isolated"""
+        futures = [storage.enqueue_session(make_session(i)) for i in range(20)]
+        duplicate = storage.enqueue_session(make_session(3))
+        storage.flush(timeout=10)
+
+        assert all(future.exception() is None for future in futures)
+        assert isinstance(duplicate.exception(), sqlite3.IntegrityError)
+        sessions = storage.get_sessions(limit=50)
+        assert [s["id"] for s in sessions[:2]] == ["s19", "s18"]
+        assert len(sessions) == 20
+
+    def test_store_session_async(self, storage):
+        """Test the async API waits for the commit"""
+        asyncio.run(storage.store_session_async(make_session(7)))
+        assert storage.get_session("s7") is not None
+
+    def test_in_memory(self):
+        """Test an in-memory database shares one connection"""
+        storage = SQLiteMetricsStorage(":memory:")
+        storage.store_session(make_session(1))
+        assert len(storage.get_sessions()) == 1
+        assert storage.pool.size == 1
+        storage.close()
@@ -0,0 +1,111 @@
+"""
+Unit tests for ring-buffer resource history
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from tekton.core.resource_monitoring.history import ResourceHistory, RingBuffer
+from tekton.core.resource_monitoring.metrics import ResourceMetrics
+
+
+def make_metrics(timestamp, cpu, component="engram"):
+    return ResourceMetrics(
+        timestamp=datetime.fromtimestamp(timestamp),
+        cpu_percent=cpu,
+        memory_percent=50.0,
+        disk_percent={"/": 10.0},
+        network_mbps={"eth0": {"total_mbps": 1.5}},
+        component_metrics={component: {"cpu_percent": cpu / 2}}
+    )
+
+
+class TestRingBuffer:
+    """Test wrap-around and time-range search"""
+
+    def test_wrapped_range(self):
+        """Test ranges across the wrap point match a plain scan"""
+        ring = RingBuffer(capacity=5)
+        for t in range(12):
+            ring.append(float(t), value=t * 10)
+
+        assert len(ring) == 5
+        timestamps, columns = ring.range()
+        assert list(timestamps) == [7, 8, 9, 10, 11]
+
+        timestamps, columns = ring.range(start=8.5, end=10)
+        assert list(timestamps) == [9, 10]
+        assert list(columns["value"]) == [90, 100]
+        assert len(ring.range(start=20)[0]) == 0
+
+        ring.drop_before(10)
+        assert list(ring.range()[0]) == [10, 11]
+        ring.drop_before(100)
+        assert len(ring) == 0 and len(ring.range()[0]) == 0
+
+        with pytest.raises(ValueError):
+            RingBuffer(capacity=0)
+
+
+class TestResourceHistory:
+    """Test bounded samples, series and rollups"""
+
+    def test_capacity_is_fixed(self):
+        """Test old samples are overwritten once the retention is covered"""
+        history = ResourceHistory(retention_seconds=10, sample_interval=1)
+        for t in range(100):
+            history.add(make_metrics(1_000_000 + t, float(t)))
+
+        assert len(history) == history.capacity == 11
+        samples = history.samples_between(start=1_000_095)
+        assert [m.cpu_percent for m in samples] == [95, 96, 97, 98, 99]
+        assert history.latest().cpu_percent == 99
+
+        timestamps, values = history.series_range("component.engram.cpu_percent", start=1_000_098)
+        assert list(values) == [49.0, 49.5]
+
+    def test_retention_by_timestamp(self):
+        """Test samples are pruned by age when they arrive slower than expected"""
+        history = ResourceHistory(retention_seconds=10, sample_interval=1)
+        for t in range(0, 100, 5):
+            history.add(make_metrics(1_000_000 + t, float(t)))
+
+        assert [m.cpu_percent for m in history.samples_between()] == [85, 90, 95]
+        timestamps, values = history.series_range("cpu_percent")
+        assert list(values) == [85, 90, 95]
+        assert list(history.rollup("cpu_percent", 1)["min"]) == [85, 90, 95]
+
+    def test_stale_series_are_dropped(self):
+        """Test series of a component that went away expire with its samples"""
+        history = ResourceHistory(retention_seconds=10, sample_interval=1)
+        for t in range(5):
+            history.add(make_metrics(1_000_000 + t, float(t), component="engram"))
+        for t in range(5, 20):
+            history.add(make_metrics(1_000_000 + t, float(t), component="hermes"))
+
+        assert "component.hermes.cpu_percent" in history.series
+        assert "component.engram.cpu_percent" not in history.series
+        assert len(history.series_range("component.engram.cpu_percent")[0]) == 0
+
+    def test_rollups(self):
+        """Test min/max/avg buckets per resolution"""
+        history = ResourceHistory(retention_seconds=3600, sample_interval=10)
+        start = 1_000_020  # Aligned to the minute
+        for t in range(0, 180, 10):
+            history.add(make_metrics(start + t, float(t)))
+
+        rollup = history.rollup("cpu_percent", 60)
+        assert list(rollup["timestamp"]) == [start, start + 60, start + 120]
+        assert list(rollup["min"]) == [0, 60, 120]
+        assert list(rollup["max"]) == [50, 110, 170]
+        assert np.allclose(rollup["avg"], [25, 85, 145])
+        assert list(rollup["count"]) == [6, 6, 6]
+
+        later = history.rollup("cpu_percent", 60, start=start + 90)
+        assert list(later["timestamp"]) == [start + 60, start + 120]
+        assert len(history.rollup("missing", 1)["avg"]) == 0
+
+        with pytest.raises(ValueError):
+            history.rollup("cpu_percent", 5)
@@ -0,0 +1,96 @@
+"""
+Unit tests for non-blocking resource sampling
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import namedtuple
+from unittest.mock import patch
+
+from tekton.core.resource_monitoring import ResourceConfig, ResourceMonitor
+
+CPUTimes = namedtuple("CPUTimes", "user system idle iowait")
+
+
+class TestResourceMonitor:
+    """Test sampling without sleeping and the sampler thread handoff"""
+
+    def test_collect_does_not_sleep(self):
+        """Test a sample with a registered component is not paced by interval sleeps"""
+        monitor = ResourceMonitor()
+        monitor.register_component("self", [os.getpid(), 2 ** 22 + 12345])
+
+        start = time.perf_counter()
+        metrics = monitor.collect_metrics()
+        assert time.perf_counter() - start < 0.1
+
+        assert "self" in metrics.component_metrics
+        assert monitor.component_pids["self"] == [os.getpid()]
+        handle = monitor._processes[os.getpid()]
+        monitor.collect_metrics()
+        assert monitor._processes[os.getpid()] is handle
+        assert len(monitor.get_metrics_history()) == 2
+
+    def test_sampler_thread_feeds_subscribers(self):
+        """Test samples reach the loop while it stays responsive"""
+        monitor = ResourceMonitor(ResourceConfig(check_interval_seconds=0.02))
+
+        async def main():
+            queue = monitor.subscribe()
+            monitor.start()
+            try:
+                first = await asyncio.wait_for(queue.get(), timeout=5)
+                second = await asyncio.wait_for(queue.get(), timeout=5)
+            finally:
+                monitor.stop()
+            monitor.unsubscribe(queue)
+            return first, second
+
+        first, second = asyncio.run(main())
+        assert second.timestamp >= first.timestamp
+        assert monitor.get_current_metrics() is not None
+        assert len(monitor.history) >= 2
+
+    def test_cpu_percent_is_per_monitor(self):
+        """Test each monitor measures CPU from its own previous sample"""
+        times = [CPUTimes(10, 10, 80, 0)]
+        with patch("psutil.cpu_times", side_effect=lambda: times[0]):
+            first = ResourceMonitor()
+            times[0] = CPUTimes(30, 10, 100, 0)
+            second = ResourceMonitor()
+            times[0] = CPUTimes(40, 20, 130, 10)
+
+            # first: 40 busy of 100 seconds; second: 20 busy of 60 seconds
+            assert first._cpu_percent() == 40.0
+            assert second._cpu_percent() == 33.3
+            times[0] = CPUTimes(70, 20, 130, 10)
+            assert first._cpu_percent() == 100.0
+            assert first._cpu_percent() == 0.0
+
+    def test_concurrent_sampling(self):
+        """Test callers can sample while the sampler thread runs"""
+        monitor = ResourceMonitor(ResourceConfig(check_interval_seconds=0.001))
+        monitor.register_component("self", [os.getpid()])
+        errors = []
+
+        def sample():
+            try:
+                for _ in range(50):
+                    monitor.collect_metrics()
+            except Exception as e:
+                errors.append(e)
+
+        monitor.start()
+        try:
+            threads = [threading.Thread(target=sample) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            monitor.stop()
+
+        assert errors == []
+        assert list(monitor._processes) == [os.getpid()]
@@ -0,0 +1,102 @@
+"""
+Unit tests for dependency-graph startup in EnhancedStartUpCoordinator
+"""
+
+import asyncio
+
+from tekton.core.dependency import DependencyResolver
+from tekton.core.startup_coordinator import EnhancedStartUpCoordinator, StartUpCoordinator
+
+
+def make_configs(graph, work, running=None, fail=()):
+    """Component configs whose start functions sleep for work[component_id]"""
+    def start_func(component_id):
+        async def start():
+            if running is not None:
+                running.append(1)
+                running[0] = max(running[0], len(running) - 1)
+            await asyncio.sleep(work[component_id])
+            if running is not None:
+                running.pop()
+            return component_id not in fail
+        return start
+
+    return {
+        component_id: {"start_func": start_func(component_id), "dependencies": deps, "timeout": 5}
+        for component_id, deps in graph.items()
+    }
+
+
+async def start_all(tmp_path, configs, coordinator_class=EnhancedStartUpCoordinator, **kwargs):
+    coordinator = coordinator_class(data_dir=str(tmp_path), **kwargs)
+    await coordinator.initialize()
+    await asyncio.sleep(0)  # Let the registry load finish
+    results = await coordinator.start_components(configs)
+    return results, coordinator.get_startup_report()
+
+
+class TestDependencyResolver:
+    """Test ordering and critical path"""
+
+    def test_dependencies_come_first(self):
+        """Test the topological order starts dependencies before dependents"""
+        order, had_cycles = DependencyResolver.resolve_dependencies(
+            {"app": ["db", "cache"], "cache": ["db"], "db": []}
+        )
+        assert order == ["db", "cache", "app"]
+        assert not had_cycles
+
+    def test_critical_path(self):
+        """Test the longest chain is weighted by duration"""
+        graph = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": []}
+        path, total = DependencyResolver.critical_path(graph, {"a": 1, "b": 1, "c": 3, "d": 1, "e": 4})
+        assert path == ["a", "c", "d"]
+        assert total == 5
+
+
+class TestDagStartup:
+    """Test components start as soon as their dependencies are ready"""
+
+    def test_parallel_startup(self, tmp_path):
+        """Test total time tracks the critical path, not the sum of start times"""
+        graph = {"hermes": [], "engram": ["hermes"], "rhetor": ["hermes"], "prometheus": ["hermes"],
+                 "athena": ["engram"], "ergon": ["engram", "rhetor"], "hephaestus": []}
+        work = {component_id: 0.05 for component_id in graph}
+        work["rhetor"] = 0.15
+
+        results, report = asyncio.run(start_all(tmp_path, make_configs(graph, work)))
+
+        assert all(results.values()) and len(results) == 7
+        assert report["critical_path"] == ["hermes", "rhetor", "ergon"]
+        assert report["elapsed"] < 0.25 + 0.2
+        timeline = {entry["component_id"]: entry for entry in report["timeline"]}
+        assert timeline["ergon"]["started_at"] >= timeline["rhetor"]["finished_at"]
+        assert timeline["athena"]["started_at"] < timeline["rhetor"]["finished_at"]
+
+    def test_concurrency_cap_and_failures(self, tmp_path):
+        """Test the concurrency cap holds and dependents of a failed component are skipped"""
+        graph = {"a": [], "b": [], "c": [], "d": ["a"], "e": ["d"], "f": ["b"]}
+        work = {component_id: 0.02 for component_id in graph}
+        running = [0]
+
+        results, report = asyncio.run(start_all(
+            tmp_path, make_configs(graph, work, running, fail={"a"}), max_concurrent_starts=2
+        ))
+
+        assert running[0] <= 2
+        assert results == {"a": False, "b": True, "c": True, "d": False, "e": False, "f": True}
+        timeline = {entry["component_id"]: entry for entry in report["timeline"]}
+        assert timeline["e"]["error"] == "Dependency failed: d"
+        assert "started_at" not in timeline["d"]
+
+    def test_legacy_coordinator(self, tmp_path):
+        """Test the legacy coordinator's start_component override works with the scheduler"""
+        graph = {"a": [], "b": ["a"]}
+        work = {"a": 0.01, "b": 0.01}
+
+        results, report = asyncio.run(start_all(
+            tmp_path, make_configs(graph, work, fail={"b"}), coordinator_class=StartUpCoordinator
+        ))
+
+        assert results == {"a": True, "b": False}
+        assert [entry["component_id"] for entry in report["timeline"]] == ["a", "b"]